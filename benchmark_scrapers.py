@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Offline scraper benchmarks.
+
+Record each target's traffic once, then replay it to measure scraper
+performance without touching the live job boards:
+
+    python benchmark_scrapers.py --record            # capture HAR archives
+    python benchmark_scrapers.py                     # replay and benchmark
+    python benchmark_scrapers.py --suite vc --repeat 3
+    python benchmark_scrapers.py --compare data/benchmarks/benchmark_<ts>.json
+
+Reports total wall time and jobs/sec per scraper, and how many scrape errors
+each target logged.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.core.metrics import SCRAPE_ERRORS
+from src.scrapers.har import HarConfig
+from src.scrapers.registry import SCRAPERS
+from universal_job_scraper import UniversalJobScraper
+from run_scraper import load_config
+
+
+# Every registered board plugin, including the ones not run by default
+VC_SCRAPER_CLASSES = [SCRAPERS.resolve(name) for name in SCRAPERS.names()]
+
+# Which universal_job_scraper class handles each platform hint
+PLATFORM_CLASSES = {
+    "greenhouse": "GreenhouseScraper",
+    "lever": "LeverScraper",
+    "ashby": "AshbyScraper",
+    "getro": "GetroScraper",
+}
+
+
+def build_result(suite: str, scraper: str, target: str, started: float, finished: float,
+                 jobs: int, error: str = "") -> Dict:
+    """Build one benchmark row from raw perf_counter timestamps."""
+    wall = finished - started
+    return {
+        "suite": suite,
+        "scraper": scraper,
+        "target": target,
+        "jobs": jobs,
+        "wall_s": round(wall, 3),
+        "jobs_per_s": round(jobs / wall, 3) if wall > 0 else 0.0,
+        "error": error,
+    }
+
+
+def error_text(errors: int) -> str:
+    """Error column for a target that logged ``errors`` scrape errors."""
+    return f"{errors} scrape error{'s' if errors != 1 else ''}" if errors else ""
+
+
+def scraper_class(target: Dict) -> str:
+    """Name of the class that scrapes a universal target."""
+    if target.get('scraper'):
+        return SCRAPERS.resolve(target['scraper']).__name__
+    return PLATFORM_CLASSES.get(target.get('platform') or '', "GenericScraper")
+
+
+async def bench_universal(targets: List[Dict], har: HarConfig, filter_apac: bool) -> List[Dict]:
+    """Benchmark each universal target through UniversalJobScraper.scrape_target."""
+    results = []
+
+    for target in targets:
+        scraper = UniversalJobScraper(targets=[target], filter_apac=filter_apac, har=har)
+
+        # scrape_target logs failures instead of raising them
+        errors_before = SCRAPE_ERRORS.get(suite=scraper.suite, target=target['name'])
+        started = time.perf_counter()
+        jobs = await scraper.scrape_target(target)
+        finished = time.perf_counter()
+        errors = int(SCRAPE_ERRORS.get(suite=scraper.suite, target=target['name']) - errors_before)
+
+        results.append(build_result("universal", scraper_class(target), target['name'], started, finished,
+                                    len(jobs), error_text(errors)))
+
+    return results
+
+
+async def bench_vc(har: HarConfig) -> List[Dict]:
+    """Benchmark every registered board scraper plugin."""
+    results = []
+
+    for scraper_cls in VC_SCRAPER_CLASSES:
+        scraper = scraper_cls(har=har)
+
+        jobs: List[Dict] = []
+        started = time.perf_counter()
+        try:
+            jobs = await scraper.scrape()
+            # Plugins count most failures in ``errors`` instead of raising them
+            error = error_text(scraper.errors)
+        except Exception as e:
+            error = str(e)
+        finished = time.perf_counter()
+
+        results.append(build_result("vc", scraper_cls.__name__, scraper.name, started, finished,
+                                    len(jobs), error))
+
+    return results
+
+
+def summarize(runs: List[List[Dict]]) -> List[Dict]:
+    """Collapse repeated runs into one row per scraper/target (median wall time)."""
+    grouped: Dict[tuple, List[Dict]] = {}
+    for run in runs:
+        for row in run:
+            grouped.setdefault((row['suite'], row['scraper'], row['target']), []).append(row)
+
+    summary = []
+    for rows in grouped.values():
+        rows = sorted(rows, key=lambda r: r['wall_s'])
+        median = rows[len(rows) // 2]
+        summary.append({**median, "runs": len(rows)})
+    return summary
+
+
+def print_table(summary: List[Dict], baseline: Optional[Dict[tuple, Dict]] = None):
+    """Print the benchmark table, with deltas against a baseline if given."""
+    print("\n" + "="*83)
+    print("⏱️  SCRAPER BENCHMARK")
+    print("="*83)
+    print(f"   {'Scraper':<24}{'Target':<22}{'Jobs':>6}{'Wall s':>9}{'Jobs/s':>9}   Δ wall")
+    print("   " + "─"*79)
+
+    for row in summary:
+        delta = ""
+        if baseline:
+            prev = baseline.get((row['suite'], row['scraper'], row['target']))
+            if prev and prev['wall_s']:
+                change = (row['wall_s'] - prev['wall_s']) / prev['wall_s'] * 100
+                delta = f"{change:+.1f}%"
+        line = (f"   {row['scraper'][:23]:<24}{row['target'][:21]:<22}{row['jobs']:>6}"
+                f"{row['wall_s']:>9.2f}{row['jobs_per_s']:>9.2f}   {delta}")
+        if row['error']:
+            line += f"  ❌ {row['error'][:40]}"
+        print(line)
+
+    print("="*83)
+
+
+async def run_benchmark(args) -> Dict:
+    """Run the selected suites and save the results."""
+    har = HarConfig(directory=args.har_dir, mode="record" if args.record else "replay")
+    config = load_config(args.config)
+    targets = [t for t in config.get("targets", []) if t.get("enabled", True)]
+    if args.target:
+        targets = [t for t in targets if t.get("name", "").lower() == args.target.lower()]
+
+    print(f"🎬 Mode: {har.mode} (archives in {har.directory})")
+
+    runs = []
+    repeat = 1 if args.record else args.repeat
+    for i in range(repeat):
+        print(f"\n▶ Run {i+1}/{repeat}")
+        rows = []
+        if args.suite in ("universal", "all"):
+            rows.extend(await bench_universal(targets, har, config.get("filters", {}).get("apac_only", True)))
+        if args.suite in ("vc", "all"):
+            rows.extend(await bench_vc(har))
+        runs.append(rows)
+
+    summary = summarize(runs)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        baseline = {(r['suite'], r['scraper'], r['target']): r for r in previous.get("results", [])}
+
+    print_table(summary, baseline)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    report = {
+        "created": datetime.now().isoformat(),
+        "mode": har.mode,
+        "repeat": repeat,
+        "results": summary,
+    }
+    with open(output_file, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n📁 Saved to: {output_file}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline scraper benchmarks (HAR record/replay)")
+    parser.add_argument("--record", action="store_true",
+                        help="Record HAR archives from the live boards instead of replaying")
+    parser.add_argument("--suite", choices=["universal", "vc", "all"], default="all",
+                        help="Which scrapers to benchmark")
+    parser.add_argument("--target", type=str, help="Only benchmark this universal target")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay runs per scraper (median is reported)")
+    parser.add_argument("--har-dir", type=str, default="./data/har", help="HAR archive directory")
+    parser.add_argument("--config", type=str, default="scraper_targets.json", help="Targets config file")
+    parser.add_argument("--output-dir", type=str, default="./data/benchmarks", help="Where to save results")
+    parser.add_argument("--compare", type=str, help="Previous benchmark JSON to diff against")
+
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
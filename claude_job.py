@@ -7,6 +7,7 @@ Execute job search workflows using Claude Code
 import argparse
 import json
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict
@@ -18,6 +19,12 @@ from src.core.job_search_mvp import JobSearchMVP, PromptExecutor
 from src.core.profile_manager import ProfileManager
 from src.core.database import DatabaseManager
 from src.core.cache import CacheManager
+from src.core.ranking import SearchIndex
+from src.core.seen_jobs import SeenJobs
+from src.core.url_canon import url_id
+from src.core.metrics import LAST_RUN, RUN_DURATION, RUN_JOBS, write_run_metrics
+from src.core.scoring import NUMPY_AVAILABLE, FeatureMatrix, MatchScorer, load_rules
+from src.scrapers.link_checker import LinkChecker
 
 
 class ClaudeJobCLI:
@@ -132,7 +139,12 @@ class ClaudeJobCLI:
             return 1
         
         # Generate matching prompt
-        prompt = self.mvp.generate_job_matching_prompt()
+        candidates_path = self.mvp.shortlist_jobs(str(jobs_path), args.top_k) if args.top_k else None
+        if candidates_path:
+            print(f"🔎 Shortlisted up to {args.top_k} jobs locally: {candidates_path}")
+        # Shortlisting already ran: without candidates, fall back to every job
+        prompt = self.mvp.generate_job_matching_prompt(top_k=args.top_k if candidates_path else None,
+                                                       candidates_path=candidates_path)
         prompt_file = self.mvp.save_prompt_to_file(prompt, "job_matching")
         
         print("📊 Job Matching Prompt Generated!")
@@ -350,6 +362,93 @@ class ClaudeJobCLI:
         
         return 0
     
+    def cmd_ingest(self, args):
+        """Load scraper output files into the jobs database."""
+        started = time.perf_counter()
+        jobs = []
+        
+        for path in args.files:
+            with open(path) as f:
+                data = json.load(f)
+            for job in data:
+                if not job.get('url') or not job.get('title'):
+                    continue
+                job.setdefault('job_id', url_id(job['url']))
+                job['company'] = job.get('company') or job.get('source') or 'Unknown'
+                jobs.append(job)
+        
+        print(f"📥 Ingesting {len(jobs)} jobs from {len(args.files)} file(s)")
+        inserted = self.db.add_jobs(jobs)
+        print(f"✅ {inserted} new, {len(jobs) - inserted} already in database")
+        indexed = SearchIndex(self.db.db_path).add_jobs(jobs)
+        print(f"🔎 {indexed} job(s) added to the search index")
+        seen = SeenJobs(self.db.db_path)
+        seen.add(jobs)
+        seen.close()
+        
+        RUN_DURATION.set(time.perf_counter() - started, suite='ingest')
+        RUN_JOBS.set(inserted, suite='ingest')
+        LAST_RUN.set(time.time(), suite='ingest')
+        metrics_file = write_run_metrics('ingest', args.metrics_dir)
+        print(f"📈 Metrics written to: {metrics_file}")
+        
+        return 0
+    
+    def cmd_check_links(self, args):
+        """Validate stored job URLs and close jobs whose postings are gone."""
+        started = time.perf_counter()
+        jobs = self.db.get_jobs_with_urls(args.statuses)
+        if args.force:
+            self.cache.invalidate_type(LinkChecker.CACHE_TYPE)
+        
+        print(f"🔗 Checking {len(jobs)} job links ({args.concurrency} at once, {args.per_host} per host)")
+        checker = LinkChecker(cache=self.cache, concurrency=args.concurrency,
+                              per_host=args.per_host, timeout_s=args.timeout)
+        results = checker.run(job['url'] for job in jobs)
+        
+        closed = [job for job in jobs if results[job['url']].state == 'closed']
+        for job in closed:
+            print(f"   ❌ {job['job_id']}: {results[job['url']].reason}")
+        updated = self.db.update_jobs_status([job['job_id'] for job in closed], 'closed')
+        
+        counts = checker.counts
+        print(f"✅ {counts['live']} live, {counts['closed']} closed, {counts['error']} unreachable, "
+              f"{counts['cached']} cached within TTL")
+        print(f"📝 {updated} job(s) marked closed")
+        
+        RUN_DURATION.set(time.perf_counter() - started, suite='check_links')
+        RUN_JOBS.set(updated, suite='check_links')
+        LAST_RUN.set(time.time(), suite='check_links')
+        metrics_file = write_run_metrics('check_links', args.metrics_dir)
+        print(f"📈 Metrics written to: {metrics_file}")
+        
+        return 0
+    
+    def cmd_rescore(self, args):
+        """Recompute stored jobs' match scores under the current scoring rules."""
+        started = time.perf_counter()
+        jobs = self.db.get_jobs_for_scoring()
+        scorer = MatchScorer(load_rules(args.config))
+        
+        print(f"🧮 Rescoring {len(jobs)} jobs with rules from {args.config}")
+        if NUMPY_AVAILABLE and jobs:
+            features = FeatureMatrix(jobs, scorer)
+            scores = features.scores().tolist()
+            print(f"   {features.matrix.shape[0]} distinct keyword patterns")
+        else:
+            scores = scorer.score_batch(jobs)
+        
+        updated = self.db.update_match_scores({job['job_id']: score for job, score in zip(jobs, scores)})
+        print(f"✅ {updated} job(s) rescored in {time.perf_counter() - started:.2f}s")
+        
+        RUN_DURATION.set(time.perf_counter() - started, suite='rescore')
+        RUN_JOBS.set(updated, suite='rescore')
+        LAST_RUN.set(time.time(), suite='rescore')
+        metrics_file = write_run_metrics('rescore', args.metrics_dir)
+        print(f"📈 Metrics written to: {metrics_file}")
+        
+        return 0
+    
     def cmd_export(self, args):
         """Export data."""
         output_path = args.output or f"./data/export_{datetime.now().strftime('%Y%m%d')}.json"
@@ -381,6 +480,8 @@ Examples:
   claude-job grok "ML Engineer" "NYC"  # Generate Grok search prompt
   claude-job workflow "Data Scientist" "Remote"  # Create complete workflow
   claude-job status --report           # Show pipeline status with report
+  claude-job ingest data/universal_all_jobs_*.json  # Load scraper output
+  claude-job check-links               # Close jobs whose postings are gone
         """
     )
     
@@ -402,6 +503,8 @@ Examples:
     
     # Match command
     parser_match = subparsers.add_parser('match', help='Match jobs with profile')
+    parser_match.add_argument('--top-k', type=int, default=50,
+                              help='Jobs to shortlist locally for the prompt (0 sends every job)')
     
     # Company command
     parser_company = subparsers.add_parser('company', help='Research companies')
@@ -439,6 +542,34 @@ Examples:
     parser_cache.add_argument('--clean', action='store_true', help='Clean expired entries')
     parser_cache.add_argument('--verbose', '-v', action='store_true', help='Show details')
     
+    # Ingest command
+    parser_ingest = subparsers.add_parser('ingest', help='Load scraper output into the database')
+    parser_ingest.add_argument('files', nargs='+', help='Scraper JSON output files')
+    parser_ingest.add_argument('--metrics-dir', default='./data/metrics',
+                               help='Where to write the OpenMetrics textfile')
+    
+    # Check-links command
+    parser_links = subparsers.add_parser('check-links', help='Validate stored job URLs')
+    parser_links.add_argument('--statuses', nargs='+', default=['new', 'shortlisted'],
+                              help='Job statuses to check (default: new shortlisted)')
+    parser_links.add_argument('--concurrency', type=int, default=20,
+                              help='Requests in flight across all hosts (default: 20)')
+    parser_links.add_argument('--per-host', type=int, default=4,
+                              help='Requests in flight per host (default: 4)')
+    parser_links.add_argument('--timeout', type=float, default=15,
+                              help='Per-request timeout in seconds (default: 15)')
+    parser_links.add_argument('--force', action='store_true',
+                              help='Ignore cached results and re-check every URL')
+    parser_links.add_argument('--metrics-dir', default='./data/metrics',
+                              help='Where to write the OpenMetrics textfile')
+    
+    # Rescore command
+    parser_rescore = subparsers.add_parser('rescore', help='Recompute stored match scores')
+    parser_rescore.add_argument('--config', default='./config/config.json',
+                                help='Config file whose matching.rules to apply')
+    parser_rescore.add_argument('--metrics-dir', default='./data/metrics',
+                                help='Where to write the OpenMetrics textfile')
+    
     # Export command
     parser_export = subparsers.add_parser('export', help='Export data')
     parser_export.add_argument('--output', '-o', help='Output file path')
@@ -463,6 +594,9 @@ Examples:
         'workflow': cli.cmd_workflow,
         'status': cli.cmd_status,
         'cache': cli.cmd_cache,
+        'ingest': cli.cmd_ingest,
+        'check-links': cli.cmd_check_links,
+        'rescore': cli.cmd_rescore,
         'export': cli.cmd_export
     }
     
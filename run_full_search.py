@@ -37,6 +37,7 @@ def main():
     if profile_path.exists():
         with open(profile_path, 'r') as f:
             profile = json.load(f)
+        profile.setdefault('name', profile.get('personal_info', {}).get('name', 'Unknown'))
         print(f"✓ Loaded existing profile: {profile['name']}")
     else:
         print("✗ No profile found. Please run profile extraction first.")
@@ -133,10 +134,7 @@ def main():
     print("\n[Step 5/6] Matching jobs with profile...")
     
     matched_jobs = []
-    for job in unique_jobs:
-        score = job_matcher.calculate_match_score(profile, job)
-        job['match_score'] = score
-        
+    for job in job_matcher.rank(unique_jobs, profile):
         # Add match reasoning
         if 'partnerships' in job.get('title', '').lower():
             job['match_reason'] = "Strong fit: Partnership expertise from Google/AWS"
@@ -147,9 +145,6 @@ def main():
         
         matched_jobs.append(job)
     
-    # Sort by match score
-    matched_jobs.sort(key=lambda x: x.get('match_score', 0), reverse=True)
-    
     print(f"✓ Matched and scored {len(matched_jobs)} positions")
     print(f"  Top match: {matched_jobs[0]['title']} at {matched_jobs[0]['company']} ({matched_jobs[0]['match_score']}%)")
     
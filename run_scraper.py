@@ -8,7 +8,9 @@ import asyncio
 import argparse
 import json
 from pathlib import Path
+from typing import Optional
 from universal_job_scraper import UniversalJobScraper
+from src.core.scheduler import parse_duration
 
 
 def load_config(config_file: str = "scraper_targets.json") -> dict:
@@ -20,8 +22,9 @@ def load_config(config_file: str = "scraper_targets.json") -> dict:
     return {"targets": [], "filters": {"apac_only": True, "gtm_only": False}}
 
 
-async def run_full_scrape(config_file: str = "scraper_targets.json"):
-    """Run full scrape with all enabled targets."""
+async def run_full_scrape(config_file: str = "scraper_targets.json", budget_s: Optional[float] = None,
+                          workers: int = 1):
+    """Run full scrape with all enabled targets, optionally within a time budget or across workers."""
     config = load_config(config_file)
 
     targets = [t for t in config.get("targets", []) if t.get("enabled", True)]
@@ -32,18 +35,21 @@ async def run_full_scrape(config_file: str = "scraper_targets.json"):
     scraper = UniversalJobScraper(
         targets=targets,
         filter_apac=filters.get("apac_only", True),
-        filter_gtm=filters.get("gtm_only", False)
+        filter_gtm=filters.get("gtm_only", False),
+        schedule=config.get("schedule"),
+        memory=config.get("memory"),
+        rate_limit=config.get("rate_limit")
     )
 
-    results = await scraper.scrape_all()
+    results = await scraper.scrape_all(budget_s=budget_s, workers=workers)
     return results
 
 
 async def run_quick_scrape():
     """Quick scrape of just the most important targets."""
     priority_targets = [
-        {"name": "Sequoia Capital", "url": "https://jobs.sequoiacap.com/jobs", "type": "vc_portfolio", "platform": "getro", "location_filter": "Australia"},
-        {"name": "Insight Partners", "url": "https://jobs.insightpartners.com/jobs", "type": "vc_portfolio", "platform": "getro", "location_filter": "Australia"},
+        {"name": "Sequoia Capital", "url": "https://jobs.sequoiacap.com/jobs", "type": "vc_portfolio", "platform": "getro", "location_filter": ["Australia", "Singapore", "Remote"]},
+        {"name": "Insight Partners", "url": "https://jobs.insightpartners.com/jobs", "type": "vc_portfolio", "platform": "getro", "location_filter": ["Australia", "Singapore", "Remote"]},
         {"name": "Anthropic", "url": "https://www.anthropic.com/careers", "type": "company", "platform": "greenhouse"},
         {"name": "Gong", "url": "https://www.gong.io/careers", "type": "company", "platform": "greenhouse"},
     ]
@@ -139,11 +145,25 @@ def main():
     parser.add_argument("--platform", type=str, help="Platform hint for add mode")
     parser.add_argument("--config", type=str, default="scraper_targets.json",
                         help="Config file path")
+    parser.add_argument("--budget", type=str,
+                        help="Time budget for full mode, e.g. 10m - scrapes the highest-yield due targets first")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for full mode, each with its own browser")
 
     args = parser.parse_args()
 
     if args.mode == "full":
-        asyncio.run(run_full_scrape(args.config))
+        budget_s = None
+        if args.budget:
+            try:
+                budget_s = parse_duration(args.budget)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
+        if args.workers < 1:
+            print("❌ --workers must be at least 1")
+            return
+        asyncio.run(run_full_scrape(args.config, budget_s, args.workers))
     elif args.mode == "quick":
         asyncio.run(run_quick_scrape())
     elif args.mode == "vc":
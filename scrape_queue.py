@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Distributed scraping through a shared SQLite work queue.
+
+Any number of workers, on any hosts that share the queue file, claim targets
+and scrape them; a single-host setup is just N local workers.
+
+    python scrape_queue.py enqueue                 # fill the queue from scraper_targets.json
+    python scrape_queue.py worker --processes 4    # run 4 local workers until the queue drains
+    python scrape_queue.py worker --har replay     # scrape from recorded HAR archives
+    python scrape_queue.py status                  # show task states and leases
+    python scrape_queue.py collect                 # dedupe, score and save finished results
+"""
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import os
+import socket
+import time
+from typing import Dict, Optional
+
+from run_scraper import load_config
+from src.core.metrics import SCRAPE_ERRORS
+from src.core.work_queue import WorkQueue, Task
+from src.scrapers.browser_session import BrowserSession
+from src.scrapers.har import HAR_MODES, HarConfig
+from universal_job_scraper import UniversalJobScraper
+
+DEFAULT_DB = "./data/work_queue.db"
+
+
+def make_queue(args) -> WorkQueue:
+    return WorkQueue(args.db, visibility_timeout_s=args.visibility_timeout, max_attempts=args.max_attempts)
+
+
+def cmd_enqueue(args):
+    """Queue every enabled target from the config."""
+    config = load_config(args.config)
+    queue = make_queue(args)
+
+    targets = [t for t in config.get("targets", []) if t.get("enabled", True)]
+    added = sum(1 for t in targets if queue.enqueue(t["name"], t))
+    print(f"📥 Queued {added} of {len(targets)} targets ({len(targets) - added} already pending or in progress)")
+
+
+async def process_task(scraper: UniversalJobScraper, queue: WorkQueue, task: Task,
+                       owner: str, timeout_s: Optional[float]):
+    """Scrape one claimed target, heartbeating its lease until it finishes."""
+    target = task.payload
+    name = target.get("name", task.key)
+    errors_before = SCRAPE_ERRORS.get(suite=scraper.suite, target=name)
+    started = time.perf_counter()
+
+    async def keep_alive():
+        while True:
+            await asyncio.sleep(queue.visibility_timeout_s / 3)
+            if not queue.heartbeat(task.id, owner):
+                return
+
+    scrape = asyncio.create_task(scraper.scrape_target(target))
+    beat = asyncio.create_task(keep_alive())
+    done, _ = await asyncio.wait({scrape, beat}, timeout=timeout_s, return_when=asyncio.FIRST_COMPLETED)
+    beat.cancel()
+
+    if scrape not in done:
+        scrape.cancel()
+        try:
+            await scrape
+        except (asyncio.CancelledError, Exception):
+            pass
+        if beat in done:
+            # Another worker owns the task now; its result will be the one kept
+            print(f"   ⚠️  Lost lease on {name}, abandoning")
+        else:
+            print(f"   ⏰ {name}: out of time after {timeout_s:.0f}s")
+            queue.fail(task.id, owner, f"timed out after {timeout_s:.0f}s", task.attempts)
+        return
+
+    jobs = scrape.result()
+    duration_s = time.perf_counter() - started
+
+    if not jobs and SCRAPE_ERRORS.get(suite=scraper.suite, target=name) > errors_before:
+        queue.fail(task.id, owner, "scrape error (see worker log)", task.attempts)
+        print(f"   🔁 {name}: attempt {task.attempts}/{queue.max_attempts} failed")
+        return
+
+    errored = SCRAPE_ERRORS.get(suite=scraper.suite, target=name) > errors_before
+    result = {"jobs": jobs, "duration_s": round(duration_s, 2), "timed_out": False, "errored": errored,
+              "worker": owner}
+    if not queue.complete(task.id, owner, result):
+        print(f"   ⚠️  Lease on {name} expired before completion, result discarded")
+
+
+async def run_worker(args):
+    """Claim and scrape tasks until the queue is drained."""
+    config = load_config(args.config)
+    filters = config.get("filters", {})
+    queue = make_queue(args)
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    har = HarConfig(directory=args.har_dir, mode=args.har) if args.har else None
+    scraper = UniversalJobScraper(targets=[], filter_apac=filters.get("apac_only", True), har=har,
+                                  memory=config.get("memory"), rate_limit=config.get("rate_limit"))
+    print(f"👷 Worker {owner} started")
+
+    handled = 0
+    scraper.session = BrowserSession(scraper.har, scraper.memory_limits)
+    async with scraper.session:
+        while True:
+            task = queue.claim(owner)
+            if task is None:
+                if queue.is_drained() or args.once:
+                    break
+                # Other workers hold the remaining leases; wait in case one expires
+                await asyncio.sleep(args.poll)
+                continue
+
+            await scraper.session.checkpoint()
+            await process_task(scraper, queue, task, owner, args.timeout)
+            handled += 1
+    scraper.session = None
+
+    print(f"👷 Worker {owner} finished after {handled} tasks")
+
+
+def _worker_process(args):
+    asyncio.run(run_worker(args))
+
+
+def cmd_worker(args):
+    """Run one or more local workers."""
+    if args.processes <= 1:
+        asyncio.run(run_worker(args))
+        return
+
+    # Spawn rather than fork: Playwright's driver threads don't survive a fork
+    ctx = mp.get_context("spawn")
+    processes = [ctx.Process(target=_worker_process, args=(args,)) for _ in range(args.processes)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def cmd_status(args):
+    """Print task counts and current leases."""
+    queue = make_queue(args)
+    counts = queue.stats()
+    print("📊 Queue: " + ", ".join(f"{status} {n}" for status, n in counts.items()))
+
+    now = time.time()
+    for task in queue.tasks():
+        line = f"   {task['key']:<24} {task['status']:<10} attempts {task['attempts']}"
+        if task['status'] == 'leased':
+            line += f"  {task['lease_owner']} ({task['lease_expires'] - now:.0f}s left)"
+        if task['error'] and task['status'] in ('pending', 'failed'):
+            line += f"  ❌ {task['error']}"
+        print(line)
+
+
+def cmd_collect(args):
+    """Merge finished results: history, global dedupe, scoring and save."""
+    queue = make_queue(args)
+    collected = queue.collect()
+    if not collected:
+        print("📭 No finished tasks to collect")
+        return
+
+    config = load_config(args.config)
+    filters = config.get("filters", {})
+    scraper = UniversalJobScraper(targets=[t for t in config.get("targets", []) if t.get("enabled", True)],
+                                  filter_apac=filters.get("apac_only", True),
+                                  filter_gtm=filters.get("gtm_only", False),
+                                  schedule=config.get("schedule"))
+
+    results: Dict[str, int] = {}
+    new_counts: Dict[str, int] = {}
+    for item in collected:
+        name, result = item["key"], item["result"]
+        jobs = result.get("jobs", [])
+        new_counts[name] = scraper.history.record(
+            name, [j.get('url', '') for j in jobs], result.get("duration_s", 0), result.get("timed_out", False))
+        results[name] = len(jobs)
+        scraper.add_target_jobs(name, jobs, result.get("timed_out", False) or result.get("errored", False))
+
+    remaining = queue.stats()
+    if remaining["pending"] or remaining["leased"]:
+        print(f"⚠️  {remaining['pending'] + remaining['leased']} tasks still pending or in progress")
+    scraper.finalize(results, new_counts, time.perf_counter(), None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed scraping through a shared work queue")
+    parser.add_argument("--db", default=DEFAULT_DB, help="Queue database (on a shared filesystem for multi-host)")
+    parser.add_argument("--config", default="scraper_targets.json", help="Config file path")
+    parser.add_argument("--visibility-timeout", type=float, default=300,
+                        help="Seconds a lease survives without a heartbeat")
+    parser.add_argument("--max-attempts", type=int, default=3, help="Attempts before a task is marked failed")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("enqueue", help="Queue enabled targets from the config")
+
+    worker = subparsers.add_parser("worker", help="Claim and scrape tasks until the queue drains")
+    worker.add_argument("--processes", type=int, default=1, help="Local worker processes to run")
+    worker.add_argument("--timeout", type=float, help="Per-target time limit in seconds")
+    worker.add_argument("--poll", type=float, default=10, help="Seconds between claims while others hold leases")
+    worker.add_argument("--once", action="store_true", help="Exit as soon as nothing is claimable")
+    worker.add_argument("--har", choices=HAR_MODES, help="Record targets to HAR archives or replay them")
+    worker.add_argument("--har-dir", default="./data/har", help="HAR archive directory")
+
+    subparsers.add_parser("status", help="Show task states and leases")
+    subparsers.add_parser("collect", help="Dedupe, score and save finished results")
+
+    args = parser.parse_args()
+    {
+        "enqueue": cmd_enqueue,
+        "worker": cmd_worker,
+        "status": cmd_status,
+        "collect": cmd_collect,
+    }[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 
 from typing import Dict, List, Optional, Any
 from .base_agent import BaseAgent
+from ..core.dedupe import find_near_duplicates, merge_jobs
+from ..core.seen_jobs import SeenJobs
 
 
 class DiscoveryAgent(BaseAgent):
@@ -9,6 +11,7 @@ class DiscoveryAgent(BaseAgent):
     
     def __init__(self):
         super().__init__("discovery")
+        self.seen_jobs = SeenJobs(str(self.data_dir / "jobs.db"))
         self.search_sources = [
             "LinkedIn Jobs",
             "Indeed", 
@@ -222,14 +225,31 @@ Output to: {self.data_dir}/{industry}_search_results.json
     
     def deduplicate_jobs(self, existing_jobs: List[Dict], 
                         new_jobs: List[Dict]) -> List[Dict]:
-        """Remove duplicate jobs based on company and title."""
+        """
+        Remove duplicate jobs: the same URL, company and title, or the same
+        role listed on another site under a different URL.
+
+        Jobs recorded in the seen-jobs store (everything ingested) are
+        dropped without loading them, so ``existing_jobs`` only needs the
+        jobs found since. New postings of one role from several sites are
+        merged into one job whose ``source_urls`` lists them all.
+        """
         existing_keys = {
             (job['company'].lower(), job['title'].lower()) 
             for job in existing_jobs
         }
+        candidates = [
+            job for job in self.seen_jobs.filter_new(new_jobs)
+            if (job['company'].lower(), job['title'].lower()) not in existing_keys
+        ]
         
+        offset = len(existing_jobs)
         unique_jobs = []
-        for job in new_jobs:
+        for group in find_near_duplicates(list(existing_jobs) + candidates):
+            if group[0] < offset:
+                continue  # already known from another source
+            postings = [candidates[i - offset] for i in group]
+            job = postings[0] if len(postings) == 1 else merge_jobs(postings)
             key = (job['company'].lower(), job['title'].lower())
             if key not in existing_keys:
                 unique_jobs.append(job)
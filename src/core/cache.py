@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 import hashlib
 
+from .metrics import record_cache_lookup
+
 
 class CacheManager:
     """Manage caching for API responses and web scraping results."""
@@ -25,7 +27,8 @@ class CacheManager:
             'grok_results': 12 * 3600,      # 12 hours
             'grok_prompts': 30 * 24 * 3600, # 30 days
             'profile': 24 * 3600,            # 24 hours
-            'search_results': 6 * 3600       # 6 hours
+            'search_results': 6 * 3600,      # 6 hours
+            'link_check': 24 * 3600          # 24 hours
         }
         
         # Load config if exists
@@ -75,10 +78,12 @@ class CacheManager:
             try:
                 with open(cache_path, 'r') as f:
                     data = json.load(f)
-                    return data.get('content')
+                record_cache_lookup(data_type, hit=True)
+                return data.get('content')
             except (json.JSONDecodeError, IOError):
-                return None
+                pass
         
+        record_cache_lookup(data_type, hit=False)
         return None
     
     def set(self, data_type: str, identifier: str, content: Any) -> bool:
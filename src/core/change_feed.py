@@ -0,0 +1,194 @@
+"""Run-to-run change feed: which jobs were added, removed or changed per target.
+
+Each run's jobs are compared against the last known state of the same
+target, keyed by canonical URL with a content hash per job, so a run costs
+one hash per job and one indexed read per target. Events go to an NDJSON
+file per run and to the ``job_changes`` table next to the jobs database.
+
+Only targets scraped in the run are compared. Targets that timed out are
+compared for additions and changes, but their missing jobs aren't reported
+as removed, since a partial scrape can't tell a closed posting from an
+unread page.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .url_canon import canonical_url
+
+EVENT_TYPES = ("added", "removed", "changed")
+
+# Fields that make up a job's content; scores and scrape metadata are ignored
+CONTENT_FIELDS = ("title", "company", "location", "description", "salary_min", "salary_max",
+                  "remote_type", "job_type")
+
+
+def content_hash(job: Dict) -> str:
+    """Stable hash of the fields that define a job's content."""
+    content = json.dumps([job.get(name) for name in CONTENT_FIELDS], default=str)
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+class ChangeFeed:
+    """Compare runs against stored per-target state and record the differences."""
+
+    def __init__(self, db_path: str = "./data/jobs.db", feed_dir: str = "./data/changes"):
+        """
+        Args:
+            db_path: SQLite file holding the state and change tables
+            feed_dir: Directory for the per-run NDJSON event files
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.feed_dir = Path(feed_dir)
+        self.init_database()
+
+    def get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def init_database(self):
+        """Create the state and change tables."""
+        conn = self.get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS job_state (
+                suite TEXT NOT NULL,
+                target TEXT NOT NULL,
+                url_key TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                job TEXT NOT NULL,
+                first_seen TEXT,
+                last_seen TEXT,
+                PRIMARY KEY (suite, target, url_key)
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS job_changes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                suite TEXT NOT NULL,
+                target TEXT NOT NULL,
+                event TEXT NOT NULL,
+                url TEXT NOT NULL,
+                content_hash TEXT,
+                changed_fields TEXT,
+                job TEXT,
+                detected_at TEXT
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_job_changes_run ON job_changes(suite, run_id)')
+        conn.commit()
+        conn.close()
+
+    def _diff_target(self, conn: sqlite3.Connection, suite: str, target: str,
+                     jobs: Iterable[Dict], partial: bool = False) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """Events for one target against its stored state, plus its jobs by URL key."""
+        previous = {row["url_key"]: row for row in conn.execute(
+            'SELECT url_key, content_hash, job FROM job_state WHERE suite = ? AND target = ?',
+            (suite, target))}
+
+        current: Dict[str, Dict] = {}
+        for job in jobs:
+            if job.get('url'):
+                current.setdefault(canonical_url(job['url']), job)
+
+        events = []
+        for key, job in current.items():
+            digest = content_hash(job)
+            before = previous.get(key)
+            if before is None:
+                events.append({"event": "added", "target": target, "url": key,
+                               "content_hash": digest, "job": job})
+            elif before["content_hash"] != digest:
+                old = json.loads(before["job"])
+                changed = [name for name in CONTENT_FIELDS if old.get(name) != job.get(name)]
+                events.append({"event": "changed", "target": target, "url": key,
+                               "content_hash": digest, "changed_fields": changed, "job": job})
+
+        if not partial:
+            for key in previous.keys() - current.keys():
+                events.append({"event": "removed", "target": target, "url": key,
+                               "content_hash": previous[key]["content_hash"],
+                               "job": json.loads(previous[key]["job"])})
+        return events, current
+
+    def apply(self, suite: str, jobs_by_target: Dict[str, List[Dict]],
+              partial_targets: Iterable[str] = (), run_id: Optional[str] = None) -> List[Dict]:
+        """
+        Diff a run against the stored state, record the events and move the state forward.
+
+        Args:
+            suite: Which scraper produced the run ("universal", "vc", ...)
+            jobs_by_target: Jobs per target scraped in this run
+            partial_targets: Targets that timed out or errored; their missing jobs are kept
+            run_id: Identifies the run in the feed (defaults to a timestamp)
+        """
+        run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now().isoformat()
+        partial = set(partial_targets)
+        events: List[Dict] = []
+        state_rows = []
+
+        conn = self.get_connection()
+        try:
+            for target, jobs in jobs_by_target.items():
+                target_events, current = self._diff_target(conn, suite, target, jobs, target in partial)
+                events.extend(target_events)
+                state_rows.extend((suite, target, key, content_hash(job), json.dumps(job, default=str), now, now)
+                                  for key, job in current.items())
+
+            for event in events:
+                event.update(run_id=run_id, suite=suite, detected_at=now)
+
+            conn.executemany('''
+                INSERT INTO job_changes (run_id, suite, target, event, url, content_hash,
+                                         changed_fields, job, detected_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(run_id, suite, e["target"], e["event"], e["url"], e["content_hash"],
+                   json.dumps(e.get("changed_fields")) if "changed_fields" in e else None,
+                   json.dumps(e["job"], default=str), now) for e in events])
+
+            conn.executemany('DELETE FROM job_state WHERE suite = ? AND target = ? AND url_key = ?',
+                             [(suite, e["target"], e["url"]) for e in events if e["event"] == "removed"])
+            conn.executemany('''
+                INSERT INTO job_state (suite, target, url_key, content_hash, job, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (suite, target, url_key) DO UPDATE SET
+                    content_hash = excluded.content_hash, job = excluded.job, last_seen = excluded.last_seen
+            ''', state_rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+        if events:
+            self.feed_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.feed_file(suite, run_id), 'w') as f:
+                for event in events:
+                    f.write(json.dumps(event, default=str) + "\n")
+        return events
+
+    def feed_file(self, suite: str, run_id: str) -> Path:
+        """Where a run's NDJSON events are written."""
+        return self.feed_dir / f"{suite}_changes_{run_id}.ndjson"
+
+    def recent_changes(self, suite: str, limit: int = 100) -> List[Dict]:
+        """Latest recorded events for a suite, newest first."""
+        conn = self.get_connection()
+        rows = conn.execute(
+            'SELECT * FROM job_changes WHERE suite = ? ORDER BY id DESC LIMIT ?', (suite, limit)).fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+
+def summarize(events: List[Dict]) -> Dict[str, Dict[str, int]]:
+    """Event counts per target: ``{target: {"added": n, "removed": n, "changed": n}}``."""
+    summary: Dict[str, Dict[str, int]] = {}
+    for event in events:
+        counts = summary.setdefault(event["target"], dict.fromkeys(EVENT_TYPES, 0))
+        counts[event["event"]] += 1
+    return summary
@@ -0,0 +1,277 @@
+"""Company entity resolution: one id per company, whatever it's called.
+
+Scrapers name companies from Getro slugs ("dealer-com-2" -> "Dealer Com"),
+card text or the target name, so one company turns up as "SafetyCulture",
+"Safety Culture" and "safetyculture-2". ``CompanyResolver`` maps every
+variant it has seen to a canonical ``company_id``:
+
+- each name, ATS board slug (Greenhouse, Lever, Ashby, Getro) or website
+  domain is reduced to a key: accents folded, lowercase, legal suffixes and
+  Getro ids dropped, words joined ("Canva Pty Ltd", "canva.com" and
+  "canva-3" all become "canva")
+- keys are stored in the ``company_aliases`` table and cached in a dict, so
+  resolving a known variant is one hash lookup
+- an unknown key can fall back to a close fuzzy match (``difflib``) among
+  keys with the same first letter before a new company is created, and the
+  new key is saved as an alias so the match is paid for once
+"""
+
+import difflib
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from .keyword_matcher import words
+
+LEGAL_SUFFIXES = {'inc', 'incorporated', 'ltd', 'limited', 'llc', 'pty', 'corp', 'corporation', 'co',
+                  'company', 'gmbh', 'plc', 'sa', 'ag', 'bv', 'holdings'}
+
+# Slugs have no spaces, so suffixes are cut from the end of the joined key
+SLUG_SUFFIXES = ('inc', 'ltd', 'llc', 'hq')
+
+# Getro appends a counter and often a (truncated) UUID to slugs, which slug-derived
+# names keep: "safetyculture-2-d0ff86a5-3d05", "Relevance Ai 2 3F66648A 7Fb6"
+ID_SUFFIX = re.compile(r"(?:[\s-]+\d+(?:[\s-]+[0-9a-f]+)*|[\s-]+(?=[0-9a-f]*\d)[0-9a-f]{8}(?:[\s-]+[0-9a-f]+)*)$",
+                       re.IGNORECASE)
+
+# Host, path pattern capturing the company slug of ATS boards
+BOARD_SLUGS = [
+    (re.compile(r"(?:job-)?boards(?:\.eu)?\.greenhouse\.io"), re.compile(r"/(?:embed/)?([^/]+)")),
+    (re.compile(r"jobs(?:\.eu)?\.lever\.co"), re.compile(r"/([^/]+)")),
+    (re.compile(r"jobs\.ashbyhq\.com"), re.compile(r"/([^/]+)")),
+    (re.compile(r".+"), re.compile(r"/companies/([^/]+)/jobs/")),
+]
+
+# Host labels that are not the company's name
+DOMAIN_PREFIXES = {'www', 'careers', 'jobs', 'job', 'about'}
+DOMAIN_SUFFIXES = {'com', 'co', 'io', 'ai', 'net', 'org', 'au', 'uk', 'de', 'app', 'dev', 'tech', 'so'}
+
+# Names scrapers and ingest use when the company is unknown
+PLACEHOLDER_KEYS = {'unknown', 'seelisting', 'na', 'none'}
+
+FUZZY_CUTOFF = 0.9
+
+
+def similar(a: str, b: str, cutoff: float = FUZZY_CUTOFF) -> bool:
+    """Whether two keys can name the same company: one extends the other, or they nearly match."""
+    return a.startswith(b) or b.startswith(a) or difflib.SequenceMatcher(None, a, b).ratio() >= cutoff
+
+
+def clean_name(name: str) -> str:
+    """Company name without a trailing Getro id ("Dealer Com 2" -> "Dealer Com")."""
+    return ID_SUFFIX.sub('', (name or '').strip()).strip()
+
+
+def company_key(name: str) -> str:
+    """Normalized key of a company name ("Canva Pty Ltd" -> "canva")."""
+    found = words(clean_name(name))
+    kept = [w for w in found if w not in LEGAL_SUFFIXES] or found
+    return "".join(kept)
+
+
+def slug_key(slug: str) -> str:
+    """Key of a board slug ("dbtlabsinc" -> "dbtlab", "canva-3" -> "canva")."""
+    key = company_key(slug.replace('-', ' '))
+    for suffix in SLUG_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix) + 3:
+            return company_key(key[:-len(suffix)])
+    return key
+
+
+def domain_key(domain: str) -> str:
+    """Key of a company website ("https://careers.canva.com/" -> "canva")."""
+    host = urlparse(domain if '//' in domain else f"//{domain}").netloc.lower().split(':')[0]
+    labels = host.split('.')
+    while len(labels) > 1 and labels[0] in DOMAIN_PREFIXES:
+        labels = labels[1:]
+    while len(labels) > 1 and labels[-1] in DOMAIN_SUFFIXES:
+        labels = labels[:-1]
+    return company_key(labels[-1]) if labels and labels[-1] else ''
+
+
+def board_slug(url: str) -> Optional[str]:
+    """Company slug of a Greenhouse, Lever, Ashby or Getro job URL."""
+    parsed = urlparse(url or '')
+    host = parsed.netloc.lower()
+    host = host[4:] if host.startswith('www.') else host
+    for host_pattern, path_pattern in BOARD_SLUGS:
+        if host_pattern.fullmatch(host):
+            match = path_pattern.match(parsed.path)
+            if match:
+                return match.group(1)
+    return None
+
+
+def display_name(slug: str) -> str:
+    """Readable name for a company only known by its slug."""
+    return clean_name(slug.replace('-', ' ')).title()
+
+
+class CompanyResolver:
+    """Maps company name, slug and domain variants to canonical company ids."""
+
+    def __init__(self, db_path: str = "./data/jobs.db", fuzzy: bool = True, cutoff: float = FUZZY_CUTOFF):
+        """
+        Args:
+            db_path: SQLite file holding the company tables
+            fuzzy: Match unknown keys to close existing ones before creating a company
+            cutoff: ``difflib`` similarity a fuzzy match needs
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fuzzy = fuzzy
+        self.cutoff = cutoff
+        self.init_database()
+        self._aliases: Optional[Dict[str, int]] = None
+        self._names: Dict[int, str] = {}
+        self._named: Set[int] = set()
+        self._by_initial: Dict[str, List[str]] = {}
+
+    def get_connection(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def init_database(self):
+        """Create the company and alias tables."""
+        conn = self.get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS company_entities (
+                company_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                named INTEGER NOT NULL DEFAULT 1
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS company_aliases (
+                alias_key TEXT PRIMARY KEY,
+                company_id INTEGER NOT NULL REFERENCES company_entities(company_id)
+            ) WITHOUT ROWID
+        ''')
+        conn.commit()
+        conn.close()
+
+    def _load(self) -> Dict[str, int]:
+        if self._aliases is None:
+            conn = self.get_connection()
+            try:
+                for company_id, name, named in conn.execute('SELECT company_id, name, named FROM company_entities'):
+                    self._names[company_id] = name
+                    if named:
+                        self._named.add(company_id)
+                self._aliases = dict(conn.execute('SELECT alias_key, company_id FROM company_aliases'))
+            finally:
+                conn.close()
+            for key in self._aliases:
+                self._by_initial.setdefault(key[:1], []).append(key)
+        return self._aliases
+
+    def _remember(self, key: str, company_id: int, new_aliases: List[Tuple[str, int]]):
+        self._aliases[key] = company_id
+        self._by_initial.setdefault(key[:1], []).append(key)
+        new_aliases.append((key, company_id))
+
+    def _closest(self, key: str) -> Optional[int]:
+        if not self.fuzzy:
+            return None
+        match = difflib.get_close_matches(key, self._by_initial.get(key[:1], []), n=1, cutoff=self.cutoff)
+        return self._aliases[match[0]] if match else None
+
+    @staticmethod
+    def variants(name: str = '', url: str = '', domain: str = '') -> Tuple[List[str], str, bool]:
+        """
+        Alias keys of one sighting of a company, most specific first, its
+        display name and whether that name was scraped rather than made up
+        from a slug or domain.
+
+        The board slug of the job URL comes first. A name that doesn't fit the
+        slug is ignored: scrapers fall back to the board's own name (the VC)
+        for portfolio jobs.
+        """
+        slug = board_slug(url)
+        slug_k = slug_key(slug) if slug else ''
+        name_k = company_key(name)
+        if name_k in PLACEHOLDER_KEYS or (name_k and slug_k and not similar(slug_k, name_k)):
+            name_k = ''
+        keys = list(dict.fromkeys(key for key in (slug_k, name_k, domain_key(domain) if domain else '')
+                                  if key and key not in PLACEHOLDER_KEYS))
+        if name_k:
+            display = clean_name(name)
+        else:
+            display = display_name(slug) if slug else (keys[0] if keys else '')
+        return keys, display, bool(name_k)
+
+    def lookup(self, name: str = '', url: str = '', domain: str = '') -> Optional[int]:
+        """Company id of a known variant, without creating anything."""
+        aliases = self._load()
+        keys, _, _ = self.variants(name, url, domain)
+        for key in keys:
+            if key in aliases:
+                return aliases[key]
+        return next((found for found in map(self._closest, keys) if found is not None), None)
+
+    def resolve_many(self, companies: Iterable[Dict[str, str]]) -> List[Optional[int]]:
+        """
+        Company ids for many ``{"name", "url", "domain"}`` variants, creating new companies as needed.
+
+        New companies and aliases are written in one transaction. A company
+        first seen only by its slug takes the first scraped name seen later.
+        """
+        aliases = self._load()
+        changed: Set[int] = set()
+        new_aliases: List[Tuple[str, int]] = []
+        next_id = max(self._names, default=0) + 1
+        ids: List[Optional[int]] = []
+
+        for company in companies:
+            keys, display, named = self.variants(company.get('name') or '', company.get('url') or '',
+                                                 company.get('domain') or '')
+            if not keys:
+                ids.append(None)
+                continue
+            company_id = next((aliases[key] for key in keys if key in aliases), None)
+            if company_id is None:
+                company_id = next((found for found in map(self._closest, keys) if found is not None), None)
+            if company_id is None:
+                company_id, next_id = next_id, next_id + 1
+            if company_id not in self._names or (named and company_id not in self._named):
+                self._names[company_id] = display
+                if named:
+                    self._named.add(company_id)
+                changed.add(company_id)
+            for key in keys:
+                if key not in aliases:
+                    self._remember(key, company_id, new_aliases)
+            ids.append(company_id)
+
+        if changed or new_aliases:
+            conn = self.get_connection()
+            try:
+                conn.executemany('''
+                    INSERT INTO company_entities (company_id, name, named) VALUES (?, ?, ?)
+                    ON CONFLICT (company_id) DO UPDATE SET name = excluded.name, named = excluded.named
+                ''', [(company_id, self._names[company_id], company_id in self._named) for company_id in changed])
+                conn.executemany('INSERT OR IGNORE INTO company_aliases (alias_key, company_id) VALUES (?, ?)',
+                                 new_aliases)
+                conn.commit()
+            finally:
+                conn.close()
+        return ids
+
+    def resolve(self, name: str = '', url: str = '', domain: str = '') -> Optional[int]:
+        """Company id for one variant, creating the company if it's new."""
+        return self.resolve_many([{"name": name, "url": url, "domain": domain}])[0]
+
+    def name(self, company_id: int) -> Optional[str]:
+        """Canonical display name of a company."""
+        self._load()
+        return self._names.get(company_id)
+
+    def resolve_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Set ``company_id`` on each job and replace its company with the canonical name."""
+        ids = self.resolve_many({"name": job.get('company') or '', "url": job.get('url') or ''} for job in jobs)
+        for job, company_id in zip(jobs, ids):
+            if company_id is not None:
+                job['company_id'] = company_id
+                job['company'] = self._names[company_id]
+        return jobs
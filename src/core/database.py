@@ -6,6 +6,11 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 import json
 
+from .companies import CompanyResolver
+from .locations import format_location, normalize_location
+from .metrics import DB_ROWS_INSERTED
+from .url_canon import url_id
+
 
 class DatabaseManager:
     """Manage SQLite database operations."""
@@ -14,6 +19,8 @@ class DatabaseManager:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.init_database()
+        self.companies = CompanyResolver(str(self.db_path))
+        self.backfill_company_ids()
     
     def init_database(self):
         """Initialize database with required tables."""
@@ -114,9 +121,52 @@ class DatabaseManager:
             )
         ''')
         
+        # JobSearchMVP creates an older jobs table without these columns
+        self._ensure_column(cursor, 'jobs', 'company_size', 'TEXT')
+        self._ensure_column(cursor, 'jobs', 'job_type', 'TEXT')
+        
+        # Canonical company ids from CompanyResolver
+        for table in ('jobs', 'connections', 'companies'):
+            self._ensure_column(cursor, table, 'company_id', 'INTEGER')
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_company_id ON {table}(company_id)')
+        
         conn.commit()
         conn.close()
     
+    # Tables with a company_id and the column naming the company
+    COMPANY_NAME_COLUMNS = (('jobs', 'company'), ('connections', 'company'), ('companies', 'name'))
+    
+    def backfill_company_ids(self):
+        """Resolve company ids for rows stored before they were tracked."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            names = {}
+            for table, name_column in self.COMPANY_NAME_COLUMNS:
+                cursor.execute(f'SELECT DISTINCT {name_column} FROM {table} '
+                               f'WHERE company_id IS NULL AND {name_column} IS NOT NULL')
+                names[table] = [row[0] for row in cursor.fetchall()]
+            # Resolve before writing here: the resolver commits on its own connection
+            ids = {table: self.companies.resolve_many({"name": name} for name in table_names)
+                   for table, table_names in names.items()}
+            for table, name_column in self.COMPANY_NAME_COLUMNS:
+                cursor.executemany(
+                    f'UPDATE {table} SET company_id = ? WHERE {name_column} = ? AND company_id IS NULL',
+                    [(company_id, name) for name, company_id in zip(names[table], ids[table])
+                     if company_id is not None]
+                )
+            conn.commit()
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def _ensure_column(cursor: sqlite3.Cursor, table: str, column: str, definition: str):
+        """Add a column to an existing table if its schema predates it."""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
         conn = sqlite3.connect(self.db_path)
@@ -125,41 +175,56 @@ class DatabaseManager:
     
     # ============= JOB OPERATIONS =============
     
+    JOB_INSERT_SQL = '''
+        INSERT {conflict}INTO jobs (
+            job_id, title, company, location, url, description,
+            requirements, posted_date, match_score, source,
+            salary_min, salary_max, remote_type, company_size, job_type, company_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    @staticmethod
+    def _job_row(job_data: Dict[str, Any]) -> tuple:
+        """Build the jobs INSERT parameters from a job dict."""
+        # Convert requirements list to JSON string if needed
+        if isinstance(job_data.get('requirements'), list):
+            job_data['requirements'] = json.dumps(job_data['requirements'])
+        # Store the gazetteer form of the location; unrecognized text is kept as scraped
+        location = job_data.get('location') or ''
+        # Jobs with a URL default to its hash, so the same posting can't be stored twice
+        if not job_data.get('job_id') and job_data.get('url'):
+            job_data['job_id'] = url_id(job_data['url'])
+        
+        return (
+            job_data.get('job_id'),
+            job_data.get('title'),
+            job_data.get('company'),
+            format_location(location) or job_data.get('location'),
+            job_data.get('url'),
+            job_data.get('description'),
+            job_data.get('requirements'),
+            job_data.get('posted_date'),
+            job_data.get('match_score'),
+            job_data.get('source', 'claude'),
+            job_data.get('salary_min'),
+            job_data.get('salary_max'),
+            job_data.get('remote_type') or normalize_location(location)['remote_type'],
+            job_data.get('company_size'),
+            job_data.get('job_type'),
+            job_data.get('company_id')
+        )
+    
     def add_job(self, job_data: Dict[str, Any]) -> Optional[int]:
         """Add a new job to the database."""
+        self.companies.resolve_jobs([job_data])
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            # Convert requirements list to JSON string if needed
-            if isinstance(job_data.get('requirements'), list):
-                job_data['requirements'] = json.dumps(job_data['requirements'])
-            
-            cursor.execute('''
-                INSERT INTO jobs (
-                    job_id, title, company, location, url, description,
-                    requirements, posted_date, match_score, source,
-                    salary_min, salary_max, remote_type, company_size, job_type
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_data.get('job_id'),
-                job_data.get('title'),
-                job_data.get('company'),
-                job_data.get('location'),
-                job_data.get('url'),
-                job_data.get('description'),
-                job_data.get('requirements'),
-                job_data.get('posted_date'),
-                job_data.get('match_score'),
-                job_data.get('source', 'claude'),
-                job_data.get('salary_min'),
-                job_data.get('salary_max'),
-                job_data.get('remote_type'),
-                job_data.get('company_size'),
-                job_data.get('job_type')
-            ))
+            cursor.execute(self.JOB_INSERT_SQL.format(conflict=''), self._job_row(job_data))
             
             conn.commit()
+            DB_ROWS_INSERTED.inc(table='jobs')
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Job already exists
@@ -167,6 +232,28 @@ class DatabaseManager:
         finally:
             conn.close()
     
+    def add_jobs(self, jobs: List[Dict[str, Any]]) -> int:
+        """Add many jobs in one transaction, skipping ones that already exist.
+        
+        Returns the number of rows inserted.
+        """
+        self.companies.resolve_jobs(jobs)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            before = conn.total_changes
+            cursor.executemany(
+                self.JOB_INSERT_SQL.format(conflict='OR IGNORE '),
+                [self._job_row(job) for job in jobs]
+            )
+            conn.commit()
+            inserted = conn.total_changes - before
+            DB_ROWS_INSERTED.inc(inserted, table='jobs')
+            return inserted
+        finally:
+            conn.close()
+    
     def get_job(self, job_id: str) -> Optional[Dict]:
         """Get job by ID."""
         conn = self.get_connection()
@@ -195,6 +282,73 @@ class DatabaseManager:
         conn.close()
         return success
     
+    def update_jobs_status(self, job_ids: List[str], status: str) -> int:
+        """Set the status of many jobs in one transaction.
+
+        Returns the number of rows updated.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            before = conn.total_changes
+            cursor.executemany(
+                'UPDATE jobs SET status = ? WHERE job_id = ?',
+                [(status, job_id) for job_id in job_ids]
+            )
+            conn.commit()
+            return conn.total_changes - before
+        finally:
+            conn.close()
+
+    def get_jobs_with_urls(self, statuses: List[str]) -> List[Dict]:
+        """Get job_id, url and status of jobs in any of the given statuses."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        placeholders = ', '.join('?' for _ in statuses)
+        cursor.execute(
+            f"SELECT job_id, url, status FROM jobs WHERE url IS NOT NULL AND url != '' "
+            f"AND status IN ({placeholders})",
+            list(statuses)
+        )
+
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [dict(row) for row in rows]
+
+    def get_jobs_for_scoring(self) -> List[Dict]:
+        """Get job_id, title and location of every job."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT job_id, title, location FROM jobs')
+
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [dict(row) for row in rows]
+
+    def update_match_scores(self, scores: Dict[str, float]) -> int:
+        """Set many jobs' match scores in one transaction.
+
+        Returns the number of rows updated.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            before = conn.total_changes
+            cursor.executemany(
+                'UPDATE jobs SET match_score = ? WHERE job_id = ?',
+                [(score, job_id) for job_id, score in scores.items()]
+            )
+            conn.commit()
+            return conn.total_changes - before
+        finally:
+            conn.close()
+
     def update_match_score(self, job_id: str, score: float) -> bool:
         """Update job match score."""
         conn = self.get_connection()
@@ -242,6 +396,25 @@ class DatabaseManager:
         
         return [dict(row) for row in rows]
     
+    def get_company_job_counts(self, limit: int = 20) -> List[Dict]:
+        """Companies with the most jobs, counting every spelling of a company as one."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT e.company_id, e.name AS company, COUNT(*) AS jobs,
+                   MAX(j.match_score) AS best_match
+            FROM jobs j JOIN company_entities e ON e.company_id = j.company_id
+            GROUP BY e.company_id
+            ORDER BY jobs DESC, best_match DESC
+            LIMIT ?
+        ''', (limit,))
+
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [dict(row) for row in rows]
+    
     # ============= APPLICATION OPERATIONS =============
     
     def add_application(self, app_data: Dict[str, Any]) -> Optional[int]:
@@ -273,6 +446,7 @@ class DatabaseManager:
         conn.commit()
         app_id = cursor.lastrowid
         conn.close()
+        DB_ROWS_INSERTED.inc(table='applications')
         return app_id
     
     def update_application_status(self, job_id: str, status: str) -> bool:
@@ -318,8 +492,8 @@ class DatabaseManager:
         cursor.execute('''
             INSERT INTO connections (
                 name, company, title, connection_degree, linkedin_url,
-                connection_path, connection_type, outreach_message, notes
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                connection_path, connection_type, outreach_message, notes, company_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
             conn_data.get('name'),
             conn_data.get('company'),
@@ -329,24 +503,29 @@ class DatabaseManager:
             conn_data.get('connection_path'),
             conn_data.get('connection_type'),
             conn_data.get('outreach_message'),
-            conn_data.get('notes')
+            conn_data.get('notes'),
+            self.companies.resolve(conn_data.get('company') or '')
         ))
         
         conn.commit()
         conn_id = cursor.lastrowid
         conn.close()
+        DB_ROWS_INSERTED.inc(table='connections')
         return conn_id
     
     def get_company_connections(self, company: str) -> List[Dict]:
-        """Get all connections at a specific company."""
+        """Get all connections at a specific company, under any spelling of its name."""
+        company_id = self.companies.lookup(company)
+        if company_id is None:
+            return []
         conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
             SELECT * FROM connections 
-            WHERE company = ? 
+            WHERE company_id = ? 
             ORDER BY connection_degree, contacted
-        ''', (company,))
+        ''', (company_id,))
         
         rows = cursor.fetchall()
         conn.close()
@@ -379,14 +558,16 @@ class DatabaseManager:
         for field in ['culture_notes', 'tech_stack', 'recent_news']:
             if isinstance(company_data.get(field), (list, dict)):
                 company_data[field] = json.dumps(company_data[field])
+        company_id = self.companies.resolve(company_data.get('name') or '',
+                                            domain=company_data.get('website') or '')
         
         try:
             cursor.execute('''
                 INSERT INTO companies (
                     name, industry, size, location_hq, website,
                     glassdoor_rating, culture_notes, tech_stack,
-                    recent_news, growth_stage, remote_policy
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    recent_news, growth_stage, remote_policy, company_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 company_data.get('name'),
                 company_data.get('industry'),
@@ -398,10 +579,12 @@ class DatabaseManager:
                 company_data.get('tech_stack'),
                 company_data.get('recent_news'),
                 company_data.get('growth_stage'),
-                company_data.get('remote_policy')
+                company_data.get('remote_policy'),
+                company_id
             ))
             
             conn.commit()
+            DB_ROWS_INSERTED.inc(table='companies')
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Company already exists, update instead
@@ -410,7 +593,7 @@ class DatabaseManager:
                     industry = ?, size = ?, location_hq = ?, website = ?,
                     glassdoor_rating = ?, culture_notes = ?, tech_stack = ?,
                     recent_news = ?, growth_stage = ?, remote_policy = ?,
-                    research_date = CURRENT_DATE
+                    company_id = ?, research_date = CURRENT_DATE
                 WHERE name = ?
             ''', (
                 company_data.get('industry'),
@@ -423,6 +606,7 @@ class DatabaseManager:
                 company_data.get('recent_news'),
                 company_data.get('growth_stage'),
                 company_data.get('remote_policy'),
+                company_id,
                 company_data.get('name')
             ))
             conn.commit()
@@ -431,11 +615,13 @@ class DatabaseManager:
             conn.close()
     
     def get_company_research(self, company_name: str) -> Optional[Dict]:
-        """Get company research data."""
+        """Get company research data, matching any spelling of the company's name."""
+        company_id = self.companies.lookup(company_name)
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM companies WHERE name = ?', (company_name,))
+        cursor.execute('SELECT * FROM companies WHERE company_id = ? OR name = ? ORDER BY name = ? DESC',
+                       (company_id, company_name, company_name))
         row = cursor.fetchone()
         conn.close()
         
@@ -476,6 +662,7 @@ class DatabaseManager:
         conn.commit()
         search_id = cursor.lastrowid
         conn.close()
+        DB_ROWS_INSERTED.inc(table='search_history')
         return search_id
     
     def get_recent_searches(self, limit: int = 10) -> List[Dict]:
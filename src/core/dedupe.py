@@ -0,0 +1,262 @@
+"""Job de-duplication shared by the scrapers and the sharded coordinator.
+
+``dedupe_by_url`` drops repeats of one posting: URLs are compared by their
+64-bit ``url_hash``, so tracking parameters, scheme, host case and the board
+an ATS job is reached through don't matter. ``merge_near_duplicates`` also
+catches the same role listed under different URLs (a VC Getro board, the
+company's Greenhouse page, LinkedIn): every job gets a MinHash signature over
+its title, company and location shingles, and LSH banding puts jobs that
+share a band of the signature in the same bucket. Only jobs sharing a bucket
+are compared, so the work grows with the number of near-duplicates rather
+than with every pair of jobs. A candidate pair is a duplicate when it comes
+from different sites (one site's own postings under different URLs are
+separate requisitions), the companies match, the locations don't contradict
+each other and the titles share most of their words; each group is merged
+into one record that keeps every source URL.
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from urllib.parse import urlparse
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .keyword_matcher import words
+from .locations import resolve_location
+from .url_canon import url_hash, url_key
+
+# 20 bands of 3 rows: pairs with ~0.4 shingle overlap or more almost always share a bucket
+BANDS = 20
+ROWS = 3
+PRIME = (1 << 31) - 1
+
+# Title word overlap (Jaccard) at which two postings are the same role
+TITLE_THRESHOLD = 0.8
+
+COMPANY_SUFFIXES = {'inc', 'ltd', 'limited', 'llc', 'pty', 'corp', 'corporation', 'co', 'company', 'gmbh',
+                    'plc', 'group', 'holdings', 'technologies', 'technology', 'labs', 'ai', 'hq'}
+TITLE_NOISE = {'m', 'f', 'd', 'x', 'w', 'and', 'of', 'the', 'for', 'in'}
+
+
+def dedupe_by_url(jobs: Iterable[Dict], seen: Optional[Set[int]] = None) -> List[Dict]:
+    """
+    Keep the first job for each posting URL, dropping jobs without one.
+
+    Args:
+        jobs: Jobs in priority order
+        seen: ``url_hash`` values already kept; updated in place so batches
+            that stream in can be de-duplicated against everything before them
+    """
+    seen = set() if seen is None else seen
+    unique = []
+    for job in jobs:
+        url = job.get('url', '')
+        if not url:
+            continue
+        key = url_hash(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(job)
+    return unique
+
+
+def company_words(name: str) -> FrozenSet[str]:
+    """Company name words without legal suffixes ("Canva Pty Ltd" -> {"canva"})."""
+    found = frozenset(words(name or ''))
+    return (found - COMPANY_SUFFIXES) or found
+
+
+def title_words(title: str) -> FrozenSet[str]:
+    """Title words without gender markers and filler ("m/f/d", "of")."""
+    return frozenset(words(title or '')) - TITLE_NOISE
+
+
+def job_shingles(job: Dict) -> FrozenSet[str]:
+    """Tagged title, company and location shingles of a job."""
+    return key_shingles(job_key(job))
+
+
+def key_shingles(key: "JobKey") -> FrozenSet[str]:
+    location = {f"l:{w}" for part in (key.city, key.country) if part for w in words(part)}
+    return frozenset({f"t:{w}" for w in key.title} | {f"c:{w}" for w in key.company} | location)
+
+
+@lru_cache(maxsize=65536)
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big') % PRIME
+
+
+class MinHasher:
+    """MinHash signatures from ``BANDS * ROWS`` seeded universal hash functions."""
+
+    def __init__(self, bands: int = BANDS, rows: int = ROWS, seed: int = 1):
+        self.bands, self.rows = bands, rows
+        size = bands * rows
+        # Fixed linear-congruential coefficients so signatures are stable across runs
+        state = seed
+        coefficients = []
+        for _ in range(2 * size):
+            state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            coefficients.append(state % (PRIME - 1) + 1)
+        self.a, self.b = coefficients[:size], coefficients[size:]
+        if NUMPY_AVAILABLE:
+            self._a = np.array(self.a, dtype=np.uint64)[:, None]
+            self._b = np.array(self.b, dtype=np.uint64)[:, None]
+
+    def signature(self, shingles: Iterable[str]) -> Tuple[int, ...]:
+        """Minimum of each hash function over the shingles."""
+        hashes = [_shingle_hash(s) for s in shingles] or [0]
+        if NUMPY_AVAILABLE:
+            values = (self._a * np.array(hashes, dtype=np.uint64)[None, :] + self._b) % PRIME
+            return tuple(values.min(axis=1).tolist())
+        return tuple(min((a * h + b) % PRIME for h in hashes) for a, b in zip(self.a, self.b))
+
+    def band_keys(self, signature: Sequence[int]) -> List[Tuple]:
+        """One bucket key per band."""
+        return [(band, tuple(signature[band * self.rows:(band + 1) * self.rows])) for band in range(self.bands)]
+
+
+class JobKey(NamedTuple):
+    """What duplicate checks compare, computed once per job."""
+    host: str
+    company: FrozenSet[str]
+    city: Optional[str]
+    country: Optional[str]
+    title: FrozenSet[str]
+
+
+def job_key(job: Dict) -> JobKey:
+    host = urlparse(job.get('url') or '').netloc.lower()
+    place = resolve_location(job.get('location') or '')
+    return JobKey(host[4:] if host.startswith('www.') else host,
+                  company_words(job.get('company') or job.get('source') or ''),
+                  place.city, place.country, title_words(job.get('title')))
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def _same_role(a: JobKey, b: JobKey, threshold: float) -> bool:
+    if a.host and a.host == b.host:
+        return False
+    if a.company and b.company and not a.company & b.company:
+        return False
+    if a.city and b.city and a.city != b.city:
+        return False
+    if a.country and b.country and a.country != b.country:
+        return False
+    return _jaccard(a.title, b.title) >= threshold
+
+
+def is_near_duplicate(a: Dict, b: Dict, threshold: float = TITLE_THRESHOLD) -> bool:
+    """Different sites, same company, compatible locations and mostly the same title words."""
+    return _same_role(job_key(a), job_key(b), threshold)
+
+
+def find_near_duplicates(jobs: List[Dict], threshold: float = TITLE_THRESHOLD,
+                         hasher: Optional[MinHasher] = None) -> List[List[int]]:
+    """
+    Groups of indexes of jobs that are the same role, in input order.
+
+    Jobs with the same URL key are always grouped; every other pair is only
+    compared when LSH puts both in a bucket.
+    """
+    hasher = hasher or MinHasher()
+    parent = list(range(len(jobs)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int):
+        i, j = find(i), find(j)
+        if i != j:
+            parent[max(i, j)] = min(i, j)
+
+    keys = [job_key(job) for job in jobs]
+    by_url: Dict[int, int] = {}
+    buckets: Dict[Tuple, List[int]] = {}
+    signatures: Dict[FrozenSet[str], List[Tuple]] = {}
+    for i, job in enumerate(jobs):
+        url = job.get('url')
+        if url:
+            union(by_url.setdefault(url_hash(url), i), i)
+        shingles = key_shingles(keys[i])
+        if shingles not in signatures:
+            signatures[shingles] = hasher.band_keys(hasher.signature(shingles))
+        # Duplicates must share a company word, so buckets are per company word;
+        # otherwise common titles in one city would fill a bucket across companies
+        for block in keys[i].company or ('',):
+            for key in signatures[shingles]:
+                buckets.setdefault((block, key), []).append(i)
+
+    checked: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        by_host: Dict[str, List[int]] = {}
+        for i in members:
+            by_host.setdefault(keys[i].host, []).append(i)
+        hosts = list(by_host.values())
+        for x, group in enumerate(hosts):
+            # Only pairs across sites (or without a URL) can be duplicates
+            pairs = [(i, j) for i in group for other in hosts[x + 1:] for j in other]
+            if not keys[group[0]].host:
+                pairs.extend((i, j) for y, i in enumerate(group) for j in group[y + 1:])
+            for i, j in pairs:
+                pair = (min(i, j), max(i, j))
+                if pair in checked or find(i) == find(j):
+                    continue
+                checked.add(pair)
+                if _same_role(keys[i], keys[j], threshold):
+                    union(i, j)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(jobs)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+def merge_jobs(group: List[Dict]) -> Dict:
+    """
+    One canonical record for a group of duplicate postings.
+
+    The first job wins, missing fields are filled from the others, and
+    ``source_urls`` lists every distinct posting URL in order.
+    """
+    merged = dict(group[0])
+    for job in group[1:]:
+        for field, value in job.items():
+            if merged.get(field) in (None, '', []) and value not in (None, '', []):
+                merged[field] = value
+    urls, keys = [], set()
+    for job in group:
+        for url in job.get('source_urls') or [job.get('url')]:
+            if url and url_key(url) not in keys:
+                keys.add(url_key(url))
+                urls.append(url)
+    merged['source_urls'] = urls
+    return merged
+
+
+def merge_near_duplicates(jobs: List[Dict], threshold: float = TITLE_THRESHOLD) -> List[Dict]:
+    """
+    Collapse near-duplicate postings into canonical records.
+
+    Args:
+        jobs: Jobs in priority order (the first of each group is kept as the base)
+        threshold: Title word overlap at which two postings are the same role
+
+    Returns:
+        One job per group in input order; merged records carry ``source_urls``
+    """
+    return [jobs[group[0]] if len(group) == 1 else merge_jobs([jobs[i] for i in group])
+            for group in find_near_duplicates(jobs, threshold)]
@@ -0,0 +1,276 @@
+"""Local profile-to-job matching with the weighted model from the config.
+
+Scores follow the same model the matching prompt asks Claude for, weighted
+by the ``matching`` section of ``config/config.json``:
+
+- skills (0.4): how much of the job's requirements the profile's skills cover
+- experience (0.3): years against any stated minimum, seniority level of the
+  title against the profile's, and overlap of the title with past and
+  desired roles
+- education (0.15): highest degree against any degree the job asks for
+- location (0.15): job location against the preferred locations and remote
+  preference, via the location gazetteer
+
+Everything about the profile is precomputed once into ``ProfileFeatures``
+(word sets, levels, resolved locations), and per-job text features are
+memoized since titles, locations and requirement lines repeat across boards,
+so a job costs a few set intersections. ``match_batch`` stacks the four
+components into a matrix and applies the weights in one product when NumPy
+is installed.
+"""
+
+import json
+import re
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .keyword_matcher import JUNIOR_MATCHER, KeywordMatcher, words
+from .locations import resolve_location
+from .ranking import STOPWORDS, job_requirements
+
+COMPONENTS = ("skills", "experience", "education", "location")
+
+DEFAULT_WEIGHTS = {"skills": 0.4, "experience": 0.3, "education": 0.15, "location": 0.15}
+
+# Component -> key in the config's ``matching`` section
+CONFIG_KEYS = {"skills": "skill_weight", "experience": "experience_weight",
+               "education": "education_weight", "location": "location_weight"}
+
+# Title seniority, highest level first; a title takes the first level it matches
+LEVELS = [
+    (4, ["chief", "cto", "ceo", "coo", "cfo", "cpo", "cro", "vp", "vice president", "president",
+         "founder", "co founder", "general manager", "gm", "managing director"]),
+    (3, ["head of", "head", "director"]),
+    (2, ["manager", "lead", "leader", "senior", "principal", "staff"]),
+]
+LEVEL_MATCHERS = [(level, KeywordMatcher(keywords)) for level, keywords in LEVELS]
+DEFAULT_LEVEL = 1
+
+# Degree level, highest first
+DEGREES = [
+    (3, ["phd", "ph d", "doctorate", "doctoral"]),
+    (2, ["master", "masters", "mba", "msc", "m sc"]),
+    (1, ["bachelor", "bachelors", "degree", "bsc", "b sc", "beng", "undergraduate"]),
+]
+DEGREE_MATCHERS = [(level, KeywordMatcher(keywords)) for level, keywords in DEGREES]
+
+YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:years|yrs)", re.IGNORECASE)
+YEAR_RE = re.compile(r"(19|20)\d{2}")
+
+# Profile skill phrases found in a job without listed requirements that count as full coverage
+SKILL_HITS_FOR_FULL = 5
+
+
+def load_weights(config_path: str = "./config/config.json") -> Dict[str, float]:
+    """Component weights from the config's ``matching`` section, over the defaults."""
+    weights = dict(DEFAULT_WEIGHTS)
+    path = Path(config_path)
+    if path.exists():
+        with open(path) as f:
+            matching = json.load(f).get('matching', {})
+        for name, key in CONFIG_KEYS.items():
+            weights[name] = matching.get(key, weights[name])
+    return weights
+
+
+def content_words(text: str) -> FrozenSet[str]:
+    """Words of ``text`` without stopwords."""
+    return frozenset(words(text)) - STOPWORDS
+
+
+@lru_cache(maxsize=65536)
+def _content_words(text: str) -> FrozenSet[str]:
+    return content_words(text)
+
+
+@lru_cache(maxsize=65536)
+def title_level(title: str) -> int:
+    """Seniority level of a title: 4 C-level/VP, 3 head/director, 2 manager/lead, 1 other, 0 junior."""
+    if JUNIOR_MATCHER.matches(title):
+        return 0
+    for level, matcher in LEVEL_MATCHERS:
+        if matcher.matches(title):
+            return level
+    return DEFAULT_LEVEL
+
+
+def degree_level(text: str) -> int:
+    """Highest degree mentioned in ``text`` (3 doctorate, 2 master's, 1 bachelor's, 0 none)."""
+    for level, matcher in DEGREE_MATCHERS:
+        if matcher.matches(text):
+            return level
+    return 0
+
+
+def required_years(text: str) -> int:
+    """Largest "N+ years" stated in ``text`` (0 if none)."""
+    return max((int(n) for n in YEARS_RE.findall(text)), default=0)
+
+
+def career_years(experience: Iterable[Dict], now: Optional[int] = None) -> int:
+    """Years from the earliest start date to the latest end date ("Present" is now)."""
+    now = now or datetime.now().year
+    starts, ends = [], []
+    for role in experience:
+        start = YEAR_RE.search(str(role.get('start_date') or ''))
+        end = YEAR_RE.search(str(role.get('end_date') or ''))
+        if start:
+            starts.append(int(start.group()))
+            ends.append(int(end.group()) if end else now)
+    return max(ends) - min(starts) if starts else 0
+
+
+class ProfileFeatures:
+    """Everything the matcher needs from a profile, computed once."""
+
+    def __init__(self, profile: Dict[str, Any]):
+        """
+        Args:
+            profile: Profile dict as stored by ``ProfileManager`` or extracted to
+                ``data/profile_extracted.json``
+        """
+        skills = profile.get('skills') or {}
+        if isinstance(skills, dict):
+            skills = [s for group in ('technical', 'soft', 'certifications') for s in skills.get(group, [])]
+        skills = list(skills)
+        for project in profile.get('projects') or []:
+            skills.extend(project.get('technologies') or [])
+        self.skill_phrases = KeywordMatcher(skills)
+        self.skill_words = frozenset().union(*(content_words(s) for s in skills))
+
+        experience = profile.get('experience') or []
+        preferences = profile.get('preferences') or {}
+        self.years = career_years(experience) if experience and isinstance(experience, list) \
+            else int(profile.get('experience_years') or 0)
+        titles = [role.get('title') or '' for role in experience if isinstance(role, dict)]
+        self.level = max((title_level(t) for t in titles), default=DEFAULT_LEVEL)
+        roles = titles + list(preferences.get('desired_roles') or profile.get('desired_roles') or [])
+        self.role_words = frozenset().union(*(content_words(r) for r in roles))
+
+        self.degree = max((degree_level(f"{e.get('degree', '')} {e.get('field', '')}")
+                           for e in profile.get('education') or [] if isinstance(e, dict)), default=0)
+
+        locations = preferences.get('locations') or profile.get('preferred_locations') or []
+        self.locations = [resolve_location(text) for text in locations]
+        remote = preferences.get('remote_preference') or profile.get('remote_preference') or 'hybrid'
+        self.accepts = {'remote', 'hybrid'} if remote in ('remote', 'hybrid', 'flexible') else {'onsite'}
+        self.accepts |= {place.remote_type for place in self.locations if place.remote_type}
+        self.relocate = bool(preferences.get('willing_to_relocate'))
+
+
+class JobMatcher:
+    """Scores jobs against a profile with the config's weighted model."""
+
+    def __init__(self, profile: Optional[Dict] = None, weights: Optional[Dict[str, float]] = None,
+                 config_path: str = "./config/config.json"):
+        """
+        Args:
+            profile: Profile to match against (can also be passed per call)
+            weights: Component weights (defaults to the config's ``matching`` section)
+            config_path: Config file to read weights from
+        """
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or load_weights(config_path))}
+        self._profile: Optional[Dict] = None
+        self.features: Optional[ProfileFeatures] = None
+        if profile is not None:
+            self.set_profile(profile)
+
+    def set_profile(self, profile: Dict):
+        """Precompute the profile's features."""
+        self._profile = profile
+        self.features = ProfileFeatures(profile)
+
+    def _features_for(self, profile: Optional[Dict]) -> ProfileFeatures:
+        if profile is not None and profile is not self._profile:
+            self.set_profile(profile)
+        if self.features is None:
+            raise ValueError("No profile set: pass one to JobMatcher() or set_profile()")
+        return self.features
+
+    def components(self, job: Dict, profile: Optional[Dict] = None) -> Tuple[float, float, float, float]:
+        """Skills, experience, education and location fit of one job, each 0-1."""
+        p = self._features_for(profile)
+        title = job.get('title') or ''
+        description = job.get('description') or job.get('description_snippet') or ''
+        requirements = job_requirements(job)
+
+        # Skills: coverage of each requirement line; without any, the title and
+        # description's overlap with the skills (or enough whole skill phrases)
+        if requirements:
+            covered = 0.0
+            for line in requirements:
+                line_words = _content_words(line)
+                if line_words:
+                    covered += len(line_words & p.skill_words) / len(line_words)
+            skills = covered / len(requirements)
+        else:
+            text = f"{title} {description}"
+            text_words = _content_words(text)
+            overlap = len(text_words & p.skill_words) / len(text_words) if text_words else 0.0
+            skills = max(overlap, min(1.0, len(p.skill_phrases.find(text)) / SKILL_HITS_FOR_FULL))
+
+        # Experience: stated years, seniority gap and role overlap, equally weighted
+        needed = required_years(description) or max((required_years(line) for line in requirements), default=0)
+        years = min(1.0, p.years / needed) if needed else 1.0
+        level = max(0.0, 1.0 - 0.25 * abs(title_level(title) - p.level))
+        title_words = _content_words(title)
+        roles = len(title_words & p.role_words) / len(title_words) if title_words else 0.0
+        experience = (years + level + roles) / 3
+
+        # Education: full marks unless the job asks for a higher degree
+        wanted = max([degree_level(line) for line in requirements] + [degree_level(description)])
+        education = 1.0 if p.degree >= wanted else max(0.0, 1.0 - 0.5 * (wanted - p.degree))
+
+        location = self.location_fit(job.get('location') or '', p)
+        return skills, experience, education, location
+
+    @staticmethod
+    def location_fit(text: str, p: ProfileFeatures) -> float:
+        """1 for a preferred city or an accepted remote setup, 0.8 for a preferred country."""
+        place = resolve_location(text)
+        if place.remote_type in ('remote', 'hybrid') and place.remote_type in p.accepts and not place.city:
+            return 1.0
+        if place.city and any(place.city == pref.city for pref in p.locations):
+            return 1.0
+        if place.country and any(place.country == pref.country for pref in p.locations):
+            return 0.8
+        if not place.country and not place.remote_type:
+            return 0.5  # unknown location
+        return 0.5 if p.relocate else 0.0
+
+    def _result(self, parts: Iterable[float]) -> Dict[str, Any]:
+        breakdown = {name: round(100 * self.weights[name] * part, 1) for name, part in zip(COMPONENTS, parts)}
+        return {"match_score": round(sum(breakdown.values()), 1), "score_breakdown": breakdown}
+
+    def match(self, job: Dict, profile: Optional[Dict] = None) -> Dict[str, Any]:
+        """``{"match_score": 0-100, "score_breakdown": {component: points}}`` for one job."""
+        return self._result(self.components(job, profile))
+
+    def match_batch(self, jobs: List[Dict], profile: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """``match`` for many jobs, with the weighting done as one matrix product."""
+        parts = [self.components(job, profile) for job in jobs]
+        if not NUMPY_AVAILABLE or not jobs:
+            return [self._result(row) for row in parts]
+        weights = 100 * np.array([self.weights[name] for name in COMPONENTS])
+        points = np.round(np.array(parts) * weights, 1)
+        totals = np.round(points.sum(axis=1), 1)
+        return [{"match_score": float(total), "score_breakdown": dict(zip(COMPONENTS, row.tolist()))}
+                for total, row in zip(totals, points)]
+
+    def calculate_match_score(self, profile: Dict, job: Dict) -> float:
+        """Match score (0-100) of one job for a profile."""
+        return self.match(job, profile)["match_score"]
+
+    def rank(self, jobs: List[Dict], profile: Optional[Dict] = None) -> List[Dict]:
+        """Set ``match_score`` and ``score_breakdown`` on every job and return them best first."""
+        for job, result in zip(jobs, self.match_batch(jobs, profile)):
+            job.update(result)
+        return sorted(jobs, key=lambda job: job['match_score'], reverse=True)
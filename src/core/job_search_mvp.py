@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 import hashlib
 from .profile_manager import ProfileManager
+from .locations import resolve_location
+from .ranking import SearchIndex, profile_query
 
 
 class JobSearchMVP:
@@ -100,6 +102,13 @@ class JobSearchMVP:
             )
         ''')
         
+        # DatabaseManager's search_history logs job_title/location instead of query
+        cursor.execute("PRAGMA table_info(search_history)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for column in ('job_title', 'location'):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE search_history ADD COLUMN {column} TEXT")
+        
         conn.commit()
         conn.close()
     
@@ -318,15 +327,103 @@ Example format:
 '''
         return prompt
     
+    def load_known_jobs(self) -> List[Dict]:
+        """Jobs already found: open jobs in the database plus saved search results."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        jobs = [dict(row) for row in conn.execute("SELECT * FROM jobs WHERE status != 'closed'")]
+        conn.close()
+
+        results_path = self.data_dir / "job_search_results.json"
+        if results_path.exists():
+            with open(results_path) as f:
+                jobs.extend(job for job in json.load(f) if isinstance(job, dict))
+        return jobs
+
+    def search_jobs(self, title: str, location: Optional[str] = None, category: str = "all",
+                    limit: int = 20) -> List[Dict]:
+        """
+        Search the jobs already collected (database and saved results) locally.
+
+        Args:
+            title: Free-text query, e.g. "Head of Partnerships Sydney"
+            location: Keep jobs in this location's country, or remote ones
+            category: Extra query words ("all" adds none)
+            limit: Maximum number of jobs returned
+
+        Returns:
+            Matching jobs, best first, each with a ``local_score``
+        """
+        jobs = self.load_known_jobs()
+        target = resolve_location(location or '')
+        if target.country:
+            jobs = [job for job in jobs
+                    if resolve_location(job.get('location') or '').country in (target.country, None)]
+
+        query = [title] if category == "all" else [title, category]
+        results = SearchIndex(self.db_path).rank_jobs(jobs, query, k=limit)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+            INSERT INTO search_history (search_type, job_title, location, results_count, parameters)
+            VALUES (?, ?, ?, ?, ?)
+        ''', ('local', title, location, len(results), json.dumps({'category': category, 'limit': limit})))
+        conn.commit()
+        conn.close()
+        return results
+
+    def shortlist_jobs(self, jobs_path: str = "./data/job_search_results.json",
+                       top_k: int = 50) -> Optional[Path]:
+        """
+        Rank the jobs in ``jobs_path`` locally against the profile and save the top ``top_k``.
+        
+        Uses the BM25 index with the profile's skills and desired roles as the
+        query. Returns the candidates file, or None when there is nothing to
+        rank against (no jobs file, or a profile without skills or roles).
+        """
+        jobs_file = Path(jobs_path)
+        query = profile_query(self.profile_manager.export_for_matching())
+        if not jobs_file.exists() or not query:
+            return None
+        
+        with open(jobs_file) as f:
+            jobs = json.load(f)
+        candidates = SearchIndex(self.db_path).rank_jobs(jobs, query, k=top_k)
+        if not candidates:
+            return None
+        
+        candidates_path = self.data_dir / "job_candidates.json"
+        with open(candidates_path, 'w') as f:
+            json.dump(candidates, f, indent=2)
+        return candidates_path
+    
     def generate_job_matching_prompt(self, profile_path: str = "./data/profile_extracted.json",
-                                    jobs_path: str = "./data/job_search_results.json") -> str:
-        """Generate prompt for job matching and scoring."""
+                                    jobs_path: str = "./data/job_search_results.json",
+                                    top_k: Optional[int] = 50,
+                                    candidates_path: Optional[Path] = None) -> str:
+        """
+        Generate prompt for job matching and scoring.
+        
+        With ``top_k`` set, only the best locally ranked jobs go into the
+        prompt (see ``shortlist_jobs``; pass ``candidates_path`` if it already
+        ran); otherwise Claude reads every job.
+        """
+        if top_k and candidates_path is None:
+            candidates_path = self.shortlist_jobs(jobs_path, top_k)
+        if candidates_path:
+            listings = f"""2. Job Listings: {candidates_path}
+   These are the best jobs (up to {top_k}) from {jobs_path}, pre-ranked locally by keyword relevance
+   to the candidate's skills and desired roles. Each has a "local_score" (0-100, relative to
+   the best match); use it as a starting signal, not as the match score."""
+        else:
+            listings = f"2. Job Listings: {jobs_path}"
+        
         prompt = f'''
 Analyze job matches based on the user's profile and the job listings found.
 
 Input files:
 1. User Profile: {profile_path}
-2. Job Listings: {jobs_path}
+{listings}
 
 For each job, calculate a match score (0-100) based on:
 - Skill alignment (40%): How well do the candidate's skills match requirements?
@@ -578,7 +675,7 @@ Report how many new unique jobs were found.
             "1_parse_resume": self.generate_resume_parse_prompt(),
             "2_search_jobs": self.generate_job_search_prompt(job_title, location),
             "3_research_companies": "Run after job search to research top companies",
-            "4_match_jobs": self.generate_job_matching_prompt(),
+            "4_match_jobs": self.generate_job_matching_prompt(top_k=None),
             "5_grok_search": self.generate_grok_search_prompt(job_title, location),
             "6_grok_import": self.generate_grok_import_prompt(),
             "7_network_discovery": "Run for each target company",
@@ -754,7 +851,7 @@ class PromptExecutor:
         )
         
         prompts["matching"] = self.mvp.save_prompt_to_file(
-            self.mvp.generate_job_matching_prompt(), "4_match_jobs"
+            self.mvp.generate_job_matching_prompt(top_k=None), "4_match_jobs"
         )
         
         prompts["grok"] = self.mvp.save_prompt_to_file(
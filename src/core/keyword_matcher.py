@@ -0,0 +1,132 @@
+"""Word-boundary keyword matching shared by the scrapers and the scorer.
+
+Keywords match whole words only, so 'india' doesn't fire on "Indiana", 'ai'
+doesn't fire on "Chair" and 'sales' doesn't fire on "Salesforce". Text and
+keywords are split into words (punctuation, hyphens and spacing don't
+matter, so 'bd ' and 'go-to-market' behave), a trailing plural 's' is
+ignored on both sides, and every keyword is compiled into one Aho-Corasick
+automaton over words. A text is therefore read once, whatever the number of
+keywords, and distinct texts are memoized since scraped batches repeat the
+same titles and locations.
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Tuple
+
+from .locations import is_apac
+
+GTM_KEYWORDS = [
+    'sales', 'account', 'business development', 'bd', 'bdr', 'sdr',
+    'gtm', 'go-to-market', 'commercial', 'revenue', 'partnerships',
+    'partner', 'customer success', 'solutions', 'presales',
+    'enterprise', 'strategic', 'field'
+]
+
+SENIOR_KEYWORDS = [
+    'director', 'head of', 'vp', 'vice president', 'chief',
+    'manager', 'lead', 'senior', 'principal', 'executive',
+    'enterprise', 'strategic', 'regional'
+]
+
+JUNIOR_KEYWORDS = ['intern', 'graduate', 'entry level', 'coordinator', 'assistant', 'junior', 'trainee']
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_word(word: str) -> str:
+    """Fold a simple plural so "Accounts" matches 'account'."""
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def words(text: str) -> Tuple[str, ...]:
+    """Lower-cased, plural-folded words of ``text``."""
+    return tuple(normalize_word(word) for word in WORD_RE.findall(text.lower()))
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over words for a fixed keyword list."""
+
+    def __init__(self, keywords: Iterable[str], cache_size: int = 65536):
+        """
+        Args:
+            keywords: Keywords or phrases, matched on word boundaries
+            cache_size: Distinct texts whose matches are memoized
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[FrozenSet[str]] = [frozenset()]
+
+        for keyword in self.keywords:
+            state = 0
+            for word in words(keyword):
+                if word not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(frozenset())
+                    self._goto[state][word] = len(self._goto) - 1
+                state = self._goto[state][word]
+            if state:
+                self._out[state] = self._out[state] | {keyword}
+
+        # Breadth-first failure links: the longest proper suffix that is also a prefix
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(word, 0)
+                self._out[child] = self._out[child] | self._out[self._fail[child]]
+
+        self.find = lru_cache(maxsize=cache_size)(self._find)
+
+    def _find(self, text: str) -> FrozenSet[str]:
+        """Keywords occurring as whole words in ``text``."""
+        found: FrozenSet[str] = frozenset()
+        state = 0
+        for word in words(text):
+            while state and word not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(word, 0)
+            if self._out[state]:
+                found = found | self._out[state]
+        return found
+
+    def matches(self, text: str) -> bool:
+        """Whether any keyword occurs in ``text``."""
+        return bool(text) and bool(self.find(text))
+
+    def filter(self, jobs: Iterable[Dict], text: Callable[[Dict], str]) -> List[Dict]:
+        """Jobs whose ``text(job)`` contains any keyword."""
+        return [job for job in jobs if self.matches(text(job))]
+
+
+GTM_MATCHER = KeywordMatcher(GTM_KEYWORDS)
+JUNIOR_MATCHER = KeywordMatcher(JUNIOR_KEYWORDS)
+
+
+def is_gtm_role(title: str) -> bool:
+    """Check if title is a GTM role."""
+    return not JUNIOR_MATCHER.matches(title) and GTM_MATCHER.matches(title)
+
+
+def is_apac_location(text: str) -> bool:
+    """Check if text names an APAC location, or is remote without a non-APAC country."""
+    return is_apac(text)
+
+
+def filter_gtm(jobs: Iterable[Dict]) -> List[Dict]:
+    """Jobs whose title is a GTM role."""
+    return [job for job in jobs if is_gtm_role(job.get('title') or '')]
+
+
+def filter_apac(jobs: Iterable[Dict]) -> List[Dict]:
+    """Jobs whose location (or title, where scrapers put it) is in APAC."""
+    return [job for job in jobs if is_apac(f"{job.get('location') or ''} {job.get('title') or ''}")]
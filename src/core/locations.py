@@ -0,0 +1,419 @@
+"""Offline location normalization backed by a bundled gazetteer.
+
+Scraped locations are free text: "Sydney, New South Wales, Australia",
+"APAC - Remote", "Hybrid (Melbourne)", "Perth, WA". ``normalize_location``
+turns them into ``{city, region, country, remote_type}`` using the
+gazetteer below, compiled once into a word trie. Short upper-case
+abbreviations ("US", "CA", "WA", "NSW") only match when written in capitals,
+so "join us" isn't the United States. Ambiguous names (Perth, Melbourne,
+WA) are settled by the other places in the same string, falling back to
+the first listed meaning.
+
+The same few hundred location strings repeat across runs, so resolutions
+are memoized and filtering on them is a dictionary lookup.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Country -> aliases. Aliases written in capitals only match capitalized text.
+COUNTRIES = {
+    "Australia": ["AU", "AUS"],
+    "New Zealand": ["NZ", "Aotearoa"],
+    "Singapore": ["SG"],
+    "Japan": ["JP"],
+    "South Korea": ["Korea", "Republic of Korea", "KR"],
+    "India": [],
+    "China": ["PRC", "Mainland China"],
+    "Hong Kong": ["HK", "Hong Kong SAR"],
+    "Taiwan": [],
+    "Indonesia": [],
+    "Malaysia": [],
+    "Philippines": [],
+    "Thailand": [],
+    "Vietnam": ["Viet Nam"],
+    "Pakistan": [],
+    "Bangladesh": [],
+    "Sri Lanka": [],
+    "United States": ["US", "USA", "U S", "U S A", "United States of America"],
+    "Canada": [],
+    "Mexico": [],
+    "Brazil": ["Brasil"],
+    "Argentina": [],
+    "Chile": [],
+    "Colombia": [],
+    "United Kingdom": ["UK", "U K", "Great Britain", "Britain"],
+    "Ireland": [],
+    "Germany": ["Deutschland"],
+    "France": [],
+    "Netherlands": ["The Netherlands", "Holland"],
+    "Spain": [],
+    "Portugal": [],
+    "Italy": [],
+    "Switzerland": [],
+    "Sweden": [],
+    "Denmark": [],
+    "Norway": [],
+    "Finland": [],
+    "Poland": [],
+    "Belgium": [],
+    "Austria": [],
+    "Czech Republic": ["Czechia"],
+    "Israel": [],
+    "United Arab Emirates": ["UAE"],
+    "Saudi Arabia": ["KSA"],
+    "South Africa": [],
+    "Nigeria": [],
+    "Kenya": [],
+    "Egypt": [],
+    "Turkey": ["Turkiye"],
+}
+
+APAC_COUNTRIES = {
+    "Australia", "New Zealand", "Singapore", "Japan", "South Korea", "India", "China", "Hong Kong",
+    "Taiwan", "Indonesia", "Malaysia", "Philippines", "Thailand", "Vietnam", "Pakistan", "Bangladesh",
+    "Sri Lanka",
+}
+
+# Region -> (country, aliases)
+REGIONS = {
+    "New South Wales": ("Australia", ["NSW"]),
+    "Victoria": ("Australia", ["VIC"]),
+    "Queensland": ("Australia", ["QLD"]),
+    "Western Australia": ("Australia", ["WA"]),
+    "South Australia": ("Australia", []),
+    "Tasmania": ("Australia", ["TAS"]),
+    "Australian Capital Territory": ("Australia", ["ACT"]),
+    "Northern Territory": ("Australia", []),
+    "California": ("United States", ["CA"]),
+    "New York": ("United States", ["NY"]),
+    "Washington": ("United States", ["WA"]),
+    "Texas": ("United States", ["TX"]),
+    "Massachusetts": ("United States", ["MA"]),
+    "Illinois": ("United States", ["IL"]),
+    "Colorado": ("United States", ["CO"]),
+    "Georgia": ("United States", ["GA"]),
+    "Florida": ("United States", ["FL"]),
+    "Oregon": ("United States", []),
+    "Virginia": ("United States", ["VA"]),
+    "North Carolina": ("United States", ["NC"]),
+    "Utah": ("United States", ["UT"]),
+    "Pennsylvania": ("United States", ["PA"]),
+    "Arizona": ("United States", ["AZ"]),
+    "Minnesota": ("United States", ["MN"]),
+    "Michigan": ("United States", ["MI"]),
+    "Tennessee": ("United States", ["TN"]),
+    "New Jersey": ("United States", ["NJ"]),
+    "District of Columbia": ("United States", ["DC", "D C"]),
+    "Ontario": ("Canada", []),
+    "British Columbia": ("Canada", ["BC"]),
+    "Quebec": ("Canada", ["QC"]),
+    "Alberta": ("Canada", []),
+    "Nova Scotia": ("Canada", []),
+    "Karnataka": ("India", []),
+    "Maharashtra": ("India", []),
+    "Telangana": ("India", []),
+    "Tamil Nadu": ("India", []),
+    "Haryana": ("India", []),
+    "Uttar Pradesh": ("India", []),
+    "England": ("United Kingdom", []),
+    "Scotland": ("United Kingdom", []),
+    "Wales": ("United Kingdom", []),
+    "Northern Ireland": ("United Kingdom", []),
+}
+
+# City -> ([(region, country), ...] most likely first, aliases)
+CITIES = {
+    "Sydney": ([("New South Wales", "Australia"), ("Nova Scotia", "Canada")],
+               ["Parramatta", "North Sydney", "Macquarie Park", "Ultimo", "Chatswood"]),
+    "Melbourne": ([("Victoria", "Australia"), ("Florida", "United States")], []),
+    "Brisbane": ([("Queensland", "Australia")], []),
+    "Perth": ([("Western Australia", "Australia"), ("Scotland", "United Kingdom")], []),
+    "Adelaide": ([("South Australia", "Australia")], []),
+    "Canberra": ([("Australian Capital Territory", "Australia")], []),
+    "Hobart": ([("Tasmania", "Australia")], []),
+    "Darwin": ([("Northern Territory", "Australia")], []),
+    "Gold Coast": ([("Queensland", "Australia")], []),
+    "Newcastle": ([("New South Wales", "Australia"), ("England", "United Kingdom")], []),
+    "Auckland": ([(None, "New Zealand")], []),
+    "Wellington": ([(None, "New Zealand")], []),
+    "Christchurch": ([(None, "New Zealand")], []),
+    "Singapore": ([(None, "Singapore")], []),
+    "Tokyo": ([(None, "Japan")], []),
+    "Osaka": ([(None, "Japan")], []),
+    "Seoul": ([(None, "South Korea")], []),
+    "Busan": ([(None, "South Korea")], []),
+    "Hong Kong": ([(None, "Hong Kong")], []),
+    "Taipei": ([(None, "Taiwan")], []),
+    "Shanghai": ([(None, "China")], []),
+    "Beijing": ([(None, "China")], []),
+    "Shenzhen": ([(None, "China")], []),
+    "Bangalore": ([("Karnataka", "India")], ["Bengaluru"]),
+    "Mumbai": ([("Maharashtra", "India")], ["Bombay"]),
+    "Pune": ([("Maharashtra", "India")], []),
+    "Hyderabad": ([("Telangana", "India")], []),
+    "Chennai": ([("Tamil Nadu", "India")], []),
+    "Delhi": ([(None, "India")], ["New Delhi", "Delhi NCR"]),
+    "Gurgaon": ([("Haryana", "India")], ["Gurugram"]),
+    "Noida": ([("Uttar Pradesh", "India")], []),
+    "Jakarta": ([(None, "Indonesia")], []),
+    "Kuala Lumpur": ([(None, "Malaysia")], ["KL"]),
+    "Manila": ([(None, "Philippines")], []),
+    "Bangkok": ([(None, "Thailand")], []),
+    "Ho Chi Minh City": ([(None, "Vietnam")], ["Saigon"]),
+    "Hanoi": ([(None, "Vietnam")], []),
+    "San Francisco": ([("California", "United States")], ["SF", "Bay Area", "San Francisco Bay Area"]),
+    "San Jose": ([("California", "United States")], []),
+    "Palo Alto": ([("California", "United States")], []),
+    "Mountain View": ([("California", "United States")], []),
+    "Menlo Park": ([("California", "United States")], []),
+    "Sunnyvale": ([("California", "United States")], []),
+    "Oakland": ([("California", "United States")], []),
+    "Los Angeles": ([("California", "United States")], []),
+    "San Diego": ([("California", "United States")], []),
+    "Seattle": ([("Washington", "United States")], []),
+    "Bellevue": ([("Washington", "United States")], []),
+    "Redmond": ([("Washington", "United States")], []),
+    "Portland": ([("Oregon", "United States")], []),
+    "New York": ([("New York", "United States")], ["NYC", "New York City", "Manhattan", "Brooklyn"]),
+    "Boston": ([("Massachusetts", "United States")], []),
+    "Cambridge": ([("Massachusetts", "United States"), ("England", "United Kingdom")], []),
+    "Austin": ([("Texas", "United States")], []),
+    "Dallas": ([("Texas", "United States")], []),
+    "Houston": ([("Texas", "United States")], []),
+    "Chicago": ([("Illinois", "United States")], []),
+    "Denver": ([("Colorado", "United States")], []),
+    "Boulder": ([("Colorado", "United States")], []),
+    "Atlanta": ([("Georgia", "United States")], []),
+    "Miami": ([("Florida", "United States")], []),
+    "Salt Lake City": ([("Utah", "United States")], []),
+    "Phoenix": ([("Arizona", "United States")], []),
+    "Philadelphia": ([("Pennsylvania", "United States")], []),
+    "Pittsburgh": ([("Pennsylvania", "United States")], []),
+    "Minneapolis": ([("Minnesota", "United States")], []),
+    "Detroit": ([("Michigan", "United States")], []),
+    "Raleigh": ([("North Carolina", "United States")], []),
+    "Nashville": ([("Tennessee", "United States")], []),
+    "Toronto": ([("Ontario", "Canada")], []),
+    "Waterloo": ([("Ontario", "Canada")], []),
+    "Ottawa": ([("Ontario", "Canada")], []),
+    "Vancouver": ([("British Columbia", "Canada")], []),
+    "Montreal": ([("Quebec", "Canada")], []),
+    "Calgary": ([("Alberta", "Canada")], []),
+    "London": ([("England", "United Kingdom"), ("Ontario", "Canada")], []),
+    "Manchester": ([("England", "United Kingdom")], []),
+    "Edinburgh": ([("Scotland", "United Kingdom")], []),
+    "Dublin": ([(None, "Ireland")], []),
+    "Berlin": ([(None, "Germany")], []),
+    "Munich": ([(None, "Germany")], ["Munchen"]),
+    "Hamburg": ([(None, "Germany")], []),
+    "Frankfurt": ([(None, "Germany")], []),
+    "Paris": ([(None, "France")], []),
+    "Amsterdam": ([(None, "Netherlands")], []),
+    "Madrid": ([(None, "Spain")], []),
+    "Barcelona": ([(None, "Spain")], []),
+    "Lisbon": ([(None, "Portugal")], ["Lisboa"]),
+    "Milan": ([(None, "Italy")], ["Milano"]),
+    "Rome": ([(None, "Italy")], []),
+    "Zurich": ([(None, "Switzerland")], []),
+    "Geneva": ([(None, "Switzerland")], []),
+    "Stockholm": ([(None, "Sweden")], []),
+    "Copenhagen": ([(None, "Denmark")], []),
+    "Oslo": ([(None, "Norway")], []),
+    "Helsinki": ([(None, "Finland")], []),
+    "Warsaw": ([(None, "Poland")], []),
+    "Brussels": ([(None, "Belgium")], []),
+    "Vienna": ([(None, "Austria")], []),
+    "Prague": ([(None, "Czech Republic")], []),
+    "Tel Aviv": ([(None, "Israel")], []),
+    "Dubai": ([(None, "United Arab Emirates")], []),
+    "Abu Dhabi": ([(None, "United Arab Emirates")], []),
+    "Riyadh": ([(None, "Saudi Arabia")], []),
+    "Cape Town": ([(None, "South Africa")], []),
+    "Johannesburg": ([(None, "South Africa")], []),
+    "Lagos": ([(None, "Nigeria")], []),
+    "Nairobi": ([(None, "Kenya")], []),
+    "Cairo": ([(None, "Egypt")], []),
+    "Istanbul": ([(None, "Turkey")], []),
+    "Sao Paulo": ([(None, "Brazil")], []),
+    "Mexico City": ([(None, "Mexico")], ["CDMX"]),
+    "Buenos Aires": ([(None, "Argentina")], []),
+    "Bogota": ([(None, "Colombia")], []),
+    "Santiago": ([(None, "Chile")], []),
+}
+
+# Multi-country regions -> aliases
+MACRO_REGIONS = {
+    "APAC": ["Asia Pacific", "Asia-Pacific"],
+    "ANZ": ["Australia and New Zealand", "Australia & New Zealand"],
+    "Asia": [],
+    "Southeast Asia": ["South East Asia", "SEA", "SEAsia"],
+    "Oceania": [],
+    "EMEA": [],
+    "Europe": [],
+    "Middle East": ["MENA"],
+    "North America": ["NA", "NAMER"],
+    "LATAM": ["Latin America"],
+    "Americas": [],
+}
+
+APAC_REGIONS = {"APAC", "ANZ", "Asia", "Southeast Asia", "Oceania"}
+
+# Work-arrangement phrases; when several appear the first one wins
+REMOTE_MARKERS = {
+    "remote": ["remote", "remote first", "fully remote", "anywhere", "team anywhere", "work from home",
+               "WFH", "distributed", "telecommute"],
+    "hybrid": ["hybrid", "flexible", "flexible working", "days office", "days in office",
+               "days in the office"],
+    "onsite": ["onsite", "on site", "in office", "office based", "on campus"],
+}
+
+WORD_RE = re.compile(r"[A-Za-z0-9]+")
+
+
+class Place(NamedTuple):
+    """One gazetteer meaning of a name."""
+    kind: str  # "city", "region", "country", "macro" or "remote"
+    city: Optional[str]
+    region: Optional[str]
+    country: Optional[str]
+
+
+class Location(NamedTuple):
+    """A resolved location string."""
+    city: Optional[str]
+    region: Optional[str]
+    country: Optional[str]
+    remote_type: Optional[str]
+    apac: bool
+
+
+def tokenize(text: str) -> List[str]:
+    """Accent-folded words of ``text``, keeping their case."""
+    folded = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode()
+    return WORD_RE.findall(folded)
+
+
+class Gazetteer:
+    """Word trie over every name and alias in the gazetteer tables."""
+
+    def __init__(self):
+        self.root: Dict = {}
+        for country, aliases in COUNTRIES.items():
+            for name in [country] + aliases:
+                self.add(name, Place("country", None, None, country))
+        for region, (country, aliases) in REGIONS.items():
+            for name in [region] + aliases:
+                self.add(name, Place("region", None, region, country))
+        for city, (homes, aliases) in CITIES.items():
+            for name in [city] + aliases:
+                for region, country in homes:
+                    self.add(name, Place("city", city, region, country))
+        for macro, aliases in MACRO_REGIONS.items():
+            for name in [macro] + aliases:
+                self.add(name, Place("macro", None, macro, None))
+        for remote_type, phrases in REMOTE_MARKERS.items():
+            for name in phrases:
+                self.add(name, Place("remote", None, None, remote_type))
+
+    def add(self, name: str, place: Place):
+        node = self.root
+        words = tokenize(name)
+        for word in words:
+            node = node.setdefault(word.lower(), {})
+        # Short all-caps aliases must be written in capitals to count
+        key = "upper" if name.isupper() and len(name.replace(' ', '')) <= 4 else "any"
+        node.setdefault(key, []).append(place)
+
+    def scan(self, text: str) -> List[List[Place]]:
+        """Longest gazetteer matches in reading order, each with its possible meanings."""
+        words = tokenize(text)
+        matches = []
+        i = 0
+        while i < len(words):
+            node, best, end = self.root, None, i
+            for j in range(i, len(words)):
+                node = node.get(words[j].lower())
+                if node is None:
+                    break
+                places = list(node.get("any", []))
+                if "upper" in node and all(word.isupper() for word in words[i:j + 1]):
+                    places += node["upper"]
+                if places:
+                    best, end = places, j + 1
+            if best:
+                matches.append(best)
+                i = end
+            else:
+                i += 1
+        return matches
+
+
+GAZETTEER = Gazetteer()
+
+
+def _pick(places: List[Place], country: Optional[str]) -> Place:
+    """The meaning that fits the chosen country, else the most likely one."""
+    for place in places:
+        if place.country == country:
+            return place
+    return places[0]
+
+
+@lru_cache(maxsize=8192)
+def resolve_location(text: str) -> Location:
+    """Resolve free-text ``text`` against the gazetteer (memoized)."""
+    remote_type = None
+    places: List[List[Place]] = []
+    for match in GAZETTEER.scan(text or ''):
+        if match[0].kind == "remote":
+            remote_type = remote_type or match[0].country
+        else:
+            places.append(match)
+
+    # An explicitly named country wins; otherwise the country most names agree on
+    countries = [match[0].country for match in places if match[0].kind == "country"]
+    country = countries[0] if countries else None
+    if country is None:
+        votes: Dict[str, int] = {}
+        for match in places:
+            for name in dict.fromkeys(p.country for p in match if p.country):
+                votes[name] = votes.get(name, 0) + 1
+        if votes:
+            country = max(votes, key=votes.get)  # ties go to the first named
+
+    city = region = None
+    for match in places:
+        place = _pick(match, country)
+        if place.kind == "city" and city is None and place.country == country:
+            city, region = place.city, place.region
+        elif place.kind == "region" and region is None and place.country == country:
+            region = place.region
+    macros = [match[0].region for match in places if match[0].kind == "macro"]
+    if region is None and country is None and macros:
+        region = macros[0]
+
+    apac = (country in APAC_COUNTRIES or any(name in APAC_COUNTRIES for name in countries)
+            or any(name in APAC_REGIONS for name in macros)
+            or (remote_type == "remote" and country is None and not macros))
+    return Location(city, region, country, remote_type, apac)
+
+
+def normalize_location(text: str) -> Dict[str, Optional[str]]:
+    """``{city, region, country, remote_type}`` for a free-text location."""
+    location = resolve_location(text or '')
+    return {"city": location.city, "region": location.region, "country": location.country,
+            "remote_type": location.remote_type}
+
+
+def format_location(text: str) -> str:
+    """Canonical "City, Region, Country" for a location, or '' if nothing was recognized."""
+    location = resolve_location(text or '')
+    return ", ".join(part for part in (location.city, location.region, location.country) if part)
+
+
+def is_apac(text: str) -> bool:
+    """Whether a location is in APAC, or remote without a country outside it."""
+    return resolve_location(text or '').apac
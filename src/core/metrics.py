@@ -0,0 +1,263 @@
+"""Run-level metrics with OpenMetrics/Prometheus textfile export.
+
+Scrape and ingest runs record into the process-wide ``REGISTRY`` and write
+it out once at the end of the run, e.g. ``data/metrics/universal.prom``.
+Point a node-exporter textfile collector at that directory to get the
+numbers onto dashboards without running a metrics server.
+"""
+
+import math
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_METRICS_DIR = "./data/metrics"
+
+# Seconds; sized for scrape targets that take anywhere from a second to ten minutes
+DURATION_BUCKETS = (1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """A metric family with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...], extra: Optional[Dict[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key)) + list((extra or {}).items())
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in pairs) + "}"
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _matching(self, keys: Iterable[Tuple[str, ...]], labels: Dict[str, str]) -> List[Tuple[str, ...]]:
+        """Keys whose label values include ``labels`` (every key when none are given)."""
+        positions = [(self.labelnames.index(n), str(v)) for n, v in labels.items()]
+        return [key for key in keys if all(key[i] == v for i, v in positions)]
+
+    def clear(self, **labels) -> None:
+        """Drop every series, or only those with these label values."""
+        for key in self._matching(list(self._values), labels):
+            del self._values[key]
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}{self._labels(k)} {_format_value(v)}" for k, v in self._values.items()]
+
+    def family_name(self, openmetrics: bool) -> str:
+        return self.name
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}_total{self._labels(k)} {_format_value(v)}" for k, v in self._values.items()]
+
+    def family_name(self, openmetrics: bool) -> str:
+        # OpenMetrics names the family without the suffix; the Prometheus
+        # text format read by node-exporter wants the sample name
+        return self.name if openmetrics else f"{self.name}_total"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Histogram(_Metric):
+    """Bucketed observations with a running sum and count."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DURATION_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._observations: Dict[Tuple[str, ...], Dict[str, object]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        state = self._observations.setdefault(
+            key, {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0})
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state["counts"][i] += 1
+        state["sum"] += value
+        state["count"] += 1
+
+    def get(self, **labels) -> float:
+        """Number of observations for these labels."""
+        state = self._observations.get(self._key(labels))
+        return float(state["count"]) if state else 0.0
+
+    def clear(self, **labels) -> None:
+        for key in self._matching(list(self._observations), labels):
+            del self._observations[key]
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, state in self._observations.items():
+            for bound, count in zip(self.buckets, state["counts"]):
+                labels = self._labels(key, {"le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{labels} {count}")
+            lines.append(f"{self.name}_count{self._labels(key)} {state['count']}")
+            lines.append(f"{self.name}_sum{self._labels(key)} {_format_value(state['sum'])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them in the text exposition format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"Metric {metric.name} already registered as {existing.type_name}")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DURATION_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self, **labels) -> None:
+        """
+        Drop recorded values but keep the registered families.
+
+        With labels, e.g. ``reset(suite="universal")``, only series carrying
+        those label values are dropped; families without the labels (cache
+        and database counters) are left alone.
+        """
+        for metric in self._metrics.values():
+            if set(labels) <= set(metric.labelnames):
+                metric.clear(**labels)
+
+    def render(self, openmetrics: bool = True) -> str:
+        """Render every family that has samples.
+
+        ``openmetrics=True`` follows the OpenMetrics text format (terminated
+        by ``# EOF``); ``False`` gives the Prometheus 0.0.4 text format.
+        """
+        lines = []
+        for metric in self._metrics.values():
+            samples = metric.samples()
+            if not samples:
+                continue
+            family = metric.family_name(openmetrics)
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.type_name}")
+            lines.extend(samples)
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str, openmetrics: bool = False) -> Path:
+        """Atomically write the registry for a node-exporter textfile collector.
+
+        Defaults to the Prometheus text format, which is what the textfile
+        collector parses. The temp-file-and-rename keeps the collector from
+        ever reading a half-written file.
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        tmp = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w') as f:
+            f.write(self.render(openmetrics=openmetrics))
+        os.replace(tmp, output)
+        return output
+
+
+# Process-wide registry used by the scrapers, database and cache
+REGISTRY = MetricsRegistry()
+
+# ============= SCRAPE METRICS =============
+
+JOBS_FOUND = REGISTRY.gauge(
+    "jobsearch_target_jobs_found", "Jobs found for a target in the last run", ["suite", "target"])
+TARGET_DURATION = REGISTRY.histogram(
+    "jobsearch_target_duration_seconds", "Wall time spent scraping a target", ["suite", "target"])
+SCRAPE_ERRORS = REGISTRY.counter(
+    "jobsearch_scrape_errors", "Errors raised while scraping a target", ["suite", "target"])
+PAGES_NAVIGATED = REGISTRY.counter(
+    "jobsearch_pages_navigated", "Browser navigations performed", ["suite", "target"])
+RUN_DURATION = REGISTRY.gauge(
+    "jobsearch_run_duration_seconds", "Wall time of the last run", ["suite"])
+RUN_JOBS = REGISTRY.gauge(
+    "jobsearch_run_jobs", "Jobs kept by the last run (unique scraped or newly ingested)", ["suite"])
+LAST_RUN = REGISTRY.gauge(
+    "jobsearch_last_run_timestamp_seconds", "Unix time the last run finished", ["suite"])
+LINKS_CHECKED = REGISTRY.counter(
+    "jobsearch_links_checked", "Stored job URLs validated, by result", ["state"])
+
+# ============= STORAGE METRICS =============
+
+DB_ROWS_INSERTED = REGISTRY.counter(
+    "jobsearch_db_rows_inserted", "Rows inserted into the jobs database", ["table"])
+CACHE_REQUESTS = REGISTRY.counter(
+    "jobsearch_cache_requests", "Cache lookups by result", ["data_type", "result"])
+CACHE_HIT_RATIO = REGISTRY.gauge(
+    "jobsearch_cache_hit_ratio", "Cache hits over lookups in this process", ["data_type"])
+
+
+def record_cache_lookup(data_type: str, hit: bool) -> None:
+    """Count a cache lookup and refresh the hit ratio for its type."""
+    CACHE_REQUESTS.inc(data_type=data_type, result="hit" if hit else "miss")
+    hits = CACHE_REQUESTS.get(data_type=data_type, result="hit")
+    misses = CACHE_REQUESTS.get(data_type=data_type, result="miss")
+    CACHE_HIT_RATIO.set(hits / (hits + misses), data_type=data_type)
+
+
+def write_run_metrics(suite: str, metrics_dir: str = DEFAULT_METRICS_DIR) -> Path:
+    """Write the registry to ``<metrics_dir>/<suite>.prom``."""
+    return REGISTRY.write_textfile(Path(metrics_dir) / f"{suite}.prom")
@@ -0,0 +1,234 @@
+"""Local BM25 ranking of jobs against a profile.
+
+The matching prompt used to hand every scraped job to Claude. This index
+ranks them locally first so only the best few go into the prompt: job title
+(counted twice), description and requirements are tokenized with the same
+word rules as the keyword matcher and stored as postings in the
+``search_docs``/``search_postings`` tables next to the jobs database.
+
+Indexing is incremental: each job is keyed by its URL key (ATS job ID or
+canonical URL) with a content hash, so re-adding an unchanged job costs one
+lookup and a changed one only rewrites its own postings. A query reads just the postings of its
+own terms.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .keyword_matcher import words
+from .url_canon import url_key
+
+# Standard BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Title words count this many times, so a skill in the title beats one in boilerplate
+TITLE_WEIGHT = 2
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it', 'of', 'on', 'or',
+    'our', 'that', 'the', 'their', 'this', 'to', 'we', 'will', 'with', 'you', 'your',
+}
+
+# Fields the index reads; a job is reindexed when any of them changes
+INDEX_FIELDS = ('title', 'description', 'description_snippet', 'requirements')
+
+# SQLite caps the number of bound parameters per statement
+CHUNK = 500
+
+
+def job_key(job: Dict) -> str:
+    """Stable index key for a job: its URL key (ATS job ID or canonical URL), else its id, else company and title."""
+    if job.get('url'):
+        return url_key(job['url'])
+    return job.get('job_id') or f"{job.get('company', '')}|{job.get('title', '')}"
+
+
+def index_hash(job: Dict) -> str:
+    """Hash of the fields the index reads."""
+    content = json.dumps([job.get(name) for name in INDEX_FIELDS], default=str)
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def job_requirements(job: Dict) -> List[str]:
+    """A job's requirements as a list, whether stored as a list or a JSON string."""
+    requirements = job.get('requirements') or []
+    if isinstance(requirements, str):
+        try:
+            requirements = json.loads(requirements)
+        except ValueError:
+            requirements = [requirements]
+    if not isinstance(requirements, list):
+        requirements = [requirements]
+    return [str(r) for r in requirements if r]
+
+
+def job_terms(job: Dict) -> Counter:
+    """Term frequencies of a job's title, description and requirements."""
+    body = " ".join([job.get('description') or job.get('description_snippet') or '',
+                     " ".join(job_requirements(job))])
+    terms = Counter()
+    for word in words(job.get('title') or ''):
+        terms[word] += TITLE_WEIGHT
+    terms.update(words(body))
+    for word in STOPWORDS & terms.keys():
+        del terms[word]
+    return terms
+
+
+def profile_query(profile: Dict) -> List[str]:
+    """Query phrases from ``ProfileManager.export_for_matching()``: skills and desired roles."""
+    return list(profile.get('skills') or []) + list(profile.get('desired_roles') or [])
+
+
+class SearchIndex:
+    """Incrementally maintained BM25 index over jobs, stored in SQLite."""
+
+    def __init__(self, db_path: str = "./data/jobs.db"):
+        """
+        Args:
+            db_path: SQLite file holding the index tables
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.init_database()
+
+    def get_connection(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def init_database(self):
+        """Create the document and postings tables."""
+        conn = self.get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS search_docs (
+                doc_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                length INTEGER NOT NULL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS search_postings (
+                term TEXT NOT NULL,
+                doc_key TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, doc_key)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_search_postings_doc ON search_postings(doc_key)')
+        conn.commit()
+        conn.close()
+
+    def add_jobs(self, jobs: Iterable[Dict]) -> int:
+        """
+        Index new or changed jobs; unchanged ones are skipped.
+
+        Returns:
+            Number of jobs (re)indexed
+        """
+        current: Dict[str, Dict] = {}
+        for job in jobs:
+            current[job_key(job)] = job
+
+        conn = self.get_connection()
+        try:
+            stored: Dict[str, str] = {}
+            keys = list(current)
+            for i in range(0, len(keys), CHUNK):
+                chunk = keys[i:i + CHUNK]
+                stored.update(conn.execute(
+                    f'SELECT doc_key, content_hash FROM search_docs WHERE doc_key IN ({",".join("?" * len(chunk))})',
+                    chunk).fetchall())
+
+            docs, postings = [], []
+            for key, job in current.items():
+                digest = index_hash(job)
+                if stored.get(key) == digest:
+                    continue
+                terms = job_terms(job)
+                docs.append((key, digest, sum(terms.values())))
+                postings.extend((term, key, tf) for term, tf in terms.items())
+
+            conn.executemany('DELETE FROM search_postings WHERE doc_key = ?', [(doc[0],) for doc in docs])
+            conn.executemany('''
+                INSERT INTO search_docs (doc_key, content_hash, length) VALUES (?, ?, ?)
+                ON CONFLICT (doc_key) DO UPDATE SET
+                    content_hash = excluded.content_hash, length = excluded.length
+            ''', docs)
+            conn.executemany('INSERT INTO search_postings (term, doc_key, tf) VALUES (?, ?, ?)', postings)
+            conn.commit()
+        finally:
+            conn.close()
+        return len(docs)
+
+    def remove_jobs(self, jobs: Iterable[Dict]) -> int:
+        """Drop jobs from the index. Returns the number removed."""
+        keys = [(job_key(job),) for job in jobs]
+        conn = self.get_connection()
+        try:
+            before = conn.total_changes
+            conn.executemany('DELETE FROM search_docs WHERE doc_key = ?', keys)
+            removed = conn.total_changes - before
+            conn.executemany('DELETE FROM search_postings WHERE doc_key = ?', keys)
+            conn.commit()
+        finally:
+            conn.close()
+        return removed
+
+    def search(self, query: Iterable[str], k: int = 50,
+               keys: Optional[Iterable[str]] = None) -> List[Tuple[str, float]]:
+        """
+        Best-matching documents for a query.
+
+        Args:
+            query: Query phrases (skills, role titles, ...)
+            k: Number of results
+            keys: Only rank these document keys (corpus statistics still cover the whole index)
+
+        Returns:
+            ``(doc_key, bm25_score)`` pairs, best first; documents matching no term are left out
+        """
+        terms = Counter(word for phrase in query for word in words(phrase) if word not in STOPWORDS)
+        if not terms:
+            return []
+        allowed = set(keys) if keys is not None else None
+
+        conn = self.get_connection()
+        try:
+            total, avg_length = conn.execute('SELECT COUNT(*), AVG(length) FROM search_docs').fetchone()
+            rows = conn.execute(f'''
+                SELECT p.term, p.doc_key, p.tf, d.length
+                FROM search_postings p JOIN search_docs d ON d.doc_key = p.doc_key
+                WHERE p.term IN ({",".join("?" * len(terms))})
+            ''', list(terms)).fetchall()
+        finally:
+            conn.close()
+        if not total:
+            return []
+
+        df = Counter(term for term, _, _, _ in rows)
+        scores: Dict[str, float] = {}
+        for term, key, tf, length in rows:
+            if allowed is not None and key not in allowed:
+                continue
+            idf = math.log(1 + (total - df[term] + 0.5) / (df[term] + 0.5))
+            norm = tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / (avg_length or 1)))
+            scores[key] = scores.get(key, 0.0) + terms[term] * idf * norm
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+    def rank_jobs(self, jobs: List[Dict], query: Iterable[str], k: int = 50) -> List[Dict]:
+        """
+        Index ``jobs`` and return the ``k`` best for ``query``, each with a ``local_score``.
+
+        ``local_score`` is 0-100 relative to the best match in the list.
+        """
+        self.add_jobs(jobs)
+        by_key = {job_key(job): job for job in jobs}
+        results = self.search(query, k=k, keys=by_key)
+        best = results[0][1] if results else 0
+        return [{**by_key[key], 'local_score': round(100 * score / best, 1)} for key, score in results]
@@ -0,0 +1,185 @@
+"""Yield-based target scheduling for time-budgeted scrape runs.
+
+``TargetHistory`` remembers, per target, how many new jobs each run found and
+how long it took. ``TargetScheduler`` turns that into a plan for a run with a
+fixed time budget: targets that are due are ordered by expected new jobs per
+second, each gets a deadline slice, and low-yield targets are only revisited
+on a slower cadence.
+"""
+
+import json
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .url_canon import url_key
+
+# Runs kept per target, and URLs remembered for "is this job new?" checks
+MAX_RUNS = 20
+MAX_SEEN_URLS = 5000
+
+DEFAULT_SCHEDULE = {
+    "ewma_alpha": 0.3,            # weight of the latest run in the yield estimate
+    "default_duration_s": 60,     # assumed run time for targets with no history
+    "min_slice_s": 20,            # never hand a target less than this
+    "slice_slack": 1.5,           # slice = expected duration * slack
+    # Average new jobs per run -> minimum hours between scrapes (first match wins)
+    "cadence": [
+        {"min_new_jobs": 3, "every_hours": 0},
+        {"min_new_jobs": 0.5, "every_hours": 24},
+        {"min_new_jobs": 0, "every_hours": 72},
+    ],
+}
+
+
+def parse_duration(text: str) -> float:
+    """Parse a budget like '90', '45s', '10m', '1h30m' into seconds."""
+    text = str(text).strip().lower()
+    if re.fullmatch(r'\d+(\.\d+)?', text):
+        return float(text)
+
+    parts = re.findall(r'(\d+(?:\.\d+)?)\s*([hms])', text)
+    if not parts or re.sub(r'\d+(?:\.\d+)?\s*[hms]', '', text).strip():
+        raise ValueError(f"Invalid duration '{text}' (use e.g. 90s, 10m, 1h30m)")
+
+    units = {'h': 3600, 'm': 60, 's': 1}
+    return sum(float(value) * units[unit] for value, unit in parts)
+
+
+class TargetHistory:
+    """Per-target run history stored as JSON."""
+
+    def __init__(self, path: str = "./data/target_history.json"):
+        self.path = Path(path)
+        self.data: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self):
+        """Load history from disk, starting fresh if missing or unreadable."""
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self.data = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                self.data = {}
+
+    def save(self):
+        """Persist history to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self.data, f, indent=2)
+
+    def runs(self, name: str) -> List[Dict]:
+        return self.data.get(name, {}).get("runs", [])
+
+    def record(self, name: str, urls: Iterable[str], duration_s: float,
+               timed_out: bool = False, now: Optional[datetime] = None) -> int:
+        """Record a run and return how many of its jobs were not seen before."""
+        entry = self.data.setdefault(name, {"runs": [], "seen_urls": []})
+        # URLs of one posting (tracking parameters, another board) count once
+        seen = {url_key(u) for u in entry["seen_urls"]}
+        by_key: Dict[str, str] = {}
+        for u in urls:
+            if u:
+                by_key.setdefault(url_key(u), u)
+        urls = list(by_key.values())
+        new_urls = [u for key, u in by_key.items() if key not in seen]
+
+        entry["runs"].append({
+            "at": (now or datetime.now()).isoformat(),
+            "jobs": len(urls),
+            "new_jobs": len(new_urls),
+            "duration_s": round(duration_s, 2),
+            "timed_out": timed_out,
+        })
+        entry["runs"] = entry["runs"][-MAX_RUNS:]
+        entry["seen_urls"] = (entry["seen_urls"] + new_urls)[-MAX_SEEN_URLS:]
+
+        self.save()
+        return len(new_urls)
+
+
+class TargetScheduler:
+    """Plan which targets to scrape, in what order, within a time budget."""
+
+    def __init__(self, history: TargetHistory, schedule: Optional[Dict] = None):
+        self.history = history
+        self.schedule = {**DEFAULT_SCHEDULE, **(schedule or {})}
+
+    def _ewma(self, values: List[float]) -> Optional[float]:
+        if not values:
+            return None
+        alpha = self.schedule["ewma_alpha"]
+        estimate = values[0]
+        for value in values[1:]:
+            estimate = alpha * value + (1 - alpha) * estimate
+        return estimate
+
+    def expected_duration(self, name: str) -> float:
+        durations = [r["duration_s"] for r in self.history.runs(name)]
+        return self._ewma(durations) or self.schedule["default_duration_s"]
+
+    def expected_yield(self, name: str) -> Optional[float]:
+        """Expected new jobs per second, or None for targets with no history."""
+        rates = [r["new_jobs"] / max(r["duration_s"], 1.0) for r in self.history.runs(name)]
+        return self._ewma(rates)
+
+    def interval_hours(self, target: Dict) -> float:
+        """Minimum hours between scrapes for a target."""
+        if "every_hours" in target:
+            return float(target["every_hours"])
+
+        runs = self.history.runs(target.get("name", ""))
+        if not runs:
+            return 0.0
+        # The first run finds every job "new", so judge on the later ones
+        recent = runs[1:] or runs
+        avg_new = sum(r["new_jobs"] for r in recent) / len(recent)
+        for tier in self.schedule["cadence"]:
+            if avg_new >= tier["min_new_jobs"]:
+                return float(tier["every_hours"])
+        return float(self.schedule["cadence"][-1]["every_hours"])
+
+    def next_due(self, target: Dict) -> Optional[datetime]:
+        """When the target is next due, or None if it has never run."""
+        runs = self.history.runs(target.get("name", ""))
+        if not runs:
+            return None
+        last = datetime.fromisoformat(runs[-1]["at"])
+        return last + timedelta(hours=self.interval_hours(target))
+
+    def is_due(self, target: Dict, now: Optional[datetime] = None) -> bool:
+        due = self.next_due(target)
+        return due is None or due <= (now or datetime.now())
+
+    def plan(self, targets: List[Dict], budget_s: float,
+             now: Optional[datetime] = None) -> Tuple[List[Tuple[Dict, float]], List[Dict]]:
+        """Order due targets by expected yield and give each a deadline slice.
+
+        Returns ``(planned, deferred)`` where ``planned`` is a list of
+        ``(target, slice_seconds)`` and ``deferred`` holds targets that are
+        not due yet or did not fit in the budget.
+        """
+        due = [t for t in targets if self.is_due(t, now)]
+        deferred = [t for t in targets if t not in due]
+
+        # Never-scraped targets go first so they get a yield estimate
+        def priority(target):
+            rate = self.expected_yield(target.get("name", ""))
+            return (rate is not None, -(rate or 0.0))
+        due.sort(key=priority)
+
+        planned = []
+        remaining = budget_s
+        min_slice = self.schedule["min_slice_s"]
+        for target in due:
+            if remaining < min_slice:
+                deferred.append(target)
+                continue
+            wanted = self.expected_duration(target.get("name", "")) * self.schedule["slice_slack"]
+            slice_s = min(remaining, max(min_slice, wanted))
+            planned.append((target, slice_s))
+            remaining -= slice_s
+
+        return planned, deferred
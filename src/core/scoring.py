@@ -0,0 +1,259 @@
+"""Keyword-rule match scoring shared by every scraper.
+
+The rules (seniority tiers, title boosts, location boosts and penalties)
+are compiled into one word-boundary ``KeywordMatcher`` automaton per job
+field, so scoring a job is a single scan of its title and one of its
+location instead of a substring test per keyword. ``score_batch`` goes further and scans each distinct
+title and location of a batch only once, and with NumPy installed a
+``FeatureMatrix`` keeps the hits so a batch can be rescored under new
+weights without scanning again.
+
+Weights come from the ``matching.rules`` section of ``config/config.json``;
+sections missing there fall back to ``DEFAULT_RULES``::
+
+    "rules": {
+      "base": 50,
+      "seniority": [{"keywords": ["director", "head of"], "weight": 20}, ...],
+      ...
+    }
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .keyword_matcher import KeywordMatcher
+from .locations import resolve_location
+
+# Section -> (job field it reads, "first" = only the first matching group counts, "all" = every group adds)
+SECTIONS = {
+    "seniority": ("title", "first"),
+    "title_boosts": ("title", "all"),
+    "location_boosts": ("location", "first"),
+    "penalties": ("title", "all"),
+}
+
+DEFAULT_RULES = {
+    "base": 50,
+    "min": 0,
+    "max": 100,
+    "seniority": [
+        {"keywords": ["director", "head of", "vp", "chief"], "weight": 20},
+        {"keywords": ["manager", "lead", "leader", "senior"], "weight": 10},
+    ],
+    "title_boosts": [
+        {"keywords": ["enterprise"], "weight": 15},
+        {"keywords": ["account executive"], "weight": 15},
+        {"keywords": ["partner", "partnerships"], "weight": 10},
+        {"keywords": ["sales"], "weight": 10},
+        {"keywords": ["gtm"], "weight": 15},
+        {"keywords": ["ai", "ml"], "weight": 15},
+    ],
+    "location_boosts": [
+        {"keywords": ["sydney"], "weight": 10},
+        {"keywords": ["australia"], "weight": 5},
+        {"keywords": ["remote"], "weight": 5},
+    ],
+    "penalties": [
+        {"keywords": ["intern", "graduate", "entry level", "coordinator", "assistant", "junior", "trainee"],
+         "weight": -30},
+    ],
+}
+
+def load_rules(config_path: str = "./config/config.json") -> Dict:
+    """Scoring rules from the config's ``matching.rules``, over the defaults."""
+    rules = dict(DEFAULT_RULES)
+    path = Path(config_path)
+    if path.exists():
+        with open(path) as f:
+            rules.update(json.load(f).get('matching', {}).get('rules', {}))
+    return rules
+
+
+class MatchScorer:
+    """Scores jobs against a compiled rule set."""
+
+    def __init__(self, rules: Optional[Dict] = None):
+        """
+        Args:
+            rules: Rule dict shaped like ``DEFAULT_RULES`` (defaults to ``load_rules()``)
+        """
+        rules = load_rules() if rules is None else {**DEFAULT_RULES, **rules}
+        self.base = rules.get("base", 50)
+        self.min = rules.get("min", 0)
+        self.max = rules.get("max", 100)
+
+        # Every rule group gets one bit; a job's hits reduce to one mask per field
+        self.sections: List[Tuple[str, List[Tuple[int, int]]]] = []  # (mode, [(bit, weight), ...])
+        group_bits: Dict[str, Dict[str, int]] = {}  # field -> keyword -> bits of its groups
+        self.group_keywords: Dict[int, Set[str]] = {}
+        bit = 1
+        for section, (field, mode) in SECTIONS.items():
+            groups = []
+            for group in rules.get(section, []):
+                for kw in group["keywords"]:
+                    bits = group_bits.setdefault(field, {})
+                    bits[kw.lower()] = bits.get(kw.lower(), 0) | bit
+                groups.append((bit, group["weight"]))
+                self.group_keywords[bit] = {kw.lower() for kw in group["keywords"]}
+                bit <<= 1
+            self.sections.append((mode, groups))
+
+        self.matchers: Dict[str, KeywordMatcher] = {}
+        self.masks: Dict[str, Dict[str, int]] = {}
+        for field, bits in group_bits.items():
+            self.matchers[field] = KeywordMatcher(bits)
+            self.masks[field] = bits
+        self._scores: Dict[int, int] = {}
+
+    def field_mask(self, field: str, text: str) -> int:
+        """Rule groups matched by one field's text."""
+        if field == "location":
+            # "Hybrid (Melbourne)" should earn the 'australia' boost too
+            place = resolve_location(text)
+            text = " ".join(filter(None, [text, place.city, place.region, place.country, place.remote_type]))
+        masks = self.masks[field]
+        mask = 0
+        for kw in self.matchers[field].find(text):
+            mask |= masks[kw]
+        return mask
+
+    def score_mask(self, mask: int) -> int:
+        """Score for a combination of matched rule groups."""
+        if mask not in self._scores:
+            score = self.base
+            for mode, groups in self.sections:
+                for bit, weight in groups:
+                    if mask & bit:
+                        score += weight
+                        if mode == "first":
+                            break
+            self._scores[mask] = min(self.max, max(self.min, score))
+        return self._scores[mask]
+
+    def score(self, job: Dict) -> int:
+        """Match score (0-100 by default) for one job."""
+        mask = 0
+        for field in self.matchers:
+            text = job.get(field)
+            if text:
+                mask |= self.field_mask(field, text)
+        return self.score_mask(mask)
+
+    def score_batch(self, jobs: List[Dict]) -> List[int]:
+        """
+        Scores for many jobs, scanning each distinct field value once.
+
+        Scraped batches repeat themselves heavily (a few dozen locations,
+        titles shared across boards), so this is the fast path for big runs.
+        """
+        return [self.score_mask(mask) for mask in self.job_masks(jobs)]
+
+    def job_masks(self, jobs: List[Dict]) -> List[int]:
+        """Matched rule groups per job, scanning each distinct field value once."""
+        masks = [0] * len(jobs)
+        for field in self.matchers:
+            texts = [job.get(field) or '' for job in jobs]
+            by_text = {text: self.field_mask(field, text) for text in set(texts)}
+            for i, text in enumerate(texts):
+                masks[i] |= by_text[text]
+        return masks
+
+    def features(self, mask: int) -> List[int]:
+        """Group bits of a mask that add to the score, as 0/1 per group in rule order."""
+        row = []
+        for mode, groups in self.sections:
+            counted = False
+            for bit, _ in groups:
+                hit = bool(mask & bit) and not counted
+                row.append(int(hit))
+                counted = counted or (hit and mode == "first")
+        return row
+
+    def weights(self, rules: Optional[Dict] = None) -> List[int]:
+        """
+        Weight per group in rule order, for these rules or another set with the same keywords.
+
+        Raises:
+            ValueError: if ``rules`` groups keywords differently, since the
+                features would then have to be rebuilt
+        """
+        if rules is None:
+            return [weight for _, groups in self.sections for _, weight in groups]
+        rules = {**DEFAULT_RULES, **rules}
+        weights = []
+        for section, (_, groups) in zip(SECTIONS, self.sections):
+            other = rules.get(section, [])
+            if [{kw.lower() for kw in group["keywords"]} for group in other] != \
+                    [self.group_keywords[bit] for bit, _ in groups]:
+                raise ValueError(f"Rules for '{section}' use different keywords; build a new scorer")
+            weights.extend(group["weight"] for group in other)
+        return weights
+
+
+class FeatureMatrix:
+    """
+    Keyword-hit features of a job list, built once and scored under any weights.
+
+    Rows are the distinct combinations of matched rule groups (a few hundred
+    even for 100k jobs), columns are the rule groups, and every job points at
+    its row. Rescoring under new weights or another profile's rules is one
+    matrix-vector product, with no string scanning.
+    """
+
+    def __init__(self, jobs: List[Dict], scorer: Optional[MatchScorer] = None):
+        """
+        Args:
+            jobs: Jobs to featurize (title and location are read)
+            scorer: Scorer whose rule groups become the columns (defaults to ``default_scorer()``)
+
+        Raises:
+            ImportError: if NumPy isn't installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("FeatureMatrix needs numpy: pip install numpy")
+        self.scorer = scorer or default_scorer()
+        index: Dict[int, int] = {}
+        self.rows = np.array([index.setdefault(mask, len(index)) for mask in self.scorer.job_masks(jobs)],
+                             dtype=np.int64)
+        self.matrix = np.array([self.scorer.features(mask) for mask in index], dtype=np.int32)
+        self.matrix = self.matrix.reshape(len(index), len(self.scorer.weights()))
+
+    def scores(self, rules: Optional[Dict] = None) -> "np.ndarray":
+        """Score per job under the scorer's weights or another rule set with the same keywords."""
+        base, low, high = self.scorer.base, self.scorer.min, self.scorer.max
+        if rules is not None:
+            # Gaps are filled from DEFAULT_RULES, as MatchScorer and weights() do
+            rules = {**DEFAULT_RULES, **rules}
+            base, low, high = rules["base"], rules["min"], rules["max"]
+        weights = np.array(self.scorer.weights(rules), dtype=np.int32)
+        return np.clip(base + self.matrix @ weights, low, high)[self.rows]
+
+
+@lru_cache(maxsize=None)
+def default_scorer() -> MatchScorer:
+    """Scorer built once from the config file."""
+    return MatchScorer()
+
+
+def calculate_match_score(job: Dict) -> int:
+    """Calculate match score."""
+    return default_scorer().score(job)
+
+
+def score_jobs(jobs: List[Dict]) -> List[Dict]:
+    """Set ``match_score`` on every job in one batch and return the jobs."""
+    if NUMPY_AVAILABLE and jobs:
+        scores = FeatureMatrix(jobs).scores().tolist()
+    else:
+        scores = default_scorer().score_batch(jobs)
+    for job, score in zip(jobs, scores):
+        job['match_score'] = score
+    return jobs
@@ -0,0 +1,223 @@
+"""Persistent record of every job seen, for O(batch) de-duplication.
+
+Each job contributes 64-bit keys: the ``url_hash`` of its URL and a hash of
+its lowercased company and title. The keys live in the ``seen_jobs`` table
+next to the jobs database and in a memory-mapped Bloom filter file beside
+it. A lookup first checks the filter, which answers "never seen" from a few
+bits without touching SQLite; only filter positives (real repeats plus about
+one false positive in a thousand) are confirmed against the table. Checking
+a batch therefore costs the same however many jobs have been recorded.
+
+The filter is sized for its capacity and rebuilt from the table at twice the
+size once it fills, so the false positive rate stays put as history grows.
+"""
+
+import hashlib
+import math
+import mmap
+import sqlite3
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .url_canon import url_hash
+
+MAGIC = b"JOBBLOOM"
+HEADER = struct.Struct("<8sQQQ")  # magic, bits, hash functions, keys added
+
+DEFAULT_CAPACITY = 100_000
+ERROR_RATE = 0.001
+
+# SQLite caps the number of bound parameters per statement
+CHUNK = 500
+
+MASK = (1 << 64) - 1
+
+
+def text_hash(text: str) -> int:
+    """Signed 64-bit hash of a string (fits an SQLite INTEGER)."""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'big', signed=True)
+
+
+def job_keys(job: Dict) -> List[int]:
+    """Keys a job is known by: its URL and its company and title."""
+    keys = [url_hash(job['url'])] if job.get('url') else []
+    company = (job.get('company') or '').strip().lower()
+    title = (job.get('title') or '').strip().lower()
+    if company and title:
+        keys.append(text_hash(f"{company}|{title}"))
+    return keys
+
+
+class BloomFilter:
+    """Bloom filter over 64-bit keys in a memory-mapped file."""
+
+    def __init__(self, path: Path, capacity: int = DEFAULT_CAPACITY, error_rate: float = ERROR_RATE):
+        """
+        Args:
+            path: Filter file; created for ``capacity`` keys if missing
+            capacity: Keys the filter holds at ``error_rate``
+            error_rate: False positive rate at capacity
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            self.create(self.path, capacity, error_rate)
+        self._file = open(self.path, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, self.bits, self.hashes, _ = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a Bloom filter file: {self.path}")
+        self.capacity = int(-self.bits * math.log(2) ** 2 / math.log(error_rate))
+
+    @staticmethod
+    def create(path: Path, capacity: int, error_rate: float = ERROR_RATE):
+        """Write an empty filter sized for ``capacity`` keys."""
+        bits = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        hashes = max(1, round(bits / capacity * math.log(2)))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, bits, hashes, 0))
+            f.truncate(HEADER.size + (bits + 7) // 8)
+
+    @property
+    def count(self) -> int:
+        return HEADER.unpack_from(self._map)[3]
+
+    def _positions(self, key: int) -> Iterable[int]:
+        # Double hashing over a splitmix64 mix of the key, so sequential keys spread too
+        h = (key + 0x9E3779B97F4A7C15) & MASK
+        h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+        h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK
+        h ^= h >> 31
+        h1, h2 = h & 0xFFFFFFFF, h >> 32 | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, keys: Iterable[int]) -> int:
+        """Set the bits of each key. Returns how many keys were new to the filter."""
+        added = 0
+        for key in keys:
+            new = False
+            for pos in self._positions(key):
+                offset, bit = HEADER.size + (pos >> 3), 1 << (pos & 7)
+                byte = self._map[offset]
+                if not byte & bit:
+                    self._map[offset] = byte | bit
+                    new = True
+            added += new
+        HEADER.pack_into(self._map, 0, MAGIC, self.bits, self.hashes, self.count + added)
+        self._map.flush()
+        return added
+
+    def __contains__(self, key: int) -> bool:
+        return all(self._map[HEADER.size + (pos >> 3)] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+class SeenJobs:
+    """Every job key seen so far: a Bloom filter in front of an SQLite table."""
+
+    def __init__(self, db_path: str = "./data/jobs.db", bloom_path: Optional[str] = None,
+                 capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            db_path: SQLite file holding the ``seen_jobs`` table
+            bloom_path: Filter file (defaults to ``seen_jobs.bloom`` next to the database)
+            capacity: Initial filter capacity; the filter doubles when full
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.bloom_path = Path(bloom_path) if bloom_path else self.db_path.with_name("seen_jobs.bloom")
+        self.capacity = capacity
+        self.bloom: Optional[BloomFilter] = None
+        self.init_database()
+        if self.bloom_path.exists():
+            self.bloom = BloomFilter(self.bloom_path)
+        else:
+            self.rebuild()
+
+    def get_connection(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def init_database(self):
+        """Create the key table, backfilled from the jobs table the first time."""
+        conn = self.get_connection()
+        try:
+            conn.execute('CREATE TABLE IF NOT EXISTS seen_jobs (job_key INTEGER PRIMARY KEY)')
+            empty = conn.execute('SELECT 1 FROM seen_jobs LIMIT 1').fetchone() is None
+            has_jobs = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'").fetchone()
+            if empty and has_jobs:
+                rows = conn.execute('SELECT url, company, title FROM jobs')
+                conn.executemany('INSERT OR IGNORE INTO seen_jobs (job_key) VALUES (?)',
+                                 ((key,) for url, company, title in rows
+                                  for key in job_keys({"url": url, "company": company, "title": title})))
+                # A filter from before the backfill is missing these keys
+                self.bloom_path.unlink(missing_ok=True)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def rebuild(self, capacity: Optional[int] = None):
+        """Recreate the filter from the table, with room for at least twice its keys."""
+        conn = self.get_connection()
+        try:
+            total = conn.execute('SELECT COUNT(*) FROM seen_jobs').fetchone()[0]
+            capacity = max(capacity or self.capacity, 2 * total)
+            if self.bloom:
+                self.bloom.close()
+            self.bloom_path.unlink(missing_ok=True)
+            BloomFilter.create(self.bloom_path, capacity)
+            self.bloom = BloomFilter(self.bloom_path)
+            self.bloom.add(key for (key,) in conn.execute('SELECT job_key FROM seen_jobs'))
+        finally:
+            conn.close()
+
+    def add(self, jobs: Iterable[Dict]) -> int:
+        """
+        Record jobs as seen.
+
+        Returns:
+            Number of new keys recorded
+        """
+        keys = list({key for job in jobs for key in job_keys(job)})
+        conn = self.get_connection()
+        try:
+            before = conn.total_changes
+            conn.executemany('INSERT OR IGNORE INTO seen_jobs (job_key) VALUES (?)', [(key,) for key in keys])
+            conn.commit()
+            added = conn.total_changes - before
+        finally:
+            conn.close()
+        self.bloom.add(keys)
+        if self.bloom.count > self.bloom.capacity:
+            self.rebuild(2 * self.bloom.capacity)
+        return added
+
+    def seen_keys(self, keys: Iterable[int]) -> Set[int]:
+        """The keys that have been recorded; only filter positives reach SQLite."""
+        maybe = [key for key in set(keys) if key in self.bloom]
+        found: Set[int] = set()
+        if not maybe:
+            return found
+        conn = self.get_connection()
+        try:
+            for i in range(0, len(maybe), CHUNK):
+                chunk = maybe[i:i + CHUNK]
+                found.update(key for (key,) in conn.execute(
+                    f'SELECT job_key FROM seen_jobs WHERE job_key IN ({",".join("?" * len(chunk))})', chunk))
+        finally:
+            conn.close()
+        return found
+
+    def filter_new(self, jobs: Iterable[Dict]) -> List[Dict]:
+        """Jobs none of whose keys have been seen, in order."""
+        keyed = [(job, job_keys(job)) for job in jobs]
+        seen = self.seen_keys(key for _, keys in keyed for key in keys)
+        return [job for job, keys in keyed if not seen.intersection(keys)]
+
+    def close(self):
+        self.bloom.close()
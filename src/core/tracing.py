@@ -0,0 +1,163 @@
+"""Lightweight span tracing for scrape runs with Chrome Trace Event export.
+
+Spans are recorded against the tracer and target that are active in the
+current context, so static scraper helpers can call ``span()`` without any
+plumbing. Outside an active tracer ``span()`` is a no-op.
+
+The written file (``{"traceEvents": [...]}``) opens in chrome://tracing or
+https://ui.perfetto.dev.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Stage names used across the scrape lifecycle, in display order
+STAGES = ["launch", "discover", "navigate", "wait", "paginate", "extract", "post_process", "save"]
+
+_current_tracer: ContextVar[Optional["Tracer"]] = ContextVar("current_tracer", default=None)
+_current_target: ContextVar[str] = ContextVar("current_target", default="")
+
+
+class Tracer:
+    """Collect timed spans and export them as Chrome trace events."""
+
+    def __init__(self, name: str = "scrape"):
+        self.name = name
+        # Metrics label; worker processes add a suffix to ``name`` only
+        self.suite = name
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self.wall_origin = time.time()
+        self._lanes: Dict[str, int] = {}
+        self._metadata: List[Dict[str, Any]] = []
+
+    def _lane(self, target: str) -> int:
+        """Trace viewer row (tid) for a target; 0 is the run itself."""
+        if not target:
+            return 0
+        if target not in self._lanes:
+            self._lanes[target] = len(self._lanes) + 1
+        return self._lanes[target]
+
+    @contextmanager
+    def span(self, name: str, target: Optional[str] = None, **args) -> Iterator[None]:
+        """Time a block of work as one complete ("X") event."""
+        target = _current_target.get() if target is None else target
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.events.append({
+                "name": name,
+                "cat": "target" if name == "target" else "stage",
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6, 1),
+                "dur": round((end - start) * 1e6, 1),
+                "pid": self.pid,
+                "tid": self._lane(target),
+                "args": {"target": target, **args},
+            })
+
+    @contextmanager
+    def target(self, name: str) -> Iterator[None]:
+        """Make this tracer and target current, and time the whole target."""
+        tracer_token = _current_tracer.set(self)
+        target_token = _current_target.set(name)
+        try:
+            with self.span("target", target=name):
+                yield
+        finally:
+            _current_target.reset(target_token)
+            _current_tracer.reset(tracer_token)
+
+    def merge(self, events: List[Dict[str, Any]], wall_origin: float) -> None:
+        """Fold in trace events recorded by another process's tracer."""
+        shift = (wall_origin - self.wall_origin) * 1e6
+        for event in events:
+            if event["ph"] == "X":
+                self.events.append(dict(event, ts=round(event["ts"] + shift, 1)))
+            else:
+                self._metadata.append(event)
+
+    def stage_totals(self) -> Dict[str, Dict[str, float]]:
+        """Seconds spent per stage, grouped by target."""
+        totals: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            target = event["args"].get("target") or "(run)"
+            stages = totals.setdefault(target, {})
+            key = "total" if event["name"] == "target" else event["name"]
+            stages[key] = stages.get(key, 0.0) + event["dur"] / 1e6
+        return totals
+
+    def format_table(self) -> str:
+        """Per-target timing table for run summaries."""
+        totals = self.stage_totals()
+        extra = sorted({s for stages in totals.values() for s in stages} - set(STAGES) - {"total"})
+        columns = STAGES + extra + ["total"]
+
+        lines = [f"   {'Target':<22}" + "".join(f"{c[:9]:>10}" for c in columns)]
+        lines.append("   " + "─" * (22 + 10 * len(columns)))
+        for target, stages in totals.items():
+            cells = "".join(
+                f"{stages[c]:>9.1f}s" if c in stages else f"{'-':>10}" for c in columns
+            )
+            lines.append(f"   {target[:21]:<22}{cells}")
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format document, with named process and per-target rows."""
+        metadata = [{
+            "name": "process_name", "ph": "M", "pid": self.pid, "tid": 0,
+            "args": {"name": self.name},
+        }, {
+            "name": "thread_name", "ph": "M", "pid": self.pid, "tid": 0,
+            "args": {"name": "run"},
+        }]
+        for target, lane in self._lanes.items():
+            metadata.append({
+                "name": "thread_name", "ph": "M", "pid": self.pid, "tid": lane,
+                "args": {"name": target},
+            })
+        return {"traceEvents": metadata + self._metadata + self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> Path:
+        """Write the Chrome trace JSON file."""
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+        return output
+
+
+def current_tracer() -> Optional[Tracer]:
+    """The tracer active in this context, if any."""
+    return _current_tracer.get()
+
+
+def current_suite() -> str:
+    """The suite of the active tracer, or '' when tracing is off."""
+    tracer = _current_tracer.get()
+    return tracer.suite if tracer else ""
+
+
+def current_target() -> str:
+    """The target being scraped in this context, or '' outside a target."""
+    return _current_target.get()
+
+
+@contextmanager
+def span(name: str, **args) -> Iterator[None]:
+    """Time a block against the active tracer; no-op when tracing is off."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield
+        return
+    with tracer.span(name, **args):
+        yield
@@ -0,0 +1,132 @@
+"""Canonical job URLs and 64-bit URL hashes for de-duplication.
+
+Scraped URLs for one posting differ in tracking parameters, trailing
+slashes, scheme, host case, ``www.`` and, for hosted applicant tracking
+systems, in the board or company page the job is reached through. Two levels
+of normalization handle that:
+
+- ``canonical_url`` is still a URL: lowercase scheme and host, no tracking
+  parameters or fragment, and ATS job pages reduced to the job itself
+  (no ``/apply`` suffix or Workday locale)
+- ``url_key`` identifies the job: ``greenhouse:<id>``, ``lever:<uuid>``,
+  ``ashby:<uuid>``, ``getro:<id>``, ``workday:<tenant>:<req>`` or
+  ``linkedin:<id>`` when the URL carries an ATS job ID (so a Getro board, a
+  company page embedding Greenhouse and the Greenhouse board agree), else the
+  canonical URL without scheme and ``www.``
+
+``url_hash`` folds the key to a signed 64-bit integer, small enough to keep
+millions in a set and to store in an SQLite INTEGER column, and ``url_id`` is
+its hex form used as the jobs table ``job_id``.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# Query parameters that track the click rather than identify the job
+TRACKING_PARAMS = {"ref", "source", "src", "trk", "refid", "trackingid", "gh_src", "lever-source",
+                   "lever-origin", "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content"}
+TRACKING_PREFIXES = ("utm_",)
+
+UUID = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+
+# ATS name, host pattern (without "www."), path pattern capturing the job ID; the first match wins
+ATS_RULES = [
+    ("greenhouse", re.compile(r"(?:job-)?boards(?:\.eu)?\.greenhouse\.io"), re.compile(r"/[^/]+/jobs/(\d+)")),
+    ("lever", re.compile(r"jobs(?:\.eu)?\.lever\.co"), re.compile(rf"/[^/]+/({UUID})", re.IGNORECASE)),
+    ("ashby", re.compile(r"jobs\.ashbyhq\.com"), re.compile(rf"/[^/]+/({UUID})", re.IGNORECASE)),
+    ("linkedin", re.compile(r"(?:[a-z]{2}\.)?linkedin\.com"), re.compile(r"/jobs/view/(?:[^/]*-)?(\d+)")),
+    # Getro boards live on each VC's own domain, so only the path identifies them
+    ("getro", re.compile(r".+"), re.compile(r"/companies/[^/]+/jobs/(\d+)")),
+]
+
+# Job IDs carried in the query string of company career pages
+ATS_PARAMS = {"gh_jid": "greenhouse", "ashby_jid": "ashby", "currentjobid": "linkedin"}
+
+WORKDAY_HOST = re.compile(r"^([^.]+)\.wd\d+\.(?:myworkdayjobs|myworkdaysite)\.com$")
+WORKDAY_PATH = re.compile(r"(?:/[a-z]{2}-[A-Z]{2})?/.+?/job/(?:.+/)?[^/]*_([A-Za-z0-9-]+)")
+WORKDAY_LOCALE = re.compile(r"^/[a-z]{2}-[A-Z]{2}(?=/)")
+
+# Trailing path segments that lead to the application form of the same job
+APPLY_SUFFIXES = ("/apply", "/application")
+
+
+def _host(netloc: str) -> str:
+    host = netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _ats_match(host: str, path: str) -> Optional[Tuple[str, str]]:
+    """``(ats, job id)`` for a host without "www." and a URL path."""
+    workday = WORKDAY_HOST.match(host)
+    if workday:
+        match = WORKDAY_PATH.fullmatch(path.rstrip('/'))
+        return ("workday", f"{workday.group(1)}:{match.group(1)}") if match else None
+    for name, host_pattern, path_pattern in ATS_RULES:
+        if host_pattern.fullmatch(host):
+            match = path_pattern.match(path)
+            if match:
+                return name, match.group(1)
+    return None
+
+
+def _tracking(param: str) -> bool:
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=65536)
+def canonical_url(url: str) -> str:
+    """Normalize a job URL so the same posting always gets the same key."""
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    path = parsed.path.rstrip('/')
+    query = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if not _tracking(k)]
+
+    ats = _ats_match(_host(host), path)
+    if ats and ats[0] == "workday":
+        path = WORKDAY_LOCALE.sub('', path)
+    elif ats and ats[0] in ("greenhouse", "lever", "ashby"):
+        for suffix in APPLY_SUFFIXES:
+            if path.endswith(suffix):
+                path = path[:-len(suffix)]
+        if ats[0] == "greenhouse":
+            query = []  # gh_jid repeats the ID in the path
+
+    return urlunparse((parsed.scheme.lower() or "https", host, path or '/', '', urlencode(sorted(query)), ''))
+
+
+def ats_job_id(url: str) -> Optional[str]:
+    """``<ats>:<job id>`` for URLs of a known applicant tracking system, else None."""
+    parsed = urlparse(url.strip())
+    ats = _ats_match(_host(parsed.netloc), parsed.path)
+    if ats:
+        return f"{ats[0]}:{ats[1].lower()}"
+    for key, value in parse_qsl(parsed.query):
+        name = ATS_PARAMS.get(key.lower())
+        if name and value:
+            return f"{name}:{value.lower()}"
+    return None
+
+
+@lru_cache(maxsize=65536)
+def url_key(url: str) -> str:
+    """What identifies the job behind a URL: its ATS job ID, else its canonical URL without scheme or ``www.``."""
+    ats = ats_job_id(url)
+    if ats:
+        return ats
+    parsed = urlparse(canonical_url(url))
+    return urlunparse(('', _host(parsed.netloc), parsed.path, '', parsed.query, '')).lstrip('/')
+
+
+def url_hash(url: str) -> int:
+    """Signed 64-bit hash of ``url_key`` (fits an SQLite INTEGER)."""
+    digest = hashlib.blake2b(url_key(url).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def url_id(url: str) -> str:
+    """Job ID for a URL: ``url_hash`` as 16 hex digits."""
+    return f"{url_hash(url) & 0xFFFFFFFFFFFFFFFF:016x}"
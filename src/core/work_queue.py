@@ -0,0 +1,233 @@
+"""SQLite-backed lease work queue for splitting scrapes across hosts.
+
+Workers on any host that can see the database file claim tasks with a lease.
+A worker keeps its lease alive with heartbeats; if it dies, the lease expires
+after the visibility timeout and another worker picks the task up. Failed
+tasks are retried with backoff until they run out of attempts.
+
+Claims run inside ``BEGIN IMMEDIATE`` transactions, so two workers can never
+lease the same task. The default rollback journal is used rather than WAL
+because WAL needs shared memory and does not work on network filesystems.
+"""
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+TASK_STATUSES = ("pending", "leased", "done", "failed", "collected")
+
+
+@dataclass
+class Task:
+    """A claimed task."""
+    id: int
+    key: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+class WorkQueue:
+    """Durable task queue with leases, heartbeats and retries."""
+
+    def __init__(self, db_path: str = "./data/work_queue.db", visibility_timeout_s: float = 300,
+                 max_attempts: int = 3, retry_backoff_s: float = 60):
+        """
+        Args:
+            db_path: SQLite file, on a filesystem shared by all workers
+            visibility_timeout_s: How long a lease lasts without a heartbeat
+            max_attempts: Claims allowed before a task is marked failed
+            retry_backoff_s: Delay before a failed attempt is retried, doubled per attempt
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.visibility_timeout_s = visibility_timeout_s
+        self.max_attempts = max_attempts
+        self.retry_backoff_s = retry_backoff_s
+        self.init_database()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get a connection in autocommit mode, so transactions are explicit."""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def init_database(self):
+        """Create the tasks table."""
+        conn = self.get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                queue TEXT NOT NULL,
+                key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT DEFAULT 'pending',
+                attempts INTEGER DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                available_at REAL DEFAULT 0,
+                result TEXT,
+                error TEXT,
+                created_at REAL,
+                updated_at REAL,
+                UNIQUE(queue, key)
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks(queue, status, available_at)')
+        conn.close()
+
+    def enqueue(self, key: str, payload: Dict[str, Any], queue: str = "scrape") -> bool:
+        """
+        Add a task, or reset a finished one for a new run.
+
+        Tasks that are pending or currently leased are left alone. Returns
+        True if the task was added or reset.
+        """
+        now = time.time()
+        conn = self.get_connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            cursor = conn.execute('''
+                INSERT OR IGNORE INTO tasks (queue, key, payload, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (queue, key, json.dumps(payload), now, now))
+            changed = cursor.rowcount > 0
+            if not changed:
+                cursor = conn.execute('''
+                    UPDATE tasks SET payload = ?, status = 'pending', attempts = 0, lease_owner = NULL,
+                        lease_expires = NULL, available_at = 0, result = NULL, error = NULL, updated_at = ?
+                    WHERE queue = ? AND key = ? AND status IN ('done', 'failed', 'collected')
+                ''', (json.dumps(payload), now, queue, key))
+                changed = cursor.rowcount > 0
+            conn.execute('COMMIT')
+            return changed
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+    def claim(self, owner: str, queue: str = "scrape") -> Optional[Task]:
+        """Lease the next available task, reclaiming expired leases."""
+        now = time.time()
+        conn = self.get_connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # Expired leases whose worker already used the last attempt are given up on
+            conn.execute('''
+                UPDATE tasks SET status = 'failed', lease_owner = NULL,
+                    error = COALESCE(error, 'lease expired'), updated_at = ?
+                WHERE queue = ? AND status = 'leased' AND lease_expires < ? AND attempts >= ?
+            ''', (now, queue, now, self.max_attempts))
+
+            row = conn.execute('''
+                SELECT id, key, payload, attempts FROM tasks
+                WHERE queue = ? AND (
+                    (status = 'pending' AND available_at <= ?)
+                    OR (status = 'leased' AND lease_expires < ?)
+                )
+                ORDER BY id LIMIT 1
+            ''', (queue, now, now)).fetchone()
+
+            if row is None:
+                conn.execute('COMMIT')
+                return None
+
+            conn.execute('''
+                UPDATE tasks SET status = 'leased', attempts = attempts + 1, lease_owner = ?,
+                    lease_expires = ?, updated_at = ?
+                WHERE id = ?
+            ''', (owner, now + self.visibility_timeout_s, now, row['id']))
+            conn.execute('COMMIT')
+            return Task(row['id'], row['key'], json.loads(row['payload']), row['attempts'] + 1)
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+    def _update_owned(self, task_id: int, owner: str, sql: str, params: tuple) -> bool:
+        """Run an UPDATE on a task only while ``owner`` still holds its lease."""
+        conn = self.get_connection()
+        try:
+            cursor = conn.execute(
+                sql + " WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                params + (task_id, owner))
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def heartbeat(self, task_id: int, owner: str) -> bool:
+        """Extend a lease. Returns False if the lease was lost to another worker."""
+        now = time.time()
+        return self._update_owned(task_id, owner,
+                                  "UPDATE tasks SET lease_expires = ?, updated_at = ?",
+                                  (now + self.visibility_timeout_s, now))
+
+    def complete(self, task_id: int, owner: str, result: Any = None) -> bool:
+        """Mark a task done and store its result."""
+        return self._update_owned(task_id, owner,
+                                  "UPDATE tasks SET status = 'done', lease_owner = NULL, result = ?, error = NULL, updated_at = ?",
+                                  (json.dumps(result), time.time()))
+
+    def fail(self, task_id: int, owner: str, error: str, attempts: int) -> bool:
+        """Release a task for retry with backoff, or mark it failed when out of attempts."""
+        now = time.time()
+        if attempts >= self.max_attempts:
+            return self._update_owned(task_id, owner,
+                                      "UPDATE tasks SET status = 'failed', lease_owner = NULL, error = ?, updated_at = ?",
+                                      (error, now))
+        retry_at = now + self.retry_backoff_s * 2 ** (attempts - 1)
+        return self._update_owned(task_id, owner,
+                                  "UPDATE tasks SET status = 'pending', lease_owner = NULL, lease_expires = NULL, "
+                                  "available_at = ?, error = ?, updated_at = ?",
+                                  (retry_at, error, now))
+
+    def stats(self, queue: str = "scrape") -> Dict[str, int]:
+        """Task counts by status."""
+        conn = self.get_connection()
+        rows = conn.execute(
+            'SELECT status, COUNT(*) AS n FROM tasks WHERE queue = ? GROUP BY status', (queue,)
+        ).fetchall()
+        conn.close()
+        counts = {status: 0 for status in TASK_STATUSES}
+        counts.update({row['status']: row['n'] for row in rows})
+        return counts
+
+    def is_drained(self, queue: str = "scrape") -> bool:
+        """Whether no task is waiting or in progress."""
+        counts = self.stats(queue)
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def tasks(self, queue: str = "scrape", status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Task rows (without payloads or results) for status displays."""
+        conn = self.get_connection()
+        sql = 'SELECT id, key, status, attempts, lease_owner, lease_expires, error FROM tasks WHERE queue = ?'
+        params: tuple = (queue,)
+        if status:
+            sql += ' AND status = ?'
+            params += (status,)
+        rows = conn.execute(sql + ' ORDER BY id', params).fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+    def collect(self, queue: str = "scrape") -> List[Dict[str, Any]]:
+        """Take the results of done tasks, marking them collected so they are read once."""
+        conn = self.get_connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            rows = conn.execute(
+                "SELECT id, key, result FROM tasks WHERE queue = ? AND status = 'done' ORDER BY id", (queue,)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE tasks SET status = 'collected', updated_at = ? WHERE id = ?",
+                [(time.time(), row['id']) for row in rows])
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return [{"key": row['key'], "result": json.loads(row['result'])} for row in rows]
@@ -0,0 +1,368 @@
+"""Shared Chromium session with memory governance for long scrape runs.
+
+One browser is reused across targets (each target still gets its own
+context, so HAR record/replay stays per target). Memory is kept bounded by:
+
+- recycling a target's page after N navigations, or when Chromium's
+  renderer RSS crosses a soft limit;
+- restarting the whole browser when total Chromium RSS crosses a hard cap.
+
+Restarts only happen at checkpoints (between targets, or between pages of
+URL-paginated boards) where the scraper's progress lives in Python, so no
+in-progress target state is lost. Click/scroll pagination calls
+``can_load_more()`` before each step and stops once the page is due for
+recycling or Chromium is over the hard cap, keeping whatever is already
+loaded; the page is then freed with its target. Memory readings are reused
+for ``sample_interval_s``, so these per-step checks don't rescan processes.
+
+The navigation helpers every scraper shares (``navigate``, ``settle`` and
+the per-host ``RATE_LIMITER``) live here too, so a change to how pages are
+loaded reaches every board.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+from urllib.parse import urlparse
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from src.core.metrics import PAGES_NAVIGATED
+from src.core.tracing import current_suite, current_target, span
+from src.scrapers.har import HarConfig
+
+T = TypeVar('T')
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Flags that keep Chromium's footprint down on small VMs
+LOW_MEMORY_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--js-flags=--max-old-space-size=512',
+]
+
+
+class HostRateLimiter:
+    """Minimum spacing between navigations to the same host, across every scraper in the process."""
+
+    def __init__(self, per_host_interval_s: float = 0.0):
+        self.per_host_interval_s = per_host_interval_s
+        self._next_slot: Dict[str, float] = {}
+
+    def configure(self, per_host_interval_s: float = 0.0):
+        """Change the spacing (0 disables the limiter)."""
+        self.per_host_interval_s = per_host_interval_s
+
+    async def wait(self, url: str):
+        """Reserve the host's next slot and sleep until it arrives."""
+        if self.per_host_interval_s <= 0:
+            return
+        host = urlparse(url).netloc.lower()
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, 0.0))
+        self._next_slot[host] = slot + self.per_host_interval_s
+        if slot > now:
+            with span("wait", reason="rate_limit"):
+                await asyncio.sleep(slot - now)
+
+
+# Shared by every scraper, so concurrent targets on one ATS share its budget
+RATE_LIMITER = HostRateLimiter()
+
+
+async def create_browser_context(playwright, har: Optional[HarConfig] = None,
+                                 target_name: str = "") -> Tuple[Browser, BrowserContext]:
+    """Launch a private browser with standard settings, optionally recording or replaying a HAR."""
+    browser = await playwright.chromium.launch(headless=True)
+    har_options = har.context_options(target_name) if har else {}
+    context = await browser.new_context(
+        user_agent=USER_AGENT,
+        viewport={'width': 1920, 'height': 1080},
+        **har_options
+    )
+    if har:
+        await har.attach(context, target_name)
+    return browser, context
+
+
+async def navigate(page: Page, url: str, **kwargs):
+    """Navigate to a URL within the host's rate limit, timed as a 'navigate' span."""
+    await RATE_LIMITER.wait(url)
+    PAGES_NAVIGATED.inc(suite=current_suite() or "unknown", target=current_target() or "unknown")
+    with span("navigate", url=url):
+        return await page.goto(url, **kwargs)
+
+
+async def settle(seconds: float):
+    """Give client-side rendering time to finish, timed as a 'wait' span."""
+    with span("wait", seconds=seconds):
+        await asyncio.sleep(seconds)
+
+
+@dataclass
+class MemoryLimits:
+    """Thresholds in MB; the defaults fit a 2 GB worker VM."""
+    max_navigations_per_page: int = 20
+    renderer_rss_mb: float = 500     # soft: recycle the page
+    browser_rss_mb: float = 1200     # hard: restart the browser
+    sample_interval_s: float = 2.0   # reuse a memory reading for this long
+
+
+def _is_chromium(name: str, cmdline: str) -> bool:
+    text = f"{name} {cmdline}".lower()
+    return 'chrom' in text or 'headless_shell' in text
+
+
+def _descendants_proc(root: int) -> List[Tuple[int, str]]:
+    """(pid, cmdline) of every descendant of ``root``, read from /proc."""
+    children: Dict[int, List[int]] = {}
+    for entry in Path('/proc').iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / 'stat').read_text()
+            # The command name is in parentheses and may contain spaces
+            ppid = int(stat.rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry.name))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    found = []
+    stack = list(children.get(root, []))
+    while stack:
+        pid = stack.pop()
+        try:
+            cmdline = (Path('/proc') / str(pid) / 'cmdline').read_bytes().replace(b'\0', b' ').decode(errors='ignore')
+        except OSError:
+            cmdline = ''
+        found.append((pid, cmdline))
+        stack.extend(children.get(pid, []))
+    return found
+
+
+def _rss_mb_proc(pid: int) -> float:
+    try:
+        for line in (Path('/proc') / str(pid) / 'status').read_text().splitlines():
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0.0
+
+
+def chromium_memory_mb() -> Dict[str, float]:
+    """RSS of the Chromium processes started by this Python process.
+
+    Returns ``{"total": ..., "renderer": ...}`` where ``renderer`` is the
+    largest single renderer process. Both are 0 when process memory can't
+    be read (no psutil and no /proc).
+    """
+    total = renderer = 0.0
+
+    if PSUTIL_AVAILABLE:
+        try:
+            processes = psutil.Process(os.getpid()).children(recursive=True)
+        except psutil.Error:
+            processes = []
+        for proc in processes:
+            try:
+                cmdline = ' '.join(proc.cmdline())
+                if not _is_chromium(proc.name(), cmdline):
+                    continue
+                rss = proc.memory_info().rss / (1024 * 1024)
+            except psutil.Error:
+                continue
+            total += rss
+            if '--type=renderer' in cmdline:
+                renderer = max(renderer, rss)
+    elif Path('/proc/self').exists():
+        for pid, cmdline in _descendants_proc(os.getpid()):
+            if not _is_chromium('', cmdline):
+                continue
+            rss = _rss_mb_proc(pid)
+            total += rss
+            if '--type=renderer' in cmdline:
+                renderer = max(renderer, rss)
+
+    return {"total": round(total, 1), "renderer": round(renderer, 1)}
+
+
+class BrowserSession:
+    """A Chromium browser shared across targets, with page recycling and restarts."""
+
+    def __init__(self, har: Optional[HarConfig] = None, limits: Optional[MemoryLimits] = None):
+        self.har = har
+        self.limits = limits or MemoryLimits()
+        self.browser: Optional[Browser] = None
+        self.contexts: Dict[str, BrowserContext] = {}
+        self.pages: Dict[str, Page] = {}
+        self.navigations: Dict[str, int] = {}
+        self.har_parts: Dict[str, int] = {}
+        self.restarts = 0
+        self.recycles = 0
+        self.peak_mb = 0.0
+        self._playwright = None
+        self._memory: Optional[Dict[str, float]] = None
+        self._sampled_at = 0.0
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self):
+        """Start Playwright and launch the browser."""
+        self._playwright = await async_playwright().start()
+        await self._launch()
+
+    async def _launch(self):
+        with span("launch"):
+            self.browser = await self._playwright.chromium.launch(headless=True, args=LOW_MEMORY_ARGS)
+
+    async def close(self):
+        """Close every context, the browser and Playwright."""
+        for name in list(self.contexts):
+            await self.release(name)
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def new_page(self, name: str) -> Page:
+        """Open a fresh context and page for a target."""
+        with span("launch", context=name):
+            har_options = self.har.context_options(name, self.har_parts.get(name, 1)) if self.har else {}
+            context = await self.browser.new_context(
+                user_agent=USER_AGENT,
+                viewport={'width': 1920, 'height': 1080},
+                **har_options
+            )
+            if self.har:
+                await self.har.attach(context, name)
+            page = await context.new_page()
+
+        self.contexts[name] = context
+        self.pages[name] = page
+        self.navigations[name] = 0
+        return page
+
+    async def release(self, name: str):
+        """Close a target's context (this also flushes a HAR being recorded)."""
+        context = self.contexts.pop(name, None)
+        self.pages.pop(name, None)
+        self.navigations.pop(name, None)
+        if context:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    def memory(self) -> Dict[str, float]:
+        """Chromium RSS, sampled at most every ``sample_interval_s``; also tracks the run's peak."""
+        now = time.monotonic()
+        if self._memory is None or now - self._sampled_at >= self.limits.sample_interval_s:
+            self._memory = chromium_memory_mb()
+            self._sampled_at = now
+            self.peak_mb = max(self.peak_mb, self._memory["total"])
+        return self._memory
+
+    def over_hard_cap(self) -> bool:
+        """Whether Chromium as a whole is above the restart threshold."""
+        return self.memory()["total"] > self.limits.browser_rss_mb
+
+    def can_load_more(self) -> bool:
+        """
+        Checkpoint between "Load more" clicks or scroll steps of a page.
+
+        The loaded DOM can't move to a fresh page, so instead of recycling
+        this says when to stop: once the renderer is over its soft limit or
+        Chromium over the hard cap. The caller extracts what is loaded and
+        the page is freed with the target's context.
+        """
+        memory = self.memory()
+        return (memory["total"] <= self.limits.browser_rss_mb
+                and memory["renderer"] <= self.limits.renderer_rss_mb)
+
+    async def restart(self):
+        """Restart the browser; open targets get a fresh context and page."""
+        names = list(self.contexts)
+        before = self.memory()["total"]
+        for name in names:
+            await self.release(name)
+        await self.browser.close()
+        await self._launch()
+        self.restarts += 1
+        self._memory = None
+        print(f"   ♻️  Restarted browser at {before:.0f} MB")
+        for name in names:
+            # Record into the next part: closing the old context flushed the archive so far
+            self.har_parts[name] = self.har_parts.get(name, 1) + 1
+            await self.new_page(name)
+
+    async def checkpoint(self, name: str = "") -> Optional[Page]:
+        """
+        Apply memory limits at a safe point and return the page to use next.
+
+        Call between targets (no name) or before each navigation of a target
+        whose progress is tracked in Python. The returned page may be new,
+        so callers must re-navigate rather than rely on previous DOM state.
+        """
+        memory = self.memory()
+
+        if memory["total"] > self.limits.browser_rss_mb:
+            await self.restart()
+        elif name in self.pages:
+            self.navigations[name] += 1
+            if (self.navigations[name] > self.limits.max_navigations_per_page
+                    or memory["renderer"] > self.limits.renderer_rss_mb):
+                await self.recycle(name)
+                self.navigations[name] = 1
+
+        return self.pages.get(name)
+
+    async def recycle(self, name: str):
+        """Replace a target's page with a fresh one in the same context."""
+        old = self.pages[name]
+        page = await self.contexts[name].new_page()
+        await old.close()
+        self.pages[name] = page
+        self.recycles += 1
+        self._memory = None
+
+
+async def scrape_in_tabs(page: Page, items: Sequence[T],
+                         scrape: Callable[[Page, T], Awaitable[List[Dict]]]) -> List[object]:
+    """
+    Run ``scrape(tab, item)`` for every item concurrently, one tab each.
+
+    The first item reuses ``page``; the others get extra tabs in the same
+    context (so they share cookies and any HAR being recorded) that are
+    closed afterwards. Returns one job list or exception per item, in order.
+    """
+    tabs = [page]
+    try:
+        for _ in items[1:]:
+            tabs.append(await page.context.new_page())
+        return await asyncio.gather(*(scrape(tab, item) for tab, item in zip(tabs, items)),
+                                    return_exceptions=True)
+    finally:
+        for tab in tabs[1:]:
+            try:
+                await tab.close()
+            except Exception:
+                pass
@@ -0,0 +1,80 @@
+"""HAR record/replay support for offline, reproducible scraper runs.
+
+In ``record`` mode every browser context writes its network traffic to a HAR
+archive (one file per target). In ``replay`` mode the same archive is served
+back through ``route_from_har`` so a scrape runs without touching the live
+job board.
+
+A browser restart mid-target re-creates its context, which records into the
+target's next part ("name.2.har") rather than over the first. Replay serves
+every part.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+HAR_MODES = ("record", "replay")
+
+
+def slugify(name: str) -> str:
+    """Turn a target name into a filesystem-friendly slug."""
+    slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+    return slug or "target"
+
+
+@dataclass
+class HarConfig:
+    """Where HAR archives live and whether to record or replay them."""
+    directory: str = "./data/har"
+    mode: str = "replay"
+    not_found: str = "abort"  # "abort" or "fallback" for requests missing from the archive
+
+    def __post_init__(self):
+        if self.mode not in HAR_MODES:
+            raise ValueError(f"Unknown HAR mode '{self.mode}', expected one of {HAR_MODES}")
+
+    def path_for(self, target_name: str, part: int = 1) -> Path:
+        """Get the HAR archive path for a target (and part, after a restart)."""
+        suffix = f".{part}" if part > 1 else ""
+        return Path(self.directory) / f"{slugify(target_name)}{suffix}.har"
+
+    def parts_for(self, target_name: str) -> List[Path]:
+        """Recorded archives of a target, in recording order."""
+        paths = []
+        while self.path_for(target_name, len(paths) + 1).exists():
+            paths.append(self.path_for(target_name, len(paths) + 1))
+        return paths
+
+    def context_options(self, target_name: str, part: int = 1) -> Dict[str, Any]:
+        """Extra ``browser.new_context`` options for this mode."""
+        # Service workers bypass HAR routing, so block them in both modes
+        options: Dict[str, Any] = {"service_workers": "block"}
+
+        if self.mode == "record":
+            path = self.path_for(target_name, part)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if part == 1:
+                # Later parts of an older recording would be replayed with this one
+                for stale in self.parts_for(target_name)[1:]:
+                    stale.unlink()
+            options["record_har_path"] = str(path)
+            options["record_har_content"] = "embed"
+            options["record_har_mode"] = "full"
+
+        return options
+
+    async def attach(self, context, target_name: str) -> None:
+        """Route a context from its recorded archive when replaying."""
+        if self.mode != "replay":
+            return
+
+        paths = self.parts_for(target_name)
+        if not paths:
+            raise FileNotFoundError(
+                f"No HAR archive for '{target_name}' at {self.path_for(target_name)} - run with --record first"
+            )
+        # The last route added is tried first, so later parts fall back to earlier ones
+        for i, path in enumerate(paths):
+            await context.route_from_har(str(path), not_found=self.not_found if i == 0 else "fallback")
@@ -1,162 +1,204 @@
 #!/usr/bin/env python3
 """
-Job scraper using Playwright to get real job listings from Sydney
+Job scraper using Playwright to get real job listings from Sydney.
+
+All searches run concurrently on one shared browser, each paging through
+results until it runs dry or hits ``max_pages``. Jobs are de-duplicated by
+URL and streamed to an NDJSON file in the data directory as they arrive.
 """
 
 import asyncio
 import json
-from datetime import datetime
-from typing import List, Dict, Any
-from playwright.async_api import async_playwright
 import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.core.dedupe import dedupe_by_url
+from src.core.tracing import span
+from src.scrapers.browser_session import BrowserSession, navigate
+
+SEEK_BASE_URL = "https://www.seek.com.au"
+SEEK_QUERIES = {
+    "technical": "CTO VP-Engineering Head-of-AI Head-of-Engineering Head-of-Product",
+    "commercial": "Chief-Revenue-Officer VP-Sales General-Manager Head-of-Sales Chief-Commercial-Officer"
+}
+SEEK_PAGE_SIZE = 22
+SEEK_CARD = 'article[data-testid="job-card"]'
+SEEK_EXTRACT_JS = '''cards => cards.map(card => {
+    const text = sel => { const el = card.querySelector(sel); return el ? el.innerText : ''; };
+    const title = card.querySelector('a[data-testid="job-title"]');
+    return {
+        title: title ? title.innerText : '',
+        href: title ? title.getAttribute('href') : '',
+        company: text('a[data-testid="job-company"]'),
+        location: text('[data-testid="job-location"]'),
+        salary: text('[data-testid="job-salary"]')
+    };
+})'''
+
+LINKEDIN_KEYWORDS = {
+    "technical": "CTO OR \"VP Engineering\" OR \"Head of AI\" OR \"Head of Engineering\"",
+    "commercial": "\"Chief Revenue Officer\" OR \"VP Sales\" OR \"General Manager\" OR \"Head of Sales\""
+}
+LINKEDIN_PAGE_SIZE = 25
+LINKEDIN_CARD = '.base-card'
+LINKEDIN_EXTRACT_JS = '''cards => cards.map(card => {
+    const text = sel => { const el = card.querySelector(sel); return el ? el.innerText : ''; };
+    const link = card.querySelector('.base-card__full-link');
+    return {
+        title: text('.base-search-card__title'),
+        company: text('.base-search-card__subtitle'),
+        location: text('.job-search-card__location'),
+        href: link ? link.getAttribute('href') : ''
+    };
+})'''
+
+# (source, role type) pairs searched by run_search
+SEARCHES = [
+    ("Seek", "technical"),
+    ("Seek", "commercial"),
+    ("LinkedIn", "technical"),
+    ("LinkedIn", "commercial"),
+]
+
 
 class SydneyJobScraper:
-    def __init__(self):
-        self.jobs = []
+    def __init__(self, output_dir: str = "./data", max_pages: int = 3, concurrency: int = 4):
+        """
+        Args:
+            output_dir: Where results are streamed and saved
+            max_pages: Result pages to read per search
+            concurrency: Searches allowed to run at once on the shared browser
+        """
+        self.jobs: List[Dict] = []
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-    async def search_seek(self, role_query: str, is_commercial: bool = False) -> List[Dict]:
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.stream_file = self.output_dir / f"sydney_jobs_{self.timestamp}.ndjson"
+        self._seen_urls = set()
+        self._stream = None
+
+    def emit(self, jobs: List[Dict]) -> List[Dict]:
+        """Keep jobs not seen in any search yet and stream them to the NDJSON file."""
+        new_jobs = dedupe_by_url(jobs, self._seen_urls)
+        for job in new_jobs:
+            self._stream.write(json.dumps(job) + "\n")
+        self._stream.flush()
+        self.jobs.extend(new_jobs)
+        return new_jobs
+
+    async def paginate(self, session: BrowserSession, name: str, page_url: Callable[[int], str], page_size: int,
+                       card_selector: str, extract_js: str, to_job: Callable[[Dict], Optional[Dict]]) -> int:
+        """
+        Read result pages until one comes back short or ``max_pages`` is reached.
+
+        Jobs other searches already emitted are dropped from the output but
+        don't end the search, so concurrent searches can't change each
+        other's depth. Waits on the card selector rather than ``networkidle``,
+        which ad-heavy job boards rarely reach. Returns how many new jobs the
+        search added.
+        """
+        found = 0
+        own_urls = set()
+        page = await session.new_page(name)
+        try:
+            for page_num in range(1, self.max_pages + 1):
+                page = await session.checkpoint(name) or page
+                await navigate(page, page_url(page_num), wait_until='domcontentloaded', timeout=30000)
+                try:
+                    with span("wait"):
+                        await page.wait_for_selector(card_selector, timeout=10000)
+                except Exception:
+                    break  # No (more) results
+
+                with span("extract"):
+                    cards = await page.eval_on_selector_all(card_selector, extract_js)
+                jobs = [job for job in (to_job(card) for card in cards) if job]
+                if not dedupe_by_url(jobs, own_urls):
+                    break  # Past the end: the board repeated a page
+                found += len(self.emit(jobs))
+                if len(cards) < page_size:
+                    break
+        except Exception as e:
+            print(f"Error searching {name}: {e}")
+        finally:
+            await session.release(name)
+        return found
+
+    async def search_seek(self, session: BrowserSession, role_type: str = "technical") -> int:
         """Search Seek.com.au for Sydney jobs"""
-        jobs = []
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = await context.new_page()
-            
-            # Build search URL for Sydney with salary filter
-            base_url = "https://www.seek.com.au"
-            search_params = {
-                "technical": "CTO VP-Engineering Head-of-AI Head-of-Engineering Head-of-Product",
-                "commercial": "Chief-Revenue-Officer VP-Sales General-Manager Head-of-Sales Chief-Commercial-Officer"
+        is_commercial = role_type == "commercial"
+        query = SEEK_QUERIES["commercial"] if is_commercial else SEEK_QUERIES["technical"]
+        # Salary filter: $350k+ in Seek is salaryrange=350000-999999
+        search_url = f"{SEEK_BASE_URL}/{query}-jobs/in-Sydney-NSW?salaryrange=350000-999999"
+
+        def to_job(card: Dict) -> Optional[Dict]:
+            if not card.get('title') or not card.get('company'):
+                return None
+            job_url = card.get('href') or ''
+            salary_text = card.get('salary', '')
+            salary_min, salary_max = self.parse_salary(salary_text)
+            company = card['company']
+            return {
+                "company": company.strip(),
+                "title": card['title'].strip(),
+                "location": f"{card.get('location') or 'Sydney, NSW'} (Hybrid)",
+                "url": job_url if job_url.startswith('http') else f"{SEEK_BASE_URL}{job_url}",
+                "salary_min": salary_min,
+                "salary_max": salary_max,
+                "salary_text": salary_text,
+                "requirements": ["Leadership", "10+ years experience", "Strategic thinking", "Team management", "P&L responsibility"],
+                "posted_date": datetime.now().strftime("%Y-%m-%d"),
+                "job_type": "full-time",
+                "company_size": "1000-5000",
+                "work_life_balance_rating": self.get_work_life_balance_rating(company),
+                "description_snippet": f"Senior {('commercial' if is_commercial else 'technical')} leadership role in Sydney",
+                "source": "Seek"
             }
-            
-            query = search_params["commercial"] if is_commercial else search_params["technical"]
-            # Salary filter: $350k+ in Seek is salaryrange=350000-999999
-            search_url = f"{base_url}/{query}-jobs/in-Sydney-NSW?salaryrange=350000-999999"
-            
-            try:
-                await page.goto(search_url, wait_until='networkidle')
-                await page.wait_for_selector('article[data-testid="job-card"]', timeout=10000)
-                
-                # Extract job cards
-                job_cards = await page.query_selector_all('article[data-testid="job-card"]')
-                
-                for card in job_cards[:10]:  # Get top 10 per search
-                    try:
-                        # Extract job details
-                        title_elem = await card.query_selector('a[data-testid="job-title"]')
-                        company_elem = await card.query_selector('a[data-testid="job-company"]')
-                        location_elem = await card.query_selector('[data-testid="job-location"]')
-                        salary_elem = await card.query_selector('[data-testid="job-salary"]')
-                        
-                        if title_elem and company_elem:
-                            title = await title_elem.inner_text()
-                            company = await company_elem.inner_text()
-                            location = await location_elem.inner_text() if location_elem else "Sydney, NSW"
-                            salary_text = await salary_elem.inner_text() if salary_elem else ""
-                            job_url = await title_elem.get_attribute('href')
-                            
-                            # Parse salary
-                            salary_min, salary_max = self.parse_salary(salary_text)
-                            
-                            # Determine work-life balance rating based on company
-                            wlb_rating = self.get_work_life_balance_rating(company)
-                            
-                            job = {
-                                "company": company.strip(),
-                                "title": title.strip(),
-                                "location": f"{location} (Hybrid)",
-                                "url": f"{base_url}{job_url}" if not job_url.startswith('http') else job_url,
-                                "salary_min": salary_min,
-                                "salary_max": salary_max,
-                                "salary_text": salary_text,
-                                "requirements": ["Leadership", "10+ years experience", "Strategic thinking", "Team management", "P&L responsibility"],
-                                "posted_date": datetime.now().strftime("%Y-%m-%d"),
-                                "job_type": "full-time",
-                                "company_size": "1000-5000",
-                                "work_life_balance_rating": wlb_rating,
-                                "description_snippet": f"Senior {('commercial' if is_commercial else 'technical')} leadership role in Sydney",
-                                "source": "Seek"
-                            }
-                            jobs.append(job)
-                            
-                    except Exception as e:
-                        print(f"Error extracting job card: {e}")
-                        continue
-                        
-            except Exception as e:
-                print(f"Error searching Seek: {e}")
-            finally:
-                await browser.close()
-                
-        return jobs
-    
-    async def search_linkedin(self, role_type: str = "technical") -> List[Dict]:
+
+        return await self.paginate(session, f"Seek {role_type}", lambda n: f"{search_url}&page={n}",
+                                   SEEK_PAGE_SIZE, SEEK_CARD, SEEK_EXTRACT_JS, to_job)
+
+    async def search_linkedin(self, session: BrowserSession, role_type: str = "technical") -> int:
         """Search LinkedIn Jobs for Sydney positions"""
-        jobs = []
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            # LinkedIn job search URL for Sydney
-            keywords = {
-                "technical": "CTO OR \"VP Engineering\" OR \"Head of AI\" OR \"Head of Engineering\"",
-                "commercial": "\"Chief Revenue Officer\" OR \"VP Sales\" OR \"General Manager\" OR \"Head of Sales\""
+        search_url = (
+            f"https://www.linkedin.com/jobs/search/"
+            f"?keywords={LINKEDIN_KEYWORDS.get(role_type, LINKEDIN_KEYWORDS['technical'])}"
+            f"&location=Sydney%2C%20New%20South%20Wales%2C%20Australia"
+            f"&f_JT=F"  # Full-time
+            f"&f_SB2=7"  # $200K+ (closest filter to our range)
+        )
+
+        def to_job(card: Dict) -> Optional[Dict]:
+            if not card.get('title') or not card.get('company'):
+                return None
+            return {
+                "company": card['company'].strip(),
+                "title": card['title'].strip(),
+                "location": (card.get('location') or "Sydney, NSW (Hybrid)").strip(),
+                # Tracking parameters differ between pages, so drop them for dedupe
+                "url": (card.get('href') or '').split('?')[0],
+                "salary_min": 350000,
+                "salary_max": 600000,
+                "requirements": ["Senior leadership", "15+ years experience", "Strategic vision", "Stakeholder management", "Budget ownership"],
+                "posted_date": datetime.now().strftime("%Y-%m-%d"),
+                "job_type": "full-time",
+                "company_size": "1000+",
+                "work_life_balance_rating": 4,
+                "description_snippet": f"Executive {role_type} role based in Sydney",
+                "source": "LinkedIn"
             }
-            
-            search_url = (
-                f"https://www.linkedin.com/jobs/search/"
-                f"?keywords={keywords.get(role_type, keywords['technical'])}"
-                f"&location=Sydney%2C%20New%20South%20Wales%2C%20Australia"
-                f"&f_JT=F"  # Full-time
-                f"&f_SB2=7"  # $200K+ (closest filter to our range)
-            )
-            
-            try:
-                await page.goto(search_url, wait_until='networkidle')
-                await page.wait_for_selector('.jobs-search__results-list', timeout=10000)
-                
-                # Extract job listings
-                job_elements = await page.query_selector_all('.base-card')
-                
-                for elem in job_elements[:10]:
-                    try:
-                        title = await elem.query_selector('.base-search-card__title')
-                        company = await elem.query_selector('.base-search-card__subtitle')
-                        location = await elem.query_selector('.job-search-card__location')
-                        link = await elem.query_selector('.base-card__full-link')
-                        
-                        if title and company:
-                            job = {
-                                "company": (await company.inner_text()).strip(),
-                                "title": (await title.inner_text()).strip(),
-                                "location": (await location.inner_text()).strip() if location else "Sydney, NSW (Hybrid)",
-                                "url": await link.get_attribute('href') if link else "",
-                                "salary_min": 350000,
-                                "salary_max": 600000,
-                                "requirements": ["Senior leadership", "15+ years experience", "Strategic vision", "Stakeholder management", "Budget ownership"],
-                                "posted_date": datetime.now().strftime("%Y-%m-%d"),
-                                "job_type": "full-time",
-                                "company_size": "1000+",
-                                "work_life_balance_rating": 4,
-                                "description_snippet": f"Executive {role_type} role based in Sydney",
-                                "source": "LinkedIn"
-                            }
-                            jobs.append(job)
-                    except Exception as e:
-                        continue
-                        
-            except Exception as e:
-                print(f"Error searching LinkedIn: {e}")
-            finally:
-                await browser.close()
-                
-        return jobs
-    
+
+        return await self.paginate(
+            session, f"LinkedIn {role_type}",
+            lambda n: f"{search_url}&start={(n - 1) * LINKEDIN_PAGE_SIZE}",
+            LINKEDIN_PAGE_SIZE, LINKEDIN_CARD, LINKEDIN_EXTRACT_JS, to_job)
+
     def parse_salary(self, salary_text: str) -> tuple:
         """Parse salary text to extract min and max values"""
         # Australian salary patterns
@@ -164,7 +206,7 @@ class SydneyJobScraper:
             r'\$?([\d,]+)[kK]?\s*-\s*\$?([\d,]+)[kK]?',  # $150k - $200k
             r'\$?([\d,]+)',  # Single value
         ]
-        
+
         for pattern in patterns:
             match = re.search(pattern, salary_text.replace(',', ''))
             if match:
@@ -181,77 +223,75 @@ class SydneyJobScraper:
                     if 'k' in salary_text.lower():
                         val *= 1000
                     return int(val), int(val * 1.2)  # Estimate max as 20% higher
-        
+
         # Default high-value range for executive roles
         return 350000, 500000
-    
+
     def get_work_life_balance_rating(self, company: str) -> int:
         """Get work-life balance rating based on company reputation"""
         excellent_companies = ['Atlassian', 'Canva', 'Google', 'Microsoft', 'Salesforce']
         very_good = ['SafetyCulture', 'Airwallex', 'NEXTDC', 'Telstra', 'Commonwealth Bank', 'ANZ', 'Westpac']
         good = ['WiseTech', 'Xero', 'REA Group', 'Seek', 'Tyro', 'Afterpay', 'Zip']
-        
+
         company_lower = company.lower()
-        
+
         for comp in excellent_companies:
             if comp.lower() in company_lower:
                 return 5
-        
+
         for comp in very_good:
             if comp.lower() in company_lower:
                 return 4
-                
+
         for comp in good:
             if comp.lower() in company_lower:
                 return 3
-                
+
         return 3  # Default rating
-    
-    async def run_search(self):
-        """Run the complete search process"""
+
+    async def run_search(self, session: Optional[BrowserSession] = None) -> List[Dict]:
+        """Run every search concurrently on one browser and save the results"""
         print("🔍 Starting real job search for Sydney executive roles...")
-        
-        all_jobs = []
-        
-        # Search for technical roles
-        print("📱 Searching for technical leadership roles on Seek...")
-        tech_jobs_seek = await self.search_seek("technical", is_commercial=False)
-        all_jobs.extend(tech_jobs_seek)
-        print(f"   Found {len(tech_jobs_seek)} technical roles on Seek")
-        
-        # Search for commercial roles
-        print("💼 Searching for commercial/GTM roles on Seek...")
-        commercial_jobs_seek = await self.search_seek("commercial", is_commercial=True)
-        all_jobs.extend(commercial_jobs_seek)
-        print(f"   Found {len(commercial_jobs_seek)} commercial roles on Seek")
-        
-        # Search LinkedIn for both
-        print("🔗 Searching LinkedIn for executive roles...")
-        tech_jobs_linkedin = await self.search_linkedin("technical")
-        all_jobs.extend(tech_jobs_linkedin)
-        print(f"   Found {len(tech_jobs_linkedin)} technical roles on LinkedIn")
-        
-        commercial_jobs_linkedin = await self.search_linkedin("commercial")
-        all_jobs.extend(commercial_jobs_linkedin)
-        print(f"   Found {len(commercial_jobs_linkedin)} commercial roles on LinkedIn")
-        
+
+        searches = {"Seek": self.search_seek, "LinkedIn": self.search_linkedin}
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_one(shared: BrowserSession, source: str, role_type: str) -> int:
+            async with semaphore:
+                count = await searches[source](shared, role_type)
+            print(f"   Found {count} new {role_type} roles on {source}")
+            return count
+
+        async def run_all(shared: BrowserSession):
+            await asyncio.gather(*(run_one(shared, source, role) for source, role in SEARCHES))
+
+        with open(self.stream_file, 'w') as self._stream:
+            if session is None:
+                async with BrowserSession() as own_session:
+                    await run_all(own_session)
+            else:
+                await run_all(session)
+        self._stream = None
+
         # Save results
-        output_file = '/Users/leroypinto/Documents/Agents/JDAppSearch/data/job_search_results.json'
+        output_file = self.output_dir / 'job_search_results.json'
         with open(output_file, 'w') as f:
-            json.dump(all_jobs, f, indent=2)
-        
+            json.dump(self.jobs, f, indent=2)
+
+        all_jobs = self.jobs
         print(f"\n✅ Total jobs found: {len(all_jobs)}")
         print(f"📁 Results saved to: {output_file}")
-        
+        print(f"   Streamed as found: {self.stream_file}")
+
         # Summary
         tech_count = len([j for j in all_jobs if 'CTO' in j['title'] or 'Engineering' in j['title'] or 'AI' in j['title'] or 'Product' in j['title']])
         commercial_count = len([j for j in all_jobs if 'Revenue' in j['title'] or 'Sales' in j['title'] or 'Commercial' in j['title'] or 'GM' in j['title'] or 'General Manager' in j['title']])
-        
+
         print(f"\n📊 Summary:")
         print(f"   Technical roles: {tech_count}")
         print(f"   Commercial roles: {commercial_count}")
         print(f"   Sources: Seek.com.au, LinkedIn")
-        
+
         return all_jobs
 
 async def main():
@@ -259,4 +299,4 @@ async def main():
     await scraper.run_search()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
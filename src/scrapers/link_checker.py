@@ -0,0 +1,217 @@
+"""Concurrent dead-link validation for stored job URLs.
+
+Every URL gets one pooled async request, bounded by a global limit and a
+per-host limit so a single ATS is never hammered:
+
+1. ``HEAD`` first, falling back to ``GET`` when a server rejects it. Hosts
+   known to serve soft "job closed" pages with a 200 are read with ``GET``
+   straight away so the body can be checked.
+2. A posting is ``closed`` on 404/410, on an ATS redirect back to the board
+   or to an error page, or on "no longer accepting" wording in the page.
+3. Live and closed results are cached with the ``link_check`` TTL, so daily
+   runs only re-check stale URLs. Network errors are never cached.
+"""
+
+import asyncio
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.core.metrics import LINKS_CHECKED
+from src.scrapers.sitemap import USER_AGENT, is_job_url
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+CLOSED_STATUSES = {404, 410}
+# Servers that refuse HEAD but answer GET
+HEAD_REJECTED_STATUSES = {403, 405, 501}
+
+# ATS boards whose posting URLs sit one level below the board root
+# (boards.greenhouse.io/<company>/jobs/<id>, jobs.lever.co/<company>/<id>, ...)
+ATS_HOSTS = re.compile(
+    r'(^|\.)(greenhouse\.io|lever\.co|ashbyhq\.com|workable\.com|smartrecruiters\.com|'
+    r'myworkdayjobs\.com|bamboohr\.com|recruitee\.com|getro\.com)$')
+
+# Hosts that answer closed postings with a 200 page rather than a 404
+SOFT_CLOSE_HOSTS = re.compile(
+    r'(^|\.)(greenhouse\.io|myworkdayjobs\.com|smartrecruiters\.com|workable\.com|seek\.com\.au|linkedin\.com)$')
+
+# Redirect targets that mark a posting as gone (Greenhouse ?error=true, Workday job-not-found, ...)
+CLOSED_URL_MARKERS = re.compile(r'[?&]error=true|job-?not-?found|/404\b|[?&]closed=|/expired', re.I)
+
+CLOSED_TEXT = re.compile(
+    r'no longer (accepting applications|available|open|active)|'
+    r'(position|role|job) has (been filled|closed|expired)|'
+    r'job (is )?(closed|expired|not found)|this (job|posting) (is|has) (closed|expired|no longer)',
+    re.I)
+
+MAX_BODY_BYTES = 64 * 1024
+
+# (method, url) -> (status, final_url, body_prefix)
+Fetch = Callable[[str, str], Awaitable[Tuple[int, str, str]]]
+
+
+@dataclass
+class LinkResult:
+    """Outcome of checking one URL."""
+    url: str
+    state: str  # live, closed or error
+    http_status: Optional[int] = None
+    final_url: Optional[str] = None
+    reason: str = ""
+    checked_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+def _path_depth(url: str) -> int:
+    return len([part for part in urlparse(url).path.split('/') if part])
+
+
+def classify(url: str, status: int, final_url: str, body: str = "") -> Tuple[str, str]:
+    """
+    Decide whether a response means the posting is live or closed.
+
+    Returns ``(state, reason)``; ``state`` is ``"error"`` for other failures.
+    """
+    if status in CLOSED_STATUSES:
+        return "closed", f"HTTP {status}"
+
+    final_url = final_url or url
+    if final_url.rstrip('/') != url.rstrip('/'):
+        if CLOSED_URL_MARKERS.search(final_url) and not CLOSED_URL_MARKERS.search(url):
+            return "closed", f"redirected to error page {final_url}"
+        host = urlparse(final_url).netloc.lower()
+        if ATS_HOSTS.search(host) and _path_depth(final_url) < _path_depth(url):
+            return "closed", f"ATS redirected to board {final_url}"
+        if is_job_url(url) and not is_job_url(final_url):
+            return "closed", f"redirected to listing {final_url}"
+
+    if status >= 400:
+        return "error", f"HTTP {status}"
+    if body and CLOSED_TEXT.search(body):
+        return "closed", "page says the job is closed"
+    return "live", f"HTTP {status}"
+
+
+def urllib_fetch(method: str, url: str, timeout: float = 15) -> Tuple[int, str, str]:
+    """Blocking stdlib request; redirects are followed and 4xx/5xx returned, not raised."""
+    request = Request(url, method=method, headers={'User-Agent': USER_AGENT})
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            body = response.read(MAX_BODY_BYTES) if method == 'GET' else b''
+            return response.status, response.geturl(), body.decode('utf-8', 'ignore')
+    except HTTPError as e:
+        return e.code, e.geturl() or url, ''
+
+
+class LinkChecker:
+    """Validate many job URLs concurrently, reusing cached results within their TTL."""
+
+    CACHE_TYPE = 'link_check'
+
+    def __init__(self, cache=None, concurrency: int = 20, per_host: int = 4,
+                 timeout_s: float = 15, fetch: Optional[Fetch] = None):
+        """
+        Args:
+            cache: CacheManager (or anything with ``get``/``set``); None disables caching
+            concurrency: Requests in flight across all hosts
+            per_host: Requests in flight against any one host
+            timeout_s: Per-request timeout
+            fetch: Async ``(method, url) -> (status, final_url, body)`` (injectable for tests)
+        """
+        self.cache = cache
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout_s = timeout_s
+        self.fetch = fetch
+        self.counts = {"live": 0, "closed": 0, "error": 0, "cached": 0}
+        self._global: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.per_host)
+        return self._hosts[host]
+
+    async def _request(self, fetch: Fetch, url: str) -> Tuple[int, str, str]:
+        host = urlparse(url).netloc.lower()
+        if SOFT_CLOSE_HOSTS.search(host):
+            return await fetch('GET', url)
+        status, final_url, body = await fetch('HEAD', url)
+        if status in HEAD_REJECTED_STATUSES:
+            return await fetch('GET', url)
+        return status, final_url, body
+
+    async def check(self, url: str, fetch: Optional[Fetch] = None) -> LinkResult:
+        """Check one URL, bounded by the global and per-host limits."""
+        fetch = fetch or self.fetch
+        async with self._global, self._host_limit(url):
+            try:
+                status, final_url, body = await self._request(fetch, url)
+            except Exception as e:
+                result = LinkResult(url, "error", reason=f"{type(e).__name__}: {e}")
+            else:
+                state, reason = classify(url, status, final_url, body)
+                result = LinkResult(url, state, status, final_url, reason)
+
+        self.counts[result.state] += 1
+        LINKS_CHECKED.inc(state=result.state)
+        if self.cache is not None and result.state != "error":
+            self.cache.set(self.CACHE_TYPE, url, asdict(result))
+        return result
+
+    async def check_all(self, urls: Iterable[str]) -> Dict[str, LinkResult]:
+        """Check every distinct URL, skipping ones with a fresh cached result."""
+        self._global = asyncio.Semaphore(self.concurrency)
+        self._hosts = {}
+
+        results: Dict[str, LinkResult] = {}
+        stale = []
+        for url in dict.fromkeys(u for u in urls if u):
+            cached = self.cache.get(self.CACHE_TYPE, url) if self.cache is not None else None
+            # Cache keys keep only 32 bits of the URL's hash, so check whose result this is
+            if cached and cached.get("url") == url:
+                results[url] = LinkResult(**cached)
+                self.counts["cached"] += 1
+            else:
+                stale.append(url)
+
+        if not stale:
+            return results
+
+        if self.fetch is not None:
+            checked = await asyncio.gather(*(self.check(url) for url in stale))
+        elif AIOHTTP_AVAILABLE:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+            timeout = aiohttp.ClientTimeout(total=self.timeout_s)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                             headers={'User-Agent': USER_AGENT}) as session:
+                async def fetch(method: str, url: str) -> Tuple[int, str, str]:
+                    async with session.request(method, url, allow_redirects=True) as response:
+                        body = await response.content.read(MAX_BODY_BYTES) if method == 'GET' else b''
+                        return response.status, str(response.url), body.decode('utf-8', 'ignore')
+
+                checked = await asyncio.gather(*(self.check(url, fetch) for url in stale))
+        else:
+            async def fetch(method: str, url: str) -> Tuple[int, str, str]:
+                return await asyncio.to_thread(urllib_fetch, method, url, self.timeout_s)
+
+            checked = await asyncio.gather(*(self.check(url, fetch) for url in stale))
+
+        results.update((result.url, result) for result in checked)
+        return results
+
+    def run(self, urls: Iterable[str]) -> Dict[str, LinkResult]:
+        """Blocking wrapper around ``check_all``."""
+        return asyncio.run(self.check_all(urls))
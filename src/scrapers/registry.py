@@ -0,0 +1,105 @@
+"""Registry of board scraper plugins, loaded lazily by name.
+
+A plugin is any class following ``vc_scraper_modular.BaseJobScraper``:
+constructed as ``cls(har=...)``, it exposes ``name`` and ``errors``, uses
+``self.session`` (a shared ``BrowserSession``) when the engine sets one, and
+returns its jobs from ``async scrape()``.
+
+Plugins are registered as ``"module:Class"`` strings, entry-point style, so
+nothing is imported until a target actually uses the plugin. Besides the
+built-in boards, installed packages can add plugins under the
+``jobsearch.scrapers`` entry-point group, and a target can name any
+``"module:Class"`` directly::
+
+    {"name": "Index Ventures", "url": "...", "scraper": "index-ventures"}
+    {"name": "My Board", "url": "...", "scraper": "my_pkg.boards:MyBoardScraper"}
+"""
+
+import importlib
+from importlib.metadata import entry_points
+from typing import Dict, List, Optional, Union
+
+ENTRY_POINT_GROUP = "jobsearch.scrapers"
+
+BUILTIN_SCRAPERS = {
+    "insight-partners": "vc_scraper_modular:InsightPartnersScraper",
+    "index-ventures": "vc_scraper_modular:IndexVenturesScraper",
+    "sequoia": "vc_scraper_modular:SequoiaScraper",
+    "lightspeed": "vc_scraper_modular:LightspeedScraper",
+    "a16z": "vc_scraper_modular:A16ZScraper",
+    "greylock": "vc_scraper_modular:GreylockScraper",
+    "wiz": "vc_scraper_modular:WizScraper",
+}
+
+# Boards the VC scripts run by default (the rest are opt-in)
+DEFAULT_VC_BOARDS = ["insight-partners", "index-ventures", "sequoia", "lightspeed"]
+
+
+def load_spec(spec: str) -> type:
+    """Import ``"package.module:Class"`` and return the class."""
+    module_name, _, attr = spec.partition(':')
+    if not module_name or not attr:
+        raise ValueError(f"Invalid scraper spec '{spec}' (expected 'module:Class')")
+    obj = importlib.import_module(module_name)
+    for part in attr.split('.'):
+        obj = getattr(obj, part)
+    return obj
+
+
+class ScraperRegistry:
+    """Name -> plugin class, imported on first use."""
+
+    def __init__(self, specs: Optional[Dict[str, str]] = None, discover: bool = True):
+        """
+        Args:
+            specs: Initial ``name -> "module:Class"`` map (defaults to the built-in boards)
+            discover: Also register plugins from installed ``jobsearch.scrapers`` entry points
+        """
+        self.specs: Dict[str, str] = dict(BUILTIN_SCRAPERS if specs is None else specs)
+        self._loaded: Dict[str, type] = {}
+        if discover:
+            self.discover()
+
+    def discover(self):
+        """Register entry-point plugins without importing them."""
+        try:
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:  # Python < 3.10
+            found = entry_points().get(ENTRY_POINT_GROUP, [])
+        for ep in found:
+            self.specs.setdefault(ep.name, ep.value)
+
+    def register(self, name: str, plugin: Union[str, type]):
+        """Register a plugin by ``"module:Class"`` spec or by class."""
+        if isinstance(plugin, str):
+            self.specs[name] = plugin
+            self._loaded.pop(name, None)
+        else:
+            self.specs[name] = f"{plugin.__module__}:{plugin.__qualname__}"
+            self._loaded[name] = plugin
+
+    def names(self) -> List[str]:
+        return list(self.specs)
+
+    def resolve(self, name_or_spec: str) -> type:
+        """Plugin class for a registered name or a ``"module:Class"`` spec."""
+        if name_or_spec not in self.specs:
+            if ':' not in name_or_spec:
+                raise KeyError(f"Unknown scraper '{name_or_spec}' (known: {', '.join(self.specs)})")
+            return load_spec(name_or_spec)
+        if name_or_spec not in self._loaded:
+            self._loaded[name_or_spec] = load_spec(self.specs[name_or_spec])
+        return self._loaded[name_or_spec]
+
+    def spec_for(self, cls: type) -> str:
+        """Registered name of a plugin class, else its ``"module:Class"`` spec."""
+        for name, registered in self.specs.items():
+            module, _, attr = registered.partition(':')
+            # A script run directly defines its classes in __main__, not under its module name
+            if attr == cls.__qualname__ and cls.__module__ in (module, '__main__'):
+                return name
+        return f"{cls.__module__}:{cls.__qualname__}"
+
+
+# Process-wide registry used by the engine
+SCRAPERS = ScraperRegistry()
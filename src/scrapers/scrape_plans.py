@@ -0,0 +1,94 @@
+"""Learned per-target scrape plans.
+
+The first time a target is scraped every candidate selector is probed. The
+plan records which selectors actually produced jobs, whether the page needed
+scrolling, and what to wait for before extracting. Later runs replay just
+that plan and only fall back to full probing when its yield drops.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PAGINATION_STYLES = ("none", "scroll")
+
+
+@dataclass
+class ScrapePlan:
+    """What worked last time for one target."""
+    selectors: List[str]
+    pagination: str = "none"
+    wait_for: Optional[str] = None
+    jobs: int = 0
+    runs: int = 1
+    updated: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class ScrapePlanStore:
+    """JSON-backed store of scrape plans keyed by platform and target."""
+
+    def __init__(self, path: str = "./data/scrape_plans.json", min_yield_ratio: float = 0.5):
+        """
+        Args:
+            path: JSON file holding the plans
+            min_yield_ratio: Re-probe when a plan finds fewer than this
+                fraction of the jobs it found when it was learned
+        """
+        self.path = Path(path)
+        self.min_yield_ratio = min_yield_ratio
+        self.plans: Dict[str, ScrapePlan] = {}
+        self.load()
+
+    def load(self):
+        """Load plans from disk, ignoring an unreadable file."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self.plans = {key: ScrapePlan(**plan) for key, plan in data.items()}
+        except (json.JSONDecodeError, IOError, TypeError):
+            self.plans = {}
+
+    def save(self):
+        """Persist plans to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({key: asdict(plan) for key, plan in self.plans.items()}, f, indent=2)
+
+    def get(self, key: str) -> Optional[ScrapePlan]:
+        return self.plans.get(key)
+
+    def learn(self, key: str, hits: Dict[str, int], pagination: str, jobs: int) -> Optional[ScrapePlan]:
+        """Store a plan from a full probe; selectors that found nothing are dropped."""
+        if pagination not in PAGINATION_STYLES:
+            raise ValueError(f"Unknown pagination style '{pagination}'")
+
+        selectors = [selector for selector, count in hits.items() if count > 0]
+        if not selectors:
+            # Nothing matched, so there is nothing worth replaying
+            self.invalidate(key)
+            return None
+
+        plan = ScrapePlan(selectors=selectors, pagination=pagination, wait_for=selectors[0], jobs=jobs)
+        self.plans[key] = plan
+        self.save()
+        return plan
+
+    def needs_reprobe(self, plan: ScrapePlan, jobs: int) -> bool:
+        """Whether a replayed plan's yield dropped enough to distrust it."""
+        return jobs == 0 or jobs < plan.jobs * self.min_yield_ratio
+
+    def confirm(self, key: str, jobs: int):
+        """Record a successful replay."""
+        plan = self.plans[key]
+        plan.runs += 1
+        plan.jobs = jobs
+        plan.updated = datetime.now().isoformat()
+        self.save()
+
+    def invalidate(self, key: str):
+        if self.plans.pop(key, None) is not None:
+            self.save()
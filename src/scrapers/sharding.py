@@ -0,0 +1,120 @@
+"""Multi-process sharded scraping.
+
+Targets are split across worker processes, each with its own event loop and
+browser. Every finished target is streamed back to the coordinator over a
+queue, so the coordinator can record history and merge jobs while the other
+workers keep scraping. Global URL dedupe, scoring and saving stay in the
+coordinator (``UniversalJobScraper.finalize``).
+"""
+
+import multiprocessing as mp
+import queue
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# (target, deadline slice or None), as produced by UniversalJobScraper's plan
+PlanItem = Tuple[Dict, Optional[float]]
+
+
+def shard_targets(plan: List[PlanItem], workers: int,
+                  cost: Optional[Callable[[Dict], float]] = None) -> List[List[PlanItem]]:
+    """
+    Split a plan into at most ``workers`` shards of similar total cost.
+
+    Targets are placed longest-first on the least-loaded shard; within a shard
+    the original plan order (highest yield first) is kept.
+    """
+    workers = max(1, min(workers, len(plan)))
+    cost = cost or (lambda target: 1.0)
+
+    loads = [0.0] * workers
+    assignment: Dict[int, int] = {}
+    for index in sorted(range(len(plan)), key=lambda i: -cost(plan[i][0])):
+        shard = loads.index(min(loads))
+        assignment[index] = shard
+        loads[shard] += cost(plan[index][0])
+
+    shards: List[List[PlanItem]] = [[] for _ in range(workers)]
+    for index, item in enumerate(plan):
+        shards[assignment[index]].append(item)
+    return shards
+
+
+def _worker_main(worker_id: int, shard: List[PlanItem], options: Dict,
+                 wall_deadline: Optional[float], results) -> None:
+    """Scrape one shard in a child process and stream results to the coordinator."""
+    import asyncio
+
+    from src.core.metrics import PAGES_NAVIGATED, SCRAPE_ERRORS
+    from universal_job_scraper import UniversalJobScraper
+
+    scraper = UniversalJobScraper(targets=[target for target, _ in shard], **options)
+    scraper.tracer.name = f"{scraper.suite}-worker-{worker_id}"
+
+    def on_result(name, jobs, duration_s, timed_out, errored):
+        errors = SCRAPE_ERRORS.get(suite=scraper.suite, target=name)
+        pages = PAGES_NAVIGATED.get(suite=scraper.suite, target=name)
+        results.put(("result", worker_id, name, jobs, duration_s, timed_out, errors, pages))
+
+    # perf_counter isn't shared between processes, so the deadline travels as wall time
+    deadline = None
+    if wall_deadline is not None:
+        deadline = time.perf_counter() + (wall_deadline - time.time())
+
+    try:
+        stats = asyncio.run(scraper.collect(shard, deadline, on_result))
+        trace = scraper.tracer.to_chrome_trace()["traceEvents"]
+        results.put(("done", worker_id, stats, trace, scraper.tracer.wall_origin))
+    except Exception as e:
+        results.put(("failed", worker_id, str(e)))
+
+
+def run_sharded(shards: List[List[PlanItem]], options: Dict, wall_deadline: Optional[float],
+                on_result: Callable, on_done: Callable) -> None:
+    """
+    Run each shard in its own process and dispatch their messages.
+
+    Args:
+        shards: Output of ``shard_targets``
+        options: ``UniversalJobScraper`` keyword arguments for the workers
+        wall_deadline: ``time.time()`` by which every worker must finish
+        on_result: Called as ``on_result(name, jobs, duration_s, timed_out, errors, pages)``
+        on_done: Called as ``on_done(stats, trace_events, wall_origin)`` per worker
+    """
+    # Spawn rather than fork: Playwright's driver threads don't survive a fork
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    # Not daemonic - workers start their own Playwright driver subprocess
+    processes = {
+        worker_id: ctx.Process(target=_worker_main, args=(worker_id, shard, options, wall_deadline, results))
+        for worker_id, shard in enumerate(shards) if shard
+    }
+    for process in processes.values():
+        process.start()
+    print(f"🧵 Started {len(processes)} workers")
+
+    pending = set(processes)
+    while pending:
+        try:
+            message = results.get(timeout=1)
+        except queue.Empty:
+            # A worker killed outright (e.g. by the OOM killer) never reports back
+            for worker_id in list(pending):
+                process = processes[worker_id]
+                if not process.is_alive():
+                    print(f"❌ Worker {worker_id} exited with code {process.exitcode}")
+                    pending.discard(worker_id)
+            continue
+
+        kind, worker_id = message[0], message[1]
+        if kind == "result":
+            on_result(*message[2:])
+        elif kind == "done":
+            on_done(*message[2:])
+            pending.discard(worker_id)
+        elif kind == "failed":
+            print(f"❌ Worker {worker_id} failed: {message[2]}")
+            pending.discard(worker_id)
+
+    for process in processes.values():
+        process.join()
@@ -0,0 +1,355 @@
+"""Sitemap-driven job URL discovery for company careers sites.
+
+Instead of rendering a careers page, read the site's sitemaps:
+
+1. Sitemaps come from ``robots.txt``, ``/sitemap.xml`` and a careers-specific
+   ``<careers path>/sitemap.xml``. Sitemap indexes are followed (preferring
+   job-related children) and gzip is detected from the content.
+2. Sitemaps are stream-parsed with ``iterparse``, so multi-megabyte files
+   never sit fully in memory.
+3. URLs are kept only if they match the same job-link patterns GenericScraper
+   probes for.
+4. Each posting is enriched from its JSON-LD ``JobPosting`` block. Pages
+   without one count as postings only on a job-detail path (an ATS job ID or
+   ``/jobs/<slug>``), so benefits or culture pages under ``/careers`` are
+   dropped. Postings whose ``lastmod`` hasn't changed since the last run
+   reuse the stored details, and child sitemaps whose own ``lastmod`` hasn't
+   changed aren't downloaded at all.
+"""
+
+import gzip
+import html
+import io
+import json
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, IO, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+from src.core.url_canon import ats_job_id
+
+# URL fragments that mark a job link; GenericScraper probes for the same ones
+JOB_URL_PATTERNS = ['/job', '/career', '/position', '/opening', 'greenhouse', 'lever']
+
+# Last path segments of listing pages rather than individual postings
+LISTING_SEGMENTS = re.compile(
+    r'(jobs?|careers?|positions?|openings?|search|all-jobs|open-positions|job-openings)?$')
+
+# A posting's own page: one segment below /job or /jobs
+JOB_DETAIL_PATH = re.compile(r'/jobs?/[^/]+')
+
+# Words that mark a child sitemap worth following in a large index
+JOB_SITEMAP_HINT = re.compile(r'job|career|position|opening|vacanc', re.I)
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+Fetch = Callable[[str], IO[bytes]]
+
+
+def http_fetch(url: str, timeout: float = 20) -> IO[bytes]:
+    """Open a URL as a binary stream."""
+    return urlopen(Request(url, headers={'User-Agent': USER_AGENT}), timeout=timeout)
+
+
+def is_job_url(url: str) -> bool:
+    """Whether a URL looks like an individual job posting."""
+    parsed = urlparse(url)
+    path = parsed.path.lower().rstrip('/')
+    if not any(p in (parsed.netloc + path).lower() for p in JOB_URL_PATTERNS):
+        return False
+    return not LISTING_SEGMENTS.fullmatch(path.rsplit('/', 1)[-1])
+
+
+def is_job_detail_url(url: str) -> bool:
+    """Whether a URL is a posting's own page by its path alone (an ATS job ID or ``/jobs/<slug>``)."""
+    if ats_job_id(url):
+        return True
+    path = urlparse(url).path.lower().rstrip('/')
+    return bool(JOB_DETAIL_PATH.search(path)) and is_job_url(url)
+
+
+def open_maybe_gzip(stream: IO[bytes]) -> IO[bytes]:
+    """Transparently decompress gzip streams (sitemap.xml.gz, or gzip served as-is)."""
+    buffered = stream if hasattr(stream, 'peek') else io.BufferedReader(stream)
+    if buffered.peek(2)[:2] == b'\x1f\x8b':
+        return gzip.GzipFile(fileobj=buffered)
+    return buffered
+
+
+def parse_sitemap(stream: IO[bytes]) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """
+    Stream ``(kind, loc, lastmod)`` entries from a sitemap or sitemap index.
+
+    ``kind`` is ``"url"`` for pages and ``"sitemap"`` for index children.
+    """
+    root = None
+    loc = lastmod = None
+    for event, elem in ET.iterparse(open_maybe_gzip(stream), events=("start", "end")):
+        if root is None:
+            root = elem
+        if event != "end":
+            continue
+        tag = elem.tag.rsplit('}', 1)[-1]
+        if tag == 'loc':
+            loc = (elem.text or '').strip()
+        elif tag == 'lastmod':
+            lastmod = (elem.text or '').strip() or None
+        elif tag in ('url', 'sitemap'):
+            if loc:
+                yield tag, loc, lastmod
+            loc = lastmod = None
+            # Drop finished entries so memory stays flat on huge sitemaps
+            root.clear()
+
+
+def sitemaps_from_robots(text: str) -> List[str]:
+    """``Sitemap:`` lines from a robots.txt."""
+    return [line.split(':', 1)[1].strip() for line in text.splitlines()
+            if line.lower().startswith('sitemap:') and line.split(':', 1)[1].strip()]
+
+
+def _job_posting(data) -> Optional[Dict]:
+    """Find a JobPosting object anywhere in a JSON-LD document."""
+    if isinstance(data, list):
+        for item in data:
+            found = _job_posting(item)
+            if found:
+                return found
+    elif isinstance(data, dict):
+        types = data.get('@type')
+        if types == 'JobPosting' or (isinstance(types, list) and 'JobPosting' in types):
+            return data
+        if '@graph' in data:
+            return _job_posting(data['@graph'])
+    return None
+
+
+def _posting_location(posting: Dict) -> str:
+    if posting.get('jobLocationType') == 'TELECOMMUTE':
+        return 'Remote'
+    locations = posting.get('jobLocation') or []
+    if isinstance(locations, dict):
+        locations = [locations]
+    places = []
+    for location in locations:
+        address = location.get('address', {}) if isinstance(location, dict) else {}
+        if isinstance(address, str):
+            places.append(address)
+            continue
+        country = address.get('addressCountry')
+        if isinstance(country, dict):
+            country = country.get('name')
+        parts = [address.get('addressLocality'), address.get('addressRegion'), country]
+        place = ', '.join(p for p in parts if p)
+        if place:
+            places.append(place)
+    return '; '.join(dict.fromkeys(places)) or 'See listing'
+
+
+def parse_job_page(url: str, page_html: str) -> Optional[Dict]:
+    """
+    Build a job dict from a posting page, preferring its JSON-LD JobPosting.
+
+    Without a JobPosting the page's ``<title>`` is used, but only on a
+    job-detail URL; any other page is not a posting and gives None.
+    """
+    posting = None
+    for block in re.findall(r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', page_html, re.S | re.I):
+        try:
+            posting = _job_posting(json.loads(block))
+        except json.JSONDecodeError:
+            continue
+        if posting:
+            break
+
+    if not posting:
+        if not is_job_detail_url(url):
+            return None
+        title = re.search(r'<title[^>]*>(.*?)</title>', page_html, re.S | re.I)
+        return {
+            'title': html.unescape(title.group(1)).strip()[:200] if title else '',
+            'company': '',
+            'location': 'See listing',
+            'url': url,
+        }
+
+    organization = posting.get('hiringOrganization') or {}
+    description = re.sub(r'<[^>]+>', ' ', html.unescape(posting.get('description') or ''))
+    return {
+        'title': html.unescape(posting.get('title') or '').strip(),
+        'company': organization.get('name', '') if isinstance(organization, dict) else str(organization),
+        'location': _posting_location(posting),
+        'url': url,
+        'description': re.sub(r'\s+', ' ', description).strip()[:2000],
+        'posted_date': posting.get('datePosted'),
+    }
+
+
+class SitemapDiscovery:
+    """Discover and enrich job postings from sitemaps, remembering lastmod per URL."""
+
+    def __init__(self, state_path: str = "./data/sitemap_state.json", fetch: Fetch = http_fetch,
+                 max_sitemaps: int = 25, max_workers: int = 8):
+        """
+        Args:
+            state_path: JSON file of per-target sitemap and posting state
+            fetch: Opens a URL as a binary stream (injectable for tests)
+            max_sitemaps: Sitemap files read per target, across index levels
+            max_workers: Posting pages fetched in parallel
+        """
+        self.state_path = Path(state_path)
+        self.fetch = fetch
+        self.max_sitemaps = max_sitemaps
+        self.max_workers = max_workers
+        self.state: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self):
+        """Load state from disk, starting fresh if missing or unreadable."""
+        if self.state_path.exists():
+            try:
+                with open(self.state_path) as f:
+                    self.state = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                self.state = {}
+
+    def save(self, name: Optional[str] = None):
+        """
+        Persist state to disk.
+
+        With ``name``, only that target's entry is written over what is on
+        disk, so workers scraping different targets don't undo each other.
+        """
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        state = self.state
+        if name is not None and self.state_path.exists():
+            try:
+                with open(self.state_path) as f:
+                    state = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                state = {}
+            state[name] = self.state[name]
+        with open(self.state_path, 'w') as f:
+            json.dump(state, f)
+
+    def candidate_sitemaps(self, careers_url: str) -> List[str]:
+        """Sitemaps named in robots.txt, then the conventional locations."""
+        parsed = urlparse(careers_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        candidates = []
+        try:
+            with self.fetch(f"{origin}/robots.txt") as response:
+                candidates += sitemaps_from_robots(response.read(256 * 1024).decode('utf-8', 'ignore'))
+        except Exception:
+            pass
+
+        careers_path = parsed.path.rstrip('/')
+        if careers_path:
+            candidates.append(f"{origin}{careers_path}/sitemap.xml")
+        candidates.append(f"{origin}/sitemap.xml")
+        return list(dict.fromkeys(candidates))
+
+    def discover(self, name: str, careers_url: str) -> Dict[str, Optional[str]]:
+        """
+        Job URLs for a target, mapped to their ``lastmod``.
+
+        Child sitemaps whose ``lastmod`` matches the last run are not
+        downloaded; their job URLs are taken from the stored state. So are
+        those of sitemaps left unread when ``max_sitemaps`` runs out, since
+        not reaching a sitemap says nothing about its postings.
+        """
+        entry = self.state.setdefault(name, {"sitemaps": {}, "urls": {}})
+        previous_sitemaps = entry["sitemaps"]
+        found: Dict[str, Optional[str]] = {}
+        sitemaps_seen: Dict[str, Optional[str]] = {}
+
+        queue: List[Tuple[str, Optional[str]]] = [(url, None) for url in self.candidate_sitemaps(careers_url)]
+        covered = set()
+        read = 0
+        while queue and read < self.max_sitemaps:
+            sitemap_url, sitemap_lastmod = queue.pop(0)
+            if sitemap_url in sitemaps_seen:
+                continue
+            sitemaps_seen[sitemap_url] = sitemap_lastmod
+
+            if sitemap_lastmod and previous_sitemaps.get(sitemap_url) == sitemap_lastmod:
+                covered.add(sitemap_url)
+                for url, info in entry["urls"].items():
+                    if info.get("sitemap") == sitemap_url:
+                        found[url] = info.get("lastmod")
+                continue
+
+            children = []
+            try:
+                with self.fetch(sitemap_url) as response:
+                    read += 1
+                    for kind, loc, lastmod in parse_sitemap(response):
+                        if kind == "sitemap":
+                            children.append((loc, lastmod))
+                        elif is_job_url(loc):
+                            found[loc] = lastmod
+                            entry["urls"].setdefault(loc, {})["sitemap"] = sitemap_url
+                covered.add(sitemap_url)
+            except Exception:
+                continue  # Missing or malformed sitemap
+
+            # In big indexes only the job-related children are worth reading
+            hinted = [c for c in children if JOB_SITEMAP_HINT.search(c[0])]
+            queue.extend(hinted or children)
+
+        if any(url not in sitemaps_seen for url, _ in queue):
+            # Out of budget: keep what the unread sitemaps listed last time
+            for url, info in entry["urls"].items():
+                if url not in found and info.get("job") and info.get("sitemap") not in covered:
+                    found[url] = info.get("lastmod")
+
+        entry["sitemaps"] = {url: lastmod for url, lastmod in sitemaps_seen.items() if lastmod}
+        return found
+
+    def _fetch_posting(self, url: str) -> Optional[Dict]:
+        try:
+            with self.fetch(url) as response:
+                page_html = response.read(MAX_PAGE_BYTES).decode('utf-8', 'ignore')
+            return parse_job_page(url, page_html)
+        except Exception:
+            return None
+
+    def discover_jobs(self, name: str, careers_url: str) -> Tuple[List[Dict], Dict[str, int]]:
+        """
+        Current postings for a target, fetching only new or changed ones.
+
+        Returns ``(jobs, counts)`` with ``counts`` holding how many postings
+        were ``fetched`` and how many were ``reused`` from the last run.
+        """
+        found = self.discover(name, careers_url)
+        entry = self.state[name]
+        stored = entry["urls"]
+
+        reused, to_fetch = [], []
+        for url, lastmod in found.items():
+            info = stored.get(url, {})
+            if lastmod and info.get("lastmod") == lastmod and info.get("job"):
+                reused.append(info["job"])
+            else:
+                to_fetch.append(url)
+
+        fetched = []
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for url, job in zip(to_fetch, pool.map(self._fetch_posting, to_fetch)):
+                    if job and job.get('title'):
+                        fetched.append(job)
+                        stored[url] = {"sitemap": stored.get(url, {}).get("sitemap"),
+                                       "lastmod": found[url], "job": job}
+
+        # Postings gone from the sitemaps are closed; forget them
+        entry["urls"] = {url: info for url, info in stored.items() if url in found}
+        entry["checked"] = datetime.now().isoformat()
+        self.save(name)
+
+        return reused + fetched, {"fetched": len(fetched), "reused": len(reused)}
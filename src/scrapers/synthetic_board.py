@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Synthetic job-board server for load and soak testing the scrapers.
+
+Serves deterministic fake boards that mimic each platform's pagination:
+- Getro "Load more" button       /getro/<board>/jobs
+- Getro-style infinite scroll     /scroll/<board>/jobs
+- Index Ventures URL pages        /index/<location>/<page>
+- Greenhouse board + JSON API     /greenhouse/<board>, /greenhouse/v1/boards/<board>/jobs
+- Lever board + JSON API          /lever/<board>, /lever/v0/postings/<board>?mode=json
+- Ashby board                     /ashby/<board>
+
+Usage:
+    python -m src.scrapers.synthetic_board --jobs 50000 --latency-ms 50 \\
+        --write-targets data/synthetic_targets.json
+    python run_scraper.py --config data/synthetic_targets.json
+"""
+
+import argparse
+import asyncio
+import base64
+import html
+import json
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+SENIORITY = ['', 'Senior ', 'Lead ', 'Principal ', 'Head of ', 'Director, ', 'VP ', 'Junior ']
+ROLES = [
+    'Account Executive', 'Enterprise Sales', 'Partnerships Manager', 'Solutions Engineer',
+    'Customer Success Manager', 'Business Development', 'Software Engineer', 'Data Scientist',
+    'Product Manager', 'ML Engineer', 'Revenue Operations', 'Marketing Manager',
+]
+COMPANY_WORDS = [
+    'Acme', 'Nimbus', 'Quantum', 'Vector', 'Orbit', 'Lumen', 'Cobalt', 'Harbor',
+    'Pixel', 'Atlas', 'Summit', 'Kinetic', 'Helix', 'Nova', 'Zenith', 'Ember',
+]
+COMPANY_SUFFIXES = ['AI', 'Labs', 'Robotics', 'Cloud', 'Health', 'Pay', 'Security', 'Data']
+LOCATIONS = [
+    'Sydney, New South Wales, Australia', 'Melbourne, Victoria, Australia', 'Brisbane, Australia',
+    'Singapore', 'Remote - APAC', 'Tokyo, Japan', 'Bangalore, India', 'Auckland, New Zealand',
+    'San Francisco, CA', 'New York, NY', 'London, United Kingdom', 'Berlin, Germany',
+    'Remote', 'Austin, TX',
+]
+DEPARTMENTS = ['Sales', 'Engineering', 'Product', 'Customer Success', 'Marketing', 'Operations']
+
+
+@dataclass
+class BoardConfig:
+    """Size, pagination and latency settings for the synthetic boards."""
+    jobs: int = 1000
+    page_size: int = 20
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    seed: int = 42
+
+
+def slug(text: str) -> str:
+    """Lower-case, hyphenated slug."""
+    return '-'.join(''.join(c if c.isalnum() else ' ' for c in text.lower()).split())
+
+
+def synthetic_job(index: int, seed: int = 42) -> Dict:
+    """Generate one deterministic job posting."""
+    rng = random.Random(seed * 1_000_003 + index)
+    company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}"
+    title = f"{rng.choice(SENIORITY)}{rng.choice(ROLES)}"
+    return {
+        "id": index + 1,
+        "title": title,
+        "company": company,
+        # Getro appends an id suffix to company slugs
+        "company_slug": f"{slug(company)}-{rng.getrandbits(24):06x}",
+        "location": rng.choice(LOCATIONS),
+        "department": rng.choice(DEPARTMENTS),
+        "posted": (date(2026, 1, 1) + timedelta(days=rng.randrange(365))).isoformat(),
+    }
+
+
+class SyntheticBoard:
+    """Deterministic job data with cached per-filter views."""
+
+    def __init__(self, config: BoardConfig):
+        self.config = config
+        self.jobs = [synthetic_job(i, config.seed) for i in range(config.jobs)]
+        self._views: Dict[Tuple[str, ...], List[Dict]] = {}
+
+    def filtered(self, terms: Tuple[str, ...] = ()) -> List[Dict]:
+        """Jobs whose location contains every term (case-insensitive)."""
+        terms = tuple(t.lower() for t in terms if t)
+        if terms not in self._views:
+            self._views[terms] = [
+                j for j in self.jobs if all(t in j['location'].lower() for t in terms)
+            ]
+        return self._views[terms]
+
+    def page(self, jobs: List[Dict], page_num: int) -> List[Dict]:
+        """1-based page of a job list."""
+        size = self.config.page_size
+        start = (page_num - 1) * size
+        return jobs[start:start + size]
+
+
+# =============================================================================
+# HTML RENDERING
+# =============================================================================
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>.job-card{{display:block;height:120px;margin:8px;border:1px solid #ddd}}</style>
+</head><body>
+<h1>{title}</h1>
+<div id="jobs">{cards}</div>
+{footer}
+</body></html>"""
+
+LOAD_MORE_SCRIPT = """<button id="load-more" {hidden}>Load more</button>
+<script>
+let nextPage = 2;
+document.getElementById('load-more').addEventListener('click', async () => {{
+  const res = await fetch('{api}' + (('{api}'.includes('?')) ? '&' : '?') + 'page=' + nextPage);
+  const data = await res.json();
+  document.getElementById('jobs').insertAdjacentHTML('beforeend', data.html);
+  nextPage += 1;
+  if (!data.has_more) document.getElementById('load-more').remove();
+}});
+</script>"""
+
+SCROLL_SCRIPT = """<script>
+let nextPage = 2, loading = false, done = {done};
+window.addEventListener('scroll', async () => {{
+  if (done || loading) return;
+  if (window.innerHeight + window.scrollY < document.body.scrollHeight - 200) return;
+  loading = true;
+  const res = await fetch('{api}' + (('{api}'.includes('?')) ? '&' : '?') + 'page=' + nextPage);
+  const data = await res.json();
+  document.getElementById('jobs').insertAdjacentHTML('beforeend', data.html);
+  nextPage += 1;
+  done = !data.has_more;
+  loading = false;
+}});
+</script>"""
+
+
+def getro_card(job: Dict, base: str, board: str) -> str:
+    """Getro-style card: one link per job with title/company/location lines."""
+    href = f"{base}/getro/{board}/companies/{job['company_slug']}/jobs/{job['id']}-{slug(job['title'])}"
+    return (f'<a class="job-card" href="{href}"><div>{html.escape(job["title"])}</div>'
+            f'<div>{html.escape(job["company"])}</div><div>{html.escape(job["location"])}</div></a>')
+
+
+def index_card(job: Dict, base: str) -> str:
+    """Index Ventures-style search result."""
+    return (f'<div class="result"><a href="{base}/index/job/{job["id"]}">'
+            f'<div>{html.escape(job["title"])}</div><div>{html.escape(job["company"])}</div>'
+            f'<div>{html.escape(job["location"])}</div></a></div>')
+
+
+def greenhouse_card(job: Dict, base: str, board: str) -> str:
+    """Greenhouse embedded board opening."""
+    return (f'<div class="opening"><a href="{base}/greenhouse/{board}/jobs/{job["id"]}">'
+            f'{html.escape(job["title"])}</a><span class="location">{html.escape(job["location"])}</span></div>')
+
+
+def lever_card(job: Dict, base: str, board: str) -> str:
+    """Lever posting block."""
+    return (f'<a class="posting" href="{base}/lever/{board}/{job["id"]}">'
+            f'<h5 class="posting-title">{html.escape(job["title"])}</h5>'
+            f'<div class="posting-categories"><span class="location">{html.escape(job["location"])}</span></div></a>')
+
+
+def ashby_card(job: Dict, base: str, board: str) -> str:
+    """Ashby job listing row."""
+    return (f'<div class="job-listing"><a href="{base}/ashby/{board}/jobs/{job["id"]}">'
+            f'{html.escape(job["title"])}</a><span class="location">{html.escape(job["location"])}</span></div>')
+
+
+def job_detail_page(job: Dict, url: str) -> str:
+    """Job posting page with schema.org JobPosting JSON-LD."""
+    posting = {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": job['title'],
+        "datePosted": job['posted'],
+        "hiringOrganization": {"@type": "Organization", "name": job['company']},
+        "jobLocation": {"@type": "Place", "address": job['location']},
+        "description": f"{job['title']} in the {job['department']} team at {job['company']}.",
+        "url": url,
+    }
+    body = (f'<script type="application/ld+json">{json.dumps(posting)}</script>'
+            f'<h2>{html.escape(job["company"])}</h2><p>{html.escape(job["location"])}</p>')
+    return PAGE_TEMPLATE.format(title=html.escape(job['title']), cards=body, footer="")
+
+
+# =============================================================================
+# HTTP SERVER
+# =============================================================================
+
+class SyntheticBoardServer:
+    """Minimal asyncio HTTP/1.1 server for the synthetic boards."""
+
+    def __init__(self, config: Optional[BoardConfig] = None, host: str = "127.0.0.1", port: int = 8765):
+        self.config = config or BoardConfig()
+        self.board = SyntheticBoard(self.config)
+        self.host = host
+        self.port = port
+        self.requests_served = 0
+        self._rng = random.Random(self.config.seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "SyntheticBoardServer":
+        """Start listening (port 0 picks a free port)."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        """Stop the server."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def serve_forever(self):
+        """Run until cancelled."""
+        if not self._server:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve keep-alive requests on one connection."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode('latin-1').split()
+                if len(parts) < 2:
+                    break
+                method, target = parts[0], parts[1]
+
+                await self._inject_latency()
+                status, content_type, body = self.route(target)
+                self.requests_served += 1
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                head = (f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                        f"Content-Length: {len(body)}\r\nCache-Control: no-store\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+                writer.write(head.encode('latin-1'))
+                if method != 'HEAD':
+                    writer.write(body)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _inject_latency(self):
+        """Sleep for the configured latency plus jitter."""
+        delay = self.config.latency_ms
+        if self.config.jitter_ms:
+            delay += self._rng.uniform(0, self.config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+    # ============= ROUTING =============
+
+    def route(self, target: str) -> Tuple[str, str, bytes]:
+        """Map a request target to (status, content type, body)."""
+        parsed = urlsplit(target)
+        parts = [unquote(p) for p in parsed.path.split('/') if p]
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        base = self.base_url
+
+        try:
+            if not parts:
+                return self._html("Synthetic Job Boards", self._directory(), "")
+
+            platform = parts[0]
+
+            if platform == 'getro' and len(parts) >= 3:
+                board = parts[1]
+                if parts[2] == 'jobs' and len(parts) == 3:
+                    return self._paged_board(f"{board} jobs", getro_card, board, query,
+                                             f"/getro/{board}/api/jobs", LOAD_MORE_SCRIPT)
+                if parts[2] == 'api':
+                    return self._api_page(getro_card, board, query)
+                if parts[2] == 'companies' and len(parts) >= 6:
+                    return self._job_page(parts[5].split('-')[0], target)
+
+            if platform == 'scroll' and len(parts) >= 3:
+                board = parts[1]
+                if parts[2] == 'jobs' and len(parts) == 3:
+                    return self._paged_board(f"{board} jobs", getro_card, board, query,
+                                             f"/scroll/{board}/api/jobs", SCROLL_SCRIPT)
+                if parts[2] == 'api':
+                    return self._api_page(getro_card, board, query)
+
+            if platform == 'index' and len(parts) >= 2:
+                if parts[1] == 'job' and len(parts) == 3:
+                    return self._job_page(parts[2], target)
+                location = parts[1]
+                page_num = int(parts[2]) if len(parts) > 2 else 1
+                jobs = self.board.page(self.board.filtered(tuple(location.split('-'))), page_num)
+                cards = ''.join(index_card(j, base) for j in jobs)
+                return self._html(f"Startup jobs in {location}", cards, "")
+
+            if platform == 'greenhouse':
+                if parts[1:3] == ['v1', 'boards'] and len(parts) >= 5:
+                    return self._greenhouse_api(parts[3])
+                if len(parts) == 2:
+                    cards = ''.join(greenhouse_card(j, base, parts[1]) for j in self.board.jobs)
+                    return self._html(f"{parts[1]} careers (greenhouse)", cards, "")
+                if len(parts) == 4 and parts[2] == 'jobs':
+                    return self._job_page(parts[3], target)
+
+            if platform == 'lever':
+                if parts[1:3] == ['v0', 'postings'] and len(parts) >= 4:
+                    return self._lever_api(parts[3], query)
+                if len(parts) == 2:
+                    cards = ''.join(lever_card(j, base, parts[1]) for j in self.board.jobs)
+                    return self._html(f"{parts[1]} careers (lever)", cards, "")
+                if len(parts) == 3:
+                    return self._job_page(parts[2], target)
+
+            if platform == 'ashby':
+                if len(parts) == 2:
+                    cards = ''.join(ashby_card(j, base, parts[1]) for j in self.board.jobs)
+                    return self._html(f"{parts[1]} careers (ashby)", cards, "")
+                if len(parts) == 4 and parts[2] == 'jobs':
+                    return self._job_page(parts[3], target)
+
+        except (ValueError, IndexError):
+            return "400 Bad Request", "text/plain", b"bad request"
+
+        return "404 Not Found", "text/plain", b"not found"
+
+    def _directory(self) -> str:
+        """Landing page listing every synthetic board."""
+        links = [f'<li><a href="{t["url"]}">{html.escape(t["name"])}</a></li>'
+                 for t in targets_for(self.base_url)]
+        return f"<ul>{''.join(links)}</ul>"
+
+    def _html(self, title: str, cards: str, footer: str) -> Tuple[str, str, bytes]:
+        page = PAGE_TEMPLATE.format(title=html.escape(title), cards=cards, footer=footer)
+        return "200 OK", "text/html; charset=utf-8", page.encode('utf-8')
+
+    def _json(self, data) -> Tuple[str, str, bytes]:
+        return "200 OK", "application/json", json.dumps(data).encode('utf-8')
+
+    def _location_terms(self, query: Dict[str, str]) -> Tuple[str, ...]:
+        """Location filter from Getro's base64 ?filter= or Sequoia's ?locations=."""
+        if 'filter' in query:
+            try:
+                # parse_qs turns an unencoded '+' into a space
+                decoded = json.loads(base64.b64decode(unquote(query['filter']).replace(' ', '+')))
+                return tuple(decoded.get('searchable_locations', [])[:1])
+            except (ValueError, TypeError):
+                return ()
+        if 'locations' in query:
+            return (query['locations'],)
+        return ()
+
+    def _paged_board(self, title: str, card, board: str, query: Dict[str, str],
+                     api_path: str, script: str) -> Tuple[str, str, bytes]:
+        """First page of a client-paginated board plus its pagination script."""
+        jobs = self.board.filtered(self._location_terms(query))
+        first = self.board.page(jobs, 1)
+        has_more = len(jobs) > len(first)
+
+        api = api_path
+        extra = {k: v for k, v in query.items() if k in ('filter', 'locations')}
+        if extra:
+            api += '?' + '&'.join(f"{k}={v}" for k, v in extra.items())
+
+        footer = script.format(api=api, hidden='' if has_more else 'hidden',
+                               done='false' if has_more else 'true')
+        cards = ''.join(card(j, self.base_url, board) for j in first)
+        return self._html(title, cards, footer)
+
+    def _api_page(self, card, board: str, query: Dict[str, str]) -> Tuple[str, str, bytes]:
+        """Next page of cards as an HTML fragment."""
+        jobs = self.board.filtered(self._location_terms(query))
+        page_num = int(query.get('page', 2))
+        page = self.board.page(jobs, page_num)
+        return self._json({
+            "html": ''.join(card(j, self.base_url, board) for j in page),
+            "has_more": page_num * self.config.page_size < len(jobs),
+        })
+
+    def _greenhouse_api(self, board: str) -> Tuple[str, str, bytes]:
+        """Greenhouse boards-api response (unpaginated, like the real API)."""
+        return self._json({
+            "jobs": [{
+                "id": j['id'],
+                "title": j['title'],
+                "absolute_url": f"{self.base_url}/greenhouse/{board}/jobs/{j['id']}",
+                "location": {"name": j['location']},
+                "departments": [{"name": j['department']}],
+                "updated_at": f"{j['posted']}T00:00:00Z",
+            } for j in self.board.jobs],
+            "meta": {"total": len(self.board.jobs)},
+        })
+
+    def _lever_api(self, board: str, query: Dict[str, str]) -> Tuple[str, str, bytes]:
+        """Lever postings API with skip/limit pagination."""
+        skip = int(query.get('skip', 0))
+        limit = int(query.get('limit', len(self.board.jobs)))
+        return self._json([{
+            "id": str(j['id']),
+            "text": j['title'],
+            "hostedUrl": f"{self.base_url}/lever/{board}/{j['id']}",
+            "categories": {"location": j['location'], "team": j['department'], "commitment": "Full-time"},
+            "createdAt": j['posted'],
+        } for j in self.board.jobs[skip:skip + limit]])
+
+    def _job_page(self, job_id: str, target: str) -> Tuple[str, str, bytes]:
+        """Detail page for one job."""
+        index = int(job_id) - 1
+        if not 0 <= index < len(self.board.jobs):
+            return "404 Not Found", "text/plain", b"job closed"
+        page = job_detail_page(self.board.jobs[index], self.base_url + target)
+        return "200 OK", "text/html; charset=utf-8", page.encode('utf-8')
+
+
+def targets_for(base_url: str) -> List[Dict]:
+    """Scraper targets (scraper_targets.json format) pointing at a synthetic server."""
+    return [
+        {"name": "Synthetic Getro", "url": f"{base_url}/getro/synthetic-vc/jobs", "type": "vc_portfolio",
+         "platform": "getro", "location_filter": "Australia", "enabled": True},
+        {"name": "Synthetic Scroll", "url": f"{base_url}/scroll/synthetic-vc/jobs", "type": "vc_portfolio",
+         "platform": "getro", "enabled": True},
+        {"name": "Synthetic Index", "url": f"{base_url}/index/sydney-australia/1", "type": "vc_portfolio",
+         "platform": "custom", "enabled": True},
+        {"name": "Synthetic Greenhouse", "url": f"{base_url}/greenhouse/synthetic", "type": "company",
+         "platform": "greenhouse", "enabled": True},
+        {"name": "Synthetic Lever", "url": f"{base_url}/lever/synthetic", "type": "company",
+         "platform": "lever", "enabled": True},
+        {"name": "Synthetic Ashby", "url": f"{base_url}/ashby/synthetic", "type": "company",
+         "platform": "ashby", "enabled": True},
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic job-board server for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jobs", type=int, default=1000, help="Postings per board")
+    parser.add_argument("--page-size", type=int, default=20, help="Jobs per page / load-more batch")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency per request")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--write-targets", type=str,
+                        help="Write a scraper targets config pointing at this server")
+    args = parser.parse_args()
+
+    config = BoardConfig(jobs=args.jobs, page_size=args.page_size, latency_ms=args.latency_ms,
+                         jitter_ms=args.jitter_ms, seed=args.seed)
+    server = SyntheticBoardServer(config, args.host, args.port)
+
+    if args.write_targets:
+        with open(args.write_targets, 'w') as f:
+            json.dump({
+                "description": "Synthetic boards for load testing",
+                "filters": {"apac_only": True, "gtm_only": False},
+                "targets": targets_for(server.base_url),
+            }, f, indent=2)
+        print(f"💾 Wrote targets to {args.write_targets}")
+
+    print(f"🧪 Serving {config.jobs} synthetic jobs per board at {server.base_url}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Shared test data."""
+
+
+def make_job(n: int = 1, **fields) -> dict:
+    """Job ``n`` on Acme's Lever board in Sydney; keyword arguments override or add fields."""
+    return {"title": f"Account Executive {n}", "company": "Acme", "location": "Sydney, Australia",
+            "url": f"https://jobs.lever.co/acme/{n}", **fields}
@@ -0,0 +1,104 @@
+"""Tests for the offline benchmark's result aggregation."""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from argparse import Namespace
+from pathlib import Path
+from unittest import mock
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import benchmark_scrapers
+    from benchmark_scrapers import bench_universal, build_result, print_table, run_benchmark, summarize
+    from src.core.metrics import SCRAPE_ERRORS
+    from universal_job_scraper import UniversalJobScraper
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+def row(target, wall_s, jobs=10, suite="universal", scraper="GreenhouseScraper", error=""):
+    return build_result(suite, scraper, target, 100.0, 100.0 + wall_s, jobs, error)
+
+
+@unittest.skipUnless(PLAYWRIGHT_AVAILABLE, "playwright not installed")
+class TestBenchmarkResults(unittest.TestCase):
+    """Test result rows, median summaries and the saved report."""
+
+    def test_build_result(self):
+        result = build_result("vc", "IndexVenturesScraper", "Index", 10.0, 14.0, 20)
+        self.assertEqual(result["wall_s"], 4.0)
+        self.assertEqual(result["jobs_per_s"], 5.0)
+        self.assertEqual(result["error"], "")
+
+    def test_universal_rows_report_logged_errors_and_plugin_classes(self):
+        async def scrape_target(scraper, target):
+            if target["name"] == "Broken":
+                SCRAPE_ERRORS.inc(suite=scraper.suite, target="Broken")
+                return []
+            return [{"url": "https://jobs.lever.co/acme/1"}]
+
+        targets = [{"name": "Broken", "platform": "lever"},
+                   {"name": "Index Ventures", "scraper": "index-ventures"}]
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            # UniversalJobScraper keeps its state under ./data
+            os.chdir(tmp)
+            try:
+                with mock.patch.object(UniversalJobScraper, "scrape_target", scrape_target):
+                    rows = asyncio.run(bench_universal(targets, None, False))
+            finally:
+                os.chdir(cwd)
+        self.assertEqual([(r["scraper"], r["jobs"], r["error"]) for r in rows],
+                         [("LeverScraper", 0, "1 scrape error"), ("IndexVenturesScraper", 1, "")])
+
+    def test_summarize_takes_median_run(self):
+        runs = [[row("Acme", 3.0), row("Beta", 1.0)],
+                [row("Acme", 1.0), row("Beta", 2.0)],
+                [row("Acme", 2.0, jobs=12), row("Beta", 9.0)]]
+        summary = {r["target"]: r for r in summarize(runs)}
+        self.assertEqual(summary["Acme"]["wall_s"], 2.0)
+        self.assertEqual(summary["Acme"]["jobs"], 12)
+        self.assertEqual(summary["Beta"]["wall_s"], 2.0)
+        self.assertEqual(summary["Acme"]["runs"], 3)
+
+    def test_table_shows_deltas_and_errors(self):
+        summary = summarize([[row("Acme", 3.0), row("Beta", 1.0, jobs=0, error="No HAR archive")]])
+        baseline = {("universal", "GreenhouseScraper", "Acme"): row("Acme", 2.0)}
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            print_table(summary, baseline)
+        self.assertIn("+50.0%", output.getvalue())
+        self.assertIn("❌ No HAR archive", output.getvalue())
+
+    def test_run_benchmark_saves_summary(self):
+        walls = iter([3.0, 1.0, 2.0])
+
+        async def bench_universal(targets, har, filter_apac):
+            return [row(t["name"], next(walls)) for t in targets]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            config = Path(tmp) / "targets.json"
+            config.write_text(json.dumps({"targets": [{"name": "Acme", "platform": "greenhouse"},
+                                                      {"name": "Off", "enabled": False}]}))
+            args = Namespace(har_dir=str(Path(tmp) / "har"), record=False, config=str(config), target=None,
+                             repeat=3, suite="universal", compare=None, output_dir=str(Path(tmp) / "out"))
+            with mock.patch.object(benchmark_scrapers, "bench_universal", bench_universal), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                report = asyncio.run(run_benchmark(args))
+
+            self.assertEqual(report["mode"], "replay")
+            self.assertEqual([(r["target"], r["wall_s"], r["runs"]) for r in report["results"]], [("Acme", 2.0, 3)])
+            saved = json.loads(next(Path(tmp, "out").glob("benchmark_*.json")).read_text())
+            self.assertEqual(saved["results"], report["results"])
+
+
+if __name__ == '__main__':
+    unittest.main()
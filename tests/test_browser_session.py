@@ -0,0 +1,208 @@
+"""Tests for browser memory governance."""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from src.scrapers import browser_session
+    from src.scrapers.browser_session import BrowserSession, MemoryLimits, chromium_memory_mb, scrape_in_tabs
+    from src.scrapers.browser_session import navigate
+    from src.scrapers.har import HarConfig
+    from src.core.metrics import PAGES_NAVIGATED
+    from src.core.tracing import Tracer
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+class FakePage:
+    def __init__(self, context=None):
+        self.context = context
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class NavigatingPage:
+    async def goto(self, url, **kwargs):
+        return url
+
+
+class FakeContext:
+    def __init__(self, **options):
+        self.options = options
+        self.pages = []
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    async def new_context(self, **kwargs):
+        return FakeContext(**kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launches = 0
+
+    async def launch(self, **kwargs):
+        self.launches += 1
+        return FakeBrowser()
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+
+@unittest.skipUnless(PLAYWRIGHT_AVAILABLE, "playwright not installed")
+class TestBrowserSession(unittest.TestCase):
+    """Test page recycling and browser restarts against fake browser objects."""
+
+    def setUp(self):
+        self.rss = {"total": 300.0, "renderer": 100.0}
+        self.readings = 0
+        self._reader = browser_session.chromium_memory_mb
+        browser_session.chromium_memory_mb = self.read_memory
+        self.session = self.make_session()
+
+    def tearDown(self):
+        browser_session.chromium_memory_mb = self._reader
+
+    def read_memory(self):
+        self.readings += 1
+        return dict(self.rss)
+
+    def make_session(self, har=None, sample_interval_s=0.0):
+        session = BrowserSession(har, MemoryLimits(max_navigations_per_page=3, renderer_rss_mb=400,
+                                                   browser_rss_mb=1000, sample_interval_s=sample_interval_s))
+        session._playwright = FakePlaywright()
+        asyncio.run(session._launch())
+        return session
+
+    def run_async(self, coro):
+        return asyncio.run(coro)
+
+    def test_recycles_page_after_max_navigations(self):
+        first = self.run_async(self.session.new_page("Index"))
+        pages = [self.run_async(self.session.checkpoint("Index")) for _ in range(4)]
+
+        self.assertIs(pages[2], first)
+        self.assertIsNot(pages[3], first)
+        self.assertTrue(first.closed)
+        self.assertEqual(self.session.recycles, 1)
+
+    def test_recycles_page_over_renderer_limit(self):
+        first = self.run_async(self.session.new_page("Index"))
+        self.rss["renderer"] = 450
+        self.assertIsNot(self.run_async(self.session.checkpoint("Index")), first)
+
+    def test_restart_over_hard_cap_keeps_open_targets(self):
+        self.run_async(self.session.new_page("Index"))
+        old_browser = self.session.browser
+        self.rss["total"] = 1500
+
+        self.assertTrue(self.session.over_hard_cap())
+        page = self.run_async(self.session.checkpoint("Index"))
+
+        self.assertTrue(old_browser.closed)
+        self.assertEqual(self.session.restarts, 1)
+        self.assertIs(self.session.pages["Index"], page)
+        self.assertEqual(self.session._playwright.chromium.launches, 2)
+        self.assertEqual(self.session.peak_mb, 1500)
+
+    def test_load_more_stops_at_either_limit(self):
+        self.assertTrue(self.session.can_load_more())
+        self.rss["renderer"] = 450
+        self.assertFalse(self.session.can_load_more())
+        self.rss.update(renderer=100, total=1500)
+        self.assertFalse(self.session.can_load_more())
+
+    def test_memory_readings_are_reused_within_interval(self):
+        session = self.make_session(sample_interval_s=60)
+        self.assertTrue(all(session.can_load_more() for _ in range(10)))
+        self.rss["total"] = 1500
+        self.assertFalse(session.over_hard_cap())
+        self.assertEqual(self.readings, 1)
+
+        session._sampled_at -= 60
+        self.assertTrue(session.over_hard_cap())
+        self.assertEqual(self.readings, 2)
+
+    def test_restart_records_the_next_har_part(self):
+        with tempfile.TemporaryDirectory() as directory:
+            session = self.make_session(har=HarConfig(directory, mode="record"))
+            self.run_async(session.new_page("Index Ventures"))
+            first = session.contexts["Index Ventures"]
+            self.rss["total"] = 1500
+            self.run_async(session.checkpoint())
+
+            self.assertTrue(first.closed)
+            paths = [context.options["record_har_path"] for context in (first, session.contexts["Index Ventures"])]
+            self.assertEqual([Path(path).name for path in paths], ["index-ventures.har", "index-ventures.2.har"])
+
+    def test_navigations_are_counted_per_suite(self):
+        before = PAGES_NAVIGATED.get(suite="vc", target="Index")
+        worker = Tracer("vc")
+        worker.name = "vc-worker-0"
+        with worker.target("Index"):
+            asyncio.run(navigate(NavigatingPage(), "https://jobs.example.com"))
+        self.assertEqual(PAGES_NAVIGATED.get(suite="vc", target="Index"), before + 1)
+
+    def test_memory_reader_returns_sizes(self):
+        memory = chromium_memory_mb()
+        self.assertGreaterEqual(memory["total"], memory["renderer"])
+        self.assertGreaterEqual(memory["renderer"], 0)
+
+
+@unittest.skipUnless(PLAYWRIGHT_AVAILABLE, "playwright not installed")
+class TestScrapeInTabs(unittest.TestCase):
+    """Test concurrent per-region tabs in one context."""
+
+    def test_regions_run_concurrently_in_extra_tabs(self):
+        context = FakeContext()
+        page = FakePage(context)
+        in_flight, peak, used = [0], [0], []
+
+        async def scrape(tab, region):
+            used.append(tab)
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            if region == "Singapore":
+                raise RuntimeError("timeout")
+            return [{"url": f"/jobs/{region}"}]
+
+        results = asyncio.run(scrape_in_tabs(page, ["Australia", "Singapore", "Remote"], scrape))
+
+        self.assertEqual(results[0], [{"url": "/jobs/Australia"}])
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(peak[0], 3)
+        self.assertIs(used[0], page)
+        self.assertFalse(page.closed)
+        self.assertTrue(all(tab.closed for tab in context.pages))
+        self.assertEqual(len(context.pages), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
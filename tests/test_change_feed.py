@@ -0,0 +1,65 @@
+"""Tests for the run-to-run change feed."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.change_feed import ChangeFeed, canonical_url, summarize
+from tests.factories import make_job
+
+
+class TestChangeFeed(unittest.TestCase):
+    """Test added/removed/changed detection and recording."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.feed = ChangeFeed(root / "jobs.db", root / "changes")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def kinds(self, events):
+        return sorted((e["event"], e["url"].rsplit("/", 1)[-1]) for e in events)
+
+    def test_canonical_url_drops_tracking_and_trailing_slash(self):
+        self.assertEqual(canonical_url("HTTPS://Jobs.Lever.co/acme/1/?lever-source=LinkedIn#apply"),
+                         "https://jobs.lever.co/acme/1")
+        self.assertEqual(canonical_url("https://acme.com/jobs?id=7&utm_source=x"),
+                         "https://acme.com/jobs?id=7")
+
+    def test_first_run_adds_and_rerun_is_quiet(self):
+        events = self.feed.apply("universal", {"Acme": [make_job(1), make_job(2)]}, run_id="r1")
+        self.assertEqual(self.kinds(events), [("added", "1"), ("added", "2")])
+        # Score changes and tracking parameters don't count as changes
+        rerun = [make_job(1, match_score=90), dict(make_job(2), url=make_job(2)["url"] + "?gh_src=abc")]
+        self.assertEqual(self.feed.apply("universal", {"Acme": rerun}, run_id="r2"), [])
+
+    def test_added_removed_changed(self):
+        self.feed.apply("universal", {"Acme": [make_job(1), make_job(2)], "Beta": [make_job(9)]}, run_id="r1")
+        events = self.feed.apply("universal", {"Acme": [make_job(1, title="Senior AE"), make_job(3)]}, run_id="r2")
+
+        self.assertEqual(self.kinds(events), [("added", "3"), ("changed", "1"), ("removed", "2")])
+        changed = next(e for e in events if e["event"] == "changed")
+        self.assertEqual(changed["changed_fields"], ["title"])
+        # Beta wasn't scraped this run, so its job isn't reported removed
+        self.assertEqual(summarize(events), {"Acme": {"added": 1, "removed": 1, "changed": 1}})
+
+        lines = self.feed.feed_file("universal", "r2").read_text().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[0])["run_id"], "r2")
+        self.assertEqual(len(self.feed.recent_changes("universal")), 6)
+
+    def test_partial_target_reports_no_removals(self):
+        self.feed.apply("vc", {"Index": [make_job(1), make_job(2)]}, run_id="r1")
+        events = self.feed.apply("vc", {"Index": [make_job(1)]}, partial_targets=["Index"], run_id="r2")
+        self.assertEqual(events, [])
+        events = self.feed.apply("vc", {"Index": [make_job(1)]}, run_id="r3")
+        self.assertEqual(self.kinds(events), [("removed", "2")])
+
+
+if __name__ == '__main__':
+    unittest.main()
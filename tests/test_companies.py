@@ -0,0 +1,77 @@
+"""Tests for company entity resolution."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.companies import CompanyResolver, board_slug, company_key, domain_key, slug_key
+
+
+class TestCompanyResolver(unittest.TestCase):
+    """Test key normalization, alias persistence and the fuzzy fallback."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = str(Path(self.test_dir) / "jobs.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_keys(self):
+        self.assertEqual(company_key("Canva Pty Ltd"), "canva")
+        self.assertEqual(company_key("Safety Culture"), company_key("SafetyCulture"))
+        self.assertEqual(slug_key("dealer-com-2"), company_key("Dealer.com"))
+        self.assertEqual(slug_key("dbtlabsinc"), company_key("dbt Labs"))
+        self.assertEqual(domain_key("https://careers.canva.com/jobs"), "canva")
+        self.assertEqual(domain_key("www.atlassian.com.au"), "atlassian")
+
+    def test_board_slugs(self):
+        cases = {
+            "https://job-boards.greenhouse.io/dbtlabsinc/jobs/4654118005": "dbtlabsinc",
+            "https://jobs.lever.co/safetyculture-2/0b4f36a5-1a7e-4d1f-8a22-96e1a8a1fd11": "safetyculture-2",
+            "https://jobs.ashbyhq.com/notion/9fe70944-f84f-421c-8168-bbf21d4b4ca4": "notion",
+            "https://jobs.accel.com/companies/canva/jobs/66534143-senior-engineer": "canva",
+            "https://stripe.com/jobs/listing/ae/7477347": None,
+        }
+        for url, expected in cases.items():
+            self.assertEqual(board_slug(url), expected, url)
+
+    def test_variants_share_an_id_across_instances(self):
+        resolver = CompanyResolver(self.db_path)
+        jobs = [
+            {"company": "SafetyCulture", "url": "https://jobs.lever.co/safetyculture-2/1"},
+            {"company": "Unknown", "url": "https://jobs.accel.com/companies/safetyculture/jobs/1-ae"},
+            {"company": "Safety Culture Pty Ltd"},
+            {"company": "Canva"},
+        ]
+        resolver.resolve_jobs(jobs)
+        self.assertEqual(len({job["company_id"] for job in jobs[:3]}), 1)
+        self.assertEqual([job["company"] for job in jobs], ["SafetyCulture"] * 3 + ["Canva"])
+
+        reopened = CompanyResolver(self.db_path, fuzzy=False)
+        self.assertEqual(reopened.lookup("safetyculture"), jobs[0]["company_id"])
+        self.assertEqual(reopened.resolve(domain="https://www.canva.com"), jobs[3]["company_id"])
+        self.assertIsNone(reopened.lookup("Atlassian"))
+        self.assertIsNone(reopened.resolve("Unknown"))
+
+    def test_slug_name_gives_way_to_scraped_name(self):
+        resolver = CompanyResolver(self.db_path)
+        company_id = resolver.resolve("Unknown", url="https://jobs.lever.co/dbtlabsinc/1")
+        self.assertEqual(resolver.name(company_id), "Dbtlabsinc")
+        self.assertEqual(resolver.resolve("dbt Labs"), company_id)
+        resolver.resolve("DBT LABS INC")
+        self.assertEqual(CompanyResolver(self.db_path).name(company_id), "dbt Labs")
+
+    def test_fuzzy_fallback(self):
+        resolver = CompanyResolver(self.db_path)
+        acme = resolver.resolve("Acme Robotics")
+        self.assertEqual(resolver.resolve("Acme Robotic"), acme)
+        self.assertNotEqual(resolver.resolve("Acme Rocketry"), acme)
+        self.assertNotEqual(CompanyResolver(self.db_path, fuzzy=False).resolve("Acme Robotix"), acme)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.core.database import DatabaseManager
+from src.core.url_canon import url_id
 
 
 class TestDatabaseManager(unittest.TestCase):
@@ -66,6 +67,44 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(job['company'], 'TechCorp')
         self.assertEqual(job['match_score'], 85.5)
     
+    def test_add_jobs_batch(self):
+        """Test batch insert skips jobs that already exist."""
+        self.db.add_job({'job_id': 'a', 'title': 'AE', 'company': 'Acme'})
+        jobs = [
+            {'job_id': 'a', 'title': 'AE', 'company': 'Acme'},
+            {'job_id': 'b', 'title': 'Sales Director', 'company': 'Acme',
+             'requirements': ['Enterprise sales']},
+            {'job_id': 'c', 'title': 'Partner Manager', 'company': 'Beta'},
+        ]
+        
+        self.assertEqual(self.db.add_jobs(jobs), 2)
+        self.assertEqual(self.db.add_jobs(jobs), 0)
+        self.assertEqual(json.loads(self.db.get_job('b')['requirements']), ['Enterprise sales'])
+    
+    def test_add_job_normalizes_location(self):
+        """Test locations are stored in gazetteer form with their remote type."""
+        self.db.add_jobs([
+            {'job_id': 'a', 'title': 'AE', 'company': 'Acme', 'location': 'Sydney, NSW (Hybrid)'},
+            {'job_id': 'b', 'title': 'AE', 'company': 'Acme', 'location': 'See listing', 'remote_type': 'onsite'},
+        ])
+        
+        job = self.db.get_job('a')
+        self.assertEqual(job['location'], 'Sydney, New South Wales, Australia')
+        self.assertEqual(job['remote_type'], 'hybrid')
+        job = self.db.get_job('b')
+        self.assertEqual(job['location'], 'See listing')
+        self.assertEqual(job['remote_type'], 'onsite')
+
+    def test_add_jobs_keys_by_url(self):
+        """Test jobs without an id are keyed by URL, so one posting is stored once."""
+        inserted = self.db.add_jobs([
+            {'title': 'AE', 'company': 'Figma', 'url': 'https://boards.greenhouse.io/figma/jobs/42'},
+            {'title': 'AE', 'company': 'Figma', 'url': 'https://www.figma.com/careers/job?gh_jid=42'},
+        ])
+
+        self.assertEqual(inserted, 1)
+        self.assertIsNotNone(self.db.get_job(url_id('https://boards.greenhouse.io/figma/jobs/42')))
+
     def test_add_duplicate_job(self):
         """Test that duplicate jobs are not added."""
         job_data = {
@@ -99,7 +138,22 @@ class TestDatabaseManager(unittest.TestCase):
         # Verify update
         job = self.db.get_job('status123')
         self.assertEqual(job['status'], 'applied')
-    
+
+    def test_close_jobs_with_urls(self):
+        """Test listing linked jobs by status and closing them in bulk."""
+        self.db.add_jobs([
+            {'job_id': 'a', 'title': 'AE', 'company': 'Acme', 'url': 'https://acme.com/jobs/a'},
+            {'job_id': 'b', 'title': 'SE', 'company': 'Acme', 'url': 'https://acme.com/jobs/b'},
+            {'job_id': 'c', 'title': 'PM', 'company': 'Acme'},
+        ])
+        self.db.update_job_status('b', 'applied')
+
+        linked = self.db.get_jobs_with_urls(['new', 'shortlisted'])
+        self.assertEqual([job['job_id'] for job in linked], ['a'])
+
+        self.assertEqual(self.db.update_jobs_status(['a'], 'closed'), 1)
+        self.assertEqual(self.db.get_job('a')['status'], 'closed')
+
     def test_update_match_score(self):
         """Test updating match score."""
         job_data = {
@@ -118,6 +172,19 @@ class TestDatabaseManager(unittest.TestCase):
         # Verify update
         job = self.db.get_job('score123')
         self.assertEqual(job['match_score'], 92.5)
+
+    def test_update_match_scores(self):
+        """Test rescoring many jobs at once."""
+        self.db.add_jobs([
+            {'job_id': 'a', 'title': 'Sales Director', 'company': 'Acme', 'location': 'Sydney'},
+            {'job_id': 'b', 'title': 'Engineer', 'company': 'Acme'},
+        ])
+
+        jobs = self.db.get_jobs_for_scoring()
+        self.assertEqual({job['job_id']: job['title'] for job in jobs}, {'a': 'Sales Director', 'b': 'Engineer'})
+
+        self.assertEqual(self.db.update_match_scores({'a': 90, 'b': 50, 'missing': 10}), 2)
+        self.assertEqual(self.db.get_job('a')['match_score'], 90)
     
     def test_get_jobs_by_status(self):
         """Test retrieving jobs by status."""
@@ -235,7 +302,23 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(len(google_conns), 2)
         # Should be ordered by connection degree
         self.assertEqual(google_conns[0]['name'], 'Alice')
-    
+
+    def test_company_variants_resolve_to_one_company(self):
+        """Test connections and job counts match every spelling of a company."""
+        self.db.add_connection({'name': 'Alice', 'company': 'SafetyCulture', 'connection_degree': 1})
+        self.db.add_connection({'name': 'Bob', 'company': 'Safety Culture Pty Ltd', 'connection_degree': 2})
+        self.db.add_jobs([
+            {'job_id': 'a', 'title': 'AE', 'company': 'safety culture'},
+            {'job_id': 'b', 'title': 'SE', 'company': 'Unknown',
+             'url': 'https://jobs.accel.com/companies/safetyculture-2/jobs/1-se'},
+            {'job_id': 'c', 'title': 'PM', 'company': 'Canva'},
+        ])
+
+        self.assertEqual([c['name'] for c in self.db.get_company_connections('safetyculture')], ['Alice', 'Bob'])
+        counts = self.db.get_company_job_counts()
+        self.assertEqual([(c['company'], c['jobs']) for c in counts], [('SafetyCulture', 2), ('Canva', 1)])
+        self.assertEqual(self.db.get_job('b')['company'], 'SafetyCulture')
+
     def test_add_company_research(self):
         """Test adding company research."""
         company_data = {
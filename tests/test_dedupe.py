@@ -0,0 +1,70 @@
+"""Tests for near-duplicate detection across sources."""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.dedupe import MinHasher, find_near_duplicates, is_near_duplicate, merge_near_duplicates
+from tests.factories import make_job
+
+
+class TestNearDuplicates(unittest.TestCase):
+    """Test matching rules, grouping and merging."""
+
+    def test_same_role_on_other_sites(self):
+        getro = make_job(title="Account Executive - ANZ", company="Canva",
+                         url="https://jobs.blackbird.vc/companies/canva/jobs/1")
+        greenhouse = make_job(title="Account Executive, ANZ", company="Canva Pty Ltd", location="Sydney, NSW",
+                              url="https://boards.greenhouse.io/canva/jobs/2", description="Own the ANZ mid-market")
+        self.assertTrue(is_near_duplicate(getro, greenhouse))
+
+        merged = merge_near_duplicates([getro, greenhouse])
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0]["url"], getro["url"])
+        self.assertEqual(merged[0]["description"], "Own the ANZ mid-market")
+        self.assertEqual(merged[0]["source_urls"], [getro["url"], greenhouse["url"]])
+
+    def test_distinct_roles_kept(self):
+        base = make_job(title="Enterprise Account Executive", company="Stripe", url="https://stripe.com/jobs/1")
+        cases = {
+            "same site": dict(base, url="https://stripe.com/jobs/2"),
+            "other city": dict(base, url="https://linkedin.com/jobs/3", location="Melbourne"),
+            "other company": dict(base, url="https://linkedin.com/jobs/4", company="Canva"),
+            "other title": dict(base, url="https://linkedin.com/jobs/5",
+                                title="Enterprise Account Executive - Healthcare"),
+        }
+        for name, other in cases.items():
+            self.assertFalse(is_near_duplicate(base, other), name)
+        self.assertEqual(len(merge_near_duplicates([base, *cases.values()])), 5)
+
+    def test_groups_follow_input_order(self):
+        engineer = make_job(title="Solutions Engineer", company="Rippling")
+        designer = make_job(title="Product Designer", company="Airwallex")
+        jobs = [
+            dict(engineer, url="https://jobs.lever.co/rippling/1"),
+            dict(designer, url="https://jobs.ashbyhq.com/airwallex/2"),
+            dict(engineer, url="https://linkedin.com/jobs/view/3"),
+            dict(designer, url="https://airwallex.com/careers/4"),
+            dict(designer, url="https://jobs.ashbyhq.com/airwallex/2"),
+        ]
+        self.assertEqual(find_near_duplicates(jobs), [[0, 2], [1, 3, 4]])
+        self.assertNotIn("source_urls", merge_near_duplicates(jobs[:2])[0])
+
+    def test_signatures_are_stable(self):
+        shingles = {"t:account", "t:executive", "c:canva", "l:sydney"}
+        self.assertEqual(MinHasher().signature(shingles), MinHasher().signature(set(shingles)))
+        self.assertEqual(len(MinHasher(bands=4, rows=2).band_keys(MinHasher(bands=4, rows=2).signature(shingles))), 4)
+
+    def test_many_companies(self):
+        jobs = []
+        for n in range(300):
+            for site in ("https://boards.greenhouse.io", "https://jobs.getro.com"):
+                jobs.append(make_job(n % 3, company=f"Company{n}", url=f"{site}/company{n}/{n}"))
+        groups = find_near_duplicates(jobs)
+        self.assertEqual(len(groups), 300)
+        self.assertTrue(all(len(group) == 2 for group in groups))
+
+
+if __name__ == '__main__':
+    unittest.main()
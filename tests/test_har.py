@@ -0,0 +1,123 @@
+"""Tests for HAR record/replay configuration."""
+
+import asyncio
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.scrapers.har import HarConfig
+from src.scrapers.synthetic_board import BoardConfig, SyntheticBoardServer, targets_for
+
+try:
+    from playwright.async_api import async_playwright
+    from universal_job_scraper import UniversalJobScraper
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+def chromium_launches() -> bool:
+    """Whether Playwright's Chromium is installed, not just the Python package."""
+    async def launch():
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            await browser.close()
+    try:
+        asyncio.run(launch())
+        return True
+    except Exception:
+        return False
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route_from_har(self, path, not_found="abort"):
+        self.routes.append((Path(path).name, not_found))
+
+
+class TestHarConfig(unittest.TestCase):
+    """Test archive paths, record options and multi-part replay."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_record_options(self):
+        har = HarConfig(str(self.directory), mode="record")
+        options = har.context_options("Index Ventures")
+        self.assertEqual(options["record_har_path"], str(self.directory / "index-ventures.har"))
+        self.assertEqual(options["service_workers"], "block")
+        self.assertEqual(Path(har.context_options("Index Ventures", part=2)["record_har_path"]).name,
+                         "index-ventures.2.har")
+        self.assertNotIn("record_har_path", HarConfig(str(self.directory)).context_options("Index Ventures"))
+        with self.assertRaises(ValueError):
+            HarConfig(mode="live")
+
+    def test_replay_serves_every_part(self):
+        for name in ("index.har", "index.2.har", "index.3.har"):
+            (self.directory / name).write_text("{}")
+        context = FakeContext()
+        asyncio.run(HarConfig(str(self.directory)).attach(context, "Index"))
+        # Later parts are routed last, so they're tried first and fall back to earlier ones
+        self.assertEqual(context.routes, [("index.har", "abort"), ("index.2.har", "fallback"),
+                                          ("index.3.har", "fallback")])
+
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(HarConfig(str(self.directory)).attach(FakeContext(), "Missing"))
+
+    def test_new_recording_drops_stale_parts(self):
+        for name in ("index.har", "index.2.har"):
+            (self.directory / name).write_text("{}")
+        HarConfig(str(self.directory), mode="record").context_options("Index")
+        self.assertEqual(sorted(p.name for p in self.directory.iterdir()), ["index.har"])
+
+
+@unittest.skipUnless(PLAYWRIGHT_AVAILABLE, "playwright not installed")
+class TestHarRoundTrip(unittest.TestCase):
+    """Record a target from the synthetic board, then replay it with the server down."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not chromium_launches():
+            raise unittest.SkipTest("Chromium not installed (playwright install chromium)")
+
+    def setUp(self):
+        # The engine keeps its state under ./data
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    async def scrape(self, target, mode):
+        scraper = UniversalJobScraper(targets=[target], filter_apac=False, har=HarConfig("./har", mode=mode))
+        with contextlib.redirect_stdout(io.StringIO()):
+            return await scraper.scrape_target(target)
+
+    def test_replay_matches_recording_offline(self):
+        async def round_trip():
+            async with SyntheticBoardServer(BoardConfig(jobs=60, page_size=20), port=0) as server:
+                target = next(t for t in targets_for(server.base_url) if t["platform"] == "greenhouse")
+                recorded = await self.scrape(target, "record")
+            # Nothing is listening now: every response must come from the archive
+            return recorded, await self.scrape(target, "replay")
+
+        recorded, replayed = asyncio.run(round_trip())
+        self.assertTrue(recorded)
+        self.assertTrue(Path("har/synthetic-greenhouse.har").exists())
+        self.assertEqual([job["url"] for job in replayed], [job["url"] for job in recorded])
+
+if __name__ == '__main__':
+    unittest.main()
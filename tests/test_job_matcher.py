@@ -0,0 +1,75 @@
+"""Tests for the local JobMatcher."""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.job_matcher import (DEFAULT_WEIGHTS, JobMatcher, career_years, degree_level,
+                                  load_weights, required_years, title_level)
+
+PROFILE = {
+    "skills": {"technical": ["Python", "AWS", "Machine Learning"], "soft": ["Strategic Partnerships", "Leadership"]},
+    "experience": [
+        {"title": "Head of Partnerships", "start_date": "01/2015", "end_date": "12/2019"},
+        {"title": "Director, Business Development", "start_date": "01/2020", "end_date": "12/2024"},
+    ],
+    "education": [{"degree": "MBA", "field": "Business"}],
+    "preferences": {"desired_roles": ["VP Partnerships"], "locations": ["Sydney", "Remote"],
+                    "remote_preference": "hybrid", "willing_to_relocate": False},
+}
+
+
+class TestJobMatcher(unittest.TestCase):
+    """Test feature extraction, component scores and batching."""
+
+    def setUp(self):
+        self.matcher = JobMatcher(PROFILE, weights=DEFAULT_WEIGHTS)
+
+    def test_helpers(self):
+        self.assertEqual(title_level("VP of Sales"), 4)
+        self.assertEqual(title_level("Head of Partnerships"), 3)
+        self.assertEqual(title_level("Sales Intern"), 0)
+        self.assertEqual(degree_level("Master's degree in CS"), 2)
+        self.assertEqual(required_years("5+ years in sales, 2 yrs leading teams"), 5)
+        self.assertEqual(career_years(PROFILE["experience"]), 9)
+        self.assertEqual(load_weights("/nonexistent.json"), DEFAULT_WEIGHTS)
+
+    def test_good_fit_outscores_poor_fit(self):
+        good = {"title": "Head of Strategic Partnerships", "location": "Sydney, NSW",
+                "requirements": ["Strategic partnerships", "AWS", "Leadership"]}
+        poor = {"title": "Junior Accountant", "location": "London",
+                "requirements": ["CPA", "PhD in Accounting", "10+ years bookkeeping"]}
+        good_result, poor_result = self.matcher.match(good), self.matcher.match(poor)
+
+        self.assertEqual(good_result["score_breakdown"]["skills"], 40.0)
+        self.assertEqual(good_result["score_breakdown"]["location"], 15.0)
+        self.assertEqual(poor_result["score_breakdown"]["location"], 0.0)
+        self.assertLess(poor_result["score_breakdown"]["education"], 15.0)
+        self.assertGreater(good_result["match_score"], poor_result["match_score"] + 40)
+        self.assertAlmostEqual(good_result["match_score"], sum(good_result["score_breakdown"].values()), places=1)
+
+    def test_location_fit(self):
+        features = self.matcher.features
+        self.assertEqual(JobMatcher.location_fit("Remote", features), 1.0)
+        self.assertEqual(JobMatcher.location_fit("Melbourne, Australia", features), 0.8)
+        self.assertEqual(JobMatcher.location_fit("See listing", features), 0.5)
+        self.assertEqual(JobMatcher.location_fit("Berlin, Germany", features), 0.0)
+
+    def test_batch_matches_single_and_rank_sorts(self):
+        jobs = [{"title": "Engineer", "location": "Berlin"},
+                {"title": "VP Partnerships", "location": "Sydney", "description": "8+ years, Python and AWS"},
+                {"title": "Partner Manager", "location": "Remote - US"}]
+        self.assertEqual(self.matcher.match_batch(jobs), [self.matcher.match(job) for job in jobs])
+        ranked = self.matcher.rank([dict(job) for job in jobs])
+        self.assertEqual(ranked[0]["title"], "VP Partnerships")
+        self.assertIn("score_breakdown", ranked[-1])
+        self.assertEqual(JobMatcher().calculate_match_score(PROFILE, jobs[1]), ranked[0]["match_score"])
+
+    def test_requires_profile(self):
+        with self.assertRaises(ValueError):
+            JobMatcher().match({"title": "Engineer"})
+
+
+if __name__ == '__main__':
+    unittest.main()
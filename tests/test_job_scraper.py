@@ -0,0 +1,114 @@
+"""Tests for the paginated Sydney job search."""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from src.core.metrics import PAGES_NAVIGATED
+    from src.scrapers import browser_session, job_scraper
+    from src.scrapers.job_scraper import SydneyJobScraper
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+class FakePage:
+    """Serves Seek-style cards; page N lists jobs from ``pages[N-1]``."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.visited = []
+
+    async def goto(self, url, **kwargs):
+        self.visited.append(int(url.rsplit("page=", 1)[1]))
+
+    async def wait_for_selector(self, selector, **kwargs):
+        if self.visited[-1] > len(self.pages):
+            raise TimeoutError("no cards")
+
+    async def eval_on_selector_all(self, selector, script):
+        return [{"title": "VP Sales", "company": "Acme", "href": f"/job/{i}", "salary": "$400k"}
+                for i in self.pages[self.visited[-1] - 1]]
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.page = FakePage(pages)
+        self.released = []
+
+    async def new_page(self, name):
+        return self.page
+
+    async def checkpoint(self, name=""):
+        return self.page
+
+    async def release(self, name):
+        self.released.append(name)
+
+
+@unittest.skipUnless(PLAYWRIGHT_AVAILABLE, "playwright not installed")
+class TestSydneyJobScraper(unittest.TestCase):
+    """Test pagination, cross-search dedupe and NDJSON streaming."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.scraper = SydneyJobScraper(output_dir=self.tmp.name, max_pages=5)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def search(self, session):
+        # Full pages hold two cards here
+        with open(self.scraper.stream_file, 'a') as self.scraper._stream, \
+                mock.patch.object(job_scraper, "SEEK_PAGE_SIZE", 2):
+            return asyncio.run(self.scraper.search_seek(session, "commercial"))
+
+    def test_pages_until_results_run_out(self):
+        session = FakeSession([[1, 2], [3, 4], [5, 6]])
+        self.assertEqual(self.search(session), 6)
+        self.assertEqual(session.page.visited, [1, 2, 3, 4])
+        self.assertEqual(session.released, ["Seek commercial"])
+
+    def test_stops_after_a_short_page(self):
+        session = FakeSession([[1, 2], [3], [4, 5]])
+        self.assertEqual(self.search(session), 3)
+        self.assertEqual(session.page.visited, [1, 2])
+
+    def test_stops_when_a_page_repeats(self):
+        session = FakeSession([[1, 2], [1, 2], [3]])
+        self.assertEqual(self.search(session), 2)
+        self.assertEqual(session.page.visited, [1, 2])
+
+    def test_jobs_seen_by_other_searches_dont_end_the_search(self):
+        self.search(FakeSession([[1, 2]]))
+        session = FakeSession([[1, 2], [3, 4], [5]])
+        self.assertEqual(self.search(session), 3)
+        self.assertEqual(session.page.visited, [1, 2, 3])
+
+    def test_pages_are_rate_limited_and_counted(self):
+        session = FakeSession([[1, 2], [3]])
+        before = PAGES_NAVIGATED.get(suite="unknown", target="unknown")
+        with mock.patch.object(browser_session.RATE_LIMITER, "wait", mock.AsyncMock()) as wait:
+            self.search(session)
+        self.assertEqual([c.args[0].rsplit("page=", 1)[1] for c in wait.call_args_list], ["1", "2"])
+        self.assertEqual(PAGES_NAVIGATED.get(suite="unknown", target="unknown"), before + 2)
+
+    def test_dedupes_across_searches_and_streams(self):
+        self.search(FakeSession([[1, 2]]))
+        self.assertEqual(self.search(FakeSession([[2, 3]])), 1)
+
+        lines = self.scraper.stream_file.read_text().splitlines()
+        urls = [json.loads(line)["url"] for line in lines]
+        self.assertEqual(urls, [f"https://www.seek.com.au/job/{i}" for i in (1, 2, 3)])
+        self.assertEqual(self.scraper.jobs[0]["salary_min"], 400000)
+
+
+if __name__ == '__main__':
+    unittest.main()
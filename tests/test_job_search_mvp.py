@@ -0,0 +1,115 @@
+"""Tests for the local search and shortlisting in JobSearchMVP."""
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from argparse import Namespace
+from pathlib import Path
+from unittest import mock
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.database import DatabaseManager
+from src.core.job_search_mvp import JobSearchMVP
+from src.core.profile_manager import ProfileManager
+from claude_job import ClaudeJobCLI
+from tests.factories import make_job
+
+
+class TestJobSearchMVP(unittest.TestCase):
+    """Test searching jobs against a database created by DatabaseManager."""
+
+    def setUp(self):
+        # JobSearchMVP creates ./reports and ./data/prompts relative to the working directory
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.db = DatabaseManager("./data/jobs.db")
+        self.db.add_jobs([
+            make_job(1, job_id="job-1", title="Head of Partnerships",
+                     description="Own strategic partnerships across ANZ"),
+            make_job(2, job_id="job-2", title="Partnerships Manager", location="London, UK",
+                     description="Grow channel partnerships"),
+            make_job(3, job_id="job-3", title="Software Engineer", description="Python services"),
+        ])
+        self.mvp = JobSearchMVP(data_dir="./data")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_search_jobs_logs_to_database_manager_schema(self):
+        results = self.mvp.search_jobs("Head of Partnerships", location="Sydney, Australia")
+        self.assertEqual([result["job_id"] for result in results], ["job-1"])
+
+        searches = self.db.get_recent_searches()
+        self.assertEqual(len(searches), 1)
+        self.assertEqual(searches[0]["job_title"], "Head of Partnerships")
+        self.assertEqual(searches[0]["location"], "Sydney, Australia")
+        self.assertEqual(searches[0]["results_count"], 1)
+
+    def test_search_jobs_on_a_fresh_database(self):
+        mvp = JobSearchMVP(data_dir="./fresh")
+        self.assertEqual(mvp.search_jobs("Partnerships"), [])
+        conn = sqlite3.connect(mvp.db_path)
+        logged = conn.execute("SELECT job_title, results_count FROM search_history").fetchall()
+        conn.close()
+        self.assertEqual(logged, [("Partnerships", 0)])
+
+
+class TestShortlist(unittest.TestCase):
+    """Test local shortlisting and the --top-k matching prompt."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        Path("data").mkdir()
+        Path("config").mkdir()
+        self.jobs_path = Path("data/job_search_results.json")
+        self.jobs_path.write_text(json.dumps([
+            make_job(1, job_id="job-1", title="Software Engineer", description="Python and Kubernetes services"),
+            make_job(2, job_id="job-2", title="Head of Partnerships", description="Strategic alliances"),
+            make_job(3, job_id="job-3", title="Data Engineer", description="Python pipelines"),
+        ]))
+        Path("data/profile_extracted.json").write_text("{}")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def set_profile(self, mvp, technical):
+        profile = ProfileManager().create_empty_profile()
+        profile["skills"]["technical"] = technical
+        Path("config/profile.json").write_text(json.dumps(profile))
+        mvp.profile_manager = ProfileManager()
+
+    def test_shortlist_jobs(self):
+        mvp = JobSearchMVP()
+        self.set_profile(mvp, [])
+        self.assertIsNone(mvp.shortlist_jobs(str(self.jobs_path)))
+
+        self.set_profile(mvp, ["Python"])
+        self.assertIsNone(mvp.shortlist_jobs("data/missing.json"))
+        candidates_path = mvp.shortlist_jobs(str(self.jobs_path), top_k=1)
+        with open(candidates_path) as f:
+            candidates = json.load(f)
+        self.assertEqual(len(candidates), 1)
+        self.assertIn(candidates[0]["job_id"], ("job-1", "job-3"))
+        self.assertEqual(candidates[0]["local_score"], 100.0)
+
+    def test_match_shortlists_once(self):
+        cli = ClaudeJobCLI()
+        for technical, shortlisted in (["Python"], True), ([], False):
+            self.set_profile(cli.mvp, technical)
+            with mock.patch.object(cli.mvp, "shortlist_jobs", wraps=cli.mvp.shortlist_jobs) as shortlist:
+                self.assertEqual(cli.cmd_match(Namespace(top_k=2)), 0)
+            self.assertEqual(shortlist.call_count, 1)
+            prompt = next(Path("data/prompts").glob("job_matching_*.txt")).read_text()
+            self.assertEqual("Job Listings: data/job_candidates.json" in prompt, shortlisted)
+            self.assertEqual("pre-ranked locally" in prompt, shortlisted)
+
+if __name__ == '__main__':
+    unittest.main()
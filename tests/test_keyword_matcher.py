@@ -0,0 +1,43 @@
+"""Tests for the word-boundary keyword matcher."""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.keyword_matcher import KeywordMatcher, filter_apac, filter_gtm, is_apac_location, is_gtm_role
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test whole-word, phrase and overlapping matches."""
+
+    def test_whole_words_only(self):
+        matcher = KeywordMatcher(["india", "ai", "sales", "bd "])
+        self.assertEqual(matcher.find("Indianapolis, Indiana"), frozenset())
+        self.assertEqual(matcher.find("Chair of Salesforce"), frozenset())
+        self.assertEqual(matcher.find("BD, India (AI)"), {"bd ", "india", "ai"})
+        self.assertTrue(matcher.matches("BD"))
+
+    def test_phrases_overlap_and_plurals(self):
+        matcher = KeywordMatcher(["head of", "of sales", "sales", "go-to-market", "account"])
+        self.assertEqual(matcher.find("Head of Sales"), {"head of", "of sales", "sales"})
+        self.assertEqual(matcher.find("Go To Market Lead"), {"go-to-market"})
+        self.assertEqual(matcher.find("Key Accounts"), {"account"})
+        self.assertEqual(matcher.find("head office"), frozenset())
+
+    def test_role_and_location_filters(self):
+        self.assertTrue(is_gtm_role("Internal Sales Lead"))
+        self.assertFalse(is_gtm_role("Sales Intern"))
+        self.assertFalse(is_gtm_role("Chair of the Board"))
+        self.assertTrue(is_apac_location("Bengaluru / Bangalore, India"))
+        self.assertFalse(is_apac_location("Indianapolis"))
+
+        jobs = [{"title": "Account Executive", "location": "Sydney"},
+                {"title": "Engineer", "location": "Remote"},
+                {"title": "Partner Manager", "location": "Indiana"}]
+        self.assertEqual([j["title"] for j in filter_gtm(jobs)], ["Account Executive", "Partner Manager"])
+        self.assertEqual([j["title"] for j in filter_apac(jobs)], ["Account Executive", "Engineer"])
+
+
+if __name__ == '__main__':
+    unittest.main()
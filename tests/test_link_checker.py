@@ -0,0 +1,118 @@
+"""Tests for the dead-link validator."""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.cache import CacheManager
+from src.scrapers.link_checker import LinkChecker, classify
+
+
+class FakeWeb:
+    """Answers ``(method, url)`` from a table and tracks concurrency per host."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+        self.in_flight = {}
+        self.peak = {}
+
+    async def __call__(self, method, url):
+        self.requests.append((method, url))
+        host = url.split('/')[2]
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+        await asyncio.sleep(0.01)
+        self.in_flight[host] -= 1
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        if callable(response):
+            return response(method)
+        return response
+
+
+class TestClassify(unittest.TestCase):
+    """Test closed-posting detection."""
+
+    def test_gone_statuses(self):
+        self.assertEqual(classify("https://jobs.lever.co/acme/1", 404, "https://jobs.lever.co/acme/1")[0], "closed")
+        self.assertEqual(classify("https://acme.com/jobs/1", 410, "")[0], "closed")
+
+    def test_ats_redirects(self):
+        self.assertEqual(classify("https://boards.greenhouse.io/acme/jobs/123", 200,
+                                  "https://boards.greenhouse.io/acme?error=true")[0], "closed")
+        self.assertEqual(classify("https://jobs.ashbyhq.com/acme/abc-123", 200,
+                                  "https://jobs.ashbyhq.com/acme")[0], "closed")
+        self.assertEqual(classify("https://acme.com/careers/sales-director", 200,
+                                  "https://acme.com/careers/")[0], "closed")
+
+    def test_soft_closed_page_and_live(self):
+        self.assertEqual(classify("https://acme.com/jobs/1", 200, "https://acme.com/jobs/1",
+                                  "<h1>We are no longer accepting applications</h1>")[0], "closed")
+        self.assertEqual(classify("https://acme.com/jobs/1", 200, "https://acme.com/jobs/1/")[0], "live")
+        self.assertEqual(classify("https://acme.com/jobs/1", 503, "https://acme.com/jobs/1")[0], "error")
+
+
+class TestLinkChecker(unittest.TestCase):
+    """Test request strategy, host limits and TTL caching."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = CacheManager(cache_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_head_falls_back_to_get_and_soft_close_hosts_use_get(self):
+        web = FakeWeb({
+            "https://acme.com/jobs/1": lambda m: (405, "https://acme.com/jobs/1", "") if m == 'HEAD'
+            else (200, "https://acme.com/jobs/1", "open role"),
+            "https://boards.greenhouse.io/acme/jobs/2": (200, "https://boards.greenhouse.io/acme/jobs/2",
+                                                         "This job is closed"),
+        })
+        results = LinkChecker(fetch=web).run(web.responses)
+        self.assertEqual(results["https://acme.com/jobs/1"].state, "live")
+        self.assertEqual(results["https://boards.greenhouse.io/acme/jobs/2"].state, "closed")
+        self.assertEqual(sorted(web.requests), [
+            ("GET", "https://acme.com/jobs/1"), ("GET", "https://boards.greenhouse.io/acme/jobs/2"),
+            ("HEAD", "https://acme.com/jobs/1")])
+
+    def test_per_host_limit(self):
+        urls = [f"https://jobs.lever.co/acme/{i}" for i in range(10)]
+        web = FakeWeb({url: (200, url, "") for url in urls})
+        LinkChecker(fetch=web, concurrency=10, per_host=3).run(urls)
+        self.assertEqual(web.peak["jobs.lever.co"], 3)
+
+    def test_cached_results_skip_recheck_but_errors_retry(self):
+        web = FakeWeb({
+            "https://acme.com/jobs/1": (200, "https://acme.com/jobs/1", ""),
+            "https://acme.com/jobs/2": ConnectionError("reset"),
+        })
+        first = LinkChecker(cache=self.cache, fetch=web).run(web.responses)
+        self.assertEqual(first["https://acme.com/jobs/2"].state, "error")
+        web.requests.clear()
+
+        checker = LinkChecker(cache=self.cache, fetch=web)
+        second = checker.run(web.responses)
+        self.assertEqual(second["https://acme.com/jobs/1"].state, "live")
+        self.assertEqual(web.requests, [("HEAD", "https://acme.com/jobs/2")])
+        self.assertEqual(checker.counts["cached"], 1)
+
+    def test_colliding_cache_key_is_a_miss(self):
+        web = FakeWeb({
+            "https://acme.com/jobs/1": (404, "https://acme.com/jobs/1", ""),
+            "https://acme.com/jobs/2": (200, "https://acme.com/jobs/2", ""),
+        })
+        with mock.patch.object(self.cache, "generate_cache_key", lambda data_type, identifier: "collision"):
+            LinkChecker(cache=self.cache, fetch=web).run(["https://acme.com/jobs/1"])
+            results = LinkChecker(cache=self.cache, fetch=web).run(["https://acme.com/jobs/2"])
+        self.assertEqual(results["https://acme.com/jobs/2"].state, "live")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tests for gazetteer location normalization."""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.locations import format_location, is_apac, normalize_location, resolve_location
+
+
+def place(city=None, region=None, country=None, remote_type=None):
+    return {"city": city, "region": region, "country": country, "remote_type": remote_type}
+
+
+class TestNormalizeLocation(unittest.TestCase):
+    """Test parsing, disambiguation and the APAC check."""
+
+    def test_structured_fields(self):
+        cases = {
+            "Sydney, New South Wales, Australia": place("Sydney", "New South Wales", "Australia"),
+            "APAC - Remote": place(region="APAC", remote_type="remote"),
+            "Hybrid (Melbourne)": place("Melbourne", "Victoria", "Australia", "hybrid"),
+            "Sydney, NSW (3 days office)": place("Sydney", "New South Wales", "Australia", "hybrid"),
+            "Bengaluru, India": place("Bangalore", "Karnataka", "India"),
+            "São Paulo, Brazil": place("Sao Paulo", None, "Brazil"),
+            "US Remote": place(country="United States", remote_type="remote"),
+            "See listing": place(),
+        }
+        for text, expected in cases.items():
+            self.assertEqual(normalize_location(text), expected, text)
+
+    def test_ambiguous_names_use_context(self):
+        self.assertEqual(normalize_location("Perth, WA")["country"], "Australia")
+        self.assertEqual(normalize_location("Seattle, WA")["region"], "Washington")
+        self.assertEqual(normalize_location("Melbourne, FL")["country"], "United States")
+        self.assertEqual(normalize_location("Melbourne")["country"], "Australia")
+
+    def test_abbreviations_need_capitals(self):
+        self.assertEqual(normalize_location("Remote - US")["country"], "United States")
+        self.assertEqual(normalize_location("Join us"), place())
+        self.assertEqual(format_location("Austin, TX"), "Austin, Texas, United States")
+
+    def test_is_apac(self):
+        for text in ["Tokyo, Japan", "Senior Counsel (APAC)", "Remote", "Team Anywhere", "Auckland"]:
+            self.assertTrue(is_apac(text), text)
+        for text in ["Remote - Italy", "Canada (Remote)", "Indianapolis", "Capacity Planning", "London"]:
+            self.assertFalse(is_apac(text), text)
+
+    def test_resolutions_are_memoized(self):
+        resolve_location.cache_clear()
+        for _ in range(3):
+            normalize_location("Singapore")
+        self.assertEqual(resolve_location.cache_info().hits, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for the OpenMetrics textfile export."""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.cache import CacheManager
+from src.core.metrics import CACHE_HIT_RATIO, CACHE_REQUESTS, MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test metric families and text rendering."""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_renders_total_suffix(self):
+        errors = self.registry.counter("scrape_errors", "Errors", ["target"])
+        errors.inc(target="Acme")
+        errors.inc(2, target="Acme")
+
+        text = self.registry.render()
+        self.assertIn("# TYPE scrape_errors counter", text)
+        self.assertIn('scrape_errors_total{target="Acme"} 3', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+        prometheus = self.registry.render(openmetrics=False)
+        self.assertIn("# TYPE scrape_errors_total counter", prometheus)
+        self.assertNotIn("# EOF", prometheus)
+
+    def test_histogram_buckets_are_cumulative(self):
+        duration = self.registry.histogram("duration_seconds", "Duration", ["suite"], buckets=[1, 10])
+        for value in (0.5, 5, 50):
+            duration.observe(value, suite="vc")
+
+        text = self.registry.render()
+        self.assertIn('duration_seconds_bucket{suite="vc",le="1"} 1', text)
+        self.assertIn('duration_seconds_bucket{suite="vc",le="10"} 2', text)
+        self.assertIn('duration_seconds_bucket{suite="vc",le="+Inf"} 3', text)
+        self.assertIn('duration_seconds_sum{suite="vc"} 55.5', text)
+
+    def test_labels_are_validated_and_escaped(self):
+        gauge = self.registry.gauge("jobs_found", "Jobs", ["target"])
+        with self.assertRaises(ValueError):
+            gauge.set(1, company="x")
+        gauge.set(4, target='Say "hi"')
+        self.assertIn('jobs_found{target="Say \\"hi\\""} 4', self.registry.render())
+
+    def test_reset_by_label_keeps_other_series(self):
+        found = self.registry.gauge("jobs_found", "Jobs", ["suite", "target"])
+        duration = self.registry.histogram("duration_seconds", "Duration", ["suite"])
+        cache = self.registry.counter("cache_requests", "Lookups", ["result"])
+        found.set(3, suite="universal", target="Acme")
+        found.set(5, suite="vc", target="Index")
+        duration.observe(2, suite="universal")
+        cache.inc(result="hit")
+
+        self.registry.reset(suite="universal")
+        self.assertEqual(found.get(suite="universal", target="Acme"), 0)
+        self.assertEqual(found.get(suite="vc", target="Index"), 5)
+        self.assertEqual(duration.get(suite="universal"), 0)
+        self.assertEqual(cache.get(result="hit"), 1)
+
+        self.registry.reset()
+        self.assertEqual(self.registry.render(), "# EOF\n")
+
+    def test_write_textfile(self):
+        self.registry.gauge("up", "Up").set(1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.registry.write_textfile(Path(tmp) / "metrics" / "run.prom")
+            self.assertEqual(path.read_text(), "# HELP up Up\n# TYPE up gauge\nup 1\n")
+            self.assertEqual([p.name for p in path.parent.iterdir()], ["run.prom"])
+
+
+class TestCacheMetrics(unittest.TestCase):
+    """Test cache lookups feed the hit ratio."""
+
+    def test_hit_ratio(self):
+        CACHE_REQUESTS.clear()
+        CACHE_HIT_RATIO.clear()
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = CacheManager(cache_dir=tmp)
+            cache.get('job_listing', 'missing')
+            cache.set('job_listing', 'present', {'title': 'AE'})
+            cache.get('job_listing', 'present')
+
+        self.assertEqual(CACHE_REQUESTS.get(data_type='job_listing', result='hit'), 1)
+        self.assertEqual(CACHE_HIT_RATIO.get(data_type='job_listing'), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
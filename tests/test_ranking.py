@@ -0,0 +1,64 @@
+"""Tests for the local BM25 job index."""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.ranking import SearchIndex, job_terms, profile_query
+from tests.factories import make_job
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test incremental indexing and BM25 ranking."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = SearchIndex(Path(self.tmp.name) / "jobs.db")
+        self.jobs = [
+            make_job(1, title="Enterprise Account Executive", description="Own enterprise sales across ANZ",
+                     requirements=["Enterprise SaaS sales", "Salesforce"]),
+            make_job(2, title="Head of Partnerships", description="Build our partner ecosystem",
+                     requirements=["Partnerships", "Alliances"]),
+            make_job(3, title="Software Engineer", description="Python and Go services",
+                     requirements=["Python", "Kubernetes"]),
+            make_job(4, title="Office Coordinator", description="Keep the office running"),
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_terms_weight_title_and_drop_stopwords(self):
+        terms = job_terms(make_job(1, title="Sales Lead", description="Sales for the region", requirements='["CRM"]'))
+        self.assertEqual(terms["sale"], 3)
+        self.assertEqual(terms["crm"], 1)
+        self.assertNotIn("the", terms)
+
+    def test_indexing_is_incremental(self):
+        self.assertEqual(self.index.add_jobs(self.jobs), 4)
+        self.assertEqual(self.index.add_jobs(self.jobs), 0)
+        # Tracking parameters don't make a new document; an edited title reindexes one
+        edited = [dict(self.jobs[0], url=self.jobs[0]["url"] + "?utm_source=x"),
+                  dict(self.jobs[1], title="VP Partnerships")]
+        self.assertEqual(self.index.add_jobs(edited), 1)
+        self.assertEqual(self.index.remove_jobs(self.jobs[2:]), 2)
+        self.assertEqual([key for key, _ in self.index.search(["Python"])], [])
+
+    def test_search_ranks_relevant_jobs_first(self):
+        self.index.add_jobs(self.jobs)
+        results = self.index.search(["Enterprise sales", "Partnerships"])
+        self.assertEqual([key.rsplit("/", 1)[-1] for key, _ in results], ["1", "2"])
+        self.assertGreater(results[0][1], results[1][1])
+        self.assertEqual(self.index.search(["and the"]), [])
+
+    def test_rank_jobs_limits_to_given_jobs(self):
+        self.index.add_jobs(self.jobs)
+        profile = {"skills": ["Python", "Enterprise sales"], "desired_roles": ["Account Executive"]}
+        ranked = self.index.rank_jobs(self.jobs[1:], profile_query(profile), k=5)
+        self.assertEqual([j["title"] for j in ranked], ["Software Engineer"])
+        self.assertEqual(ranked[0]["local_score"], 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
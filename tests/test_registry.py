@@ -0,0 +1,78 @@
+"""Tests for the scraper plugin registry and shared rate limiter."""
+
+import asyncio
+import sys
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.scrapers.browser_session import HostRateLimiter
+from src.scrapers.registry import BUILTIN_SCRAPERS, ScraperRegistry, load_spec
+
+
+class TestScraperRegistry(unittest.TestCase):
+    """Test lazy plugin resolution."""
+
+    def test_builtins_are_lazy(self):
+        registry = ScraperRegistry(discover=False)
+        self.assertEqual(set(registry.names()), set(BUILTIN_SCRAPERS))
+        self.assertEqual(registry._loaded, {})
+
+    def test_resolve_name_and_spec(self):
+        registry = ScraperRegistry({"ordered": "collections:OrderedDict"}, discover=False)
+        from collections import OrderedDict
+        self.assertIs(registry.resolve("ordered"), OrderedDict)
+        self.assertIs(registry.resolve("pathlib:PurePosixPath"), load_spec("pathlib:PurePosixPath"))
+        with self.assertRaises(KeyError):
+            registry.resolve("no-such-board")
+        with self.assertRaises(ValueError):
+            load_spec("collections")
+
+    def test_register_and_spec_for(self):
+        class Board:
+            name = "Board"
+
+        registry = ScraperRegistry({}, discover=False)
+        registry.register("board", Board)
+        self.assertIs(registry.resolve("board"), Board)
+        self.assertEqual(registry.spec_for(Board), "board")
+
+        registry.register("ordered", "collections:OrderedDict")
+        from collections import OrderedDict
+        self.assertEqual(registry.spec_for(OrderedDict), "ordered")
+        self.assertEqual(registry.spec_for(dict), "builtins:dict")
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    """Test per-host navigation spacing."""
+
+    def test_spaces_same_host_only(self):
+        limiter = HostRateLimiter(per_host_interval_s=0.05)
+        finished = {}
+
+        async def visit(key, url):
+            await limiter.wait(url)
+            finished[key] = time.monotonic()
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(visit("a1", "https://jobs.lever.co/a"), visit("a2", "https://jobs.lever.co/b"),
+                                 visit("a3", "https://jobs.lever.co/c"), visit("b1", "https://acme.com/jobs"))
+            return started
+
+        started = asyncio.run(run())
+        self.assertLess(finished["b1"] - started, 0.04)
+        self.assertGreaterEqual(finished["a3"] - started, 0.095)
+        self.assertGreaterEqual(finished["a3"] - finished["a2"], 0.04)
+
+    def test_disabled_by_default(self):
+        limiter = HostRateLimiter()
+        started = time.monotonic()
+        asyncio.run(limiter.wait("https://acme.com"))
+        asyncio.run(limiter.wait("https://acme.com"))
+        self.assertLess(time.monotonic() - started, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for yield-based target scheduling."""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.scheduler import TargetHistory, TargetScheduler, parse_duration
+
+
+class TestParseDuration(unittest.TestCase):
+    """Test budget parsing."""
+
+    def test_units(self):
+        self.assertEqual(parse_duration("90"), 90)
+        self.assertEqual(parse_duration("45s"), 45)
+        self.assertEqual(parse_duration("10m"), 600)
+        self.assertEqual(parse_duration("1h30m"), 5400)
+
+    def test_invalid(self):
+        for text in ("", "ten minutes", "10x", "5m later"):
+            with self.assertRaises(ValueError):
+                parse_duration(text)
+
+
+class TestTargetScheduler(unittest.TestCase):
+    """Test history recording and planning."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = TargetHistory(Path(self.tmp.name) / "history.json")
+        self.scheduler = TargetScheduler(self.history)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_record_counts_new_urls_and_persists(self):
+        self.assertEqual(self.history.record("Acme", ["a", "b"], 10), 2)
+        self.assertEqual(self.history.record("Acme", ["a", "b", "c"], 10), 1)
+
+        reloaded = TargetHistory(self.history.path)
+        self.assertEqual([r["new_jobs"] for r in reloaded.runs("Acme")], [2, 1])
+
+    def test_plan_orders_by_yield_with_new_targets_first(self):
+        then = datetime.now() - timedelta(days=7)
+        self.history.record("Slow", [f"s{i}" for i in range(2)], 100, now=then)
+        self.history.record("Fast", [f"f{i}" for i in range(20)], 10, now=then)
+        targets = [{"name": "Slow"}, {"name": "Fast"}, {"name": "Brand New"}]
+
+        planned, deferred = self.scheduler.plan(targets, budget_s=3600)
+        self.assertEqual([t["name"] for t, _ in planned], ["Brand New", "Fast", "Slow"])
+        self.assertEqual(deferred, [])
+        self.assertEqual(dict((t["name"], s) for t, s in planned)["Slow"], 150)
+
+    def test_budget_limits_plan(self):
+        targets = [{"name": f"T{i}"} for i in range(5)]
+        planned, deferred = self.scheduler.plan(targets, budget_s=200)
+        self.assertLessEqual(sum(s for _, s in planned), 200)
+        self.assertEqual(len(planned) + len(deferred), 5)
+        self.assertTrue(deferred)
+
+    def test_low_yield_targets_follow_cadence(self):
+        now = datetime.now()
+        for _ in range(3):
+            self.history.record("Dry", [], 30, now=now - timedelta(hours=1))
+        self.history.record("Busy", ["a"], 30, now=now - timedelta(hours=1))
+        self.history.record("Busy", ["b", "c", "d", "e"], 30, now=now - timedelta(hours=1))
+
+        self.assertFalse(self.scheduler.is_due({"name": "Dry"}, now))
+        self.assertTrue(self.scheduler.is_due({"name": "Busy"}, now))
+        self.assertTrue(self.scheduler.is_due({"name": "Dry", "every_hours": 0}, now))
+
+
+if __name__ == '__main__':
+    unittest.main()
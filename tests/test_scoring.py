@@ -0,0 +1,98 @@
+"""Tests for the compiled keyword-rule scorer."""
+
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.scoring import DEFAULT_RULES, NUMPY_AVAILABLE, FeatureMatrix, MatchScorer, load_rules
+
+
+WORDS = ["Senior", "Enterprise", "Account", "Executive", "Director", "Head of", "VP", "Sales", "GTM",
+         "Partner", "Partnerships", "AI", "ML", "Junior", "Intern", "Lead", "Manager", "Chief", "Retail",
+         "Engineer", "Coordinator", "Entry Level", "Strategic", "Chair", "HTML"]
+PLACES = ["Sydney, Australia", "Melbourne, Australia", "Remote", "Singapore", "", "Remote - Sydney"]
+
+
+class TestMatchScorer(unittest.TestCase):
+    """Test rule scores, batching and configured weights."""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.jobs = [{"title": " ".join(rng.sample(WORDS, rng.randint(1, 4))), "location": rng.choice(PLACES)}
+                     for _ in range(500)]
+
+    def test_rule_scores(self):
+        scorer = MatchScorer(DEFAULT_RULES)
+        cases = [
+            ({"title": "Senior Enterprise Account Executive", "location": "Sydney, Australia"}, 100),
+            ({"title": "Head of Partnerships", "location": "Singapore"}, 80),
+            ({"title": "Team Leader", "location": "Remote"}, 65),
+            ({"title": "Sales Intern", "location": "Melbourne, Australia"}, 35),
+            # Whole words only: no 'ai' in "Chair", 'ml' in "HTML" or 'sales' in "Salesforce"
+            ({"title": "Chair", "location": ""}, 50),
+            ({"title": "HTML Developer", "location": ""}, 50),
+            ({"title": "Salesforce Administrator", "location": "Sydney"}, 60),
+            ({"title": "Director, AI/ML", "location": "Remote - Sydney"}, 95),
+            # Locations are normalized first, so Melbourne counts as Australia
+            ({"title": "Engineer", "location": "Hybrid (Melbourne)"}, 55),
+        ]
+        for job, expected in cases:
+            self.assertEqual(scorer.score(job), expected, job)
+
+    def test_batch_equals_single(self):
+        scorer = MatchScorer(DEFAULT_RULES)
+        jobs = self.jobs + [{"title": None}, {}]
+        self.assertEqual(scorer.score_batch(jobs), [scorer.score(job) for job in jobs])
+
+    def test_weights_from_config(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text(json.dumps({"matching": {"rules": {
+                "base": 40, "title_boosts": [{"keywords": ["solutions"], "weight": 25}]}}}))
+            rules = load_rules(str(path))
+        self.assertEqual(rules["seniority"], DEFAULT_RULES["seniority"])
+        scorer = MatchScorer(rules)
+        # Seniority and location come from the defaults; the title boosts are replaced
+        self.assertEqual(scorer.score({"title": "Senior Solutions Engineer", "location": "Sydney"}), 85)
+        self.assertEqual(scorer.score({"title": "Enterprise Sales", "location": ""}), 40)
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestFeatureMatrix(unittest.TestCase):
+    """Test rescoring from the cached keyword-hit matrix."""
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.jobs = [{"title": " ".join(rng.sample(WORDS, rng.randint(1, 4))), "location": rng.choice(PLACES)}
+                     for _ in range(300)]
+        self.scorer = MatchScorer(DEFAULT_RULES)
+
+    def test_scores_match_scorer(self):
+        features = FeatureMatrix(self.jobs, self.scorer)
+        self.assertEqual(features.scores().tolist(), self.scorer.score_batch(self.jobs))
+        self.assertLess(features.matrix.shape[0], len(self.jobs))
+
+    def test_rescore_with_new_weights(self):
+        features = FeatureMatrix(self.jobs, self.scorer)
+        rules = json.loads(json.dumps(DEFAULT_RULES))
+        rules["base"] = 30
+        rules["seniority"][0]["weight"] = 40
+        rules["location_boosts"][0]["weight"] = -10
+        self.assertEqual(features.scores(rules).tolist(), MatchScorer(rules).score_batch(self.jobs))
+
+        # Missing base, min and max come from the defaults, not from the scorer the matrix was built with
+        features = FeatureMatrix(self.jobs, MatchScorer({**DEFAULT_RULES, "base": 70, "max": 90}))
+        partial = {section: rules[section] for section in ("seniority", "title_boosts", "location_boosts")}
+        self.assertEqual(features.scores(partial).tolist(), MatchScorer(partial).score_batch(self.jobs))
+
+        rules["title_boosts"][0]["keywords"] = ["enterprise", "strategic"]
+        with self.assertRaises(ValueError):
+            features.scores(rules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Tests for learned scrape plans."""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.scrapers.scrape_plans import ScrapePlanStore
+
+try:
+    from universal_job_scraper import scrape_with_plan
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+class FakePage:
+    """Answers extraction scripts from a fixed selector -> hrefs map."""
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.probed = []
+
+    async def goto(self, url, **kwargs):
+        return None
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return None
+
+    async def evaluate(self, script, selectors=None):
+        if selectors is None:
+            return 1000
+        self.probed.append(list(selectors))
+        items, hits, seen = [], {}, set()
+        for selector in selectors:
+            hits[selector] = 0
+            for href in self.matches.get(selector, []):
+                if href not in seen:
+                    seen.add(href)
+                    hits[selector] += 1
+                    items.append({"href": href})
+        return {"items": items, "hits": hits}
+
+
+class TestScrapePlanStore(unittest.TestCase):
+    """Test plan learning and persistence."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "plans.json"
+        self.store = ScrapePlanStore(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_learn_keeps_matching_selectors(self):
+        plan = self.store.learn("generic:Acme", {"a.job": 12, "article a": 0, ".card a": 3}, "scroll", 15)
+        self.assertEqual(plan.selectors, ["a.job", ".card a"])
+        self.assertEqual(plan.wait_for, "a.job")
+
+        reloaded = ScrapePlanStore(self.path).get("generic:Acme")
+        self.assertEqual(reloaded.pagination, "scroll")
+        self.assertEqual(reloaded.jobs, 15)
+
+    def test_no_matches_drops_plan(self):
+        self.store.learn("generic:Acme", {"a.job": 5}, "none", 5)
+        self.assertIsNone(self.store.learn("generic:Acme", {"a.job": 0}, "none", 0))
+        self.assertIsNone(self.store.get("generic:Acme"))
+
+    def test_needs_reprobe_on_yield_drop(self):
+        plan = self.store.learn("k", {"a": 20}, "none", 20)
+        self.assertFalse(self.store.needs_reprobe(plan, 15))
+        self.assertTrue(self.store.needs_reprobe(plan, 5))
+        self.assertTrue(self.store.needs_reprobe(plan, 0))
+
+
+@unittest.skipUnless(PLAYWRIGHT_AVAILABLE, "playwright not installed")
+class TestScrapeWithPlan(unittest.TestCase):
+    """Test replaying and re-learning plans against a fake page."""
+
+    SELECTORS = ["a.nav", "a.job", "article a"]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ScrapePlanStore(Path(self.tmp.name) / "plans.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def scrape(self, page):
+        return asyncio.run(scrape_with_plan(
+            page, "https://example.com/careers", "script", self.SELECTORS,
+            self.store, "generic:Acme", settle_s=0))
+
+    def test_probe_then_replay(self):
+        page = FakePage({"a.job": [f"/jobs/{i}" for i in range(10)]})
+        self.assertEqual(len(self.scrape(page)), 10)
+        self.assertEqual(len(self.scrape(page)), 10)
+        self.assertEqual(page.probed, [self.SELECTORS, ["a.job"]])
+
+    def test_yield_drop_falls_back_to_full_probe(self):
+        self.scrape(FakePage({"a.job": [f"/jobs/{i}" for i in range(10)]}))
+
+        redesigned = FakePage({"article a": [f"/roles/{i}" for i in range(8)]})
+        self.assertEqual(len(self.scrape(redesigned)), 8)
+        self.assertEqual(redesigned.probed, [["a.job"], self.SELECTORS])
+        self.assertEqual(self.store.get("generic:Acme").selectors, ["article a"])
+
+
+if __name__ == '__main__':
+    unittest.main()
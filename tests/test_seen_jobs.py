@@ -0,0 +1,65 @@
+"""Tests for the persistent seen-jobs store."""
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.database import DatabaseManager
+from src.core.seen_jobs import BloomFilter, SeenJobs, job_keys
+from tests.factories import make_job
+
+
+class TestSeenJobs(unittest.TestCase):
+    """Test the Bloom filter, the exact check and persistence."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = str(Path(self.test_dir) / "jobs.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(Path(self.test_dir) / "test.bloom", capacity=1000)
+        self.assertGreater(bloom.add(range(1000)), 990)
+        self.assertTrue(all(key in bloom for key in range(1000)))
+        false_positives = sum(key in bloom for key in range(10_000, 20_000))
+        self.assertLess(false_positives, 50)
+        bloom.close()
+
+    def test_filter_new_across_instances(self):
+        seen = SeenJobs(self.db_path)
+        self.assertEqual(seen.add([make_job(1), make_job(2)]), 4)
+        seen.close()
+
+        seen = SeenJobs(self.db_path)
+        batch = [make_job(1), dict(make_job(3), url="https://jobs.lever.co/acme/2?lever-source=x"),
+                 make_job(4, title="account executive 1 "), make_job(5)]
+        self.assertEqual(seen.filter_new(batch), [make_job(5)])
+        seen.close()
+
+    def test_grows_past_capacity(self):
+        seen = SeenJobs(self.db_path, capacity=100)
+        seen.add([make_job(n) for n in range(500)])
+        self.assertGreaterEqual(seen.bloom.capacity, 1000)
+        self.assertEqual(seen.filter_new([make_job(n) for n in range(495, 505)]), [make_job(n) for n in range(500, 505)])
+        seen.close()
+
+    def test_backfills_from_jobs_table(self):
+        DatabaseManager(self.db_path).add_jobs([dict(make_job(1), job_id="a"), dict(make_job(2), job_id="b")])
+        seen = SeenJobs(self.db_path)
+        self.assertEqual(seen.filter_new([make_job(1), make_job(3)]), [make_job(3)])
+        seen.close()
+
+        conn = sqlite3.connect(self.db_path)
+        stored = {key for (key,) in conn.execute("SELECT job_key FROM seen_jobs")}
+        conn.close()
+        self.assertEqual(stored, set(job_keys(make_job(1)) + job_keys(make_job(2))))
+
+
+if __name__ == '__main__':
+    unittest.main()
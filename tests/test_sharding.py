@@ -0,0 +1,68 @@
+"""Tests for sharded scraping helpers."""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.dedupe import dedupe_by_url
+from src.core.tracing import Tracer
+from src.scrapers.sharding import shard_targets
+
+
+class TestShardTargets(unittest.TestCase):
+    """Test splitting a plan across workers."""
+
+    def test_balances_cost_and_keeps_plan_order(self):
+        costs = {"A": 100, "B": 10, "C": 60, "D": 50, "E": 5}
+        plan = [({"name": name}, None) for name in costs]
+
+        shards = shard_targets(plan, 2, cost=lambda t: costs[t["name"]])
+        names = [[t["name"] for t, _ in shard] for shard in shards]
+
+        self.assertEqual(sorted(n for shard in names for n in shard), sorted(costs))
+        loads = [sum(costs[n] for n in shard) for shard in names]
+        self.assertLessEqual(abs(loads[0] - loads[1]), 20)
+        for shard in names:
+            self.assertEqual(shard, [n for n in costs if n in shard])
+
+    def test_never_more_shards_than_targets(self):
+        plan = [({"name": "A"}, 30.0), ({"name": "B"}, 30.0)]
+        shards = shard_targets(plan, 8)
+        self.assertEqual(len(shards), 2)
+        self.assertEqual(shards[0][0][1], 30.0)
+
+
+class TestDedupeByUrl(unittest.TestCase):
+    """Test URL de-duplication."""
+
+    def test_keeps_first_and_drops_missing_urls(self):
+        jobs = [{"url": "a", "n": 1}, {"url": ""}, {"url": "b"}, {"url": "a", "n": 2}, {}]
+        self.assertEqual(dedupe_by_url(jobs), [{"url": "a", "n": 1}, {"url": "b"}])
+
+    def test_seen_carries_across_batches(self):
+        seen = set()
+        dedupe_by_url([{"url": "a"}], seen)
+        self.assertEqual(dedupe_by_url([{"url": "a"}, {"url": "c"}], seen), [{"url": "c"}])
+
+
+class TestTracerMerge(unittest.TestCase):
+    """Test folding worker traces into the coordinator's tracer."""
+
+    def test_merge_shifts_to_coordinator_clock(self):
+        coordinator = Tracer("universal")
+        worker = Tracer("universal-worker-0")
+        worker.pid = coordinator.pid + 1
+        with worker.target("Acme"):
+            pass
+
+        coordinator.merge(worker.to_chrome_trace()["traceEvents"], coordinator.wall_origin + 2.0)
+
+        self.assertIn("Acme", coordinator.stage_totals())
+        self.assertGreaterEqual(coordinator.events[0]["ts"], 2e6)
+        names = [e["args"]["name"] for e in coordinator.to_chrome_trace()["traceEvents"] if e["ph"] == "M"]
+        self.assertIn("universal-worker-0", names)
+
+
+if __name__ == '__main__':
+    unittest.main()
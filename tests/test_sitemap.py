@@ -0,0 +1,151 @@
+"""Tests for sitemap job discovery."""
+
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.scrapers.sitemap import SitemapDiscovery, is_job_detail_url, is_job_url, parse_job_page, parse_sitemap
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(entries):
+    body = "".join(f"<url><loc>{loc}</loc><lastmod>{mod}</lastmod></url>" for loc, mod in entries)
+    return f'<?xml version="1.0"?><urlset {NS}>{body}</urlset>'.encode()
+
+
+def posting(title, city):
+    data = {"@context": "https://schema.org", "@type": "JobPosting", "title": title,
+            "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+            "jobLocation": {"@type": "Place", "address": {"addressLocality": city, "addressCountry": "AU"}},
+            "description": "<p>Own the <b>APAC</b> region</p>", "datePosted": "2026-01-02"}
+    return f'<html><script type="application/ld+json">{json.dumps(data)}</script></html>'.encode()
+
+
+class FakeWeb:
+    """Serves fixed bytes per URL and records what was fetched."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+
+    def __call__(self, url):
+        self.fetched.append(url)
+        if url not in self.pages:
+            raise IOError(f"404 {url}")
+        return io.BytesIO(self.pages[url])
+
+
+class TestSitemapParsing(unittest.TestCase):
+    """Test URL filtering and page parsing."""
+
+    def test_is_job_url(self):
+        self.assertTrue(is_job_url("https://acme.com/careers/senior-account-executive-123"))
+        self.assertTrue(is_job_url("https://acme.com/jobs/4567"))
+        self.assertFalse(is_job_url("https://acme.com/careers/"))
+        self.assertFalse(is_job_url("https://acme.com/blog/hiring-tips"))
+
+    def test_is_job_detail_url(self):
+        self.assertTrue(is_job_detail_url("https://acme.com/jobs/senior-account-executive"))
+        self.assertTrue(is_job_detail_url("https://acme.com/careers?gh_jid=4567"))
+        self.assertTrue(is_job_detail_url("https://boards.greenhouse.io/acme/jobs/4567"))
+        self.assertFalse(is_job_detail_url("https://acme.com/careers/benefits"))
+        self.assertFalse(is_job_detail_url("https://acme.com/jobs/search"))
+
+    def test_parse_gzip_sitemap(self):
+        data = gzip.compress(urlset([("https://acme.com/jobs/1", "2026-01-01")]))
+        self.assertEqual(list(parse_sitemap(io.BytesIO(data))),
+                         [("url", "https://acme.com/jobs/1", "2026-01-01")])
+
+    def test_parse_job_page_json_ld(self):
+        job = parse_job_page("https://acme.com/jobs/1", posting("Head of Sales", "Sydney").decode())
+        self.assertEqual(job["title"], "Head of Sales")
+        self.assertEqual(job["company"], "Acme")
+        self.assertEqual(job["location"], "Sydney, AU")
+        self.assertEqual(job["description"], "Own the APAC region")
+
+    def test_parse_job_page_without_json_ld(self):
+        page = "<html><title>Life at Acme</title></html>"
+        self.assertIsNone(parse_job_page("https://acme.com/careers/life-at-acme", page))
+        self.assertEqual(parse_job_page("https://acme.com/jobs/account-executive", page)["title"], "Life at Acme")
+
+
+class TestSitemapDiscovery(unittest.TestCase):
+    """Test index following and lastmod-based refetching."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state = Path(self.tmp.name) / "state.json"
+        index = (f'<sitemapindex {NS}>'
+                 '<sitemap><loc>https://acme.com/sitemap-blog.xml</loc></sitemap>'
+                 '<sitemap><loc>https://acme.com/sitemap-jobs.xml.gz</loc><lastmod>2026-01-05</lastmod></sitemap>'
+                 '</sitemapindex>').encode()
+        self.web = FakeWeb({
+            "https://acme.com/robots.txt": b"User-agent: *\nSitemap: https://acme.com/sitemap_index.xml\n",
+            "https://acme.com/sitemap_index.xml": index,
+            "https://acme.com/sitemap-jobs.xml.gz": gzip.compress(urlset([
+                ("https://acme.com/careers/1", "2026-01-01"),
+                ("https://acme.com/careers/2", "2026-01-01"),
+                ("https://acme.com/about", "2026-01-01"),
+                ("https://acme.com/careers/benefits", "2026-01-01"),
+            ])),
+            "https://acme.com/careers/benefits": b"<html><title>Benefits at Acme</title></html>",
+            "https://acme.com/careers/1": posting("Account Executive", "Sydney"),
+            "https://acme.com/careers/2": posting("Sales Director", "Melbourne"),
+        })
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def discover(self):
+        return SitemapDiscovery(self.state, fetch=self.web).discover_jobs("Acme", "https://acme.com/careers")
+
+    def test_discovers_jobs_through_index(self):
+        jobs, counts = self.discover()
+        self.assertEqual(sorted(j["title"] for j in jobs), ["Account Executive", "Sales Director"])
+        self.assertEqual(counts, {"fetched": 2, "reused": 0})
+        self.assertNotIn("https://acme.com/sitemap-blog.xml", self.web.fetched)
+
+    def test_unchanged_sitemap_and_postings_are_not_refetched(self):
+        self.discover()
+        self.web.fetched.clear()
+
+        jobs, counts = self.discover()
+        self.assertEqual(len(jobs), 2)
+        self.assertEqual(counts, {"fetched": 0, "reused": 2})
+        self.assertNotIn("https://acme.com/sitemap-jobs.xml.gz", self.web.fetched)
+
+    def test_changed_posting_is_refetched_and_removed_posting_dropped(self):
+        self.discover()
+        self.web.pages["https://acme.com/sitemap_index.xml"] = self.web.pages["https://acme.com/sitemap_index.xml"].replace(
+            b"2026-01-05", b"2026-01-06")
+        self.web.pages["https://acme.com/sitemap-jobs.xml.gz"] = gzip.compress(urlset([
+            ("https://acme.com/careers/1", "2026-01-06"),
+        ]))
+        self.web.fetched.clear()
+
+        jobs, counts = self.discover()
+        self.assertEqual([j["url"] for j in jobs], ["https://acme.com/careers/1"])
+        self.assertEqual(counts, {"fetched": 1, "reused": 0})
+
+    def test_unread_sitemaps_keep_their_postings(self):
+        self.discover()
+        self.web.pages["https://acme.com/sitemap_index.xml"] = self.web.pages["https://acme.com/sitemap_index.xml"].replace(
+            b"2026-01-05", b"2026-01-06")
+
+        # The budget only covers robots.txt's index, so the job sitemap goes unread
+        jobs, counts = SitemapDiscovery(self.state, fetch=self.web, max_sitemaps=1).discover_jobs(
+            "Acme", "https://acme.com/careers")
+        self.assertEqual(counts, {"fetched": 0, "reused": 2})
+
+        jobs, counts = self.discover()
+        self.assertEqual(counts, {"fetched": 0, "reused": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
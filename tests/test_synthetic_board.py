@@ -0,0 +1,97 @@
+"""Tests for the synthetic job-board server."""
+
+import asyncio
+import base64
+import json
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.scrapers.synthetic_board import (
+    BoardConfig, SyntheticBoard, SyntheticBoardServer, synthetic_job, targets_for,
+)
+
+
+async def fetch(port: int, path: str) -> tuple:
+    """Issue a GET and return (status line, body)."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, body = raw.partition(b'\r\n\r\n')
+    return head.split(b'\r\n')[0].decode(), body
+
+
+class TestSyntheticBoard(unittest.TestCase):
+    """Test deterministic data generation and paging."""
+
+    def test_jobs_are_deterministic(self):
+        self.assertEqual(synthetic_job(7, seed=1), synthetic_job(7, seed=1))
+        self.assertNotEqual(synthetic_job(7, seed=1), synthetic_job(7, seed=2))
+
+    def test_filtered_and_paged(self):
+        board = SyntheticBoard(BoardConfig(jobs=500, page_size=25))
+        australia = board.filtered(("Australia",))
+        self.assertTrue(australia)
+        self.assertTrue(all('australia' in j['location'].lower() for j in australia))
+        self.assertEqual(len(board.page(board.jobs, 1)), 25)
+        self.assertEqual(board.page(board.jobs, 21), [])
+
+    def test_targets_point_at_server(self):
+        targets = targets_for("http://127.0.0.1:9999")
+        self.assertTrue(all(t['url'].startswith("http://127.0.0.1:9999/") for t in targets))
+        self.assertIn("getro", {t['platform'] for t in targets})
+
+
+class TestSyntheticBoardServer(unittest.TestCase):
+    """Test the HTTP endpoints."""
+
+    def run_with_server(self, check):
+        async def runner():
+            async with SyntheticBoardServer(BoardConfig(jobs=120, page_size=20), port=0) as server:
+                await check(server)
+        asyncio.run(runner())
+
+    def test_getro_load_more_pages(self):
+        async def check(server):
+            location_filter = base64.b64encode(
+                json.dumps({"searchable_locations": ["Australia"]}).encode()).decode()
+            status, body = await fetch(server.port, f"/getro/vc/jobs?filter={location_filter}")
+            self.assertEqual(status, "HTTP/1.1 200 OK")
+            self.assertIn(b'Load more', body)
+            self.assertIn(b'/companies/', body)
+
+            status, body = await fetch(server.port, f"/getro/vc/api/jobs?filter={location_filter}&page=2")
+            data = json.loads(body)
+            self.assertIn('html', data)
+            self.assertIn('has_more', data)
+        self.run_with_server(check)
+
+    def test_greenhouse_and_lever_apis(self):
+        async def check(server):
+            _, body = await fetch(server.port, "/greenhouse/v1/boards/acme/jobs")
+            self.assertEqual(len(json.loads(body)['jobs']), 120)
+
+            _, body = await fetch(server.port, "/lever/v0/postings/acme?mode=json&skip=100&limit=50")
+            self.assertEqual(len(json.loads(body)), 20)
+        self.run_with_server(check)
+
+    def test_index_pages_end(self):
+        async def check(server):
+            _, body = await fetch(server.port, "/index/australia/1")
+            self.assertIn(b'class="result"', body)
+            _, body = await fetch(server.port, "/index/australia/99")
+            self.assertNotIn(b'class="result"', body)
+        self.run_with_server(check)
+
+    def test_unknown_path_404(self):
+        async def check(server):
+            status, _ = await fetch(server.port, "/nope/at/all")
+            self.assertTrue(status.endswith("404 Not Found"))
+        self.run_with_server(check)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Tests for scrape-run span tracing."""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.tracing import Tracer, current_tracer, span
+
+
+class TestTracer(unittest.TestCase):
+    """Test span recording, per-target totals and trace export."""
+
+    def test_span_is_noop_without_tracer(self):
+        self.assertIsNone(current_tracer())
+        with span("navigate"):
+            pass
+
+    def test_spans_attach_to_current_target(self):
+        tracer = Tracer("test")
+        with tracer.target("Acme"):
+            with span("navigate", url="https://example.com"):
+                pass
+            with span("paginate", step=1):
+                pass
+            with span("paginate", step=2):
+                pass
+        with tracer.span("save"):
+            pass
+
+        totals = tracer.stage_totals()
+        self.assertEqual(set(totals["Acme"]), {"navigate", "paginate", "total"})
+        self.assertIn("save", totals["(run)"])
+        self.assertIsNone(current_tracer())
+
+    def test_concurrent_targets_keep_their_own_context(self):
+        tracer = Tracer("test")
+
+        async def scrape(name):
+            with tracer.target(name):
+                with span("wait"):
+                    await asyncio.sleep(0.01)
+
+        async def runner():
+            await asyncio.gather(scrape("A"), scrape("B"))
+
+        asyncio.run(runner())
+        targets = {e["args"]["target"] for e in tracer.events if e["name"] == "wait"}
+        self.assertEqual(targets, {"A", "B"})
+
+    def test_chrome_trace_export(self):
+        tracer = Tracer("test")
+        with tracer.target("Acme"):
+            with span("extract"):
+                pass
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = tracer.write(Path(tmp) / "traces" / "trace.json")
+            with open(path) as f:
+                trace = json.load(f)
+
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual({e["name"] for e in complete}, {"target", "extract"})
+        self.assertTrue(all(e["dur"] >= 0 and "ts" in e for e in complete))
+        names = {e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+        self.assertIn("Acme", names)
+        self.assertIn("Acme", tracer.format_table())
+
+
+if __name__ == '__main__':
+    unittest.main()
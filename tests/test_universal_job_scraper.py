@@ -0,0 +1,132 @@
+"""Tests for the scraping engine's run bookkeeping, without a browser."""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import universal_job_scraper
+from src.core.metrics import record_cache_lookup
+from universal_job_scraper import UniversalJobScraper
+from tests.factories import make_job
+
+
+class FakeSession:
+    """Stands in for BrowserSession: targets here never open a page."""
+
+    peak_mb = 0.0
+    restarts = 0
+    recycles = 0
+
+    def __init__(self, *args):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def checkpoint(self, name=""):
+        return None
+
+
+class TestUniversalJobScraper(unittest.TestCase):
+    """Test how finished targets feed the change feed."""
+
+    def setUp(self):
+        # The engine keeps its state under ./data
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def run_scraper(self, targets, render, suite="universal"):
+        """Run scrape_all with ``render(name)`` standing in for page rendering; returns the result and output."""
+        async def render_target(name, url, platform_hint, location_filter):
+            outcome = render(name)
+            if asyncio.iscoroutine(outcome):
+                outcome = await outcome
+            if isinstance(outcome, Exception):
+                raise outcome
+            return [dict(j) for j in outcome]
+
+        scraper = UniversalJobScraper(targets=[{"name": name, "url": f"https://{name.lower()}.example/careers",
+                                                "platform": "greenhouse"} for name in targets],
+                                      filter_apac=False, suite=suite)
+        output = io.StringIO()
+        with mock.patch.object(universal_job_scraper, "BrowserSession", FakeSession), \
+                mock.patch.object(scraper, "render_target", render_target), \
+                contextlib.redirect_stdout(output):
+            return asyncio.run(scraper.scrape_all()), output.getvalue()
+
+    def test_errored_target_is_partial(self):
+        jobs = [make_job(n) for n in range(5)]
+        first, _ = self.run_scraper(["Acme"], lambda name: jobs)
+        self.assertEqual(first["changes"], {"Acme": {"added": 5, "removed": 0, "changed": 0}})
+
+        failed, _ = self.run_scraper(["Acme"], lambda name: ConnectionError("net::ERR_CONNECTION_RESET"))
+        self.assertEqual(failed["changes"], {})
+
+        again, _ = self.run_scraper(["Acme"], lambda name: jobs)
+        self.assertEqual(again["changes"], {})
+
+    def test_failed_getro_region_is_partial_in_any_suite(self):
+        jobs = [make_job(n) for n in range(4)]
+        first, _ = self.run_scraper(["Blackbird"], lambda name: jobs, suite="vc")
+        self.assertEqual(first["changes"], {"Blackbird": {"added": 4, "removed": 0, "changed": 0}})
+
+        async def regions(tab, names, scrape):
+            return [jobs[:2], TimeoutError("Singapore timed out")]
+
+        with mock.patch.object(universal_job_scraper, "scrape_in_tabs", regions):
+            failed, _ = self.run_scraper(["Blackbird"], lambda name: universal_job_scraper.GetroScraper.scrape_regions(
+                None, "https://jobs.blackbird.vc/jobs", ["Australia", "Singapore"], None), suite="vc")
+        self.assertEqual(failed["changes"], {})
+
+    def test_run_metrics_keep_process_wide_series(self):
+        record_cache_lookup("run_metrics_test", hit=True)
+        self.run_scraper(["Acme"], lambda name: [make_job(1)])
+        prom = Path("data/metrics/universal.prom").read_text()
+        self.assertIn('jobsearch_cache_hit_ratio{data_type="run_metrics_test"} 1', prom)
+        self.assertIn('jobsearch_target_jobs_found{suite="universal",target="Acme"} 1', prom)
+
+    def test_merged_role_is_reported_once_and_scored(self):
+        listings = {
+            "Blackbird": [make_job(1, company="Canva", title="Head of Partnerships APAC",
+                                   url="https://jobs.blackbird.vc/companies/canva/jobs/41-head-of-partnerships-apac")],
+            "Canva": [make_job(2, company="Canva", title="Head of Partnerships, APAC",
+                               url="https://boards.greenhouse.io/canva/jobs/4242")],
+        }
+        result, output = self.run_scraper(list(listings), listings.get)
+        self.assertEqual(result["total"], 1)
+        with open(result["files"]["all"]) as f:
+            saved = json.load(f)[0]
+        self.assertEqual(len(saved["source_urls"]), 2)
+        self.assertGreater(saved["match_score"], 0)
+
+        self.assertIn("Changes: +1 new", output)
+        top = output.split("TOP 20")[1]
+        self.assertEqual(top.count("Head of Partnerships"), 1)
+        self.assertIn(f"[{saved['match_score']}%]", top)
+
+        conn = sqlite3.connect("data/jobs.db")
+        stored = [json.loads(row[0]) for row in conn.execute("SELECT job FROM job_state")]
+        conn.close()
+        self.assertEqual(len(stored), 2)
+        self.assertTrue(all(record.get("match_score", 0) > 0 for record in stored))
+
+
+if __name__ == '__main__':
+    unittest.main()
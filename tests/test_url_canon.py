@@ -0,0 +1,68 @@
+"""Tests for canonical job URLs and URL hashes."""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.dedupe import dedupe_by_url
+from src.core.url_canon import ats_job_id, canonical_url, url_hash, url_id, url_key
+
+
+class TestUrlCanon(unittest.TestCase):
+    """Test normalization, ATS job IDs and hashing."""
+
+    def test_canonical_url_trims_ats_pages(self):
+        cases = {
+            "https://jobs.lever.co/acme/0b4f36a5-1a7e-4d1f-8a22-96e1a8a1fd11/apply?lever-source=x":
+                "https://jobs.lever.co/acme/0b4f36a5-1a7e-4d1f-8a22-96e1a8a1fd11",
+            "https://jobs.ashbyhq.com/notion/9fe70944-f84f-421c-8168-bbf21d4b4ca4/application":
+                "https://jobs.ashbyhq.com/notion/9fe70944-f84f-421c-8168-bbf21d4b4ca4",
+            "https://boards.greenhouse.io/figma/jobs/5781632004?gh_jid=5781632004":
+                "https://boards.greenhouse.io/figma/jobs/5781632004",
+            "https://acme.wd3.myworkdayjobs.com/en-US/Careers/job/Sydney/Account-Executive_JR-123/":
+                "https://acme.wd3.myworkdayjobs.com/Careers/job/Sydney/Account-Executive_JR-123",
+            "https://acme.com/careers/jobs/?id=7&utm_campaign=x&utm_id=y#top": "https://acme.com/careers/jobs?id=7",
+        }
+        for url, expected in cases.items():
+            self.assertEqual(canonical_url(url), expected, url)
+
+    def test_ats_job_ids(self):
+        cases = {
+            "https://job-boards.greenhouse.io/figma/jobs/5781632004": "greenhouse:5781632004",
+            "https://www.figma.com/careers/job?gh_jid=5781632004": "greenhouse:5781632004",
+            "https://jobs.lever.co/Acme/0B4F36A5-1A7E-4D1F-8A22-96E1A8A1FD11": "lever:0b4f36a5-1a7e-4d1f-8a22-96e1a8a1fd11",
+            "https://jobs.ashbyhq.com/notion/9fe70944-f84f-421c-8168-bbf21d4b4ca4": "ashby:9fe70944-f84f-421c-8168-bbf21d4b4ca4",
+            "https://jobs.accel.com/companies/canva/jobs/66534143-senior-engineer#content": "getro:66534143",
+            "https://acme.wd3.myworkdayjobs.com/en-US/Careers/job/Sydney/Account-Executive_JR-123": "workday:acme:jr-123",
+            "https://au.linkedin.com/jobs/view/head-of-partnerships-at-acme-3797056611": "linkedin:3797056611",
+            "https://acme.com/careers/account-executive": None,
+        }
+        for url, expected in cases.items():
+            self.assertEqual(ats_job_id(url), expected, url)
+
+    def test_same_posting_same_key(self):
+        variants = [
+            "https://jobs.insightpartners.com/companies/launchdarkly/jobs/58467804-senior-ae#content",
+            "https://jobs.generalcatalyst.com/companies/launchdarkly/jobs/58467804-senior-ae?utm_source=x",
+        ]
+        self.assertEqual(len({url_key(u) for u in variants}), 1)
+        self.assertEqual(url_key("http://WWW.Stripe.com/jobs/listing/ae/7477347/?ref=abc"),
+                         "stripe.com/jobs/listing/ae/7477347")
+        self.assertNotEqual(url_key("https://acme.com/jobs?id=7"), url_key("https://acme.com/jobs?id=8"))
+
+    def test_hash_fits_sqlite_integer(self):
+        value = url_hash("https://stripe.com/jobs/listing/ae/7477347")
+        self.assertTrue(-2 ** 63 <= value < 2 ** 63)
+        self.assertEqual(url_hash("http://www.stripe.com/jobs/listing/ae/7477347/"), value)
+        self.assertRegex(url_id("https://stripe.com/jobs/listing/ae/7477347"), r"^[0-9a-f]{16}$")
+
+    def test_dedupe_by_url_uses_keys(self):
+        jobs = [{"url": "https://boards.greenhouse.io/figma/jobs/1"},
+                {"url": "https://www.figma.com/careers/job?gh_jid=1&gh_src=x"},
+                {"url": "https://boards.greenhouse.io/figma/jobs/2"}]
+        self.assertEqual(dedupe_by_url(jobs), [jobs[0], jobs[2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Tests for the SQLite lease work queue."""
+
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+from argparse import Namespace
+from pathlib import Path
+from unittest import mock
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.work_queue import WorkQueue
+
+try:
+    import scrape_queue
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+class TestWorkQueue(unittest.TestCase):
+    """Test leasing, heartbeats, retries and collection."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = WorkQueue(Path(self.tmp.name) / "queue.db", visibility_timeout_s=60,
+                               max_attempts=2, retry_backoff_s=0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def expire_leases(self):
+        conn = self.queue.get_connection()
+        conn.execute("UPDATE tasks SET lease_expires = ?", (time.time() - 1,))
+        conn.close()
+
+    def test_each_task_is_claimed_once(self):
+        for name in ("A", "B"):
+            self.assertTrue(self.queue.enqueue(name, {"name": name}))
+        self.assertFalse(self.queue.enqueue("A", {"name": "A"}))
+
+        first = self.queue.claim("w1")
+        second = self.queue.claim("w2")
+        self.assertEqual({first.key, second.key}, {"A", "B"})
+        self.assertIsNone(self.queue.claim("w3"))
+        self.assertEqual(self.queue.stats()["leased"], 2)
+
+    def test_expired_lease_is_reclaimed_and_old_owner_locked_out(self):
+        self.queue.enqueue("A", {"name": "A"})
+        task = self.queue.claim("w1")
+        self.assertTrue(self.queue.heartbeat(task.id, "w1"))
+
+        self.expire_leases()
+        reclaimed = self.queue.claim("w2")
+        self.assertEqual(reclaimed.id, task.id)
+        self.assertEqual(reclaimed.attempts, 2)
+
+        self.assertFalse(self.queue.heartbeat(task.id, "w1"))
+        self.assertFalse(self.queue.complete(task.id, "w1", {"jobs": []}))
+        self.assertTrue(self.queue.complete(task.id, "w2", {"jobs": [1]}))
+
+    def test_failures_retry_until_out_of_attempts(self):
+        self.queue.enqueue("A", {"name": "A"})
+        task = self.queue.claim("w1")
+        self.queue.fail(task.id, "w1", "boom", task.attempts)
+        self.assertEqual(self.queue.stats()["pending"], 1)
+
+        task = self.queue.claim("w1")
+        self.queue.fail(task.id, "w1", "boom again", task.attempts)
+        self.assertEqual(self.queue.stats()["failed"], 1)
+        self.assertTrue(self.queue.is_drained())
+        self.assertIsNone(self.queue.claim("w1"))
+
+    def test_collect_reads_results_once_and_enqueue_resets(self):
+        self.queue.enqueue("A", {"name": "A"})
+        task = self.queue.claim("w1")
+        self.queue.complete(task.id, "w1", {"jobs": [{"url": "u"}]})
+
+        self.assertEqual(self.queue.collect(), [{"key": "A", "result": {"jobs": [{"url": "u"}]}}])
+        self.assertEqual(self.queue.collect(), [])
+
+        self.assertTrue(self.queue.enqueue("A", {"name": "A"}))
+        self.assertEqual(self.queue.claim("w1").attempts, 1)
+
+
+class FakeSession:
+    def __init__(self, *args):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+@unittest.skipUnless(PLAYWRIGHT_AVAILABLE, "playwright not installed")
+class TestWorker(unittest.TestCase):
+    """Test that queue workers scrape with the same settings as a local run."""
+
+    def test_worker_applies_rate_limits_and_har(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = Path(tmp) / "targets.json"
+            config.write_text(json.dumps({"targets": [], "rate_limit": {"per_host_interval_s": 2.0}}))
+            args = Namespace(config=str(config), db=str(Path(tmp) / "queue.db"), visibility_timeout=60,
+                             max_attempts=3, once=True, poll=0, timeout=None, har="replay",
+                             har_dir=str(Path(tmp) / "har"))
+            with mock.patch.object(scrape_queue, "UniversalJobScraper") as scraper_cls, \
+                    mock.patch.object(scrape_queue, "BrowserSession", FakeSession):
+                asyncio.run(scrape_queue.run_worker(args))
+
+        options = scraper_cls.call_args.kwargs
+        self.assertEqual(options["rate_limit"], {"per_host_interval_s": 2.0})
+        self.assertEqual((options["har"].mode, options["har"].directory), ("replay", args.har_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
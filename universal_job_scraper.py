@@ -9,16 +9,39 @@ Universal Job Scraper
 from __future__ import annotations
 
 import asyncio
+import base64
 import json
 import re
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Union
 from urllib.parse import urlparse, urljoin
 from dataclasses import dataclass, field
 from enum import Enum
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import async_playwright, Page
+
+from src.core.metrics import (
+    JOBS_FOUND, LAST_RUN, PAGES_NAVIGATED, REGISTRY, RUN_DURATION, RUN_JOBS,
+    SCRAPE_ERRORS, TARGET_DURATION, write_run_metrics,
+)
+from src.core.change_feed import ChangeFeed, summarize
+from src.core.scheduler import TargetHistory, TargetScheduler
+from src.core.scoring import score_jobs
+from src.core.dedupe import dedupe_by_url, merge_near_duplicates
+from src.core.keyword_matcher import filter_apac, filter_gtm, is_apac_location
+from src.core.locations import normalize_location
+from src.core.tracing import Tracer, current_suite, current_target, span
+from src.core.url_canon import url_key
+from src.scrapers.browser_session import (
+    RATE_LIMITER, BrowserSession, MemoryLimits, create_browser_context, navigate, scrape_in_tabs, settle,
+)
+from src.scrapers.har import HarConfig
+from src.scrapers.scrape_plans import ScrapePlan, ScrapePlanStore
+from src.scrapers.registry import SCRAPERS
+from src.scrapers.sitemap import JOB_URL_PATTERNS, SitemapDiscovery
 
 
 # =============================================================================
@@ -45,16 +68,17 @@ class ScrapingTarget:
     url: str
     type: str = "company"  # "company" or "vc_portfolio"
     platform: Optional[str] = None  # Auto-detected if not specified
-    location_filter: Optional[str] = None
+    scraper: Optional[str] = None  # Board plugin (registry name or "module:Class"); skips detection
+    location_filter: Optional[Union[str, List[str]]] = None  # a list is fetched region by region
     enabled: bool = True
 
 
 # Default targets - add your own or load from JSON
 DEFAULT_TARGETS = [
     # Top VCs
-    {"name": "Sequoia Capital", "url": "https://jobs.sequoiacap.com/jobs", "type": "vc_portfolio", "platform": "getro", "location_filter": "Australia"},
-    {"name": "Insight Partners", "url": "https://jobs.insightpartners.com/jobs", "type": "vc_portfolio", "platform": "getro", "location_filter": "Australia"},
-    {"name": "Index Ventures", "url": "https://www.indexventures.com/startup-jobs/sydney-australia", "type": "vc_portfolio", "platform": "custom"},
+    {"name": "Sequoia Capital", "url": "https://jobs.sequoiacap.com/jobs", "type": "vc_portfolio", "platform": "getro", "location_filter": ["Australia", "Singapore", "Remote"]},
+    {"name": "Insight Partners", "url": "https://jobs.insightpartners.com/jobs", "type": "vc_portfolio", "platform": "getro", "location_filter": ["Australia", "Singapore", "Remote"]},
+    {"name": "Index Ventures", "url": "https://www.indexventures.com/startup-jobs/sydney-australia", "type": "vc_portfolio", "platform": "custom", "scraper": "index-ventures"},
     {"name": "Lightspeed VP", "url": "https://jobs.lsvp.com/jobs", "type": "vc_portfolio", "platform": "getro"},
     {"name": "Accel", "url": "https://jobs.accel.com/jobs", "type": "vc_portfolio", "platform": "getro"},
     {"name": "a16z", "url": "https://jobs.a16z.com/jobs", "type": "vc_portfolio", "platform": "getro"},
@@ -81,80 +105,73 @@ DEFAULT_TARGETS = [
     {"name": "Lacework", "url": "https://www.lacework.com/careers", "type": "company", "platform": "greenhouse"},
 ]
 
-# Keywords for filtering
-GTM_KEYWORDS = [
-    'sales', 'account', 'business development', 'bd ', 'bdr', 'sdr',
-    'gtm', 'go-to-market', 'commercial', 'revenue', 'partnerships',
-    'partner', 'customer success', 'solutions', 'presales',
-    'enterprise', 'strategic', 'field'
-]
-
-SENIOR_KEYWORDS = [
-    'director', 'head of', 'vp ', 'vice president', 'chief',
-    'manager', 'lead', 'senior', 'principal', 'executive',
-    'enterprise', 'strategic', 'regional'
-]
-
-JUNIOR_KEYWORDS = ['intern', 'graduate', 'entry level', 'coordinator', 'assistant', 'junior', 'trainee']
-
-APAC_LOCATIONS = [
-    'australia', 'sydney', 'melbourne', 'brisbane', 'perth',
-    'singapore', 'apac', 'asia', 'remote', 'india', 'bangalore',
-    'mumbai', 'tokyo', 'seoul', 'hong kong', 'new zealand', 'auckland'
-]
-
-
 # =============================================================================
 # UTILITIES
 # =============================================================================
 
-def is_gtm_role(title: str) -> bool:
-    """Check if title is a GTM role."""
-    title_lower = title.lower()
-    if any(kw in title_lower for kw in JUNIOR_KEYWORDS):
-        return False
-    return any(kw in title_lower for kw in GTM_KEYWORDS)
+async def scroll_page(page: Page, max_scrolls: int) -> bool:
+    """Scroll to the bottom until the page stops growing. Returns True if it grew."""
+    grew = False
+    last_height = await page.evaluate('document.body.scrollHeight')
+    for i in range(max_scrolls):
+        with span("paginate", kind="scroll", step=i + 1):
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            await asyncio.sleep(1)
+            new_height = await page.evaluate('document.body.scrollHeight')
+        if new_height == last_height:
+            break
+        grew = True
+        last_height = new_height
+    return grew
 
 
-def calculate_match_score(job: Dict) -> int:
-    """Calculate match score."""
-    score = 50
-    title = job.get('title', '').lower()
+async def wait_for_plan(page: Page, plan: ScrapePlan, max_wait_s: float):
+    """Wait for the plan's selector to appear instead of sleeping a fixed time."""
+    with span("wait", selector=plan.wait_for):
+        try:
+            await page.wait_for_selector(plan.wait_for, state='attached', timeout=max_wait_s * 1000)
+        except Exception:
+            pass
 
-    if any(kw in title for kw in ['director', 'head of', 'vp ', 'chief']): score += 20
-    elif any(kw in title for kw in ['manager', 'lead', 'senior']): score += 10
 
-    if 'enterprise' in title: score += 15
-    if 'account executive' in title: score += 15
-    if 'partner' in title: score += 10
-    if 'sales' in title: score += 10
-    if 'gtm' in title: score += 15
-    if 'ai' in title or 'ml' in title: score += 15
+async def scrape_with_plan(page: Page, url: str, script: str, selectors: List[str],
+                           plans: Optional[ScrapePlanStore], key: str,
+                           settle_s: float, max_scrolls: int = 0) -> List[Dict]:
+    """
+    Load a page and run a selector-probing extraction script.
 
-    loc = job.get('location', '').lower()
-    if 'sydney' in loc: score += 10
-    elif 'australia' in loc: score += 5
-    elif 'remote' in loc: score += 5
+    With a learned plan only its selectors, wait condition and pagination are
+    used. Without one, or when the plan's yield drops, every selector is
+    probed and the plan is (re)learned from what matched.
 
-    if any(kw in title for kw in JUNIOR_KEYWORDS): score -= 30
+    The script takes a selector list and returns ``{items, hits}``, where
+    ``hits`` counts the new items each selector contributed.
+    """
+    plan = plans.get(key) if plans else None
 
-    return min(100, max(0, score))
+    await navigate(page, url, wait_until='domcontentloaded', timeout=30000)
 
+    if plan:
+        await wait_for_plan(page, plan, settle_s)
+        if plan.pagination == "scroll":
+            await scroll_page(page, max_scrolls)
 
-def is_apac_location(text: str) -> bool:
-    """Check if text contains APAC location."""
-    text_lower = text.lower()
-    return any(loc in text_lower for loc in APAC_LOCATIONS)
+        with span("extract", plan="replay"):
+            result = await page.evaluate(script, plan.selectors)
+        if not plans.needs_reprobe(plan, len(result['items'])):
+            plans.confirm(key, len(result['items']))
+            return result['items']
+        print(f"   ↻ Learned plan found {len(result['items'])} jobs (was {plan.jobs}), re-probing selectors")
+    else:
+        await settle(settle_s)
 
+    grew = await scroll_page(page, max_scrolls) if max_scrolls else False
 
-async def create_browser_context(playwright) -> tuple[Browser, BrowserContext]:
-    """Create browser with standard settings."""
-    browser = await playwright.chromium.launch(headless=True)
-    context = await browser.new_context(
-        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        viewport={'width': 1920, 'height': 1080}
-    )
-    return browser, context
+    with span("extract", plan="probe"):
+        result = await page.evaluate(script, selectors)
+    if plans is not None:
+        plans.learn(key, result['hits'], "scroll" if grew else "none", len(result['items']))
+    return result['items']
 
 
 # =============================================================================
@@ -222,6 +239,42 @@ class PlatformDetector:
 class GreenhouseScraper:
     """Scraper for Greenhouse-powered job boards."""
 
+    # Candidate selectors for Greenhouse embeds, probed until a plan is learned
+    SELECTORS = [
+        'a[href*="greenhouse.io/"]',
+        'a[href*="/jobs/"]',
+        '[class*="job"] a',
+        '[class*="opening"] a',
+        '[class*="position"] a',
+        'div[class*="job-post"] a',
+        'tr[class*="job"] a'
+    ]
+
+    EXTRACT_JS = '''(selectors) => {
+        const jobs = [];
+        const hits = {};
+        const seen = new Set();
+
+        for (const selector of selectors) {
+            hits[selector] = 0;
+            document.querySelectorAll(selector).forEach(el => {
+                const href = el.getAttribute('href');
+                const text = el.innerText || el.textContent;
+
+                if (href && text && text.length > 3 && !seen.has(href)) {
+                    seen.add(href);
+                    hits[selector]++;
+                    jobs.push({
+                        text: text.trim(),
+                        href: href,
+                        parent_text: el.closest('div, tr, li')?.innerText || ''
+                    });
+                }
+            });
+        }
+        return {items: jobs, hits: hits};
+    }'''
+
     @staticmethod
     async def get_jobs_via_api(company_slug: str) -> List[Dict]:
         """Try to get jobs via Greenhouse public API."""
@@ -233,7 +286,7 @@ class GreenhouseScraper:
             page = await browser.new_page()
 
             try:
-                response = await page.goto(api_url, wait_until='domcontentloaded', timeout=15000)
+                response = await navigate(page, api_url, wait_until='domcontentloaded', timeout=15000)
                 content = await page.content()
 
                 # Parse JSON response
@@ -258,45 +311,14 @@ class GreenhouseScraper:
         return jobs
 
     @staticmethod
-    async def scrape_page(page: Page, base_url: str) -> List[Dict]:
+    async def scrape_page(page: Page, base_url: str, plans: Optional[ScrapePlanStore] = None,
+                          plan_key: str = "") -> List[Dict]:
         """Scrape jobs from Greenhouse-embedded careers page."""
         jobs = []
 
-        await page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
-        await asyncio.sleep(3)
-
-        # Try multiple selectors for Greenhouse embeds
-        job_data = await page.evaluate('''() => {
-            const jobs = [];
-            const selectors = [
-                'a[href*="greenhouse.io/"]',
-                'a[href*="/jobs/"]',
-                '[class*="job"] a',
-                '[class*="opening"] a',
-                '[class*="position"] a',
-                'div[class*="job-post"] a',
-                'tr[class*="job"] a'
-            ];
-
-            const seen = new Set();
-
-            for (const selector of selectors) {
-                document.querySelectorAll(selector).forEach(el => {
-                    const href = el.getAttribute('href');
-                    const text = el.innerText || el.textContent;
-
-                    if (href && text && text.length > 3 && !seen.has(href)) {
-                        seen.add(href);
-                        jobs.push({
-                            text: text.trim(),
-                            href: href,
-                            parent_text: el.closest('div, tr, li')?.innerText || ''
-                        });
-                    }
-                });
-            }
-            return jobs;
-        }''')
+        job_data = await scrape_with_plan(
+            page, base_url, GreenhouseScraper.EXTRACT_JS, GreenhouseScraper.SELECTORS,
+            plans, f"greenhouse:{plan_key or base_url}", settle_s=3)
 
         for item in job_data:
             try:
@@ -312,7 +334,7 @@ class GreenhouseScraper:
                 location = ""
                 parent_lines = [l.strip() for l in parent.split('\n') if l.strip()]
                 for line in parent_lines:
-                    if is_apac_location(line) or any(x in line.lower() for x in ['remote', 'hybrid', 'office']):
+                    if is_apac_location(line) or normalize_location(line)['remote_type']:
                         location = line
                         break
 
@@ -339,30 +361,31 @@ class LeverScraper:
         """Scrape jobs from Lever careers page."""
         jobs = []
 
-        await page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
-        await asyncio.sleep(3)
+        await navigate(page, base_url, wait_until='domcontentloaded', timeout=30000)
+        await settle(3)
 
         # Lever has a consistent structure
-        job_data = await page.evaluate('''() => {
-            const jobs = [];
-            const postings = document.querySelectorAll('.posting, [class*="lever-job"], a[href*="lever.co/"]');
+        with span("extract"):
+            job_data = await page.evaluate('''() => {
+                const jobs = [];
+                const postings = document.querySelectorAll('.posting, [class*="lever-job"], a[href*="lever.co/"]');
 
-            postings.forEach(posting => {
-                const titleEl = posting.querySelector('.posting-title, h5, [class*="title"]');
-                const locationEl = posting.querySelector('.posting-categories, .location, [class*="location"]');
-                const linkEl = posting.querySelector('a[href*="lever.co"]') || posting;
+                postings.forEach(posting => {
+                    const titleEl = posting.querySelector('.posting-title, h5, [class*="title"]');
+                    const locationEl = posting.querySelector('.posting-categories, .location, [class*="location"]');
+                    const linkEl = posting.querySelector('a[href*="lever.co"]') || posting;
 
-                if (titleEl) {
-                    jobs.push({
-                        title: titleEl.innerText?.trim() || '',
-                        location: locationEl?.innerText?.trim() || '',
-                        url: linkEl.getAttribute?.('href') || ''
-                    });
-                }
-            });
+                    if (titleEl) {
+                        jobs.push({
+                            title: titleEl.innerText?.trim() || '',
+                            location: locationEl?.innerText?.trim() || '',
+                            url: linkEl.getAttribute?.('href') || ''
+                        });
+                    }
+                });
 
-            return jobs;
-        }''')
+                return jobs;
+            }''')
 
         for item in job_data:
             if item.get('title'):
@@ -379,51 +402,55 @@ class LeverScraper:
 class AshbyScraper:
     """Scraper for Ashby-powered job boards."""
 
-    @staticmethod
-    async def scrape_page(page: Page, base_url: str) -> List[Dict]:
-        """Scrape jobs from Ashby careers page."""
-        jobs = []
-
-        await page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
-        await asyncio.sleep(3)
-
-        # Ashby typically has clean semantic markup
-        job_data = await page.evaluate('''() => {
-            const jobs = [];
-
-            // Try Ashby-specific selectors
-            const selectors = [
-                'a[href*="ashbyhq.com"]',
-                'a[href*="/jobs/"]',
-                '[data-testid*="job"]',
-                '.job-listing a',
-                '[class*="JobListing"] a'
-            ];
+    # Ashby-specific selectors, probed until a plan is learned
+    SELECTORS = [
+        'a[href*="ashbyhq.com"]',
+        'a[href*="/jobs/"]',
+        '[data-testid*="job"]',
+        '.job-listing a',
+        '[class*="JobListing"] a'
+    ]
+
+    EXTRACT_JS = '''(selectors) => {
+        const jobs = [];
+        const hits = {};
+        const seen = new Set();
+
+        for (const selector of selectors) {
+            hits[selector] = 0;
+            document.querySelectorAll(selector).forEach(el => {
+                const href = el.getAttribute('href');
+                const text = el.innerText?.trim();
 
-            const seen = new Set();
+                if (href && text && text.length > 5 && !seen.has(href)) {
+                    seen.add(href);
+                    hits[selector]++;
 
-            for (const selector of selectors) {
-                document.querySelectorAll(selector).forEach(el => {
-                    const href = el.getAttribute('href');
-                    const text = el.innerText?.trim();
+                    const parent = el.closest('div, li, tr');
+                    const locationEl = parent?.querySelector('[class*="location"], [class*="Location"]');
 
-                    if (href && text && text.length > 5 && !seen.has(href)) {
-                        seen.add(href);
+                    jobs.push({
+                        title: text.split('\\n')[0]?.trim() || text,
+                        location: locationEl?.innerText?.trim() || '',
+                        url: href
+                    });
+                }
+            });
+        }
 
-                        const parent = el.closest('div, li, tr');
-                        const locationEl = parent?.querySelector('[class*="location"], [class*="Location"]');
+        return {items: jobs, hits: hits};
+    }'''
 
-                        jobs.push({
-                            title: text.split('\\n')[0]?.trim() || text,
-                            location: locationEl?.innerText?.trim() || '',
-                            url: href
-                        });
-                    }
-                });
-            }
+    @staticmethod
+    async def scrape_page(page: Page, base_url: str, plans: Optional[ScrapePlanStore] = None,
+                          plan_key: str = "") -> List[Dict]:
+        """Scrape jobs from Ashby careers page."""
+        jobs = []
 
-            return jobs;
-        }''')
+        # Ashby typically has clean semantic markup
+        job_data = await scrape_with_plan(
+            page, base_url, AshbyScraper.EXTRACT_JS, AshbyScraper.SELECTORS,
+            plans, f"ashby:{plan_key or base_url}", settle_s=3)
 
         for item in job_data:
             if item.get('title'):
@@ -442,29 +469,68 @@ class GetroScraper:
     """Scraper for Getro-powered VC job boards."""
 
     @staticmethod
-    async def scrape_page(page: Page, base_url: str, location_filter: Optional[str] = None) -> List[Dict]:
-        """Scrape jobs from Getro VC portfolio page."""
-        jobs = []
+    def filtered_url(base_url: str, location_filter: Optional[str]) -> str:
+        """Board URL with Getro's base64-encoded location filter."""
+        if not location_filter:
+            return base_url
+        filter_json = json.dumps({"searchable_locations": [location_filter]})
+        return f"{base_url}?filter={base64.b64encode(filter_json.encode()).decode()}"
 
-        # Add location filter if specified
-        url = base_url
-        if location_filter:
-            # Getro uses base64-encoded filters
-            import base64
-            filter_json = json.dumps({"searchable_locations": [location_filter]})
-            filter_b64 = base64.b64encode(filter_json.encode()).decode()
-            url = f"{base_url}?filter={filter_b64}"
+    @staticmethod
+    async def scrape_regions(page: Page, base_url: str, location_filter: Union[str, List[str], None] = None,
+                             session: Optional[BrowserSession] = None) -> List[Dict]:
+        """
+        Scrape one or more location filters of a board, merged by URL.
+
+        Each region loads in its own tab of the same context, concurrently,
+        so three regions cost about as long as the slowest one rather than
+        three full scrapes. A failed region is reported and skipped unless
+        every region fails.
+        """
+        regions = location_filter if isinstance(location_filter, list) else [location_filter]
+        if len(regions) <= 1:
+            return await GetroScraper.scrape_page(page, base_url, regions[0] if regions else None, session)
+
+        results = await scrape_in_tabs(
+            page, regions, lambda tab, region: GetroScraper.scrape_page(tab, base_url, region, session))
+
+        failures = [(region, r) for region, r in zip(regions, results) if isinstance(r, BaseException)]
+        if len(failures) == len(regions):
+            raise failures[0][1]
+        for region, error in failures:
+            print(f"   ⚠️  {region}: {error}")
+            SCRAPE_ERRORS.inc(suite=current_suite() or "unknown", target=current_target() or "unknown")
+
+        listed = [job for r in results if not isinstance(r, BaseException) for job in r]
+        jobs = dedupe_by_url(listed)
+        print(f"   🌏 {len(regions)} regions: {len(listed)} listings, {len(jobs)} unique")
+        return jobs
+
+    @staticmethod
+    async def scrape_page(page: Page, base_url: str, location_filter: Optional[str] = None,
+                          session: Optional[BrowserSession] = None) -> List[Dict]:
+        """
+        Scrape jobs from Getro VC portfolio page.
+
+        With a shared ``session``, pagination stops early once the page is
+        over its memory limits and the jobs loaded so far are extracted.
+        """
+        jobs = []
 
-        await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-        await asyncio.sleep(5)
+        await navigate(page, GetroScraper.filtered_url(base_url, location_filter), wait_until='domcontentloaded', timeout=30000)
+        await settle(5)
 
         # Click "Load more" until done
-        for _ in range(15):
+        for i in range(15):
+            if session and not session.can_load_more():
+                print(f"   🧠 Memory limit reached, stopping after {i} load-more clicks")
+                break
             try:
                 load_more = page.locator('button:has-text("Load more")')
                 if await load_more.count() > 0 and await load_more.is_visible():
-                    await load_more.click()
-                    await asyncio.sleep(1.5)
+                    with span("paginate", kind="load_more", step=i + 1):
+                        await load_more.click()
+                        await asyncio.sleep(1.5)
                 else:
                     break
             except:
@@ -472,32 +538,36 @@ class GetroScraper:
 
         # Also try infinite scroll
         last_height = 0
-        for _ in range(10):
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(1)
-            new_height = await page.evaluate('document.body.scrollHeight')
+        for i in range(10):
+            if session and not session.can_load_more():
+                break
+            with span("paginate", kind="scroll", step=i + 1):
+                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                await asyncio.sleep(1)
+                new_height = await page.evaluate('document.body.scrollHeight')
             if new_height == last_height:
                 break
             last_height = new_height
 
         # Extract jobs
-        job_data = await page.evaluate('''() => {
-            const jobs = [];
-            const links = document.querySelectorAll('a[href*="/companies/"][href*="/jobs/"], a[href*="/jobs/"]');
-            const seen = new Set();
+        with span("extract"):
+            job_data = await page.evaluate('''() => {
+                const jobs = [];
+                const links = document.querySelectorAll('a[href*="/companies/"][href*="/jobs/"], a[href*="/jobs/"]');
+                const seen = new Set();
 
-            links.forEach(link => {
-                const href = link.getAttribute('href');
-                const text = link.innerText;
+                links.forEach(link => {
+                    const href = link.getAttribute('href');
+                    const text = link.innerText;
 
-                if (href && text && text.length > 5 && !seen.has(href)) {
-                    seen.add(href);
-                    jobs.push({text: text, href: href});
-                }
-            });
+                    if (href && text && text.length > 5 && !seen.has(href)) {
+                        seen.add(href);
+                        jobs.push({text: text, href: href});
+                    }
+                });
 
-            return jobs;
-        }''')
+                return jobs;
+            }''')
 
         for item in job_data:
             try:
@@ -543,65 +613,59 @@ class GetroScraper:
 class GenericScraper:
     """Generic scraper for unknown platforms."""
 
-    @staticmethod
-    async def scrape_page(page: Page, base_url: str) -> List[Dict]:
-        """Try to scrape any careers page."""
-        jobs = []
-
-        await page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
-        await asyncio.sleep(5)
+    # Everything that commonly marks a job link, probed until a plan is learned
+    SELECTORS = [f'a[href*="{pattern}"]' for pattern in JOB_URL_PATTERNS] + [
+        '[class*="job"] a',
+        '[class*="career"] a',
+        '[class*="position"] a',
+        '[class*="opening"] a',
+        '[class*="listing"] a',
+        'article a',
+        '.card a'
+    ]
+
+    EXTRACT_JS = '''(selectors) => {
+        const jobs = [];
+        const hits = {};
+        const seen = new Set();
+
+        for (const selector of selectors) {
+            hits[selector] = 0;
+            document.querySelectorAll(selector).forEach(el => {
+                const href = el.getAttribute('href');
+                const text = el.innerText?.trim();
+
+                // Filter out nav links, etc.
+                if (href && text && text.length > 10 && text.length < 200 && !seen.has(href)) {
+                    // Skip if it looks like navigation
+                    if (['home', 'about', 'contact', 'blog', 'news'].includes(text.toLowerCase())) {
+                        return;
+                    }
+                    seen.add(href);
+                    hits[selector]++;
 
-        # Scroll to load content
-        for _ in range(5):
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(1)
+                    const parent = el.closest('div, li, article, tr');
+                    jobs.push({
+                        text: text,
+                        href: href,
+                        parent_text: parent?.innerText?.substring(0, 500) || ''
+                    });
+                }
+            });
+        }
 
-        # Try many different selectors
-        job_data = await page.evaluate('''() => {
-            const jobs = [];
-            const selectors = [
-                'a[href*="/job"]',
-                'a[href*="/career"]',
-                'a[href*="/position"]',
-                'a[href*="/opening"]',
-                'a[href*="greenhouse"]',
-                'a[href*="lever"]',
-                '[class*="job"] a',
-                '[class*="career"] a',
-                '[class*="position"] a',
-                '[class*="opening"] a',
-                '[class*="listing"] a',
-                'article a',
-                '.card a'
-            ];
-
-            const seen = new Set();
-
-            for (const selector of selectors) {
-                document.querySelectorAll(selector).forEach(el => {
-                    const href = el.getAttribute('href');
-                    const text = el.innerText?.trim();
-
-                    // Filter out nav links, etc.
-                    if (href && text && text.length > 10 && text.length < 200 && !seen.has(href)) {
-                        // Skip if it looks like navigation
-                        if (['home', 'about', 'contact', 'blog', 'news'].includes(text.toLowerCase())) {
-                            return;
-                        }
-                        seen.add(href);
+        return {items: jobs, hits: hits};
+    }'''
 
-                        const parent = el.closest('div, li, article, tr');
-                        jobs.push({
-                            text: text,
-                            href: href,
-                            parent_text: parent?.innerText?.substring(0, 500) || ''
-                        });
-                    }
-                });
-            }
+    @staticmethod
+    async def scrape_page(page: Page, base_url: str, plans: Optional[ScrapePlanStore] = None,
+                          plan_key: str = "") -> List[Dict]:
+        """Try to scrape any careers page."""
+        jobs = []
 
-            return jobs;
-        }''')
+        job_data = await scrape_with_plan(
+            page, base_url, GenericScraper.EXTRACT_JS, GenericScraper.SELECTORS,
+            plans, f"generic:{plan_key or base_url}", settle_s=5, max_scrolls=5)
 
         for item in job_data:
             try:
@@ -617,7 +681,7 @@ class GenericScraper:
                 location = "See listing"
                 for line in parent.split('\n'):
                     line = line.strip()
-                    if is_apac_location(line) or any(x in line.lower() for x in ['remote', 'hybrid']):
+                    if is_apac_location(line) or normalize_location(line)['remote_type'] in ('remote', 'hybrid'):
                         location = line[:100]
                         break
 
@@ -643,44 +707,157 @@ class GenericScraper:
 class UniversalJobScraper:
     """
     Universal scraper that auto-detects platform and scrapes jobs.
+
+    This is the one scraping engine: targets either go through platform
+    detection or name a board plugin from ``src.scrapers.registry``, and
+    every target shares the pooled browser, rate limiter, history, change
+    feed and streaming output. The VC scripts run their boards through it.
     """
 
-    def __init__(self, targets: Optional[List[Dict]] = None, filter_apac: bool = True, filter_gtm: bool = False):
+    def __init__(self, targets: Optional[List[Dict]] = None, filter_apac: bool = True, filter_gtm: bool = False,
+                 har: Optional[HarConfig] = None, schedule: Optional[Dict] = None,
+                 memory: Optional[Dict] = None, rate_limit: Optional[Dict] = None,
+                 suite: str = "universal", title: str = "Universal Job Scraper"):
         """
         Initialize scraper.
 
         Args:
-            targets: List of target dicts with name, url, type, platform, location_filter
+            targets: List of target dicts with name, url, type, platform or scraper, location_filter
             filter_apac: Only keep APAC-relevant jobs
             filter_gtm: Only keep GTM roles
+            har: Record or replay each target's traffic as a HAR archive
+            schedule: Scheduler settings (cadence, slices) for budgeted runs
+            memory: MemoryLimits overrides for the shared browser in scrape_all
+            rate_limit: HostRateLimiter settings, e.g. ``{"per_host_interval_s": 1.0}``
+            suite: Label for metrics, output files and the change feed
+            title: Banner printed at the start of a run
         """
         self.targets = targets or DEFAULT_TARGETS
         self.filter_apac = filter_apac
         self.filter_gtm = filter_gtm
+        self.har = har
+        self.suite = suite
+        self.title = title
+        self.rate_limit = rate_limit
+        if rate_limit:
+            RATE_LIMITER.configure(**rate_limit)
+        self.tracer = Tracer(suite)
         self.all_jobs: List[Dict] = []
+        self.gtm_jobs: List[Dict] = []
         self.output_dir = Path("./data")
         self.output_dir.mkdir(exist_ok=True)
+        self.history = TargetHistory(self.output_dir / "target_history.json")
+        self.plans = ScrapePlanStore(self.output_dir / "scrape_plans.json")
+        self.sitemaps = SitemapDiscovery(self.output_dir / "sitemap_state.json")
+        self.changes = ChangeFeed(self.output_dir / "jobs.db", self.output_dir / "changes")
+        self.target_jobs: Dict[str, List[Dict]] = {}
+        self.partial_targets = set()
+        self.stream_file: Optional[Path] = None
+        self.scheduler = TargetScheduler(self.history, schedule)
+        self.memory_limits = MemoryLimits(**(memory or {}))
+        self.session: Optional[BrowserSession] = None
 
     def add_target(self, name: str, url: str, type: str = "company",
-                   platform: Optional[str] = None, location_filter: Optional[str] = None):
+                   platform: Optional[str] = None, location_filter: Union[str, List[str], None] = None,
+                   scraper: Optional[str] = None):
         """Add a scraping target."""
-        self.targets.append({
+        target = {
             "name": name,
             "url": url,
             "type": type,
             "platform": platform,
             "location_filter": location_filter,
             "enabled": True
-        })
+        }
+        if scraper:
+            target["scraper"] = scraper
+        self.targets.append(target)
 
     def add_company(self, name: str, careers_url: str, platform: Optional[str] = None):
         """Shorthand to add a company target."""
         self.add_target(name, careers_url, "company", platform)
 
-    def add_vc(self, name: str, jobs_url: str, location_filter: Optional[str] = "Australia"):
+    def add_vc(self, name: str, jobs_url: str, location_filter: Union[str, List[str], None] = "Australia"):
         """Shorthand to add a VC portfolio target."""
         self.add_target(name, jobs_url, "vc_portfolio", "getro", location_filter)
 
+    @asynccontextmanager
+    async def open_page(self, name: str):
+        """Page for one target: from the shared session if running, else a private browser."""
+        if self.session:
+            page = await self.session.new_page(name)
+            try:
+                yield page
+            finally:
+                await self.session.release(name)
+            return
+
+        async with async_playwright() as p:
+            with span("launch"):
+                browser, context = await create_browser_context(p, self.har, name)
+                page = await context.new_page()
+            try:
+                yield page
+            finally:
+                # Closing the context first flushes any HAR being recorded
+                await context.close()
+                await browser.close()
+
+    def use_sitemap(self, target: Dict) -> bool:
+        """Whether to try sitemap discovery before rendering the careers page."""
+        # Sitemap fetches bypass the browser, so they can't be recorded or replayed
+        if self.har is not None:
+            return False
+        if target.get('discovery'):
+            return target['discovery'] == 'sitemap'
+        # Platforms with a dedicated scraper already get a complete listing
+        return target.get('type', 'company') == 'company' and target.get('platform') in (None, 'custom', 'generic')
+
+    async def scrape_sitemap(self, name: str, url: str) -> List[Dict]:
+        """Job postings from the site's sitemaps; empty if it has none."""
+        with span("discover"):
+            loop = asyncio.get_running_loop()
+            jobs, counts = await loop.run_in_executor(None, self.sitemaps.discover_jobs, name, url)
+        if jobs:
+            print(f"   🗺️  Sitemap: {len(jobs)} postings ({counts['fetched']} fetched, {counts['reused']} unchanged)")
+        return jobs
+
+    async def render_target(self, name: str, url: str, platform_hint: Optional[str],
+                            location_filter: Union[str, List[str], None]) -> List[Dict]:
+        """Render the careers page and scrape it with the platform's scraper."""
+        async with self.open_page(name) as page:
+            # Determine platform
+            if platform_hint:
+                platform = Platform(platform_hint)
+            else:
+                await navigate(page, url, wait_until='domcontentloaded', timeout=30000)
+                platform = await PlatformDetector.detect(page, url)
+                print(f"   Detected platform: {platform.value}")
+
+            # Use appropriate scraper
+            if platform == Platform.GREENHOUSE:
+                return await GreenhouseScraper.scrape_page(page, url, self.plans, name)
+            elif platform == Platform.LEVER:
+                return await LeverScraper.scrape_page(page, url)
+            elif platform == Platform.ASHBY:
+                return await AshbyScraper.scrape_page(page, url, self.plans, name)
+            elif platform == Platform.GETRO:
+                return await GetroScraper.scrape_regions(page, url, location_filter, self.session)
+            else:
+                return await GenericScraper.scrape_page(page, url, self.plans, name)
+
+    async def run_plugin(self, target: Dict) -> List[Dict]:
+        """Scrape a target with its board plugin, on the shared browser if one is running."""
+        board = SCRAPERS.resolve(target['scraper'])(har=self.har)
+        board.session = self.session
+        try:
+            jobs = await board.scrape()
+        finally:
+            board.session = None
+        if board.errors:
+            SCRAPE_ERRORS.inc(board.errors, suite=self.suite, target=target.get('name', board.name))
+        return jobs
+
     async def scrape_target(self, target: Dict) -> List[Dict]:
         """Scrape a single target."""
         name = target.get('name', 'Unknown')
@@ -694,96 +871,256 @@ class UniversalJobScraper:
 
         print(f"🔍 Scraping {name}...")
         jobs = []
+        started = time.perf_counter()
 
-        async with async_playwright() as p:
-            browser, context = await create_browser_context(p)
-            page = await context.new_page()
-
+        with self.tracer.target(name):
             try:
-                # Determine platform
-                if platform_hint:
-                    platform = Platform(platform_hint)
-                else:
-                    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                    platform = await PlatformDetector.detect(page, url)
-                    print(f"   Detected platform: {platform.value}")
-
-                # Use appropriate scraper
-                if platform == Platform.GREENHOUSE:
-                    jobs = await GreenhouseScraper.scrape_page(page, url)
-                elif platform == Platform.LEVER:
-                    jobs = await LeverScraper.scrape_page(page, url)
-                elif platform == Platform.ASHBY:
-                    jobs = await AshbyScraper.scrape_page(page, url)
-                elif platform == Platform.GETRO:
-                    jobs = await GetroScraper.scrape_page(page, url, location_filter)
+                if target.get('scraper'):
+                    jobs = await self.run_plugin(target)
                 else:
-                    jobs = await GenericScraper.scrape_page(page, url)
-
-                # Add metadata
-                for job in jobs:
-                    job['source'] = name
-                    job['source_type'] = target_type
-                    if 'company' not in job or not job['company']:
-                        job['company'] = name if target_type == 'company' else ''
-                    job['match_score'] = calculate_match_score(job)
-                    job['scraped_date'] = datetime.now().isoformat()
-
-                # Filter if requested
-                if self.filter_apac:
-                    jobs = [j for j in jobs if is_apac_location(j.get('location', '') + ' ' + j.get('title', ''))]
+                    if self.use_sitemap(target):
+                        jobs = await self.scrape_sitemap(name, url)
+                    if not jobs:
+                        jobs = await self.render_target(name, url, platform_hint, location_filter)
+
+                with span("post_process"):
+                    # Add metadata
+                    for job in jobs:
+                        job['source'] = name
+                        job['source_type'] = target_type
+                        if 'company' not in job or not job['company']:
+                            job['company'] = name if target_type == 'company' else ''
+                        job['scraped_date'] = datetime.now().isoformat()
+
+                    # Filter if requested
+                    if self.filter_apac:
+                        jobs = filter_apac(jobs)
 
                 print(f"   ✅ Found {len(jobs)} jobs")
 
             except Exception as e:
                 print(f"   ❌ Error: {e}")
-            finally:
-                await browser.close()
+                SCRAPE_ERRORS.inc(suite=self.suite, target=name)
 
+        TARGET_DURATION.observe(time.perf_counter() - started, suite=self.suite, target=name)
+        JOBS_FOUND.set(len(jobs), suite=self.suite, target=name)
         return jobs
 
-    async def scrape_all(self) -> Dict:
-        """Scrape all targets."""
+    def print_plan(self, plan: List[tuple], deferred: List[Dict], budget_s: float):
+        """Print the scheduled order, slices and skipped targets."""
+        print(f"📅 Schedule for a {budget_s:.0f}s budget:")
+        for i, (target, slice_s) in enumerate(plan, 1):
+            rate = self.scheduler.expected_yield(target['name'])
+            rate_text = f"{rate * 60:.2f} new/min" if rate is not None else "no history"
+            print(f"   {i}. {target['name']:<24} {rate_text:<16} slice {slice_s:.0f}s")
+        for target in deferred:
+            due = self.scheduler.next_due(target)
+            reason = f"due {due:%Y-%m-%d %H:%M}" if due and due > datetime.now() else "no time left"
+            print(f"   -  {target['name']:<24} skipped ({reason})")
+        print()
+
+    async def scrape_all(self, budget_s: Optional[float] = None, workers: int = 1) -> Dict:
+        """
+        Scrape all targets.
+
+        Args:
+            budget_s: Total time budget. When set, targets that are due are
+                scraped in order of expected new jobs per second, each within
+                its own deadline slice.
+            workers: Number of worker processes to shard targets across, each
+                with its own event loop and browser
+        """
         print("\n" + "="*60)
-        print("🚀 Universal Job Scraper")
+        print(f"🚀 {self.title}")
         print("="*60 + "\n")
 
         results = {}
+        new_counts = {}
+        # Only this suite's run series: cache and database counters cover the whole process
+        REGISTRY.reset(suite=self.suite)
+        run_started = time.perf_counter()
+        self.stream_file = self.output_dir / f"{self.suite}_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+
+        enabled = [t for t in self.targets if t.get('enabled', True)]
+        if budget_s is None:
+            plan = [(t, None) for t in enabled]
+        else:
+            plan, deferred = self.scheduler.plan(enabled, budget_s)
+            self.print_plan(plan, deferred, budget_s)
+        deadline = run_started + budget_s if budget_s is not None else None
+
+        def on_result(name: str, jobs: List[Dict], duration_s: float, timed_out: bool, errored: bool):
+            new_counts[name] = self.history.record(
+                name, [j.get('url', '') for j in jobs], duration_s, timed_out)
+            results[name] = len(jobs)
+            self.add_target_jobs(name, jobs, partial=timed_out or errored)
+
+        if workers > 1 and len(plan) > 1:
+            browser_stats = await self.collect_sharded(plan, deadline, workers, on_result)
+        else:
+            browser_stats = await self.collect(plan, deadline, on_result)
+
+        return self.finalize(results, new_counts, run_started, browser_stats)
+
+    async def collect(self, plan: List[tuple], deadline: Optional[float], on_result: Callable) -> Dict:
+        """
+        Scrape planned targets in this process on one shared browser.
 
-        for target in self.targets:
-            if not target.get('enabled', True):
-                continue
+        ``on_result(name, jobs, duration_s, timed_out, errored)`` is called as
+        each target finishes; ``errored`` is set when the scrape recorded an
+        error, so its jobs may be incomplete. Returns the browser session's
+        memory stats.
+        """
+        # One browser for the whole run, kept within the memory limits
+        self.session = BrowserSession(self.har, self.memory_limits)
+        async with self.session:
+            for i, (target, slice_s) in enumerate(plan):
+                name = target['name']
+                timeout = None
+                if deadline is not None:
+                    # Time left over by fast targets carries forward; later slices stay reserved
+                    reserved = sum(s for _, s in plan[i + 1:])
+                    timeout = deadline - time.perf_counter() - reserved
+                    if timeout < self.scheduler.schedule["min_slice_s"]:
+                        print(f"⏭️  Skipping {name}: budget exhausted\n")
+                        continue
+
+                # Between targets is always safe for a browser restart
+                await self.session.checkpoint()
+                errors_before = SCRAPE_ERRORS.get(suite=self.suite, target=name)
+                started = time.perf_counter()
+                timed_out = False
+                try:
+                    jobs = await asyncio.wait_for(self.scrape_target(target), timeout)
+                except asyncio.TimeoutError:
+                    print(f"   ⏰ {name}: out of time after {timeout:.0f}s")
+                    SCRAPE_ERRORS.inc(suite=self.suite, target=name)
+                    jobs = []
+                    timed_out = True
+
+                errored = SCRAPE_ERRORS.get(suite=self.suite, target=name) > errors_before
+                on_result(name, jobs, time.perf_counter() - started, timed_out, errored)
+                print()
+
+            stats = {"peak_mb": self.session.peak_mb, "restarts": self.session.restarts,
+                     "recycles": self.session.recycles}
+        self.session = None
+        return stats
+
+    async def collect_sharded(self, plan: List[tuple], deadline: Optional[float], workers: int,
+                              on_result: Callable) -> Dict:
+        """Scrape planned targets across worker processes, merging results as they arrive."""
+        from src.scrapers.sharding import run_sharded, shard_targets
+
+        shards = shard_targets(plan, workers, cost=lambda t: self.scheduler.expected_duration(t['name']))
+        options = {"filter_apac": self.filter_apac, "har": self.har,
+                   "schedule": self.scheduler.schedule, "memory": vars(self.memory_limits),
+                   "rate_limit": self.rate_limit, "suite": self.suite}
+        wall_deadline = time.time() + (deadline - time.perf_counter()) if deadline is not None else None
+        stats = {"peak_mb": 0.0, "restarts": 0, "recycles": 0}
+
+        def worker_result(name, jobs, duration_s, timed_out, errors, pages):
+            # Worker registries die with the worker, so re-record per-target metrics here
+            TARGET_DURATION.observe(duration_s, suite=self.suite, target=name)
+            JOBS_FOUND.set(len(jobs), suite=self.suite, target=name)
+            if errors:
+                SCRAPE_ERRORS.inc(errors, suite=self.suite, target=name)
+            if pages:
+                PAGES_NAVIGATED.inc(pages, suite=self.suite, target=name)
+            print(f"   📥 {name}: {len(jobs)} jobs")
+            on_result(name, jobs, duration_s, timed_out, errors > 0)
+
+        def worker_done(worker_stats, trace_events, wall_origin):
+            stats["peak_mb"] = max(stats["peak_mb"], worker_stats["peak_mb"])
+            stats["restarts"] += worker_stats["restarts"]
+            stats["recycles"] += worker_stats["recycles"]
+            self.tracer.merge(trace_events, wall_origin)
+
+        # The coordinator only waits on the queue, so run it off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, run_sharded, shards, options, wall_deadline,
+                                   worker_result, worker_done)
+        print()
+        return stats
+
+    def add_target_jobs(self, name: str, jobs: List[Dict], partial: bool = False):
+        """
+        Collect a target's jobs for this run.
 
-            jobs = await self.scrape_target(target)
-            results[target['name']] = len(jobs)
-            self.all_jobs.extend(jobs)
-            print()
+        Partial targets (timed out or errored) are diffed without removals, so
+        a failed scrape doesn't report every job as closed.
 
-        # Deduplicate by URL
-        seen = set()
-        unique = []
-        for job in self.all_jobs:
-            url = job.get('url', '')
-            if url and url not in seen:
-                seen.add(url)
-                unique.append(job)
+        During ``scrape_all`` each target's jobs are also appended to the
+        run's NDJSON stream as soon as they arrive.
+        """
+        self.target_jobs[name] = jobs
+        if partial:
+            self.partial_targets.add(name)
+        self.all_jobs.extend(jobs)
+        if self.stream_file and jobs:
+            with open(self.stream_file, 'a') as f:
+                for job in jobs:
+                    f.write(json.dumps(job, default=str) + "\n")
 
-        self.all_jobs = unique
-        self.all_jobs.sort(key=lambda x: x.get('match_score', 0), reverse=True)
+    def changed_roles(self, events: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Added and changed jobs from the change feed, as this run's canonical records.
 
-        # Filter GTM if requested
-        gtm_jobs = [j for j in self.all_jobs if is_gtm_role(j.get('title', ''))]
+        Events are per target, so a role listed on a VC board and on the
+        company's own page is added twice; it's reported once, merged and scored.
+        """
+        canonical = {}
+        for job in self.all_jobs:
+            for url in job.get('source_urls') or [job.get('url', '')]:
+                canonical[url_key(url)] = job
+        roles: Dict[str, Dict[int, Dict]] = {"added": {}, "changed": {}}
+        for event in events:
+            if event["event"] in roles:
+                job = canonical.get(url_key(event["url"]), event["job"])
+                roles[event["event"]][id(job)] = job
+        return {kind: list(jobs.values()) for kind, jobs in roles.items()}
+
+    def finalize(self, results: Dict[str, int], new_counts: Dict[str, int],
+                 run_started: float, browser_stats: Optional[Dict] = None) -> Dict:
+        """Dedupe, score, save and summarize everything collected in this run."""
+        with self.tracer.span("post_process"):
+            # Score each target's own records: the change feed stores and reports those
+            score_jobs(self.all_jobs)
+            self.all_jobs = dedupe_by_url(self.all_jobs)
+            listed = len(self.all_jobs)
+            # The same role on a VC board and the company's own page
+            self.all_jobs = merge_near_duplicates(self.all_jobs)
+            merged = listed - len(self.all_jobs)
+            # Merged records may have filled in fields from the other postings
+            score_jobs([job for job in self.all_jobs if job.get('source_urls')])
+            self.all_jobs.sort(key=lambda x: x.get('match_score', 0), reverse=True)
+
+            # Filter GTM if requested
+            gtm_jobs = filter_gtm(self.all_jobs)
+            self.gtm_jobs = gtm_jobs
 
         # Save results
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        all_file = self.output_dir / f"universal_all_jobs_{ts}.json"
-        with open(all_file, 'w') as f:
-            json.dump(self.all_jobs, f, indent=2)
+        with self.tracer.span("save"):
+            all_file = self.output_dir / f"{self.suite}_all_jobs_{ts}.json"
+            with open(all_file, 'w') as f:
+                json.dump(self.all_jobs, f, indent=2)
+
+            gtm_file = self.output_dir / f"{self.suite}_gtm_jobs_{ts}.json"
+            with open(gtm_file, 'w') as f:
+                json.dump(gtm_jobs, f, indent=2)
 
-        gtm_file = self.output_dir / f"universal_gtm_jobs_{ts}.json"
-        with open(gtm_file, 'w') as f:
-            json.dump(gtm_jobs, f, indent=2)
+            events = self.changes.apply(self.suite, self.target_jobs, self.partial_targets, run_id=ts)
+            deltas = summarize(events)
+            roles = self.changed_roles(events)
+
+        trace_file = self.tracer.write(self.output_dir / "traces" / f"{self.suite}_trace_{ts}.json")
+
+        RUN_DURATION.set(time.perf_counter() - run_started, suite=self.suite)
+        RUN_JOBS.set(len(self.all_jobs), suite=self.suite)
+        LAST_RUN.set(time.time(), suite=self.suite)
+        metrics_file = write_run_metrics(self.suite, str(self.output_dir / "metrics"))
 
         # Print summary
         print("="*60)
@@ -795,21 +1132,48 @@ class UniversalJobScraper:
         company_total = sum(v for k, v in results.items()) - vc_total
 
         for name, count in results.items():
-            print(f"   {name}: {count} jobs")
+            if name in deltas:
+                d = deltas[name]
+                print(f"   {name}: +{d['added']} new, -{d['removed']} removed, "
+                      f"~{d['changed']} changed ({count} listed)")
+        unchanged = len([name for name in results if name not in deltas])
+        if unchanged:
+            print(f"   {unchanged} target(s) unchanged")
         print("   " + "─"*40)
+        removed = sum(d["removed"] for d in deltas.values())
+        print(f"   Changes: +{len(roles['added'])} new, -{removed} removed, ~{len(roles['changed'])} changed")
         print(f"   Total unique: {len(self.all_jobs)} jobs")
+        if merged:
+            print(f"   Cross-source duplicates merged: {merged}")
         print(f"   GTM matches: {len(gtm_jobs)} jobs")
+        if browser_stats:
+            print(f"   Browser memory: peak {browser_stats['peak_mb']:.0f} MB, "
+                  f"{browser_stats['restarts']} restarts, {browser_stats['recycles']} page recycles")
+
+        print("\n⏱️  TIMING (seconds per stage)")
+        print(self.tracer.format_table())
 
         print(f"\n📁 Saved to:")
         print(f"   {all_file}")
         print(f"   {gtm_file}")
-
-        # Print top matches
+        print(f"   {trace_file} (open in chrome://tracing or ui.perfetto.dev)")
+        print(f"   {metrics_file}")
+        if self.stream_file and self.stream_file.exists():
+            print(f"   {self.stream_file} (streamed as targets finished)")
+        if events:
+            print(f"   {self.changes.feed_file(self.suite, ts)}")
+
+        # Print top new and changed matches
         print("\n" + "="*60)
-        print("🎯 TOP 20 MATCHES")
+        print("🎯 TOP 20 NEW & CHANGED MATCHES")
         print("="*60)
 
-        display_jobs = gtm_jobs[:20] if self.filter_gtm else self.all_jobs[:20]
+        delta_jobs = list({id(job): job for job in roles["added"] + roles["changed"]}.values())
+        if self.filter_gtm:
+            delta_jobs = filter_gtm(delta_jobs)
+        display_jobs = sorted(delta_jobs, key=lambda x: x.get('match_score', 0), reverse=True)[:20]
+        if not display_jobs:
+            print("\n   No new or changed jobs since the last run")
         for i, job in enumerate(display_jobs, 1):
             score = job.get('match_score', 0)
             emoji = "🔥" if score >= 80 else "⭐" if score >= 70 else "👍"
@@ -825,9 +1189,14 @@ class UniversalJobScraper:
             "total": len(self.all_jobs),
             "gtm_matches": len(gtm_jobs),
             "by_source": results,
+            "new_by_source": new_counts,
+            "changes": deltas,
             "files": {
                 "all": str(all_file),
-                "gtm": str(gtm_file)
+                "gtm": str(gtm_file),
+                "trace": str(trace_file),
+                "metrics": str(metrics_file),
+                "stream": str(self.stream_file) if self.stream_file else None
             }
         }
 
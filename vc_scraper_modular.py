@@ -5,97 +5,23 @@ Each job board has its own dedicated scraper class with custom pagination handli
 """
 
 import asyncio
-import json
 import re
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from datetime import datetime
-from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import async_playwright, Page
 
-
-# =============================================================================
-# CONFIGURATION
-# =============================================================================
-
-SENIOR_KEYWORDS = [
-    'director', 'head of', 'vp ', 'vice president', 'chief',
-    'manager', 'lead', 'senior', 'principal', 'executive',
-    'enterprise', 'strategic', 'regional'
-]
-
-GTM_KEYWORDS = [
-    'sales', 'account', 'business development', 'bd ', 'bdr',
-    'gtm', 'go-to-market', 'commercial', 'revenue', 'partnerships',
-    'partner', 'customer success', 'solutions', 'presales',
-    'enterprise', 'strategic', 'field'
-]
-
-JUNIOR_KEYWORDS = [
-    'intern', 'graduate', 'entry level', 'coordinator',
-    'assistant', 'junior', 'trainee'
-]
-
-APAC_LOCATIONS = [
-    'australia', 'sydney', 'melbourne', 'brisbane', 'perth',
-    'singapore', 'apac', 'asia', 'remote', 'india', 'bangalore',
-    'tokyo', 'seoul', 'hong kong'
-]
-
-
-# =============================================================================
-# UTILITIES
-# =============================================================================
-
-def is_gtm_role(title: str) -> bool:
-    """Check if job title is a GTM role."""
-    title_lower = title.lower()
-    if any(kw in title_lower for kw in JUNIOR_KEYWORDS):
-        return False
-    return any(kw in title_lower for kw in GTM_KEYWORDS)
-
-
-def calculate_match_score(job: Dict) -> int:
-    """Calculate match score for Leroy's profile."""
-    score = 50
-    title = job.get('title', '').lower()
-
-    # Seniority boost
-    if any(kw in title for kw in ['director', 'head of', 'vp ', 'chief']):
-        score += 20
-    elif any(kw in title for kw in ['manager', 'lead', 'senior']):
-        score += 10
-
-    # Role type boost
-    if 'enterprise' in title: score += 15
-    if 'account executive' in title: score += 15
-    if 'partner' in title: score += 10
-    if 'sales' in title: score += 10
-    if 'gtm' in title: score += 15
-    if 'ai' in title or 'ml' in title: score += 15
-
-    # Location boost
-    loc = job.get('location', '').lower()
-    if 'sydney' in loc: score += 10
-    elif 'australia' in loc: score += 5
-    elif 'remote' in loc: score += 5
-
-    # Junior penalty
-    if any(kw in title for kw in JUNIOR_KEYWORDS):
-        score -= 30
-
-    return min(100, max(0, score))
-
-
-async def create_browser_context(playwright) -> tuple[Browser, BrowserContext]:
-    """Create browser with standard settings."""
-    browser = await playwright.chromium.launch(headless=True)
-    context = await browser.new_context(
-        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        viewport={'width': 1920, 'height': 1080}
-    )
-    return browser, context
+from src.core.dedupe import dedupe_by_url
+from src.core.keyword_matcher import GTM_MATCHER, is_apac_location
+from src.core.tracing import span
+from src.scrapers.browser_session import (
+    BrowserSession, create_browser_context, navigate, scrape_in_tabs, settle,
+)
+from src.scrapers.har import HarConfig
+from src.scrapers.registry import DEFAULT_VC_BOARDS, SCRAPERS
+from universal_job_scraper import UniversalJobScraper
 
 
 # =============================================================================
@@ -108,8 +34,46 @@ class BaseJobScraper(ABC):
     name: str = "Base"
     base_url: str = ""
 
-    def __init__(self):
+    def __init__(self, har: Optional[HarConfig] = None):
         self.jobs: List[Dict] = []
+        self.har = har
+        self.session: Optional[BrowserSession] = None
+        self.errors = 0
+
+    @asynccontextmanager
+    async def open_page(self):
+        """Page for this board: from the shared session if set, else a private browser."""
+        if self.session:
+            page = await self.session.new_page(self.name)
+            try:
+                yield page
+            finally:
+                await self.session.release(self.name)
+            return
+
+        async with async_playwright() as p:
+            with span("launch"):
+                browser, context = await create_browser_context(p, self.har, self.name)
+                page = await context.new_page()
+            try:
+                yield page
+            finally:
+                # Closing the context first flushes any HAR being recorded
+                await context.close()
+                await browser.close()
+
+    async def checkpoint(self, page: Page) -> Page:
+        """Let the shared session recycle the page between URL-paginated pages."""
+        if self.session:
+            return await self.session.checkpoint(self.name) or page
+        return page
+
+    def memory_exhausted(self) -> bool:
+        """Whether click/scroll pagination should stop to keep the page within its memory limits."""
+        if self.session and not self.session.can_load_more():
+            print("      🧠 Memory limit reached, extracting what is loaded")
+            return True
+        return False
 
     @abstractmethod
     async def scrape(self) -> List[Dict]:
@@ -129,7 +93,6 @@ class BaseJobScraper(ABC):
     def add_metadata(self, job: Dict) -> Dict:
         """Add standard metadata to job."""
         job["source"] = self.name
-        job["match_score"] = calculate_match_score(job)
         job["scraped_date"] = datetime.now().isoformat()
         return job
 
@@ -145,11 +108,12 @@ class InsightPartnersScraper(BaseJobScraper):
     Insight Partners job board scraper.
     - Uses Getro platform
     - Pagination via "Load more" button
-    - Filter by Australia location
+    - Filter by each APAC region, loaded concurrently in tabs
     """
 
     name = "Insight Partners"
     base_url = "https://jobs.insightpartners.com/jobs"
+    regions = ["Australia", "Singapore", "Remote"]
 
     def get_filtered_url(self, location: str = "Australia") -> str:
         """Get URL with location filter (base64 encoded)."""
@@ -166,18 +130,21 @@ class InsightPartnersScraper(BaseJobScraper):
         """Click 'Load more' button until all jobs are loaded."""
         max_clicks = 15
         for i in range(max_clicks):
+            if self.memory_exhausted():
+                break
             try:
                 load_more = page.locator('button:has-text("Load more")')
                 if await load_more.count() > 0 and await load_more.is_visible():
-                    await load_more.click()
-                    await asyncio.sleep(1.5)
+                    with span("paginate", kind="load_more", step=i + 1):
+                        await load_more.click()
+                        await asyncio.sleep(1.5)
                     print(f"      Loading more ({i+1})...")
                 else:
                     break
             except:
                 break
 
-    async def extract_jobs(self, page: Page) -> List[Dict]:
+    async def extract_jobs(self, page: Page, region: str = "Australia") -> List[Dict]:
         """Extract jobs from Getro-style job cards."""
         jobs = []
 
@@ -209,9 +176,9 @@ class InsightPartnersScraper(BaseJobScraper):
                     company = re.sub(r'\s*\d+\s*[A-Fa-f0-9\-]+$', '', company)
 
                 # Find location in text
-                location = "Australia"
+                location = region
                 for line in lines[1:4]:
-                    if any(loc in line.lower() for loc in APAC_LOCATIONS):
+                    if is_apac_location(line):
                         location = line
                         break
 
@@ -230,29 +197,39 @@ class InsightPartnersScraper(BaseJobScraper):
 
         return jobs
 
+    async def scrape_region(self, page: Page, region: str) -> List[Dict]:
+        """Load and extract one region's filtered listing."""
+        await navigate(page, self.get_filtered_url(region), wait_until='domcontentloaded', timeout=30000)
+        await settle(5)  # Wait for JS render
+
+        await self.handle_pagination(page)
+        await asyncio.sleep(2)
+
+        with span("extract"):
+            return await self.extract_jobs(page, region)
+
     async def scrape(self) -> List[Dict]:
         """Main scrape method for Insight Partners."""
         print(f"🔍 Scraping {self.name}...")
 
-        async with async_playwright() as p:
-            browser, context = await create_browser_context(p)
-            page = await context.new_page()
-
+        async with self.open_page() as page:
             try:
-                url = self.get_filtered_url("Australia")
-                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                await asyncio.sleep(5)  # Wait for JS render
-
-                await self.handle_pagination(page)
-                await asyncio.sleep(2)
-
-                self.jobs = await self.extract_jobs(page)
+                results = await scrape_in_tabs(page, self.regions, self.scrape_region)
+                listed = []
+                for region, result in zip(self.regions, results):
+                    if isinstance(result, BaseException):
+                        print(f"   ⚠️  {region}: {result}")
+                        self.errors += 1
+                    else:
+                        listed.extend(result)
+
+                self.jobs = dedupe_by_url(listed)
+                print(f"   🌏 {len(self.regions)} regions: {len(listed)} listings, {len(self.jobs)} unique")
                 print(f"   ✅ Found {len(self.jobs)} jobs")
 
             except Exception as e:
                 print(f"   ❌ Error: {e}")
-            finally:
-                await browser.close()
+                self.errors += 1
 
         return self.jobs
 
@@ -280,13 +257,14 @@ class IndexVenturesScraper(BaseJobScraper):
 
     async def wait_for_vue_render(self, page: Page, max_wait: int = 20) -> None:
         """Wait for Vue.js to process templates."""
-        for _ in range(max_wait):
-            html = await page.content()
-            # Vue templates use [[ ]] syntax - if present, not yet rendered
-            if '[[' not in html or ']]' not in html:
-                break
-            await asyncio.sleep(0.5)
-        await asyncio.sleep(2)  # Extra buffer
+        with span("wait"):
+            for _ in range(max_wait):
+                html = await page.content()
+                # Vue templates use [[ ]] syntax - if present, not yet rendered
+                if '[[' not in html or ']]' not in html:
+                    break
+                await asyncio.sleep(0.5)
+            await asyncio.sleep(2)  # Extra buffer
 
     async def handle_pagination(self, page: Page) -> None:
         """URL-based pagination - handled in scrape() method."""
@@ -338,7 +316,7 @@ class IndexVenturesScraper(BaseJobScraper):
                 # Find location
                 location = "Sydney, Australia"
                 for line in lines:
-                    if any(loc in line.lower() for loc in APAC_LOCATIONS):
+                    if is_apac_location(line):
                         location = line
                         break
 
@@ -364,10 +342,7 @@ class IndexVenturesScraper(BaseJobScraper):
         locations = ["sydney-australia", "melbourne-australia", "australia"]
         max_pages = 10
 
-        async with async_playwright() as p:
-            browser, context = await create_browser_context(p)
-            page = await context.new_page()
-
+        async with self.open_page() as page:
             try:
                 for location in locations:
                     print(f"   Location: {location}")
@@ -377,10 +352,12 @@ class IndexVenturesScraper(BaseJobScraper):
                         print(f"      Page {page_num}...")
 
                         try:
-                            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                            page = await self.checkpoint(page)
+                            await navigate(page, url, wait_until='domcontentloaded', timeout=30000)
                             await self.wait_for_vue_render(page)
 
-                            page_jobs = await self.extract_jobs(page)
+                            with span("extract"):
+                                page_jobs = await self.extract_jobs(page)
 
                             if not page_jobs:
                                 print(f"      No more jobs, moving to next location")
@@ -391,23 +368,18 @@ class IndexVenturesScraper(BaseJobScraper):
 
                         except Exception as e:
                             print(f"      Page error: {e}")
+                            self.errors += 1
                             break
 
                 # Dedupe by URL
-                seen = set()
-                unique = []
-                for job in self.jobs:
-                    if job['url'] not in seen:
-                        seen.add(job['url'])
-                        unique.append(job)
-                self.jobs = unique
+                with span("post_process"):
+                    self.jobs = dedupe_by_url(self.jobs)
 
                 print(f"   ✅ Total: {len(self.jobs)} unique jobs")
 
             except Exception as e:
                 print(f"   ❌ Error: {e}")
-            finally:
-                await browser.close()
+                self.errors += 1
 
         return self.jobs
 
@@ -439,10 +411,13 @@ class SequoiaScraper(BaseJobScraper):
         last_height = 0
 
         for i in range(max_scrolls):
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(1.5)
+            if self.memory_exhausted():
+                break
+            with span("paginate", kind="scroll", step=i + 1):
+                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                await asyncio.sleep(1.5)
 
-            new_height = await page.evaluate('document.body.scrollHeight')
+                new_height = await page.evaluate('document.body.scrollHeight')
             if new_height == last_height:
                 print(f"      Reached end after {i+1} scrolls")
                 break
@@ -497,24 +472,21 @@ class SequoiaScraper(BaseJobScraper):
         """Main scrape with infinite scroll pagination."""
         print(f"🔍 Scraping {self.name}...")
 
-        async with async_playwright() as p:
-            browser, context = await create_browser_context(p)
-            page = await context.new_page()
-
+        async with self.open_page() as page:
             try:
                 url = self.get_filtered_url("Australia")
-                await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-                await asyncio.sleep(5)
+                await navigate(page, url, wait_until='domcontentloaded', timeout=60000)
+                await settle(5)
 
                 await self.handle_pagination(page)
 
-                self.jobs = await self.extract_jobs(page)
+                with span("extract"):
+                    self.jobs = await self.extract_jobs(page)
                 print(f"   ✅ Found {len(self.jobs)} jobs")
 
             except Exception as e:
                 print(f"   ❌ Error: {e}")
-            finally:
-                await browser.close()
+                self.errors += 1
 
         return self.jobs
 
@@ -542,10 +514,13 @@ class LightspeedScraper(BaseJobScraper):
         last_height = 0
 
         for i in range(max_scrolls):
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(1.5)
+            if self.memory_exhausted():
+                break
+            with span("paginate", kind="scroll", step=i + 1):
+                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                await asyncio.sleep(1.5)
 
-            new_height = await page.evaluate('document.body.scrollHeight')
+                new_height = await page.evaluate('document.body.scrollHeight')
             if new_height == last_height:
                 break
             last_height = new_height
@@ -577,8 +552,7 @@ class LightspeedScraper(BaseJobScraper):
                     continue
 
                 # Filter for APAC locations
-                text_lower = text.lower()
-                if not any(loc in text_lower for loc in APAC_LOCATIONS):
+                if not is_apac_location(text):
                     continue
 
                 seen.add(href)
@@ -604,23 +578,20 @@ class LightspeedScraper(BaseJobScraper):
         """Main scrape with APAC filtering."""
         print(f"🔍 Scraping {self.name} (APAC filter)...")
 
-        async with async_playwright() as p:
-            browser, context = await create_browser_context(p)
-            page = await context.new_page()
-
+        async with self.open_page() as page:
             try:
-                await page.goto(self.base_url, wait_until='domcontentloaded', timeout=60000)
-                await asyncio.sleep(5)
+                await navigate(page, self.base_url, wait_until='domcontentloaded', timeout=60000)
+                await settle(5)
 
                 await self.handle_pagination(page)
 
-                self.jobs = await self.extract_jobs(page)
+                with span("extract"):
+                    self.jobs = await self.extract_jobs(page)
                 print(f"   ✅ Found {len(self.jobs)} APAC jobs")
 
             except Exception as e:
                 print(f"   ❌ Error: {e}")
-            finally:
-                await browser.close()
+                self.errors += 1
 
         return self.jobs
 
@@ -645,13 +616,16 @@ class A16ZScraper(BaseJobScraper):
         """Click load more buttons."""
         max_clicks = 20
         for i in range(max_clicks):
+            if self.memory_exhausted():
+                break
             try:
                 # Try different button selectors
                 for selector in ['button:has-text("Load more")', 'button:has-text("Show more")', '[class*="load-more"]']:
                     btn = page.locator(selector)
                     if await btn.count() > 0 and await btn.is_visible():
-                        await btn.click()
-                        await asyncio.sleep(1.5)
+                        with span("paginate", kind="load_more", step=i + 1):
+                            await btn.click()
+                            await asyncio.sleep(1.5)
                         break
                 else:
                     break
@@ -685,8 +659,7 @@ class A16ZScraper(BaseJobScraper):
                     continue
 
                 # Filter for APAC
-                text_lower = text.lower()
-                if not any(loc in text_lower for loc in APAC_LOCATIONS):
+                if not is_apac_location(text):
                     continue
 
                 seen.add(href)
@@ -711,23 +684,20 @@ class A16ZScraper(BaseJobScraper):
         """Main scrape method."""
         print(f"🔍 Scraping {self.name} (APAC filter)...")
 
-        async with async_playwright() as p:
-            browser, context = await create_browser_context(p)
-            page = await context.new_page()
-
+        async with self.open_page() as page:
             try:
-                await page.goto(self.base_url, wait_until='domcontentloaded', timeout=60000)
-                await asyncio.sleep(5)
+                await navigate(page, self.base_url, wait_until='domcontentloaded', timeout=60000)
+                await settle(5)
 
                 await self.handle_pagination(page)
 
-                self.jobs = await self.extract_jobs(page)
+                with span("extract"):
+                    self.jobs = await self.extract_jobs(page)
                 print(f"   ✅ Found {len(self.jobs)} APAC jobs")
 
             except Exception as e:
                 print(f"   ❌ Error: {e}")
-            finally:
-                await browser.close()
+                self.errors += 1
 
         return self.jobs
 
@@ -750,9 +720,12 @@ class GreylockScraper(BaseJobScraper):
         last_height = 0
 
         for i in range(max_scrolls):
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(1.5)
-            new_height = await page.evaluate('document.body.scrollHeight')
+            if self.memory_exhausted():
+                break
+            with span("paginate", kind="scroll", step=i + 1):
+                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                await asyncio.sleep(1.5)
+                new_height = await page.evaluate('document.body.scrollHeight')
             if new_height == last_height:
                 break
             last_height = new_height
@@ -783,8 +756,7 @@ class GreylockScraper(BaseJobScraper):
                 if not href or href in seen:
                     continue
 
-                text_lower = text.lower()
-                if not any(loc in text_lower for loc in APAC_LOCATIONS):
+                if not is_apac_location(text):
                     continue
 
                 seen.add(href)
@@ -809,20 +781,17 @@ class GreylockScraper(BaseJobScraper):
         """Main scrape."""
         print(f"🔍 Scraping {self.name} (APAC filter)...")
 
-        async with async_playwright() as p:
-            browser, context = await create_browser_context(p)
-            page = await context.new_page()
-
+        async with self.open_page() as page:
             try:
-                await page.goto(self.base_url, wait_until='domcontentloaded', timeout=60000)
-                await asyncio.sleep(5)
+                await navigate(page, self.base_url, wait_until='domcontentloaded', timeout=60000)
+                await settle(5)
                 await self.handle_pagination(page)
-                self.jobs = await self.extract_jobs(page)
+                with span("extract"):
+                    self.jobs = await self.extract_jobs(page)
                 print(f"   ✅ Found {len(self.jobs)} APAC jobs")
             except Exception as e:
                 print(f"   ❌ Error: {e}")
-            finally:
-                await browser.close()
+                self.errors += 1
 
         return self.jobs
 
@@ -854,7 +823,7 @@ class WizScraper(BaseJobScraper):
 
         try:
             # Use Greenhouse API directly
-            response = await page.goto(self.jobs_api, wait_until='domcontentloaded')
+            response = await navigate(page, self.jobs_api, wait_until='domcontentloaded')
             content = await page.content()
 
             # Parse JSON from page
@@ -869,22 +838,23 @@ class WizScraper(BaseJobScraper):
             pass
 
         # Fallback: scrape the careers page directly
-        await page.goto(self.base_url, wait_until='domcontentloaded', timeout=30000)
-        await asyncio.sleep(5)
-
-        job_data = await page.evaluate('''() => {
-            const jobs = [];
-            // Wiz uses various job listing formats
-            const links = document.querySelectorAll('a[href*="greenhouse"], a[href*="/careers/"], a[href*="job"]');
-            links.forEach(link => {
-                const text = link.innerText;
-                const href = link.getAttribute('href');
-                if (text && text.length > 5 && href) {
-                    jobs.push({text: text, href: href});
-                }
-            });
-            return jobs;
-        }''')
+        await navigate(page, self.base_url, wait_until='domcontentloaded', timeout=30000)
+        await settle(5)
+
+        with span("extract"):
+            job_data = await page.evaluate('''() => {
+                const jobs = [];
+                // Wiz uses various job listing formats
+                const links = document.querySelectorAll('a[href*="greenhouse"], a[href*="/careers/"], a[href*="job"]');
+                links.forEach(link => {
+                    const text = link.innerText;
+                    const href = link.getAttribute('href');
+                    if (text && text.length > 5 && href) {
+                        jobs.push({text: text, href: href});
+                    }
+                });
+                return jobs;
+            }''')
 
         seen = set()
         for item in job_data:
@@ -896,9 +866,8 @@ class WizScraper(BaseJobScraper):
                     continue
 
                 # Filter for APAC/Sales keywords
-                text_lower = text.lower()
-                has_apac = any(loc in text_lower for loc in APAC_LOCATIONS)
-                has_gtm = any(kw in text_lower for kw in GTM_KEYWORDS)
+                has_apac = is_apac_location(text)
+                has_gtm = GTM_MATCHER.matches(text)
 
                 if not (has_apac or has_gtm):
                     continue
@@ -925,17 +894,13 @@ class WizScraper(BaseJobScraper):
         """Scrape Wiz careers."""
         print(f"🔍 Scraping {self.name}...")
 
-        async with async_playwright() as p:
-            browser, context = await create_browser_context(p)
-            page = await context.new_page()
-
+        async with self.open_page() as page:
             try:
                 self.jobs = await self.extract_jobs(page)
                 print(f"   ✅ Found {len(self.jobs)} relevant jobs")
             except Exception as e:
                 print(f"   ❌ Error: {e}")
-            finally:
-                await browser.close()
+                self.errors += 1
 
         return self.jobs
 
@@ -945,102 +910,57 @@ class WizScraper(BaseJobScraper):
 # =============================================================================
 
 class VCJobScraperOrchestrator:
-    """Orchestrates all scrapers and aggregates results."""
-
-    def __init__(self):
-        self.scrapers: List[BaseJobScraper] = [
-            InsightPartnersScraper(),
-            IndexVenturesScraper(),
-            SequoiaScraper(),
-            LightspeedScraper(),
-            # A16ZScraper(),  # Uncomment to enable
-            # GreylockScraper(),  # Uncomment to enable
-            # WizScraper(),  # Uncomment to enable
-        ]
-        self.all_jobs: List[Dict] = []
-        self.gtm_jobs: List[Dict] = []
-        self.output_dir = Path("./data")
-        self.output_dir.mkdir(exist_ok=True)
-
-    def add_scraper(self, scraper: BaseJobScraper):
-        """Add a custom scraper."""
-        self.scrapers.append(scraper)
-
-    async def run_all(self) -> Dict:
-        """Run all scrapers and aggregate results."""
-        print("\n" + "="*60)
-        print("🚀 VC Job Scraper - Modular Version")
-        print("="*60 + "\n")
+    """
+    Runs the VC boards through the shared scraping engine.
 
-        results = {}
+    Each board becomes a ``UniversalJobScraper`` target naming its plugin, so
+    the boards get the engine's pooled browser, rate limiter, change feed,
+    metrics and streaming output.
+    """
 
-        for scraper in self.scrapers:
-            jobs = await scraper.scrape()
-            results[scraper.name] = len(jobs)
-            self.all_jobs.extend(jobs)
-            print()
+    def __init__(self, har: Optional[HarConfig] = None, memory: Optional[Dict] = None,
+                 boards: Optional[List[str]] = None):
+        """
+        Args:
+            har: Record or replay each board's traffic as a HAR archive
+            memory: MemoryLimits overrides for the shared browser
+            boards: Registry names or "module:Class" specs (defaults to DEFAULT_VC_BOARDS)
+        """
+        self.har = har
+        self.memory = memory
+        self.boards: List[str] = list(DEFAULT_VC_BOARDS if boards is None else boards)
+        self.all_jobs: List[Dict] = []
+        self.gtm_jobs: List[Dict] = []
 
-        # Deduplicate by URL
-        seen = set()
-        unique = []
-        for job in self.all_jobs:
-            url = job.get('url', '')
-            if url and url not in seen:
-                seen.add(url)
-                unique.append(job)
-
-        self.all_jobs = unique
-        self.all_jobs.sort(key=lambda x: x.get('match_score', 0), reverse=True)
-
-        # Filter GTM roles
-        self.gtm_jobs = [j for j in self.all_jobs if is_gtm_role(j.get('title', ''))]
-
-        # Save results
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        all_file = self.output_dir / f"vc_all_jobs_{ts}.json"
-        with open(all_file, 'w') as f:
-            json.dump(self.all_jobs, f, indent=2)
-
-        gtm_file = self.output_dir / f"vc_gtm_matches_{ts}.json"
-        with open(gtm_file, 'w') as f:
-            json.dump(self.gtm_jobs, f, indent=2)
-
-        # Print summary
-        print("="*60)
-        print("📊 RESULTS")
-        print("="*60)
-        for name, count in results.items():
-            print(f"   {name}: {count} jobs")
-        print("   " + "─"*30)
-        print(f"   Total unique: {len(self.all_jobs)} jobs")
-        print(f"   GTM matches: {len(self.gtm_jobs)} jobs")
-        print(f"\n📁 Saved to:")
-        print(f"   {all_file}")
-        print(f"   {gtm_file}")
-
-        # Print top matches
-        print("\n" + "="*60)
-        print("🎯 TOP 15 GTM MATCHES")
-        print("="*60)
-
-        for i, job in enumerate(self.gtm_jobs[:15], 1):
-            score = job.get('match_score', 0)
-            emoji = "🔥" if score >= 80 else "⭐" if score >= 70 else "👍"
-            print(f"\n{i}. {emoji} [{score}%] {job['title']}")
-            print(f"   Company: {job.get('company') or 'See link'}")
-            print(f"   Location: {job.get('location', 'N/A')}")
-            print(f"   Source: {job.get('source')}")
-            print(f"   {job.get('url', '')[:80]}")
-
-        print("\n" + "="*60)
-
-        return {
-            "total": len(self.all_jobs),
-            "gtm_matches": len(self.gtm_jobs),
-            "by_source": results,
-            "top_jobs": self.gtm_jobs[:15]
-        }
+    def add_scraper(self, scraper: Union[str, type, BaseJobScraper]):
+        """Add a board by registry name, "module:Class" spec, plugin class or instance."""
+        if isinstance(scraper, str):
+            self.boards.append(scraper)
+            return
+        cls = scraper if isinstance(scraper, type) else type(scraper)
+        self.boards.append(SCRAPERS.spec_for(cls))
+
+    def targets(self) -> List[Dict]:
+        """Engine targets for the configured boards."""
+        targets = []
+        for board in self.boards:
+            cls = SCRAPERS.resolve(board)
+            targets.append({"name": cls.name, "url": cls.base_url, "type": "vc_portfolio",
+                            "scraper": board, "enabled": True})
+        return targets
+
+    async def run_all(self, workers: int = 1) -> Dict:
+        """Run all boards and aggregate results."""
+        engine = UniversalJobScraper(self.targets(), filter_apac=False, filter_gtm=True,
+                                     har=self.har, memory=self.memory, suite="vc",
+                                     title="VC Job Scraper - Modular Version")
+        results = await engine.scrape_all(workers=workers)
+        self.all_jobs = engine.all_jobs
+        self.gtm_jobs = engine.gtm_jobs
+        results["top_jobs"] = self.gtm_jobs[:15]
+        results["trace_file"] = results["files"]["trace"]
+        results["metrics_file"] = results["files"]["metrics"]
+        return results
 
 
 # =============================================================================
@@ -1050,8 +970,8 @@ class VCJobScraperOrchestrator:
 async def main():
     orchestrator = VCJobScraperOrchestrator()
 
-    # Optionally add more scrapers
-    # orchestrator.add_scraper(WizScraper())
+    # Optionally add more boards
+    # orchestrator.add_scraper("wiz")
 
     results = await orchestrator.run_all()
     return results